@@ -757,6 +757,23 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/api/research-pipeline/events/node-timing": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /** Ingest Node Timing */
+        post: operations["ingest_node_timing_api_research_pipeline_events_node_timing_post"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/api/research-pipeline/events/run-started": {
         parameters: {
             query?: never;
@@ -2254,6 +2271,31 @@ export interface components {
             /** Cost */
             cost: number;
         };
+        /** NodeTimingEvent */
+        NodeTimingEvent: {
+            /** Stage */
+            stage: string;
+            /** Node Id */
+            node_id: string;
+            /** Is Buggy */
+            is_buggy: boolean;
+            /** Total S */
+            total_s: number;
+            /** Phases */
+            phases: {
+                [key: string]: {
+                    [key: string]: unknown;
+                };
+            };
+            /** Profile Path */
+            profile_path?: string | null;
+        };
+        /** NodeTimingPayload */
+        NodeTimingPayload: {
+            /** Run Id */
+            run_id: string;
+            event: components["schemas"]["NodeTimingEvent"];
+        };
         /** PaperGenerationProgressEvent */
         PaperGenerationProgressEvent: {
             /** Step */
@@ -4273,6 +4315,39 @@ export interface operations {
             };
         };
     };
+    ingest_node_timing_api_research_pipeline_events_node_timing_post: {
+        parameters: {
+            query?: never;
+            header: {
+                authorization: string;
+            };
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["NodeTimingPayload"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            204: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content?: never;
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     ingest_run_started_api_research_pipeline_events_run_started_post: {
         parameters: {
             query?: never;
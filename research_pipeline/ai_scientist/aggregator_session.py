@@ -0,0 +1,410 @@
+"""
+Persistent execution session for the plot aggregator script.
+
+The aggregator script is rewritten by the LLM on every reflection, but most of its
+plots usually stay the same. Instead of starting a fresh interpreter per revision,
+the session keeps one child process alive for the whole plotting stage:
+
+- `numpy.load` is wrapped so plain .npy arrays are memory-mapped (copy-on-write),
+  pickled experiment data is served from its memory-mapped companion format when
+  available, and other pickled object arrays are unpickled once and handed out as
+  deep copies.
+- Each top-level ``try`` block that saves a figure is treated as a plot block and
+  fingerprinted by its own source plus the source of everything that runs before
+  it. A block whose fingerprint and output files are unchanged since the previous
+  run is skipped and its captured output replayed, so unchanged figures keep their
+  bytes (and any memoized reviews of them stay valid).
+"""
+
+import ast
+import copy
+import hashlib
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from multiprocessing import Queue
+from multiprocessing.context import SpawnProcess
+from pathlib import Path
+from types import CodeType
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from ai_scientist.treesearch.utils.experiment_data import (
+    has_fresh_companion,
+    install_numpy_load_hook,
+)
+
+logger = logging.getLogger(__name__)
+
+FIGURES_DIR_NAME = "figures"
+
+_original_np_load = np.load
+_companion_np_load = np.load
+_pickled_array_cache: Dict[Tuple[Any, ...], Any] = {}
+_np_load_stats = {"mapped": 0, "cached": 0, "loaded": 0}
+
+
+def _cached_np_load(file: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    if (
+        args
+        or kwargs.get("mmap_mode") is not None
+        or not isinstance(file, (str, os.PathLike))
+        or not os.fspath(file).endswith(".npy")
+    ):
+        return _original_np_load(file, *args, **kwargs)
+    path = os.path.abspath(os.fspath(file))
+    if kwargs.get("allow_pickle") and has_fresh_companion(path):
+        # Memory-mapped companion of a pickled experiment_data.npy; cheap to rebuild.
+        _np_load_stats["mapped"] += 1
+        return _companion_np_load(path, **kwargs)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns, tuple(sorted(kwargs.items())))
+    if key in _pickled_array_cache:
+        _np_load_stats["cached"] += 1
+        return copy.deepcopy(_pickled_array_cache[key])
+    try:
+        mapped = _original_np_load(path, mmap_mode="c", **kwargs)
+        _np_load_stats["mapped"] += 1
+        return mapped
+    except ValueError:
+        # Object arrays (e.g. experiment_data.npy dicts) cannot be memory-mapped; the
+        # companion-aware load writes a companion for large ones.
+        loaded = _companion_np_load(path, **kwargs)
+    _np_load_stats["loaded"] += 1
+    if not has_fresh_companion(path):
+        _pickled_array_cache[key] = loaded
+    return copy.deepcopy(loaded)
+
+
+@dataclass(frozen=True)
+class ScriptUnit:
+    """A top-level statement of the aggregator script, compiled for separate execution."""
+
+    code: CodeType
+    fingerprint: Optional[str]
+
+
+# Method calls that change their receiver in place. `x.append(...)` inside a plot block
+# writes `x` just like an assignment would.
+_MUTATING_METHODS = frozenset(
+    {
+        "__delitem__",
+        "__setitem__",
+        "add",
+        "append",
+        "clear",
+        "difference_update",
+        "discard",
+        "extend",
+        "fill",
+        "insert",
+        "intersection_update",
+        "itemset",
+        "pop",
+        "popitem",
+        "put",
+        "remove",
+        "resize",
+        "reverse",
+        "setdefault",
+        "setflags",
+        "sort",
+        "symmetric_difference_update",
+        "update",
+    }
+)
+
+
+def _root_name(node: ast.AST) -> Optional[str]:
+    while isinstance(node, (ast.Attribute, ast.Subscript)):
+        node = node.value
+    return node.id if isinstance(node, ast.Name) else None
+
+
+def _names(node: ast.AST) -> Tuple[Set[str], Set[str], Set[str]]:
+    """
+    Return the (bound, mutated, loaded) names of a statement. Mutations (item and
+    attribute stores, augmented assignments, in-place method calls) read the old
+    value, so unlike a rebinding they never hide an earlier write from later code.
+    """
+    bound: Set[str] = set()
+    mutated: Set[str] = set()
+    loaded: Set[str] = set()
+    for child in ast.walk(node):
+        root: Optional[str] = None
+        if isinstance(child, ast.Name):
+            (bound if isinstance(child.ctx, ast.Store) else loaded).add(child.id)
+        elif isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(child.name)
+        elif isinstance(child, (ast.Import, ast.ImportFrom)):
+            bound.update((alias.asname or alias.name).split(".")[0] for alias in child.names)
+        elif isinstance(child, (ast.Attribute, ast.Subscript)) and isinstance(
+            child.ctx, (ast.Store, ast.Del)
+        ):
+            root = _root_name(child.value)
+        elif isinstance(child, ast.AugAssign):
+            root = _root_name(child.target)
+        elif isinstance(child, ast.Call) and isinstance(child.func, ast.Attribute):
+            if child.func.attr in _MUTATING_METHODS or any(
+                keyword.arg == "inplace" for keyword in child.keywords
+            ):
+                root = _root_name(child.func.value)
+        if root is not None:
+            mutated.add(root)
+    return bound, mutated, loaded
+
+
+def _saves_figure(node: ast.AST) -> bool:
+    return any(
+        isinstance(child, ast.Call)
+        and isinstance(child.func, ast.Attribute)
+        and child.func.attr == "savefig"
+        for child in ast.walk(node)
+    )
+
+
+def plan_script_units(source: str, filename: str) -> List[ScriptUnit]:
+    """
+    Split a script into top-level units. Plot blocks get a fingerprint; every other
+    statement (imports, data loading, helpers) runs unconditionally and feeds into the
+    fingerprints of the plot blocks after it.
+
+    A plot block is only skippable when no later statement reads a name it assigns or
+    mutates, so skipping it can never leave later code without a variable (or an
+    update to one) it expects.
+    """
+    tree = ast.parse(source, filename=filename)
+    name_sets = [_names(stmt) for stmt in tree.body]
+    free_later: List[Set[str]] = [set() for _ in tree.body]
+    running: Set[str] = set()
+    for idx in range(len(tree.body) - 1, -1, -1):
+        free_later[idx] = set(running)
+        bound, mutated, loaded = name_sets[idx]
+        running |= (loaded - bound) | mutated
+
+    units: List[ScriptUnit] = []
+    context = hashlib.sha256()
+    for idx, stmt in enumerate(tree.body):
+        module = ast.Module(body=[stmt], type_ignores=[])
+        code = compile(module, filename, "exec")
+        segment = ast.get_source_segment(source, stmt) or ast.dump(stmt)
+        bound, mutated, _ = name_sets[idx]
+        writes = bound | mutated
+        if isinstance(stmt, ast.Try) and _saves_figure(stmt) and not writes & free_later[idx]:
+            block_hash = context.copy()
+            block_hash.update(segment.encode("utf-8"))
+            units.append(ScriptUnit(code=code, fingerprint=block_hash.hexdigest()))
+        else:
+            context.update(segment.encode("utf-8"))
+            context.update(b"\0")
+            units.append(ScriptUnit(code=code, fingerprint=None))
+    return units
+
+
+def _snapshot(directory: Path) -> Dict[str, Tuple[int, int]]:
+    if not directory.is_dir():
+        return {}
+    snapshot: Dict[str, Tuple[int, int]] = {}
+    for path in directory.rglob("*"):
+        if path.is_file():
+            stat = path.stat()
+            snapshot[str(path.relative_to(directory))] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+@dataclass
+class _RenderedBlock:
+    outputs: Dict[str, Tuple[int, int]]
+    output_text: str
+
+
+@dataclass
+class _SessionState:
+    blocks: Dict[str, _RenderedBlock] = field(default_factory=dict)
+
+
+def _reset_plotting_state() -> None:
+    pyplot = sys.modules.get("matplotlib.pyplot")
+    if pyplot is not None:
+        pyplot.close("all")
+    matplotlib = sys.modules.get("matplotlib")
+    if matplotlib is not None:
+        matplotlib.rcdefaults()
+
+
+def _execute_script(working_dir: Path, script_name: str, state: _SessionState) -> Dict[str, Any]:
+    started = time.monotonic()
+    os.chdir(working_dir)
+    figures_dir = working_dir / FIGURES_DIR_NAME
+    script_path = working_dir / script_name
+    output = io.StringIO()
+    rendered: Dict[str, _RenderedBlock] = {}
+    plot_blocks = 0
+    skipped = 0
+    succeeded = True
+    loads_before = dict(_np_load_stats)
+    _reset_plotting_state()
+    namespace: Dict[str, Any] = {"__name__": "__main__", "__file__": str(script_path)}
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            units = plan_script_units(script_path.read_text(), str(script_path))
+            for unit in units:
+                if unit.fingerprint is None:
+                    exec(unit.code, namespace)
+                    continue
+                plot_blocks += 1
+                previous = state.blocks.get(unit.fingerprint)
+                current = _snapshot(figures_dir)
+                if (
+                    previous is not None
+                    and previous.outputs
+                    and all(current.get(name) == meta for name, meta in previous.outputs.items())
+                ):
+                    output.write(previous.output_text)
+                    rendered[unit.fingerprint] = previous
+                    skipped += 1
+                    continue
+                block_output = io.StringIO()
+                with redirect_stdout(block_output), redirect_stderr(block_output):
+                    exec(unit.code, namespace)
+                output.write(block_output.getvalue())
+                after = _snapshot(figures_dir)
+                rendered[unit.fingerprint] = _RenderedBlock(
+                    outputs={
+                        name: meta for name, meta in after.items() if current.get(name) != meta
+                    },
+                    output_text=block_output.getvalue(),
+                )
+        except SystemExit as exc:
+            succeeded = exc.code in (None, 0)
+        except BaseException as exc:
+            succeeded = False
+            tb = exc.__traceback__.tb_next if exc.__traceback__ is not None else None
+            output.write("".join(traceback.format_exception(type(exc), exc, tb)))
+        finally:
+            _reset_plotting_state()
+
+    removed: List[str] = []
+    if succeeded:
+        claimed = {name for block in rendered.values() for name in block.outputs}
+        for fingerprint, block in state.blocks.items():
+            if fingerprint in rendered:
+                continue
+            for name in block.outputs:
+                stale = figures_dir / name
+                if name not in claimed and stale.is_file():
+                    stale.unlink()
+                    removed.append(name)
+        state.blocks = rendered
+    return {
+        "output": output.getvalue(),
+        "succeeded": succeeded,
+        "duration_s": time.monotonic() - started,
+        "plot_blocks": plot_blocks,
+        "skipped_blocks": skipped,
+        "removed_outputs": removed,
+        "npy_loads": {key: _np_load_stats[key] - loads_before[key] for key in _np_load_stats},
+    }
+
+
+def _aggregator_session_loop(*, working_dir: str, request_q: Queue, result_q: Queue) -> None:
+    """Module-level multiprocessing target; runs aggregator scripts until it receives None."""
+    global _companion_np_load
+    install_numpy_load_hook()
+    _companion_np_load = np.load
+    np.load = _cached_np_load
+    sys.path.append(working_dir)
+    state = _SessionState()
+    while True:
+        script_name = request_q.get()
+        if script_name is None:
+            return
+        result_q.put(_execute_script(Path(working_dir), script_name, state))
+
+
+@dataclass(frozen=True)
+class AggregatorRunResult:
+    output: str
+    succeeded: bool
+    duration_s: float
+    plot_blocks: int
+    skipped_blocks: int
+    removed_outputs: Tuple[str, ...]
+    npy_loads: Dict[str, int]
+
+
+class AggregatorSession:
+    """Runs successive versions of the aggregator script in one long-lived child process."""
+
+    def __init__(self, working_dir: str | Path) -> None:
+        self.working_dir = Path(working_dir).resolve()
+        self.mp_context = multiprocessing.get_context("spawn")
+        self.process: SpawnProcess | None = None
+        self.request_q: Queue
+        self.result_q: Queue
+
+    def _start(self) -> None:
+        self.request_q = self.mp_context.Queue()
+        self.result_q = self.mp_context.Queue()
+        self.process = self.mp_context.Process(
+            target=_aggregator_session_loop,
+            kwargs=dict(
+                working_dir=str(self.working_dir),
+                request_q=self.request_q,
+                result_q=self.result_q,
+            ),
+            daemon=True,
+        )
+        self.process.start()
+        logger.debug(f"Aggregator session started (pid={self.process.pid})")
+
+    def run(self, script_name: str) -> AggregatorRunResult:
+        """
+        Execute `script_name` (relative to the working directory) in the session.
+        Raises RuntimeError if the child process dies; the next call starts a new one.
+        """
+        if self.process is None or not self.process.is_alive():
+            self.close()
+            self._start()
+        assert self.process is not None
+        self.request_q.put(script_name)
+        while True:
+            try:
+                result = self.result_q.get(timeout=1.0)
+                break
+            except queue.Empty:
+                if not self.process.is_alive():
+                    exitcode = self.process.exitcode
+                    self.close()
+                    raise RuntimeError(
+                        f"Aggregator session process exited unexpectedly (exit code {exitcode})"
+                    ) from None
+        return AggregatorRunResult(
+            output=result["output"],
+            succeeded=result["succeeded"],
+            duration_s=result["duration_s"],
+            plot_blocks=result["plot_blocks"],
+            skipped_blocks=result["skipped_blocks"],
+            removed_outputs=tuple(result["removed_outputs"]),
+            npy_loads=result["npy_loads"],
+        )
+
+    def close(self) -> None:
+        if self.process is None:
+            return
+        if self.process.is_alive():
+            self.request_q.put(None)
+            self.process.join(timeout=5)
+        if self.process.exitcode is None:
+            self.process.kill()
+            self.process.join(timeout=2)
+        self.process.close()
+        self.process = None
@@ -2,22 +2,60 @@
 Collect and publish research pipeline artifacts.
 """
 
+import hashlib
+import json
 import logging
-import shutil
-import tempfile
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Literal
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import Any, Literal
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
 
 import boto3
 import magic
 import psycopg2
+from botocore.client import BaseClient
 
 from ai_scientist.telemetry.event_persistence import _parse_database_url
 
 logger = logging.getLogger(__name__)
 
+# S3 requires parts of at least 5 MiB (except the last) and at most 10,000 parts per
+# upload, so 32 MiB parts cover archives up to ~320 GB.
+MULTIPART_PART_SIZE = 32 * 1024 * 1024
+MAX_PARALLEL_PARTS = 4
+ARCHIVE_CONTENT_TYPE = "application/zip"
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Re-deflating these only burns CPU, so they are stored as-is inside archives.
+ALREADY_COMPRESSED_SUFFIXES = frozenset(
+    {
+        ".7z",
+        ".bz2",
+        ".gif",
+        ".gz",
+        ".jpeg",
+        ".jpg",
+        ".mp4",
+        ".npz",
+        ".parquet",
+        ".pdf",
+        ".png",
+        ".pt",
+        ".pth",
+        ".safetensors",
+        ".tgz",
+        ".webp",
+        ".whl",
+        ".xz",
+        ".zip",
+        ".zst",
+    }
+)
+
 
 @dataclass(frozen=True)
 class ArtifactUploadRequest:
@@ -40,6 +78,130 @@ class ArtifactSpec:
     exclude_dir_names: tuple[str, ...] = tuple()
 
 
+@dataclass(frozen=True)
+class ArchiveEntry:
+    """A file to place in a directory archive."""
+
+    path: Path
+    arcname: str
+    size: int
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class ArtifactUploadStats:
+    """Timing and resource usage of a single artifact upload."""
+
+    s3_key: str
+    duration_s: float
+    uploaded_bytes: int
+    files_total: int
+    files_stored_uncompressed: int
+    peak_buffered_bytes: int
+    temp_disk_bytes: int
+    skipped_unchanged: bool
+
+    def describe(self) -> str:
+        if self.skipped_unchanged:
+            return (
+                f"{self.s3_key}: unchanged since last upload ({self.files_total} files), "
+                f"skipped after {self.duration_s:.2f}s"
+            )
+        return (
+            f"{self.s3_key}: {self.uploaded_bytes / 1e6:.1f} MB in {self.duration_s:.2f}s "
+            f"({self.files_total} files, {self.files_stored_uncompressed} stored uncompressed); "
+            f"peak buffered {self.peak_buffered_bytes / 1e6:.1f} MB, "
+            f"temp disk {self.temp_disk_bytes / 1e6:.1f} MB"
+        )
+
+
+class _MultipartUploadWriter:
+    """
+    Write-only file object that feeds an S3 multipart upload.
+
+    Bytes are buffered until a full part is available, then uploaded on a thread pool
+    while the caller keeps writing. At most `max_parallel_parts` parts are in flight,
+    which bounds memory to roughly (max_parallel_parts + 1) * part_size.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: BaseClient,
+        bucket_name: str,
+        s3_key: str,
+        upload_id: str,
+        executor: ThreadPoolExecutor,
+        part_size: int,
+        max_parallel_parts: int,
+    ) -> None:
+        self._client = client
+        self._bucket_name = bucket_name
+        self._s3_key = s3_key
+        self._upload_id = upload_id
+        self._executor = executor
+        self._part_size = part_size
+        self._slots = threading.BoundedSemaphore(max_parallel_parts)
+        self._buffer = bytearray()
+        self._futures: list[Future[dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._in_flight_bytes = 0
+        self.bytes_written = 0
+        self.peak_buffered_bytes = 0
+
+    def write(self, data: bytes) -> int:
+        self._buffer += data
+        self.bytes_written += len(data)
+        self._record_buffered()
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit(part=part)
+        return len(data)
+
+    def flush(self) -> None:
+        return None
+
+    def finish(self) -> list[dict[str, Any]]:
+        """Upload the trailing partial part and wait for all parts to complete."""
+        if self._buffer or not self._futures:
+            self._submit(part=bytes(self._buffer))
+            self._buffer.clear()
+        return [future.result() for future in self._futures]
+
+    def _record_buffered(self) -> None:
+        with self._lock:
+            buffered = len(self._buffer) + self._in_flight_bytes
+            self.peak_buffered_bytes = max(self.peak_buffered_bytes, buffered)
+
+    def _submit(self, *, part: bytes) -> None:
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                future.result()
+        self._slots.acquire()
+        with self._lock:
+            self._in_flight_bytes += len(part)
+        part_number = len(self._futures) + 1
+        self._futures.append(
+            self._executor.submit(self._upload_part, part_number=part_number, part=part)
+        )
+
+    def _upload_part(self, *, part_number: int, part: bytes) -> dict[str, Any]:
+        try:
+            response = self._client.upload_part(
+                Bucket=self._bucket_name,
+                Key=self._s3_key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=part,
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+        finally:
+            with self._lock:
+                self._in_flight_bytes -= len(part)
+            self._slots.release()
+
+
 class S3ArtifactUploader:
     def __init__(
         self,
@@ -48,6 +210,9 @@ class S3ArtifactUploader:
         region: str,
         aws_access_key_id: str,
         aws_secret_access_key: str,
+        endpoint_url: str | None = None,
+        part_size: int = MULTIPART_PART_SIZE,
+        max_parallel_parts: int = MAX_PARALLEL_PARTS,
     ) -> None:
         self._bucket_name = bucket_name
         self._client = boto3.client(
@@ -55,7 +220,14 @@ class S3ArtifactUploader:
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             region_name=region,
+            endpoint_url=endpoint_url,
         )
+        self._part_size = part_size
+        self._max_parallel_parts = max_parallel_parts
+        self._part_executor = ThreadPoolExecutor(
+            max_workers=max_parallel_parts, thread_name_prefix="s3-part"
+        )
+        self._manifests: dict[str, dict[str, dict[str, Any]]] = {}
         self._detector: magic.Magic | None
         try:
             self._detector = magic.Magic(mime=True)
@@ -65,16 +237,17 @@ class S3ArtifactUploader:
     def upload(self, *, request: ArtifactUploadRequest, run_id: str) -> tuple[str, str, int]:
         file_size = request.local_path.stat().st_size
         content_type = self._detect_content_type(path=request.local_path)
-        s3_key = f"research-pipeline/{run_id}/{request.artifact_type}/{request.filename}"
-        metadata = {
-            "run_id": run_id,
-            "artifact_type": request.artifact_type,
-            "source_path": str(request.source_path),
-        }
-        sanitized_metadata = {
-            key: self._sanitize_ascii(value=value) for key, value in metadata.items()
+        s3_key = self._build_key(
+            run_id=run_id, artifact_type=request.artifact_type, filename=request.filename
+        )
+        extra_args = {
+            "ContentType": content_type,
+            "Metadata": self._build_metadata(
+                run_id=run_id,
+                artifact_type=request.artifact_type,
+                source_path=request.source_path,
+            ),
         }
-        extra_args = {"ContentType": content_type, "Metadata": sanitized_metadata}
         self._client.upload_file(
             Filename=str(request.local_path),
             Bucket=self._bucket_name,
@@ -83,6 +256,174 @@ class S3ArtifactUploader:
         )
         return s3_key, content_type, file_size
 
+    def upload_directory_archive(
+        self,
+        *,
+        run_id: str,
+        artifact_type: str,
+        filename: str,
+        source_dir: Path,
+        entries: list[ArchiveEntry],
+    ) -> ArtifactUploadStats:
+        """
+        Zip `entries` straight into an S3 multipart upload, without a local archive file.
+
+        A manifest of per-file content hashes is stored next to the archive. When the
+        directory content matches the previous manifest for the same key, the upload is
+        skipped and the returned stats have `skipped_unchanged` set.
+        """
+        started = time.monotonic()
+        s3_key = self._build_key(run_id=run_id, artifact_type=artifact_type, filename=filename)
+        previous = self._load_manifest(s3_key=s3_key)
+        if previous is not None and self._matches_manifest(entries=entries, manifest=previous):
+            return ArtifactUploadStats(
+                s3_key=s3_key,
+                duration_s=time.monotonic() - started,
+                uploaded_bytes=0,
+                files_total=len(entries),
+                files_stored_uncompressed=0,
+                peak_buffered_bytes=0,
+                temp_disk_bytes=0,
+                skipped_unchanged=True,
+            )
+
+        upload_id = self._client.create_multipart_upload(
+            Bucket=self._bucket_name,
+            Key=s3_key,
+            ContentType=ARCHIVE_CONTENT_TYPE,
+            Metadata=self._build_metadata(
+                run_id=run_id, artifact_type=artifact_type, source_path=source_dir
+            ),
+        )["UploadId"]
+        writer = _MultipartUploadWriter(
+            client=self._client,
+            bucket_name=self._bucket_name,
+            s3_key=s3_key,
+            upload_id=upload_id,
+            executor=self._part_executor,
+            part_size=self._part_size,
+            max_parallel_parts=self._max_parallel_parts,
+        )
+        manifest: dict[str, dict[str, Any]] = {}
+        stored = 0
+        try:
+            with ZipFile(writer, mode="w") as archive:  # type: ignore[arg-type]
+                for entry in entries:
+                    compress_type = self._compression_for(path=entry.path)
+                    stored += compress_type == ZIP_STORED
+                    digest = self._write_archive_member(
+                        archive=archive, entry=entry, compress_type=compress_type
+                    )
+                    manifest[entry.arcname] = {
+                        "size": entry.size,
+                        "mtime_ns": entry.mtime_ns,
+                        "sha256": digest,
+                    }
+            parts = writer.finish()
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket_name,
+                Key=s3_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except BaseException:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket_name, Key=s3_key, UploadId=upload_id
+            )
+            raise
+        self._store_manifest(s3_key=s3_key, manifest=manifest)
+        return ArtifactUploadStats(
+            s3_key=s3_key,
+            duration_s=time.monotonic() - started,
+            uploaded_bytes=writer.bytes_written,
+            files_total=len(entries),
+            files_stored_uncompressed=stored,
+            peak_buffered_bytes=writer.peak_buffered_bytes,
+            temp_disk_bytes=0,
+            skipped_unchanged=False,
+        )
+
+    def close(self) -> None:
+        self._part_executor.shutdown(wait=True)
+
+    def _build_key(self, *, run_id: str, artifact_type: str, filename: str) -> str:
+        return f"research-pipeline/{run_id}/{artifact_type}/{filename}"
+
+    def _build_metadata(
+        self, *, run_id: str, artifact_type: str, source_path: Path
+    ) -> dict[str, str]:
+        metadata = {
+            "run_id": run_id,
+            "artifact_type": artifact_type,
+            "source_path": str(source_path),
+        }
+        return {key: self._sanitize_ascii(value=value) for key, value in metadata.items()}
+
+    def _compression_for(self, *, path: Path) -> int:
+        return ZIP_STORED if path.suffix.lower() in ALREADY_COMPRESSED_SUFFIXES else ZIP_DEFLATED
+
+    def _write_archive_member(
+        self, *, archive: ZipFile, entry: ArchiveEntry, compress_type: int
+    ) -> str:
+        info = ZipInfo.from_file(entry.path, arcname=entry.arcname)
+        info.compress_type = compress_type
+        digest = hashlib.sha256()
+        with entry.path.open("rb") as source, archive.open(info, mode="w") as target:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+                target.write(chunk)
+        return digest.hexdigest()
+
+    def _matches_manifest(
+        self, *, entries: list[ArchiveEntry], manifest: dict[str, dict[str, Any]]
+    ) -> bool:
+        """Compare against a previous manifest, re-hashing only files whose size or mtime moved."""
+        if set(manifest) != {entry.arcname for entry in entries}:
+            return False
+        for entry in entries:
+            recorded = manifest[entry.arcname]
+            if recorded.get("size") != entry.size:
+                return False
+            if recorded.get("mtime_ns") == entry.mtime_ns:
+                continue
+            if self._hash_file(path=entry.path) != recorded.get("sha256"):
+                return False
+        return True
+
+    def _hash_file(self, *, path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as source:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _load_manifest(self, *, s3_key: str) -> dict[str, dict[str, Any]] | None:
+        cached = self._manifests.get(s3_key)
+        if cached is not None:
+            return cached
+        try:
+            response = self._client.get_object(
+                Bucket=self._bucket_name, Key=f"{s3_key}{MANIFEST_SUFFIX}"
+            )
+            loaded = json.loads(response["Body"].read())
+        except Exception:
+            logger.debug("No previous artifact manifest for %s", s3_key)
+            return None
+        files = loaded.get("files") if isinstance(loaded, dict) else None
+        return files if isinstance(files, dict) else None
+
+    def _store_manifest(self, *, s3_key: str, manifest: dict[str, dict[str, Any]]) -> None:
+        self._manifests[s3_key] = manifest
+        try:
+            self._client.put_object(
+                Bucket=self._bucket_name,
+                Key=f"{s3_key}{MANIFEST_SUFFIX}",
+                Body=json.dumps({"archive_key": s3_key, "files": manifest}).encode("utf-8"),
+                ContentType="application/json",
+            )
+        except Exception:
+            logger.exception("Failed to store artifact manifest for %s", s3_key)
+
     def _detect_content_type(self, *, path: Path) -> str:
         try:
             if self._detector is not None:
@@ -155,27 +496,31 @@ class ArtifactPublisher:
         aws_region: str,
         aws_s3_bucket_name: str,
         database_url: str,
+        aws_endpoint_url: str | None = None,
     ) -> None:
         self._run_id = run_id
-        self._temp_dir = Path(tempfile.mkdtemp(prefix="rp-artifacts-"))
         self._uploader = S3ArtifactUploader(
             bucket_name=aws_s3_bucket_name,
             region=aws_region,
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
+            endpoint_url=aws_endpoint_url,
         )
         self._repository = ArtifactRepository(database_url=database_url)
 
-    def publish(self, *, spec: ArtifactSpec) -> None:
-        request = self._build_request(spec=spec)
+    def publish(self, *, spec: ArtifactSpec) -> ArtifactUploadStats | None:
+        if spec.packaging == "zip":
+            return self._publish_directory_archive(spec=spec)
+        request = self._build_file_request(spec=spec)
         if request is None:
             logger.info(
                 "Skipping artifact %s because nothing was found at %s",
                 spec.artifact_type,
                 spec.path,
             )
-            return
+            return None
         logger.info("Uploading %s artifact from %s", spec.artifact_type, spec.path)
+        started = time.monotonic()
         s3_key, file_type, file_size = self._uploader.upload(request=request, run_id=self._run_id)
         self._repository.insert(
             run_id=self._run_id,
@@ -186,44 +531,59 @@ class ArtifactPublisher:
             s3_key=s3_key,
             source_path=str(request.source_path),
         )
+        stats = ArtifactUploadStats(
+            s3_key=s3_key,
+            duration_s=time.monotonic() - started,
+            uploaded_bytes=file_size,
+            files_total=1,
+            files_stored_uncompressed=0,
+            peak_buffered_bytes=0,
+            temp_disk_bytes=0,
+            skipped_unchanged=False,
+        )
+        logger.info("Uploaded %s", stats.describe())
+        return stats
 
     def close(self) -> None:
-        shutil.rmtree(self._temp_dir, ignore_errors=True)
-
-    def _build_request(self, *, spec: ArtifactSpec) -> ArtifactUploadRequest | None:
-        if spec.packaging == "zip":
-            return self._build_zip_request(spec=spec)
-        return self._build_file_request(spec=spec)
+        self._uploader.close()
 
-    def _build_zip_request(self, *, spec: ArtifactSpec) -> ArtifactUploadRequest | None:
+    def _publish_directory_archive(self, *, spec: ArtifactSpec) -> ArtifactUploadStats | None:
         source_dir = spec.path
         if not source_dir.exists() or not source_dir.is_dir():
             logger.warning("Zip source missing for artifact %s: %s", spec.artifact_type, source_dir)
             return None
-        exclude = set(spec.exclude_dir_names)
-        if not self._directory_has_files(target=source_dir, excluded=exclude):
+        entries = self._collect_archive_entries(
+            source_dir=source_dir, excluded=set(spec.exclude_dir_names)
+        )
+        if not entries:
+            logger.info(
+                "Skipping artifact %s because nothing was found at %s",
+                spec.artifact_type,
+                spec.path,
+            )
             return None
         archive_name = spec.archive_name or f"{source_dir.name}.zip"
-        archive_path = self._temp_dir / archive_name
-        files_added = 0
-        with ZipFile(archive_path, mode="w", compression=ZIP_DEFLATED) as archive:
-            for candidate in source_dir.rglob("*"):
-                if not candidate.is_file():
-                    continue
-                relative_path = candidate.relative_to(source_dir)
-                if self._is_excluded(relative_path=relative_path, excluded=exclude):
-                    continue
-                archive.write(candidate, arcname=str(relative_path))
-                files_added += 1
-        if files_added == 0:
-            archive_path.unlink(missing_ok=True)
-            return None
-        return ArtifactUploadRequest(
+        logger.info("Publishing %s archive from %s", spec.artifact_type, source_dir)
+        stats = self._uploader.upload_directory_archive(
+            run_id=self._run_id,
+            artifact_type=spec.artifact_type,
+            filename=archive_name,
+            source_dir=source_dir,
+            entries=entries,
+        )
+        logger.info("Uploaded %s", stats.describe())
+        if stats.skipped_unchanged:
+            return stats
+        self._repository.insert(
+            run_id=self._run_id,
             artifact_type=spec.artifact_type,
             filename=archive_name,
-            local_path=archive_path,
-            source_path=source_dir,
+            file_size=stats.uploaded_bytes,
+            file_type=ARCHIVE_CONTENT_TYPE,
+            s3_key=stats.s3_key,
+            source_path=str(source_dir),
         )
+        return stats
 
     def _build_file_request(self, *, spec: ArtifactSpec) -> ArtifactUploadRequest | None:
         file_path = spec.path
@@ -237,14 +597,33 @@ class ArtifactPublisher:
             source_path=file_path,
         )
 
-    def _directory_has_files(self, *, target: Path, excluded: set[str]) -> bool:
-        for candidate in target.rglob("*"):
-            if not candidate.is_file():
-                continue
-            relative_path = candidate.relative_to(target)
-            if not self._is_excluded(relative_path=relative_path, excluded=excluded):
-                return True
-        return False
+    def _collect_archive_entries(
+        self, *, source_dir: Path, excluded: set[str]
+    ) -> list[ArchiveEntry]:
+        """Walk `source_dir` once, pruning excluded directory names before descending."""
+        entries: list[ArchiveEntry] = []
+        for dirpath, dirnames, filenames in os.walk(source_dir):
+            dirnames[:] = sorted(name for name in dirnames if name not in excluded)
+            for filename in sorted(filenames):
+                path = Path(dirpath) / filename
+                relative_path = path.relative_to(source_dir)
+                if self._is_excluded(relative_path=relative_path, excluded=excluded):
+                    continue
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                if not path.is_file():
+                    continue
+                entries.append(
+                    ArchiveEntry(
+                        path=path,
+                        arcname=relative_path.as_posix(),
+                        size=stat.st_size,
+                        mtime_ns=stat.st_mtime_ns,
+                    )
+                )
+        return entries
 
     def _is_excluded(self, *, relative_path: Path, excluded: set[str]) -> bool:
         return any(part in excluded for part in relative_path.parts)
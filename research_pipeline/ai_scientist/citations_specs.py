@@ -21,6 +21,34 @@ class CitationSearchResponse(BaseModel):
     )
 
 
+class CitationQuery(BaseModel):
+    description: str = Field(
+        ...,
+        description="Purpose of the desired citation and the gap it fills.",
+    )
+    query: str = Field(
+        ...,
+        description="Semantic Scholar search query to find the desired paper.",
+    )
+
+
+class CitationSearchBatchResponse(BaseModel):
+    needs_more_citations: bool = Field(
+        ...,
+        description=(
+            "True if more citations should be collected this round. "
+            "When False, leave queries empty."
+        ),
+    )
+    queries: List[CitationQuery] = Field(
+        default_factory=list,
+        description=(
+            "Independent citations still needed, each with its own search query. "
+            "Queries must target different papers (only populated when needs_more_citations=True)."
+        ),
+    )
+
+
 class CitationSelectionResponse(BaseModel):
     should_add: bool = Field(
         ...,
@@ -43,4 +71,5 @@ class CitationSelectionResponse(BaseModel):
 
 
 CITATION_SEARCH_SCHEMA = CitationSearchResponse
+CITATION_SEARCH_BATCH_SCHEMA = CitationSearchBatchResponse
 CITATION_SELECTION_SCHEMA = CitationSelectionResponse
@@ -6,13 +6,23 @@ This module provides:
 2. search_for_papers(): Individual paper search with rate limiting
 3. search_for_papers_batch(): Parallel search for multiple queries
 4. RateLimiter: Thread-safe rate limiting for API calls
+5. SearchResultCache: Persistent query -> results cache with TTL
+6. LocalSemanticScholarCorpus: File-backed stand-in for offline runs and benchmarks
 
 Key Features:
 - Intelligent rate limiting (0.9 req/sec without API key, 5 req/sec with key)
 - Thread-safe parallel search capability
 - Automatic backoff on API errors
+- Normalized, TTL-bounded on-disk result cache shared across rounds, runs and processes
 - Backward compatible with existing code
 
+Environment:
+    AI_SCIENTIST_S2_CACHE_DIR: cache directory (default: ~/.cache/ai_scientist/semantic_scholar)
+    AI_SCIENTIST_S2_CACHE_TTL_SECONDS: cache entry lifetime (default: 7 days)
+    AI_SCIENTIST_DISABLE_S2_CACHE: set to 1/true/yes to bypass the cache
+    AI_SCIENTIST_S2_LOCAL_CORPUS: path to a JSON list of papers served instead of the API
+    AI_SCIENTIST_S2_LOCAL_LATENCY_SECONDS: simulated per-request latency of the local corpus
+
 Example Usage:
     # Single search
     papers = search_for_papers("transformer attention", result_limit=10)
@@ -27,11 +37,15 @@ Example Usage:
 For more details, see: ai_scientist/tools/SEMANTIC_SCHOLAR_IMPROVEMENTS.md
 """
 
+import hashlib
+import json
 import logging
 import os
+import re
 import time
 import warnings
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, List, Optional
 
@@ -76,6 +90,214 @@ _rate_limiter_with_key = RateLimiter(calls_per_second=5.0)  # Conservative limit
 _rate_limiter_without_key = RateLimiter(calls_per_second=0.9)  # Slightly under 1/sec without key
 
 
+S2_PAPER_SEARCH_URL = "https://api.semanticscholar.org/graph/v1/paper/search"
+DEFAULT_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _env_flag(name: str) -> bool:
+    return os.getenv(name, "").lower() in {"1", "true", "yes"}
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a search query used for cache keys (case, punctuation, spacing)."""
+    return " ".join(re.sub(r"[^\w\s]", " ", query.lower()).split())
+
+
+class SearchResultCache:
+    """
+    Persistent query -> response cache stored as one JSON file per normalized key.
+
+    Entries older than `ttl_seconds` are treated as misses. Responses without papers are
+    not stored: the API returns them for transient failures too, and caching one would hide
+    the query's results for the whole TTL. Writes go through a temp file and an atomic
+    rename so concurrent writers never expose partial files.
+    """
+
+    def __init__(self, cache_dir: Path, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = Lock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(query: str, limit: int, fields: str) -> str:
+        raw = json.dumps(
+            {"query": normalize_query(query), "limit": int(limit), "fields": fields},
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, query: str, limit: int, fields: str) -> Optional[Dict[str, Any]]:
+        path = self._path(self.make_key(query, limit, fields))
+        payload: Optional[Dict[str, Any]] = None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            if time.time() - float(entry.get("stored_at", 0.0)) <= self.ttl_seconds:
+                payload = entry.get("response")
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            logger.debug(f"Ignoring unreadable Semantic Scholar cache entry {path}")
+        with self._lock:
+            if isinstance(payload, dict):
+                self.hits += 1
+                return payload
+            self.misses += 1
+        return None
+
+    def put(self, query: str, limit: int, fields: str, response: Dict[str, Any]) -> None:
+        if not response.get("data"):
+            return
+        path = self._path(self.make_key(query, limit, fields))
+        entry = {
+            "query": query,
+            "normalized_query": normalize_query(query),
+            "stored_at": time.time(),
+            "response": response,
+        }
+        tmp_path = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+        try:
+            tmp_path.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.debug(f"Failed to write Semantic Scholar cache entry {path}", exc_info=True)
+            tmp_path.unlink(missing_ok=True)
+
+
+class LocalSemanticScholarCorpus:
+    """
+    File-backed stand-in for the paper search endpoint.
+
+    The corpus file is a JSON list of paper records in the Semantic Scholar response
+    shape. Queries are answered by token overlap against title and abstract so that
+    citation gathering can be run and benchmarked without network access.
+    """
+
+    def __init__(self, corpus_path: Path, latency_seconds: float = 0.0):
+        self.corpus_path = corpus_path
+        self.latency_seconds = latency_seconds
+        loaded = json.loads(corpus_path.read_text(encoding="utf-8"))
+        papers = loaded.get("data", []) if isinstance(loaded, dict) else loaded
+        self.papers: List[Dict[str, Any]] = [p for p in papers if isinstance(p, dict)]
+        self._tokens = [
+            set(normalize_query(f"{p.get('title', '')} {p.get('abstract') or ''}").split())
+            for p in self.papers
+        ]
+
+    def search(self, query: str, limit: int, fields: str) -> Dict[str, Any]:
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        query_tokens = set(normalize_query(query).split())
+        scored = []
+        for paper, tokens in zip(self.papers, self._tokens):
+            score = len(query_tokens & tokens)
+            if score:
+                scored.append((score, paper.get("citationCount") or 0, paper))
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+        wanted_fields = set(fields.split(",")) | {"paperId"}
+        data = [
+            {key: value for key, value in paper.items() if key in wanted_fields}
+            for _, _, paper in scored[:limit]
+        ]
+        return {"total": len(scored), "offset": 0, "data": data}
+
+
+_cache_lock = Lock()
+_search_cache: Optional[SearchResultCache] = None
+_local_corpus: Optional[LocalSemanticScholarCorpus] = None
+
+
+def get_search_cache() -> Optional[SearchResultCache]:
+    """Return the process-wide result cache configured from the environment, if enabled."""
+    global _search_cache
+    if _env_flag("AI_SCIENTIST_DISABLE_S2_CACHE"):
+        return None
+    cache_dir = Path(
+        os.getenv("AI_SCIENTIST_S2_CACHE_DIR")
+        or Path.home() / ".cache" / "ai_scientist" / "semantic_scholar"
+    )
+    ttl_seconds = float(
+        os.getenv("AI_SCIENTIST_S2_CACHE_TTL_SECONDS", str(DEFAULT_CACHE_TTL_SECONDS))
+    )
+    with _cache_lock:
+        if (
+            _search_cache is None
+            or _search_cache.cache_dir != cache_dir
+            or _search_cache.ttl_seconds != ttl_seconds
+        ):
+            try:
+                _search_cache = SearchResultCache(cache_dir=cache_dir, ttl_seconds=ttl_seconds)
+            except OSError:
+                logger.warning(f"Semantic Scholar cache disabled; cannot create {cache_dir}")
+                return None
+        return _search_cache
+
+
+def get_local_corpus() -> Optional[LocalSemanticScholarCorpus]:
+    """Return the local stand-in corpus if AI_SCIENTIST_S2_LOCAL_CORPUS is set."""
+    global _local_corpus
+    corpus_path = os.getenv("AI_SCIENTIST_S2_LOCAL_CORPUS")
+    if not corpus_path:
+        return None
+    latency_seconds = float(os.getenv("AI_SCIENTIST_S2_LOCAL_LATENCY_SECONDS", "0"))
+    with _cache_lock:
+        if _local_corpus is None or _local_corpus.corpus_path != Path(corpus_path):
+            _local_corpus = LocalSemanticScholarCorpus(
+                Path(corpus_path), latency_seconds=latency_seconds
+            )
+        _local_corpus.latency_seconds = latency_seconds
+        return _local_corpus
+
+
+def fetch_paper_search(
+    query: str,
+    result_limit: int,
+    fields: str,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Run a paper search and return the raw response payload ({"total", "data", ...}).
+
+    Results are served from the persistent cache when possible; only misses wait on
+    the shared rate limiter and reach the API (or the local stand-in corpus).
+    """
+    cache = get_search_cache()
+    if cache is not None:
+        cached = cache.get(query, result_limit, fields)
+        if cached is not None:
+            logger.debug(f"Semantic Scholar cache hit for query: {query!r}")
+            return cached
+
+    api_key = os.getenv("S2_API_KEY")
+    rate_limiter = _rate_limiter_with_key if api_key else _rate_limiter_without_key
+    corpus = get_local_corpus()
+    if corpus is not None:
+        rate_limiter.wait()
+        payload = corpus.search(query, result_limit, fields)
+    else:
+        headers = {"X-API-KEY": api_key} if api_key else {}
+        rate_limiter.wait()
+        rsp = requests.get(
+            S2_PAPER_SEARCH_URL,
+            headers=headers,
+            params={"query": query, "limit": str(result_limit), "fields": fields},
+            timeout=timeout,
+        )
+        logger.debug(f"Response Status Code: {rsp.status_code}")
+        logger.debug(f"Response Content: {rsp.text[:500]}")
+        rsp.raise_for_status()
+        payload = rsp.json()
+
+    if cache is not None and isinstance(payload, dict):
+        cache.put(query, result_limit, fields, payload)
+    return payload if isinstance(payload, dict) else {}
+
+
 class SemanticScholarSearchTool(BaseTool):
     def __init__(
         self,
@@ -120,28 +342,11 @@ class SemanticScholarSearchTool(BaseTool):
         if not query:
             return None
 
-        headers = {}
-        has_api_key = bool(self.S2_API_KEY)
-        if self.S2_API_KEY:
-            headers["X-API-KEY"] = self.S2_API_KEY
-
-        # Use appropriate rate limiter
-        rate_limiter = _rate_limiter_with_key if has_api_key else _rate_limiter_without_key
-        rate_limiter.wait()
-
-        rsp = requests.get(
-            "https://api.semanticscholar.org/graph/v1/paper/search",
-            headers=headers,
-            params={
-                "query": query,
-                "limit": str(self.max_results),
-                "fields": "title,authors,venue,year,abstract,citationCount",
-            },
+        results = fetch_paper_search(
+            query,
+            result_limit=self.max_results,
+            fields="title,authors,venue,year,abstract,citationCount",
         )
-        logger.debug(f"Response Status Code: {rsp.status_code}")
-        logger.debug(f"Response Content: {rsp.text[:500]}")
-        rsp.raise_for_status()
-        results = rsp.json()
         total = results.get("total", 0)
         if total == 0:
             return None
@@ -167,42 +372,24 @@ Abstract: {paper.get("abstract", "No abstract available.")}"""
 
 @backoff.on_exception(backoff.expo, requests.exceptions.HTTPError, on_backoff=on_backoff)
 def search_for_papers(query: str, result_limit: int = 10) -> list[Dict[Any, Any]] | None:
-    S2_API_KEY = os.getenv("S2_API_KEY")
-    headers = {}
-    has_api_key = bool(S2_API_KEY)
-
-    if not has_api_key:
+    if not os.getenv("S2_API_KEY") and not os.getenv("AI_SCIENTIST_S2_LOCAL_CORPUS"):
         warnings.warn(
             "No Semantic Scholar API key found. Requests will be subject to stricter rate limits."
         )
-    else:
-        headers["X-API-KEY"] = S2_API_KEY
 
     if not query:
         return None
 
-    # Use appropriate rate limiter
-    rate_limiter = _rate_limiter_with_key if has_api_key else _rate_limiter_without_key
-    rate_limiter.wait()
-
-    rsp = requests.get(
-        "https://api.semanticscholar.org/graph/v1/paper/search",
-        headers=headers,
-        params={
-            "query": query,
-            "limit": str(result_limit),
-            "fields": "title,authors,venue,year,abstract,citationStyles,citationCount",
-        },
+    results = fetch_paper_search(
+        query,
+        result_limit=result_limit,
+        fields="title,authors,venue,year,abstract,citationStyles,citationCount",
     )
-    logger.debug(f"Response Status Code: {rsp.status_code}")
-    logger.debug(f"Response Content: {rsp.text[:500]}")
-    rsp.raise_for_status()
-    results = rsp.json()
-    total = results["total"]
+    total = results.get("total", 0)
     if not total:
         return None
 
-    papers = results["data"]
+    papers = results.get("data", [])
     return papers if isinstance(papers, list) else []
 
 
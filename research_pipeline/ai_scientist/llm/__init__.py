@@ -1,4 +1,5 @@
 from .llm import (
+    PROMPT_CACHE_BREAKPOINT,
     OutputType,
     PromptType,
     get_batch_responses_from_llm,
@@ -17,6 +18,7 @@ __all__ = [
     "get_structured_response_from_vlm",
     "PromptType",
     "OutputType",
+    "PROMPT_CACHE_BREAKPOINT",
     "query",
     "structured_query_with_schema",
 ]
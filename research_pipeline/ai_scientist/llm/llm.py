@@ -7,7 +7,7 @@ from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, System
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel
 
-from .token_tracker import TrackCostCallbackHandler
+from .token_tracker import TrackCostCallbackHandler, extract_model_name_and_provider
 
 logger = logging.getLogger("ai-scientist")
 
@@ -17,6 +17,16 @@ FunctionCallType = dict[str, Any]
 OutputType = str | FunctionCallType
 TStructured = TypeVar("TStructured", bound=BaseModel)
 
+# Key marking where the static part of a dict prompt ends. The sections before it are the
+# same for every call of a kind within a stage (role, task, instructions); the sections after
+# it change per call (memory, code, execution output). The static part is sent first so the
+# provider can serve it from its prompt cache.
+PROMPT_CACHE_BREAKPOINT = "__prompt_cache_breakpoint__"
+
+# Providers whose LangChain integration needs an explicit cache_control hint; the others
+# (OpenAI, Gemini, DeepSeek, ...) cache repeated prompt prefixes automatically
+_CACHE_CONTROL_PROVIDERS = frozenset({"anthropic"})
+
 
 def get_batch_responses_from_llm(
     prompt: str,
@@ -151,6 +161,8 @@ def compile_prompt_to_md(
                 out: list[str] = []
                 header_prefix = "#" * _header_depth
                 for k, v in prompt.items():
+                    if k == PROMPT_CACHE_BREAKPOINT:
+                        continue
                     out.append(f"{header_prefix} {k}\n")
                     compiled_v = compile_prompt_to_md(prompt=v, _header_depth=_header_depth + 1)
                     if isinstance(compiled_v, str):
@@ -173,6 +185,37 @@ def compile_prompt_to_md(
         raise
 
 
+def _split_at_cache_breakpoint(
+    prompt: PromptType,
+) -> tuple[dict[str, Any], dict[str, Any]] | None:
+    """The static and volatile sections of a dict prompt, or None if it has no breakpoint."""
+    if not isinstance(prompt, dict) or PROMPT_CACHE_BREAKPOINT not in prompt:
+        return None
+    keys = list(prompt)
+    split = keys.index(PROMPT_CACHE_BREAKPOINT)
+    return (
+        {k: prompt[k] for k in keys[:split]},
+        {k: prompt[k] for k in keys[split + 1 :]},
+    )
+
+
+def _compile_system_message(*, system_message: PromptType, model: str) -> SystemMessage:
+    """
+    Compile `system_message` into a SystemMessage, marking its static part as cacheable for
+    providers that take hints. The text is the same as compile_prompt_to_md's either way.
+    """
+    parts = _split_at_cache_breakpoint(system_message)
+    if parts is None or extract_model_name_and_provider(model)[1] not in _CACHE_CONTROL_PROVIDERS:
+        return SystemMessage(content=str(compile_prompt_to_md(prompt=system_message)))
+    static, volatile = (str(compile_prompt_to_md(prompt=part)) for part in parts)
+    blocks: list[str | dict[Any, Any]] = [
+        {"type": "text", "text": static, "cache_control": {"type": "ephemeral"}}
+    ]
+    if volatile:
+        blocks.append({"type": "text", "text": "\n" + volatile})
+    return SystemMessage(content=blocks)
+
+
 def get_structured_response_from_llm(
     *,
     prompt: str,
@@ -188,11 +231,9 @@ def get_structured_response_from_llm(
 
     new_msg_history = msg_history + [HumanMessage(content=prompt)]
 
-    combined_system = system_message
     messages: list[BaseMessage] = []
-    if combined_system is not None:
-        compiled_system = compile_prompt_to_md(prompt=combined_system)
-        messages.append(SystemMessage(content=str(compiled_system)))
+    if system_message is not None:
+        messages.append(_compile_system_message(system_message=system_message, model=model))
     messages.extend(new_msg_history)
 
     chat = init_chat_model(
@@ -225,11 +266,11 @@ def _build_messages_for_query(
     *,
     system_message: PromptType | None,
     user_message: PromptType | None = None,
+    model: str,
 ) -> list[BaseMessage]:
     messages: list[BaseMessage] = []
     if system_message is not None:
-        compiled_system = compile_prompt_to_md(prompt=system_message)
-        messages.append(SystemMessage(content=str(compiled_system)))
+        messages.append(_compile_system_message(system_message=system_message, model=model))
     if user_message is not None:
         compiled_user = compile_prompt_to_md(prompt=user_message)
         # Normalize compiled_user to types accepted by HumanMessage:
@@ -259,6 +300,7 @@ def _invoke_langchain_query(
     messages = _build_messages_for_query(
         system_message=system_message,
         user_message=user_message,
+        model=model,
     )
     logger.debug("LLM _invoke_langchain_query - model=%s, temperature=%s", model, temperature)
     logger.debug("LLM _invoke_langchain_query - compiled messages:")
@@ -292,6 +334,7 @@ def _invoke_structured_langchain_query(
     messages = _build_messages_for_query(
         system_message=system_message,
         user_message=user_message,
+        model=model,
     )
     logger.debug(
         "LLM _invoke_structured_langchain_query - model=%s, temperature=%s",
@@ -337,6 +380,7 @@ def structured_query_with_schema(
     messages = _build_messages_for_query(
         system_message=system_message,
         user_message=user_message,
+        model=model,
     )
     chat = init_chat_model(
         model=model,
@@ -1,10 +1,11 @@
 import csv
 import logging
 import os
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID
 
 import psycopg2
@@ -20,6 +21,47 @@ database_url = os.environ.get("DATABASE_PUBLIC_URL")
 RUN_ID = os.environ.get("RUN_ID")
 pg_config = _parse_database_url(database_url) if database_url else None
 
+# Called with (model, input_tokens, output_tokens, cached_input_tokens) after every tracked
+# LLM call; cached_input_tokens is the part of input_tokens the provider read from its cache
+UsageListener = Callable[[str, int, int, int], None]
+_usage_listeners: list[UsageListener] = []
+
+# Speculative code generation records usage from background threads of the same process
+_file_cost_track_lock = threading.Lock()
+_FILE_COST_TRACK_COLUMNS = [
+    "provider",
+    "model_name",
+    "input_tokens",
+    "output_tokens",
+    "created_at",
+    "cached_input_tokens",
+]
+
+
+def add_usage_listener(listener: UsageListener) -> None:
+    """Register `listener` to be told about the token usage of each LLM call in this process."""
+    if listener not in _usage_listeners:
+        _usage_listeners.append(listener)
+
+
+def _notify_usage_listeners(
+    model: str, input_tokens: int, output_tokens: int, cached_input_tokens: int
+) -> None:
+    for listener in _usage_listeners:
+        try:
+            listener(model, input_tokens, output_tokens, cached_input_tokens)
+        except Exception:
+            logging.warning("Token usage listener failed", exc_info=True)
+
+
+def _cached_input_tokens(ai_message: AIMessage) -> int:
+    """Input tokens served from the provider's prompt cache, as LangChain reports them."""
+    usage_metadata = ai_message.usage_metadata
+    if not usage_metadata:
+        return 0
+    details = usage_metadata.get("input_token_details") or {}
+    return int(details.get("cache_read", 0) or 0)
+
 
 def _should_use_db_tracking(run_id: str | None) -> bool:
     return run_id is not None and pg_config is not None
@@ -30,6 +72,7 @@ def save_cost_track(
     *,
     input_tokens: int | None = None,
     output_tokens: int | None = None,
+    cached_input_tokens: int | None = None,
     ai_message: AIMessage | None = None,
     run_id: str | None = None,
 ) -> None:
@@ -43,6 +86,9 @@ def save_cost_track(
             input_tokens = int(usage_metadata.get("input_tokens", 0) or 0)
         if output_tokens is None and usage_metadata:
             output_tokens = int(usage_metadata.get("output_tokens", 0) or 0)
+        if cached_input_tokens is None:
+            cached_input_tokens = _cached_input_tokens(ai_message)
+    _notify_usage_listeners(model, input_tokens or 0, output_tokens or 0, cached_input_tokens or 0)
 
     model_name, provider = extract_model_name_and_provider(model)
     now = datetime.now()
@@ -61,6 +107,7 @@ def save_cost_track(
             model_name=model_name,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
+            cached_input_tokens=cached_input_tokens,
             now=now,
         )
 
@@ -128,26 +175,29 @@ def save_file_cost_track(
     input_tokens: int | None,
     output_tokens: int | None,
     now: datetime | None,
+    cached_input_tokens: int | None = None,
 ) -> None:
     file_path = Path(os.environ.get("WORKSPACE_DIR") or "") / "cost_track.csv"
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    if not file_path.exists():
-        with file_path.open(mode="w", newline="") as f:
+    row = [
+        provider or "",
+        model_name or "",
+        input_tokens or "",
+        output_tokens or "",
+        now or "",
+        cached_input_tokens or "",
+    ]
+    with _file_cost_track_lock:
+        if not file_path.exists():
+            with file_path.open(mode="w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(_FILE_COST_TRACK_COLUMNS)
+        with file_path.open(newline="") as f:
+            header = next(csv.reader(f), [])
+        with file_path.open(mode="a", newline="") as f:
             writer = csv.writer(f)
-            writer.writerow(
-                ["provider", "model_name", "input_tokens", "output_tokens", "created_at"]
-            )
-    with file_path.open(mode="a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                provider or "",
-                model_name or "",
-                input_tokens or "",
-                output_tokens or "",
-                now or "",
-            ]
-        )
+            # Files started before the cached column existed keep their layout
+            writer.writerow(row[: len(header)] if header else row)
 
 
 class TrackCostCallbackHandler(BaseCallbackHandler):
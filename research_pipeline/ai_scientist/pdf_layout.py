@@ -0,0 +1,285 @@
+import hashlib
+import logging
+import os.path as osp
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern, Tuple
+
+import pymupdf  # type: ignore[import-untyped]
+
+logger = logging.getLogger(__name__)
+
+# Compiled PDFs are small and rewritten in place between reflections, so a
+# handful of recent indices is enough to serve the writeup and review loops.
+_MAX_CACHED_INDICES = 16
+
+_HEADER_FOOTER_PATTERNS = [
+    re.compile(r"^\d+$"),  # Only digits (e.g., page numbers like "000", "001", etc.)
+    re.compile(r"^Under review"),  # Lines starting with "Under review"
+]
+
+# Fallback heading detection for PDFs compiled without hyperref bookmarks.
+_NUMBERED_HEADING_PATTERN = re.compile(
+    r"^(?P<number>[A-Z]?\d+(?:\.\d+)*)\.?\s+(?P<title>[A-Z].{0,80})$"
+)
+_NAMED_HEADINGS = (
+    "Abstract",
+    "Acknowledgements",
+    "Acknowledgments",
+    "Appendix",
+    "Impact Statement",
+    "References",
+)
+
+
+def is_header_or_footer(line: str) -> bool:
+    """
+    Returns True if the line is likely a header or footer (blank lines, bare page
+    numbers, "Under review" banners).
+    """
+    line_stripped = line.strip()
+    if len(line_stripped) < 1:
+        return True
+    return any(pattern.match(line_stripped) for pattern in _HEADER_FOOTER_PATTERNS)
+
+
+def clean_lines(content: str) -> List[str]:
+    """
+    Given raw text content, split it into lines and remove lines that are
+    likely headers/footers or otherwise not part of the main content.
+    """
+    return [line for line in content.splitlines() if not is_header_or_footer(line)]
+
+
+def compute_file_hash(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class SectionSpan:
+    """Pages (1-indexed, inclusive) covered by a section of the compiled paper."""
+
+    title: str
+    level: int
+    start_page: int
+    end_page: int
+
+
+@dataclass(frozen=True)
+class PdfLayoutIndex:
+    """
+    Per-page text layout of a compiled PDF, extracted once and queried many times.
+
+    Page numbers returned by the query helpers are 1-indexed to match the
+    values reported to the LLM in reflection prompts.
+    """
+
+    pdf_hash: str
+    page_texts: Tuple[str, ...]
+    page_lines: Tuple[Tuple[str, ...], ...]
+    cleaned_page_lines: Tuple[Tuple[str, ...], ...]
+    sections: Tuple[SectionSpan, ...]
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_texts)
+
+    def find_phrase(
+        self, phrase: str | Pattern[str], *, cleaned: bool = True, start_page: int = 1
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Locate the first line containing `phrase` (a literal string or compiled regex),
+        searching from `start_page` on.
+        Returns (page_number, line_number) or None; line numbers count cleaned lines
+        when `cleaned` is True and raw extracted lines otherwise.
+        """
+        pages = self.cleaned_page_lines if cleaned else self.page_lines
+        for page_idx in range(max(start_page, 1) - 1, len(pages)):
+            for line_idx, line in enumerate(pages[page_idx]):
+                if isinstance(phrase, str):
+                    matched = phrase in line
+                else:
+                    matched = phrase.search(line) is not None
+                if matched:
+                    return (page_idx + 1, line_idx + 1)
+        return None
+
+    def page_line_counts(self, first_page: int, last_page: int) -> Dict[int, int]:
+        """Return {page_number: number_of_cleaned_lines} for pages present in the PDF."""
+        last_page = min(last_page, self.page_count)
+        return {
+            page: len(self.cleaned_page_lines[page - 1])
+            for page in range(first_page, last_page + 1)
+        }
+
+    def section_span(self, title: str) -> Optional[SectionSpan]:
+        """Return the span of the first section whose title matches `title` (case-insensitive)."""
+        wanted = _normalize_heading(title)
+        for section in self.sections:
+            if _normalize_heading(section.title) == wanted:
+                return section
+        for section in self.sections:
+            if _normalize_heading(section.title).startswith(wanted):
+                return section
+        return None
+
+    def find_heading(
+        self, title: str, phrase: str | Pattern[str] | None = None, *, cleaned: bool = True
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Locate the heading of section `title`: the first line matching `phrase` (default:
+        the title itself) from the page the section starts on, so earlier mentions in the
+        body text are skipped. Searches the whole document if the section is unknown or
+        the phrase is not found from its start page.
+        """
+        if phrase is None:
+            phrase = title
+        span = self.section_span(title)
+        if span is not None:
+            location = self.find_phrase(phrase, cleaned=cleaned, start_page=span.start_page)
+            if location is not None:
+                return location
+        return self.find_phrase(phrase, cleaned=cleaned)
+
+    def text(self, num_pages: Optional[int] = None) -> str:
+        pages = self.page_texts if num_pages is None else self.page_texts[:num_pages]
+        return "".join(pages)
+
+
+def _normalize_heading(title: str) -> str:
+    title = re.sub(r"^[A-Z]?\d+(?:\.\d+)*\.?\s+", "", title.strip())
+    return " ".join(title.lower().split())
+
+
+def _sections_from_toc(toc: List[List[object]], page_count: int) -> List[Tuple[str, int, int]]:
+    entries: List[Tuple[str, int, int]] = []
+    for entry in toc:
+        level, title, page = entry[0], entry[1], entry[2]
+        if not isinstance(level, int) or not isinstance(page, int) or page < 1:
+            continue
+        entries.append((str(title).strip(), level, min(page, page_count)))
+    return entries
+
+
+def _sections_from_lines(
+    page_lines: Tuple[Tuple[str, ...], ...],
+) -> List[Tuple[str, int, int]]:
+    entries: List[Tuple[str, int, int]] = []
+    named = {name.lower() for name in _NAMED_HEADINGS}
+    for page_idx, lines in enumerate(page_lines):
+        for line in lines:
+            stripped = line.strip()
+            if stripped.lower() in named:
+                entries.append((stripped, 1, page_idx + 1))
+                continue
+            match = _NUMBERED_HEADING_PATTERN.match(stripped)
+            if match and not stripped.endswith("."):
+                level = match.group("number").count(".") + 1
+                entries.append((stripped, level, page_idx + 1))
+    return entries
+
+
+def _build_section_spans(entries: List[Tuple[str, int, int]], page_count: int) -> List[SectionSpan]:
+    spans: List[SectionSpan] = []
+    for idx, (title, level, start_page) in enumerate(entries):
+        end_page = page_count
+        for _next_title, next_level, next_start in entries[idx + 1 :]:
+            if next_level <= level:
+                end_page = max(start_page, next_start)
+                break
+        spans.append(
+            SectionSpan(title=title, level=level, start_page=start_page, end_page=end_page)
+        )
+    return spans
+
+
+def build_pdf_layout_index(pdf_path: str, pdf_hash: Optional[str] = None) -> PdfLayoutIndex:
+    """Extract page texts, cleaned lines and section spans from a PDF in one pass."""
+    if pdf_hash is None:
+        pdf_hash = compute_file_hash(pdf_path)
+    page_texts: List[str] = []
+    page_lines: List[Tuple[str, ...]] = []
+    cleaned_page_lines: List[Tuple[str, ...]] = []
+    with pymupdf.open(pdf_path) as doc:
+        for page in doc:
+            content = str(page.get_text("text", sort=True))
+            page_texts.append(content)
+            page_lines.append(tuple(content.split("\n")))
+            cleaned_page_lines.append(tuple(clean_lines(content)))
+        toc = doc.get_toc(simple=True)
+
+    page_count = len(page_texts)
+    cleaned = tuple(cleaned_page_lines)
+    entries = _sections_from_toc(toc, page_count) if toc else []
+    if not entries:
+        entries = _sections_from_lines(cleaned)
+    return PdfLayoutIndex(
+        pdf_hash=pdf_hash,
+        page_texts=tuple(page_texts),
+        page_lines=tuple(page_lines),
+        cleaned_page_lines=cleaned,
+        sections=tuple(_build_section_spans(entries, page_count)),
+    )
+
+
+_index_cache: "OrderedDict[str, PdfLayoutIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def get_pdf_layout_index(pdf_path: str) -> Optional[PdfLayoutIndex]:
+    """
+    Return the layout index for `pdf_path`, building it at most once per PDF content hash.
+    Returns None if the file is missing or cannot be parsed.
+    """
+    if not osp.exists(pdf_path):
+        return None
+    try:
+        pdf_hash = compute_file_hash(pdf_path)
+    except OSError:
+        logger.exception(f"Failed to hash PDF {pdf_path}")
+        return None
+
+    with _index_cache_lock:
+        cached = _index_cache.get(pdf_hash)
+        if cached is not None:
+            _index_cache.move_to_end(pdf_hash)
+            return cached
+
+    try:
+        index = build_pdf_layout_index(pdf_path, pdf_hash=pdf_hash)
+    except Exception:
+        logger.exception(f"Failed to build layout index for {pdf_path}")
+        return None
+
+    with _index_cache_lock:
+        _index_cache[pdf_hash] = index
+        while len(_index_cache) > _MAX_CACHED_INDICES:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def render_page_clips(
+    pdf_path: str,
+    clips: List[Tuple[int, Tuple[float, float, float, float], str]],
+    dpi: int = 150,
+) -> List[str]:
+    """
+    Render rectangular regions of PDF pages to PNG files.
+
+    Each clip is (0-indexed page number, (x0, y0, x1, y1), output path). Kept free of
+    heavy imports so it can run cheaply inside spawned worker processes.
+    """
+    written: List[str] = []
+    with pymupdf.open(pdf_path) as doc:
+        for page_num, (x0, y0, x1, y1), out_path in clips:
+            pix = doc[page_num].get_pixmap(clip=pymupdf.Rect(x0, y0, x1, y1), dpi=dpi)
+            pix.save(out_path)
+            written.append(out_path)
+    return written
@@ -6,18 +6,19 @@ import os.path as osp
 import re
 import shutil
 import subprocess
-import tempfile
 import traceback
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.messages import BaseMessage
 
-from ai_scientist.citations_specs import CITATION_SEARCH_SCHEMA, CITATION_SELECTION_SCHEMA
-from ai_scientist.ideation.semantic_scholar import search_for_papers
+from ai_scientist.citations_specs import CITATION_SEARCH_BATCH_SCHEMA, CITATION_SELECTION_SCHEMA
+from ai_scientist.ideation.semantic_scholar import normalize_query, search_for_papers_batch
 from ai_scientist.latest_run_finder import find_latest_run_dir_name
 from ai_scientist.llm import get_response_from_llm, get_structured_response_from_llm
+from ai_scientist.pdf_layout import get_pdf_layout_index
 from ai_scientist.perform_vlm_review import (
     detect_duplicate_figures,
     generate_vlm_img_review,
@@ -85,158 +86,43 @@ def compile_latex(cwd: str, pdf_file: str, timeout: int = 30) -> None:
         logger.exception("EXCEPTION in compile_latex while moving PDF:")
 
 
-def is_header_or_footer(line: str) -> bool:
-    """
-    Returns True if the line is likely a header or footer.
-    Filters out:
-      - Lines that are too short (< 4 characters after stripping).
-      - Lines that are only digits.
-      - Lines starting with known phrases (e.g., "Under review").
-      - Lines that consist solely of capital letters and spaces.
-    """
-    line_stripped = line.strip()
-    if len(line_stripped) < 1:
-        return True
-
-    header_footer_patterns = [
-        r"^\d+$",  # Only digits (e.g., page numbers like "000", "001", etc.)
-        r"^Under review",  # Lines starting with "Under review"
-    ]
-    for pattern in header_footer_patterns:
-        if re.match(pattern, line_stripped):
-            return True
-    return False
-
-
-def clean_lines(content: str) -> List[str]:
-    """
-    Given raw text content, split it into lines and remove lines that are
-    likely headers/footers or otherwise not part of the main content.
-    """
-    lines = content.splitlines()
-    # Keep only lines that are not detected as headers/footers.
-    return [line for line in lines if not is_header_or_footer(line)]
-
-
 def detect_references_position_clean(pdf_file: str) -> Optional[Tuple[int, int]]:
     """
-    Locate the first occurrence of the word "References" (or variations like
-    "R EFERENCES") within the cleaned content extracted from the PDF.
-    Uses pdftotext with layout preservation and cleans the extracted text.
+    Locate the "References" heading (or variations like "R EFERENCES") within the
+    cleaned content extracted from the PDF, starting from the page the References
+    section starts on when the PDF outline or headings reveal it.
 
     Returns a tuple (ref_page, ref_line) if found (with ref_line counting only
     the cleaned lines), otherwise None.
     """
-    if not osp.exists(pdf_file):
+    index = get_pdf_layout_index(pdf_file)
+    if index is None:
         return None
 
     # Compile a regex pattern to match "REFERENCES" even if there are extra spaces
     # between letters (and do a case-insensitive match).
     pattern = re.compile(r"\bR\s*E\s*F\s*E\s*R\s*E\s*N\s*C\s*E\s*S\b", re.IGNORECASE)
-
-    # Loop through pages (limit to 50 pages by default)
-    for page in range(1, 51):
-        temp_dir = tempfile.mkdtemp()
-        page_txt = osp.join(temp_dir, f"page_{page}.txt")
-        try:
-            subprocess.run(
-                [
-                    "pdftotext",
-                    "-layout",
-                    "-f",
-                    str(page),
-                    "-l",
-                    str(page),
-                    "-q",
-                    pdf_file,
-                    page_txt,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            if not osp.exists(page_txt):
-                shutil.rmtree(temp_dir)
-                break
-            try:
-                with open(page_txt, "r", encoding="utf-8", errors="ignore") as fp:
-                    content = fp.read()
-            except Exception as e:
-                logger.exception(f"Error reading page {page}: {e}")
-                shutil.rmtree(temp_dir)
-                continue
-            finally:
-                shutil.rmtree(temp_dir)
-        except Exception as e:
-            logger.exception(f"Error running pdftotext for page {page}: {e}")
-            shutil.rmtree(temp_dir)
-            continue
-
-        # Clean the lines before searching for "References"
-        cleaned = clean_lines(content)
-        for idx, line in enumerate(cleaned):
-            if pattern.search(line):
-                # Found "References" on this page at cleaned line number idx + 1
-                return (page, idx + 1)
-    return None
+    return index.find_heading("References", pattern)
 
 
 def extract_page_line_counts(pdf_file: str, first_page: int, last_page: int) -> Dict[int, int]:
     """
     Extract the number of cleaned text lines for each page from first_page to last_page.
-    This uses pdftotext with layout preservation and the clean_lines helper.
     Returns a dictionary {page_number: number_of_cleaned_lines}.
-    Pages for which extraction fails are omitted.
+    Pages beyond the end of the document are omitted.
     """
-    page_lines = {}
-    for page in range(first_page, last_page + 1):
-        temp_dir = tempfile.mkdtemp()
-        page_txt = osp.join(temp_dir, f"page_{page}.txt")
-        try:
-            subprocess.run(
-                [
-                    "pdftotext",
-                    "-layout",
-                    "-f",
-                    str(page),
-                    "-l",
-                    str(page),
-                    "-q",
-                    pdf_file,
-                    page_txt,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-            if not osp.exists(page_txt):
-                shutil.rmtree(temp_dir)
-                break
-            try:
-                with open(page_txt, "r", encoding="utf-8", errors="ignore") as fp:
-                    content = fp.read()
-            except Exception as e:
-                logger.exception(f"Error reading page {page}: {e}")
-                shutil.rmtree(temp_dir)
-                continue
-            finally:
-                shutil.rmtree(temp_dir)
-        except Exception as e:
-            logger.exception(f"Error running pdftotext for page {page}: {e}")
-            shutil.rmtree(temp_dir)
-            continue
-        # Clean the extracted text and count the number of remaining lines.
-        cleaned = clean_lines(content)
-        page_lines[page] = len(cleaned)
-    return page_lines
+    index = get_pdf_layout_index(pdf_file)
+    if index is None:
+        return {}
+    return index.page_line_counts(first_page, last_page)
 
 
 def check_page_limit(pdf_file: str, page_limit: int = 4) -> Optional[Dict[str, int]]:
     """
-    Compile the LaTeX project in a temporary folder, then determine where the
-    "References" section begins using cleaned text extraction. Next, count the
-    number of cleaned text lines used before the word "References" and compare that
-    to the total number of cleaned lines available in the allowed number of pages (page_limit).
+    Determine where the "References" section begins in the compiled PDF using the
+    cached layout index. Next, count the number of cleaned text lines used before the
+    word "References" and compare that to the total number of cleaned lines available
+    in the allowed number of pages (page_limit).
 
     Returns a dictionary with:
       - 'ref_page': page number where "References" was found (or None)
@@ -246,7 +132,7 @@ def check_page_limit(pdf_file: str, page_limit: int = 4) -> Optional[Dict[str, i
       - 'excess': if used_lines > allowed_lines (number of lines over the limit),
       - 'available': if used_lines < allowed_lines (number of lines still available)
 
-    If compilation or extraction fails, returns None.
+    If the PDF is missing or extraction fails, returns None.
     """
     try:
         # Ensure the PDF was produced
@@ -327,14 +213,23 @@ def get_reflection_page_info(reflection_pdf: str, page_limit: int) -> str:
     return reflection_page_info
 
 
-def get_citation_addition(
+def get_citation_additions(
     model: str,
     context: Tuple[str, str],
     current_round: int,
     total_rounds: int,
     idea_text: str,
     temperature: float,
-) -> Tuple[Optional[str], bool]:
+    max_queries: int = 3,
+) -> Tuple[List[str], int, bool]:
+    """
+    Run one citation round with up to `max_queries` independent searches.
+
+    The searches are proposed in a single LLM call, resolved concurrently through the
+    cached Semantic Scholar client, and the per-query paper selections run in parallel.
+    Returns (bibtex additions, searches issued, done) where done means no more citations
+    are needed.
+    """
     report, citations = context
     msg_history: list[BaseMessage] = []
     citation_system_msg_template = """You are an ambitious AI researcher who is looking to publish a paper to a workshop at ICLR 2025 that explores real-world pitfalls, failures, and challenges in deep learning.
@@ -377,15 +272,17 @@ Your current list of citations is:
 {citations}
 ```
 
-Identify the most important citation that you still need to add, and the query to find the paper.
+Identify up to {max_queries} of the most important citations that you still need to add, and the query to find each paper.
+The citations must be independent of each other: each query should target a different paper.
 
-Return a JSON object matching the CitationSearchResponse schema:
-- "needs_more_citations": whether another citation is required.
-- "description": the purpose of the desired citation and what you are looking for.
-- "query": the search query to find the paper (e.g., attention is all you need).
-If "needs_more_citations" is false, leave the other fields empty."""
+Return a JSON object matching the CitationSearchBatchResponse schema:
+- "needs_more_citations": whether more citations are required.
+- "queries": a list of objects, each with:
+  - "description": the purpose of the desired citation and what you are looking for.
+  - "query": the search query to find the paper (e.g., attention is all you need).
+If "needs_more_citations" is false, leave "queries" empty."""
 
-    citation_second_prompt_template = """Search has recovered the following articles:
+    citation_second_prompt_template = """Search for "{query}" ({description}) has recovered the following articles:
 
 {papers}
 
@@ -395,6 +292,7 @@ Return a JSON object matching the CitationSelectionResponse schema:
 - "description": an updated description of the selected citation(s), their relevance, and where in the paper they belong.
 If "should_add" is false, keep "selected_indices" empty."""
 
+    system_message = citation_system_msg_template.format(total_rounds=total_rounds)
     try:
         structured_response, msg_history = get_structured_response_from_llm(
             prompt=citation_first_prompt_template.format(
@@ -403,87 +301,99 @@ If "should_add" is false, keep "selected_indices" empty."""
                 Idea=idea_text,
                 report=report,
                 citations=citations,
+                max_queries=max_queries,
             ),
             model=model,
-            system_message=citation_system_msg_template.format(total_rounds=total_rounds),
+            system_message=system_message,
             temperature=temperature,
-            schema_class=CITATION_SEARCH_SCHEMA,
+            schema_class=CITATION_SEARCH_BATCH_SCHEMA,
             msg_history=msg_history,
         )
         if not structured_response.get("needs_more_citations", True):
             logger.info("No more citations needed.")
-            return None, True
-        query = structured_response.get("query", "")
-        if not isinstance(query, str) or not query.strip():
-            logger.warning("Citation search response missing query.")
-            return None, False
-        papers = search_for_papers(query, result_limit=5)
+            return [], 0, True
+        proposed: Dict[str, Dict[str, str]] = {}
+        for item in structured_response.get("queries", [])[:max_queries]:
+            query = item.get("query", "") if isinstance(item, dict) else ""
+            if not isinstance(query, str) or not query.strip():
+                continue
+            proposed.setdefault(
+                normalize_query(query), {"query": query, "description": item.get("description", "")}
+            )
+        if not proposed:
+            logger.warning("Citation search response missing queries.")
+            return [], 0, False
+        queries = [entry["query"] for entry in proposed.values()]
+        search_results = search_for_papers_batch(queries, result_limit=5, max_workers=len(queries))
     except Exception:
-        logger.exception("EXCEPTION in get_citation_addition (initial search):")
-        return None, False
-
-    if papers is None:
-        logger.warning("No papers found.")
-        return None, False
-
-    paper_strings = []
-    for i, paper in enumerate(papers):
-        paper_strings.append(
-            "{i}: {title}. {authors}. {venue}, {year}.\nAbstract: {abstract}".format(
-                i=i,
-                title=paper["title"],
-                authors=paper["authors"],
-                venue=paper["venue"],
-                year=paper["year"],
-                abstract=paper["abstract"],
+        logger.exception("EXCEPTION in get_citation_additions (initial search):")
+        return [], 0, False
+
+    def _select(entry: Dict[str, str]) -> Optional[str]:
+        papers = search_results.get(entry["query"])
+        if not papers:
+            logger.warning(f"No papers found for query: {entry['query']}")
+            return None
+
+        paper_strings = []
+        for i, paper in enumerate(papers):
+            paper_strings.append(
+                "{i}: {title}. {authors}. {venue}, {year}.\nAbstract: {abstract}".format(
+                    i=i,
+                    title=paper["title"],
+                    authors=paper["authors"],
+                    venue=paper["venue"],
+                    year=paper["year"],
+                    abstract=paper["abstract"],
+                )
             )
-        )
-    papers_str = "\n\n".join(paper_strings)
+        papers_str = "\n\n".join(paper_strings)
 
-    try:
-        selection_response, msg_history = get_structured_response_from_llm(
-            prompt=citation_second_prompt_template.format(
-                papers=papers_str,
-                current_round=current_round + 1,
-                total_rounds=total_rounds,
-            ),
-            model=model,
-            system_message=citation_system_msg_template.format(total_rounds=total_rounds),
-            temperature=temperature,
-            schema_class=CITATION_SELECTION_SCHEMA,
-            msg_history=msg_history,
-        )
-        if not selection_response.get("should_add", False):
-            logger.info("Do not add any.")
-            return None, False
-        selected_indices = selection_response.get("selected_indices", [])
-        if not isinstance(selected_indices, list) or not selected_indices:
-            logger.warning("Citation selection returned no indices.")
-            return None, False
-        if not all(isinstance(idx, int) and 0 <= idx < len(papers) for idx in selected_indices):
-            logger.warning("Received invalid citation indices: %s", selected_indices)
-            return None, False
-        bibtexs = [papers[i]["citationStyles"]["bibtex"] for i in selected_indices]
-
-        cleaned_bibtexs = []
-        for bibtex in bibtexs:
-            newline_index = bibtex.find("\n")
-            cite_key_line = bibtex[:newline_index]
-            cite_key_line = remove_accents_and_clean(cite_key_line)
-            cleaned_bibtexs.append(cite_key_line + bibtex[newline_index:])
-        bibtexs = cleaned_bibtexs
-
-        bibtex_string = "\n".join(bibtexs)
-        desc = selection_response.get("description", "")
-    except Exception:
-        logger.exception("EXCEPTION in get_citation_addition (selecting papers):")
-        return None, False
+        try:
+            selection_response, _ = get_structured_response_from_llm(
+                prompt=citation_second_prompt_template.format(
+                    query=entry["query"],
+                    description=entry["description"],
+                    papers=papers_str,
+                ),
+                model=model,
+                system_message=system_message,
+                temperature=temperature,
+                schema_class=CITATION_SELECTION_SCHEMA,
+                msg_history=msg_history,
+            )
+            if not selection_response.get("should_add", False):
+                logger.info(f"Do not add any for query: {entry['query']}")
+                return None
+            selected_indices = selection_response.get("selected_indices", [])
+            if not isinstance(selected_indices, list) or not selected_indices:
+                logger.warning("Citation selection returned no indices.")
+                return None
+            if not all(isinstance(idx, int) and 0 <= idx < len(papers) for idx in selected_indices):
+                logger.warning("Received invalid citation indices: %s", selected_indices)
+                return None
+            bibtexs = [papers[i]["citationStyles"]["bibtex"] for i in selected_indices]
+
+            cleaned_bibtexs = []
+            for bibtex in bibtexs:
+                newline_index = bibtex.find("\n")
+                cite_key_line = bibtex[:newline_index]
+                cite_key_line = remove_accents_and_clean(cite_key_line)
+                cleaned_bibtexs.append(cite_key_line + bibtex[newline_index:])
+
+            bibtex_string = "\n".join(cleaned_bibtexs)
+            desc = selection_response.get("description", "")
+        except Exception:
+            logger.exception("EXCEPTION in get_citation_additions (selecting papers):")
+            return None
 
-    references_format = """% {description}
+        references_format = """% {description}
 {bibtex}"""
+        return references_format.format(bibtex=bibtex_string, description=desc)
 
-    references_prompt = references_format.format(bibtex=bibtex_string, description=desc)
-    return references_prompt, False
+    with ThreadPoolExecutor(max_workers=len(proposed)) as executor:
+        selections = list(executor.map(_select, proposed.values()))
+    return [addition for addition in selections if addition is not None], len(proposed), False
 
 
 writeup_system_message_template = """You are an ambitious AI researcher who is looking to publish a paper to the "I Can't Believe It's Not Better" (ICBINB) Workshop at ICLR 2025.
@@ -777,15 +687,17 @@ def gather_citations(
     run_dir_name: Optional[str] = None,
     event_callback: Optional[Callable[[BaseEvent], None]] = None,
     run_id: Optional[str] = None,
+    queries_per_round: int = 3,
 ) -> Optional[str]:
     """
     Gather citations for a paper, with ability to resume from previous progress.
 
     Args:
         base_folder: Path to project folder
-        num_cite_rounds: Maximum number of citation gathering rounds
+        num_cite_rounds: Maximum number of citation searches across all rounds
         model: Model to use for writeup.
-        resume: Whether to try to resume from previous progress
+        queries_per_round: Independent searches proposed and resolved concurrently per round;
+            each search issued uses one of num_cite_rounds, and a failed round uses one
 
     Returns:
         str: The gathered citations text, or None if failed
@@ -839,11 +751,13 @@ def gather_citations(
         # Run model for citation additions
         citation_model = model
 
-        for round_idx in range(current_round, num_cite_rounds):
+        round_idx = current_round
+        while round_idx < num_cite_rounds:
+            batch_size = max(1, min(queries_per_round, num_cite_rounds - round_idx))
             try:
                 # Emit event: citation gathering round progress
                 if event_callback and run_id:
-                    step_progress = (round_idx + 1) / num_cite_rounds
+                    step_progress = min(round_idx + batch_size, num_cite_rounds) / num_cite_rounds
                     citation_count = len(re.findall(r"@\w+{", citations_text))
                     event_callback(
                         PaperGenerationProgressEvent(
@@ -859,13 +773,14 @@ def gather_citations(
                     )
 
                 context_for_citation = (filtered_summaries_str, citations_text)
-                addition, done = get_citation_addition(
+                additions, queries_issued, done = get_citation_additions(
                     model=citation_model,
                     context=context_for_citation,
                     current_round=round_idx,
                     total_rounds=num_cite_rounds,
                     idea_text=idea_text,
                     temperature=temperature,
+                    max_queries=batch_size,
                 )
 
                 if done:
@@ -879,7 +794,10 @@ def gather_citations(
                         )
                     break
 
-                if addition is not None:
+                # A round that issued no search still uses one, so a model that keeps
+                # proposing nothing cannot loop forever
+                round_idx += max(queries_issued, 1)
+                for addition in additions:
                     # Simple check to avoid duplicating the same title
                     title_match = re.search(r" title = {(.*?)}", addition)
                     if title_match:
@@ -888,17 +806,18 @@ def gather_citations(
                         existing_titles = [t.lower() for t in existing_titles]
                         if new_title not in existing_titles:
                             citations_text += "\n" + addition
-                            # Save progress after each successful addition
-                            with open(citations_cache_path, "w") as f:
-                                f.write(citations_text)
-                            with open(progress_path, "w") as f:
-                                json.dump(
-                                    {
-                                        "completed_rounds": round_idx + 1,
-                                        "status": "in_progress",
-                                    },
-                                    f,
-                                )
+                if additions:
+                    # Save progress after each round with successful additions
+                    with open(citations_cache_path, "w") as f:
+                        f.write(citations_text)
+                    with open(progress_path, "w") as f:
+                        json.dump(
+                            {
+                                "completed_rounds": round_idx,
+                                "status": "in_progress",
+                            },
+                            f,
+                        )
 
             except Exception as e:
                 logger.exception(f"Error in citation round {round_idx}: {e}")
@@ -907,6 +826,7 @@ def gather_citations(
                     f.write(citations_text)
                 with open(progress_path, "w") as f:
                     json.dump({"completed_rounds": round_idx, "status": "error"}, f)
+                round_idx += 1
                 continue
 
         # Emit event: citation gathering completed
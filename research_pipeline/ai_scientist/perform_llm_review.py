@@ -1,17 +1,22 @@
+import functools
 import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
 from textwrap import dedent
-from typing import Any, Callable, Dict, Iterable, List, Literal, Optional
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple
 
 import numpy as np
-import pymupdf  # type: ignore[import-untyped]
 import pymupdf4llm  # type: ignore[import-untyped]
 from langchain_core.messages import AIMessage, BaseMessage
 from pydantic import BaseModel, Field
 from pypdf import PdfReader
 
 from ai_scientist.llm import get_structured_response_from_llm
+from ai_scientist.pdf_layout import compute_file_hash, get_pdf_layout_index
 from ai_scientist.treesearch.events import BaseEvent, PaperGenerationProgressEvent
 
 logger = logging.getLogger(__name__)
@@ -368,26 +373,117 @@ Return an updated JSON object following the required schema.
 Add a boolean field "should_continue" and set it to false only if no further changes are needed."""
 
 
+# Extracted text is keyed by PDF content hash, page limit and minimum size. The
+# extractor version is part of the on-disk file name so upgrades never serve stale text.
+_PAPER_TEXT_EXTRACTOR = f"pymupdf4llm-{getattr(pymupdf4llm, '__version__', 'unknown')}"
+_MAX_CACHED_PAPER_TEXTS = 32
+
+_paper_text_cache: "OrderedDict[Tuple[str, Optional[int], int], str]" = OrderedDict()
+_paper_text_cache_lock = threading.Lock()
+
+
+def _paper_text_cache_dir() -> Optional[Path]:
+    """
+    On-disk cache directory for extracted paper text, configured by
+    AI_SCIENTIST_PAPER_TEXT_CACHE_DIR (default: ~/.cache/ai_scientist/paper_text).
+    Set AI_SCIENTIST_DISABLE_PAPER_TEXT_CACHE to 1/true/yes to bypass both cache levels.
+    """
+    if os.getenv("AI_SCIENTIST_DISABLE_PAPER_TEXT_CACHE", "").lower() in {"1", "true", "yes"}:
+        return None
+    return Path(
+        os.getenv("AI_SCIENTIST_PAPER_TEXT_CACHE_DIR")
+        or Path.home() / ".cache" / "ai_scientist" / "paper_text"
+    )
+
+
+def _paper_text_cache_path(cache_dir: Path, key: Tuple[str, Optional[int], int]) -> Path:
+    pdf_hash, num_pages, min_size = key
+    pages = "all" if num_pages is None else str(num_pages)
+    return cache_dir / f"{pdf_hash}-{pages}-{min_size}-{_PAPER_TEXT_EXTRACTOR}.md"
+
+
+def _read_cached_paper_text(cache_dir: Path, key: Tuple[str, Optional[int], int]) -> Optional[str]:
+    try:
+        return _paper_text_cache_path(cache_dir, key).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError):
+        logger.debug(f"Ignoring unreadable paper text cache entry for {key[0]}")
+        return None
+
+
+def _write_cached_paper_text(
+    cache_dir: Path, key: Tuple[str, Optional[int], int], text: str
+) -> None:
+    path = _paper_text_cache_path(cache_dir, key)
+    tmp_path = path.with_suffix(f".{os.getpid()}.{time.monotonic_ns()}.tmp")
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.debug(f"Failed to write paper text cache entry {path}", exc_info=True)
+        tmp_path.unlink(missing_ok=True)
+
+
 def load_paper(pdf_path: str, num_pages: int | None = None, min_size: int = 100) -> str:
+    """
+    Extract the text of a PDF as markdown, falling back to pymupdf and then pypdf.
+
+    Results are memoized in-process and on disk by PDF content hash and page limit, so
+    repeated reviews of the same paper skip the markdown conversion. Fallback text is
+    never cached: the next call retries pymupdf4llm instead of serving degraded text.
+    """
+    cache_dir = _paper_text_cache_dir()
+    if cache_dir is None:
+        return _extract_paper_text(pdf_path, num_pages, min_size)[0]
+    try:
+        key = (compute_file_hash(pdf_path), num_pages, min_size)
+    except OSError:
+        return _extract_paper_text(pdf_path, num_pages, min_size)[0]
+
+    with _paper_text_cache_lock:
+        cached = _paper_text_cache.get(key)
+        if cached is not None:
+            _paper_text_cache.move_to_end(key)
+            return cached
+
+    text = _read_cached_paper_text(cache_dir, key)
+    if text is None:
+        started = time.perf_counter()
+        text, is_fallback = _extract_paper_text(pdf_path, num_pages, min_size)
+        logger.debug(f"Extracted text of {pdf_path} in {time.perf_counter() - started:.2f}s")
+        if is_fallback:
+            return text
+        _write_cached_paper_text(cache_dir, key, text)
+
+    with _paper_text_cache_lock:
+        _paper_text_cache[key] = text
+        while len(_paper_text_cache) > _MAX_CACHED_PAPER_TEXTS:
+            _paper_text_cache.popitem(last=False)
+    return text
+
+
+def _extract_paper_text(pdf_path: str, num_pages: int | None, min_size: int) -> Tuple[str, bool]:
+    """Return the paper text and whether a fallback extractor produced it."""
     try:
         text: str
         if num_pages is None:
             text = str(pymupdf4llm.to_markdown(pdf_path))
         else:
-            reader = PdfReader(pdf_path)
-            min_pages = min(len(reader.pages), num_pages)
+            index = get_pdf_layout_index(pdf_path)
+            page_count = index.page_count if index is not None else len(PdfReader(pdf_path).pages)
+            min_pages = min(page_count, num_pages)
             text = str(pymupdf4llm.to_markdown(pdf_path, pages=list(range(min_pages))))
         if len(text) < min_size:
             raise Exception("Text too short")
     except Exception as e:
         logger.warning(f"Error with pymupdf4llm, falling back to pymupdf: {e}")
         try:
-            doc = pymupdf.open(pdf_path)
-            if num_pages:
-                doc = doc[:num_pages]
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            index = get_pdf_layout_index(pdf_path)
+            if index is None:
+                raise Exception("Could not index PDF")
+            text = index.text(num_pages=num_pages or None)
             if len(text) < min_size:
                 raise Exception("Text too short")
         except Exception as e:
@@ -400,7 +496,8 @@ def load_paper(pdf_path: str, num_pages: int | None = None, min_size: int = 100)
             text = "".join(page.extract_text() for page in pages)
             if len(text) < min_size:
                 raise Exception("Text too short")
-    return text
+        return text, True
+    return text, False
 
 
 def load_review(json_path: str) -> str:
@@ -424,7 +521,18 @@ fewshot_reviews = [
 ]
 
 
+@functools.lru_cache(maxsize=None)
+def _load_fewshot_paper_text(paper_path: str) -> str:
+    txt_path = paper_path.replace(".pdf", ".txt")
+    if os.path.exists(txt_path):
+        with open(txt_path, "r") as f:
+            return f.read()
+    return load_paper(paper_path)
+
+
+@functools.lru_cache(maxsize=None)
 def get_review_fewshot_examples(num_fs_examples: int = 1) -> str:
+    """Build the few-shot review block once per example count; the examples ship with the package."""
     fewshot_prompt = """
 Below are some sample reviews, copied from previous machine learning conferences.
 Note that while each review is formatted differently according to each reviewer's style, the reviews are well-structured and therefore easy to navigate.
@@ -432,12 +540,7 @@ Note that while each review is formatted differently according to each reviewer'
     for paper_path, review_path in zip(
         fewshot_papers[:num_fs_examples], fewshot_reviews[:num_fs_examples]
     ):
-        txt_path = paper_path.replace(".pdf", ".txt")
-        if os.path.exists(txt_path):
-            with open(txt_path, "r") as f:
-                paper_text = f.read()
-        else:
-            paper_text = load_paper(paper_path)
+        paper_text = _load_fewshot_paper_text(paper_path)
         review_text = load_review(review_path)
         fewshot_prompt += f"""
 Paper:
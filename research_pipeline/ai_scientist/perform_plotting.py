@@ -5,6 +5,7 @@ import os
 import shutil
 import subprocess
 import sys
+import time
 import traceback
 from pathlib import Path
 from typing import Callable, Optional
@@ -12,6 +13,7 @@ from typing import Callable, Optional
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, Field
 
+from ai_scientist.aggregator_session import AggregatorSession
 from ai_scientist.latest_run_finder import find_latest_run_dir_name
 from ai_scientist.llm import get_structured_response_from_llm
 from ai_scientist.perform_icbinb_writeup import (
@@ -133,6 +135,47 @@ def run_aggregator_script(
     return aggregator_out
 
 
+def run_aggregator_in_session(
+    session: AggregatorSession,
+    aggregator_code: str,
+    aggregator_script_path: str,
+    base_folder: str,
+    script_name: str,
+) -> str:
+    """
+    Run the aggregator script in a persistent session, re-rendering only plot blocks
+    whose code (or the code they depend on) changed. Falls back to a fresh subprocess
+    if the session process dies.
+    """
+    if not aggregator_code.strip():
+        logger.info("No aggregator code was provided. Skipping aggregator script run.")
+        return ""
+    with open(aggregator_script_path, "w") as f:
+        f.write(aggregator_code)
+
+    try:
+        result = session.run(script_name)
+    except RuntimeError:
+        logger.exception("Aggregator session failed; re-running the script in a subprocess.")
+        started = time.monotonic()
+        aggregator_out = run_aggregator_script(
+            aggregator_code, aggregator_script_path, base_folder, script_name
+        )
+        logger.info(f"Aggregator run took {time.monotonic() - started:.1f}s (subprocess)")
+        return aggregator_out
+
+    if result.succeeded:
+        logger.info("Aggregator script ran successfully.")
+    else:
+        logger.warning("Error: aggregator script did not complete successfully.")
+    logger.info(
+        f"Aggregator run took {result.duration_s:.1f}s: re-rendered "
+        f"{result.plot_blocks - result.skipped_blocks} of {result.plot_blocks} plot blocks, "
+        f"removed {len(result.removed_outputs)} stale figure(s), npy loads {result.npy_loads}"
+    )
+    return result.output
+
+
 def aggregate_plots(
     base_folder: str,
     model: str,
@@ -263,36 +306,43 @@ def aggregate_plots(
             )
         )
 
-    # First run of aggregator script
-    aggregator_out = run_aggregator_script(
-        aggregator_code, aggregator_script_path, base_folder, filename
-    )
+    # Reuse one interpreter (and its loaded .npy data) across reflections
+    session = AggregatorSession(base_folder)
+    try:
+        # First run of aggregator script
+        aggregator_out = run_aggregator_in_session(
+            session, aggregator_code, aggregator_script_path, base_folder, filename
+        )
 
-    # Multiple reflection loops
-    for i in range(n_reflections):
-        # Check number of figures
-        figure_count = 0
-        if os.path.exists(figures_dir):
-            figure_count = len(
-                [f for f in os.listdir(figures_dir) if os.path.isfile(os.path.join(figures_dir, f))]
-            )
-        logger.info(f"[{i + 1} / {n_reflections}]: Number of figures: {figure_count}")
-
-        # Emit event: plot aggregation reflection progress
-        if event_callback and run_id:
-            step_progress = (i + 1) / n_reflections
-            event_callback(
-                PaperGenerationProgressEvent(
-                    run_id=run_id,
-                    step="plot_aggregation",
-                    substep=f"Reflection {i + 1} of {n_reflections} (figures: {figure_count})",
-                    progress=0.15 * step_progress,  # plot_aggregation is 0-15% of overall
-                    step_progress=step_progress,
-                    details={"figure_count": figure_count} if figure_count > 0 else None,
+        # Multiple reflection loops
+        for i in range(n_reflections):
+            # Check number of figures
+            figure_count = 0
+            if os.path.exists(figures_dir):
+                figure_count = len(
+                    [
+                        f
+                        for f in os.listdir(figures_dir)
+                        if os.path.isfile(os.path.join(figures_dir, f))
+                    ]
                 )
-            )
-        # Reflection prompt with reminder for common checks and early exit
-        reflection_prompt = f"""We have run your aggregator script and it produced {figure_count} figure(s). The script's output is:
+            logger.info(f"[{i + 1} / {n_reflections}]: Number of figures: {figure_count}")
+
+            # Emit event: plot aggregation reflection progress
+            if event_callback and run_id:
+                step_progress = (i + 1) / n_reflections
+                event_callback(
+                    PaperGenerationProgressEvent(
+                        run_id=run_id,
+                        step="plot_aggregation",
+                        substep=f"Reflection {i + 1} of {n_reflections} (figures: {figure_count})",
+                        progress=0.15 * step_progress,  # plot_aggregation is 0-15% of overall
+                        step_progress=step_progress,
+                        details={"figure_count": figure_count} if figure_count > 0 else None,
+                    )
+                )
+            # Reflection prompt with reminder for common checks and early exit
+            reflection_prompt = f"""We have run your aggregator script and it produced {figure_count} figure(s). The script's output is:
 ```
 {aggregator_out}
 ```
@@ -307,45 +357,52 @@ Please criticize the current script for any flaws including but not limited to:
 
 Respond using the structured schema: set `should_stop` to true if no further changes are required; otherwise update the `script` field with the revised Python code."""
 
-        logger.debug(f"Reflection prompt: {reflection_prompt}")
-        try:
-            reflection_dict, msg_history = get_structured_response_from_llm(
-                prompt=reflection_prompt,
-                model=model,
-                system_message=AGGREGATOR_SYSTEM_MSG,
-                temperature=temperature,
-                msg_history=msg_history,
-                schema_class=AggregatorScriptResponse,
-            )
+            logger.debug(f"Reflection prompt: {reflection_prompt}")
+            try:
+                reflection_dict, msg_history = get_structured_response_from_llm(
+                    prompt=reflection_prompt,
+                    model=model,
+                    system_message=AGGREGATOR_SYSTEM_MSG,
+                    temperature=temperature,
+                    msg_history=msg_history,
+                    schema_class=AggregatorScriptResponse,
+                )
 
-        except Exception:
-            traceback.print_exc()
-            logger.exception("Failed to get reflection from LLM.")
-            return
-
-        try:
-            reflection_data = AggregatorScriptResponse.model_validate(reflection_dict)
-        except Exception:
-            logger.error("Structured reflection response validation failed: %s", reflection_dict)
-            break
-
-        # Early-exit check
-        if figure_count > 0 and reflection_data.should_stop:
-            logger.info("LLM indicated it is done with reflections. Exiting reflection loop.")
-            break
-
-        aggregator_new_code = reflection_data.script.strip()
-
-        # If new code is provided and differs, run again
-        if aggregator_new_code.strip() and aggregator_new_code.strip() != aggregator_code.strip():
-            aggregator_code = aggregator_new_code
-            aggregator_out = run_aggregator_script(
-                aggregator_code, aggregator_script_path, base_folder, filename
-            )
-        else:
-            logger.debug(
-                f"No new aggregator script was provided or it was identical. Reflection step {i + 1} complete."
-            )
+            except Exception:
+                traceback.print_exc()
+                logger.exception("Failed to get reflection from LLM.")
+                return
+
+            try:
+                reflection_data = AggregatorScriptResponse.model_validate(reflection_dict)
+            except Exception:
+                logger.error(
+                    "Structured reflection response validation failed: %s", reflection_dict
+                )
+                break
+
+            # Early-exit check
+            if figure_count > 0 and reflection_data.should_stop:
+                logger.info("LLM indicated it is done with reflections. Exiting reflection loop.")
+                break
+
+            aggregator_new_code = reflection_data.script.strip()
+
+            # If new code is provided and differs, run again
+            if (
+                aggregator_new_code.strip()
+                and aggregator_new_code.strip() != aggregator_code.strip()
+            ):
+                aggregator_code = aggregator_new_code
+                aggregator_out = run_aggregator_in_session(
+                    session, aggregator_code, aggregator_script_path, base_folder, filename
+                )
+            else:
+                logger.debug(
+                    f"No new aggregator script was provided or it was identical. Reflection step {i + 1} complete."
+                )
+    finally:
+        session.close()
 
     # Move generated figures into a per-run subfolder to avoid mixing runs
     try:
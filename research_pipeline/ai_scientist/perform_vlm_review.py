@@ -1,14 +1,21 @@
+import atexit
 import base64
+import bisect
 import hashlib
 import logging
+import multiprocessing
 import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import pymupdf  # type: ignore[import-untyped]
 from pydantic import BaseModel, Field
 
 from ai_scientist.llm.vlm import get_response_from_vlm, get_structured_response_from_vlm
+from ai_scientist.pdf_layout import compute_file_hash, render_page_clips
 from ai_scientist.perform_llm_review import load_paper
 
 logger = logging.getLogger(__name__)
@@ -155,6 +162,122 @@ Deliberate carefully before answering. When ready, return only a JSON object mat
 Ensure the JSON is valid and properly formatted, as it will be parsed automatically."""
 
 
+# Captures the figure label so we can reference it later (group name 'fig_label').
+# Example matches: "Figure 1:", "Figure (A).2.", "Figure A.1:"
+_FIGURE_LABEL_PATTERN = (
+    r"(?:\d+"  # "1", "11", ...
+    r"|[A-Za-z]+\.\d+"  # "A.1", "S2.3"
+    r"|\(\s*[A-Za-z]+\s*\)\.\d+"  # "(A).2"
+    r")"
+)
+_FIGURE_CAPTION_PATTERN = re.compile(
+    rf"^(?:Figure)\s+(?P<fig_label>{_FIGURE_LABEL_PATTERN})(?:\.|:)",  # Must end with "." or ":"
+    re.IGNORECASE,
+)
+# Figure/Fig./Fig-ure + possible line break + label, with no letter/digit right after
+# the label (so "Figure 11" is never counted as a reference to "Figure 1").
+_FIGURE_REFERENCE_PATTERN = re.compile(
+    rf"(?:Fig(?:\.|-\s*ure)?|Figure)\s*(?P<fig_label>{_FIGURE_LABEL_PATTERN})(?![0-9A-Za-z])",
+    re.IGNORECASE,
+)
+_SUBFIGURE_PATTERN = re.compile(r"\(\s*[a-zA-Z]\s*\)")
+
+_FIGURE_RENDER_DPI = 150
+_MAX_RENDER_WORKERS = 4
+# Spawning render workers costs roughly a second, so short papers render faster in-process.
+_MIN_CLIPS_FOR_PARALLEL_RENDER = 24
+_MAX_CACHED_EXTRACTIONS = 16
+
+_extraction_cache: "OrderedDict[Tuple[Any, ...], List[Dict[str, Any]]]" = OrderedDict()
+_extraction_cache_lock = threading.Lock()
+_render_executor: Optional[ProcessPoolExecutor] = None
+_render_executor_lock = threading.Lock()
+
+
+def _normalize_figure_label(label: str) -> str:
+    return "".join(label.split()).lower()
+
+
+class _PageBlockIndex:
+    """Text blocks of one page sorted by bottom edge, for nearest-block-above queries."""
+
+    def __init__(self, blocks: List[Dict[str, Any]]):
+        self.blocks = sorted(blocks, key=lambda b: b["bbox"].y1)
+        self.bottoms = [b["bbox"].y1 for b in self.blocks]
+
+    def nearest_above(
+        self, caption_bbox: pymupdf.Rect, min_vertical_gap: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the eligible block with the largest bottom edge that sits at least
+        `min_vertical_gap` above the caption and overlaps it horizontally by > 30%.
+        """
+        fig_x0, fig_y0, fig_x1, _ = caption_bbox
+        if min_vertical_gap > 0:
+            end = bisect.bisect_right(self.bottoms, fig_y0 - min_vertical_gap)
+        else:
+            end = bisect.bisect_left(self.bottoms, fig_y0)
+        for idx in range(end - 1, -1, -1):
+            block = self.blocks[idx]
+            if not block["eligible_above"]:
+                continue
+            bbox = block["bbox"]
+            overlap_x = min(fig_x1, bbox.x1) - max(fig_x0, bbox.x0)
+            width_min = min((fig_x1 - fig_x0), (bbox.x1 - bbox.x0))
+            horiz_overlap_ratio = overlap_x / float(width_min) if width_min > 0 else 0.0
+            if horiz_overlap_ratio > 0.3:
+                return block
+        return None
+
+
+def _get_render_executor() -> ProcessPoolExecutor:
+    global _render_executor
+    with _render_executor_lock:
+        if _render_executor is None:
+            _render_executor = ProcessPoolExecutor(
+                max_workers=max(1, min(_MAX_RENDER_WORKERS, os.cpu_count() or 1)),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            atexit.register(_shutdown_render_executor)
+        return _render_executor
+
+
+def _shutdown_render_executor() -> None:
+    """Stop the render workers; the next figure-heavy paper starts a fresh pool."""
+    global _render_executor
+    with _render_executor_lock:
+        executor, _render_executor = _render_executor, None
+    if executor is not None:
+        atexit.unregister(_shutdown_render_executor)
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _render_figure_clips(
+    pdf_path: str, clips: List[Tuple[int, Tuple[float, float, float, float], str]]
+) -> None:
+    """Render figure clips, spreading pages across worker processes for figure-heavy papers."""
+    pages = sorted({page_num for page_num, _, _ in clips})
+    if len(pages) < 2 or len(clips) < _MIN_CLIPS_FOR_PARALLEL_RENDER:
+        render_page_clips(pdf_path, clips, dpi=_FIGURE_RENDER_DPI)
+        return
+    chunks: List[List[Tuple[int, Tuple[float, float, float, float], str]]] = [
+        [] for _ in range(min(len(pages), _MAX_RENDER_WORKERS))
+    ]
+    for clip in clips:
+        chunks[pages.index(clip[0]) % len(chunks)].append(clip)
+    try:
+        executor = _get_render_executor()
+        futures = [
+            executor.submit(render_page_clips, pdf_path, chunk, _FIGURE_RENDER_DPI)
+            for chunk in chunks
+        ]
+        for future in futures:
+            future.result()
+    except Exception:
+        logger.warning("Parallel figure rendering failed; rendering in-process.", exc_info=True)
+        render_page_clips(pdf_path, clips, dpi=_FIGURE_RENDER_DPI)
+
+
 def extract_figure_screenshots(
     pdf_path: str,
     img_folder_path: str,
@@ -167,147 +290,153 @@ def extract_figure_screenshots(
     and also gather text blocks (anywhere in the PDF) mentioning that
     exact figure with "Figure", "Fig.", or "Fig-ure" (including line breaks).
     Avoid partial matches, e.g. "Figure 11" doesn't match "Figure 1".
+
+    Results are cached per PDF content hash, so repeated reviews of the same
+    compiled PDF reuse the extracted figures instead of re-rendering them.
     """
     os.makedirs(img_folder_path, exist_ok=True)
-    doc = pymupdf.open(pdf_path)
-    page_range = range(len(doc)) if num_pages is None else range(min(num_pages, len(doc)))
-
-    # ---------- (A) EXTRACT ALL TEXT BLOCKS FROM THE DOCUMENT ----------
-    text_blocks: List[Dict[str, Any]] = (
-        []
-    )  # will hold dicts: { 'page': int, 'bbox': Rect, 'text': str }
-    for page_num in page_range:
-        page = doc[page_num]
-        try:
-            blocks = page.get_text("blocks")
-            # blocks: [x0, y0, x1, y1, text, block_no, ...]
-            for b in blocks:
-                txt = b[4].strip()
-                if txt:
-                    bbox = pymupdf.Rect(b[0], b[1], b[2], b[3])
-                    text_blocks.append({"page": page_num, "bbox": bbox, "text": txt})
-        except Exception as e:
-            logger.exception(f"Error extracting text from page {page_num}: {e}")
-
-    # ---------- (B) REGEX FOR FIGURE CAPTIONS  ----------
-    # Captures the figure label so we can reference it later (group name 'fig_label').
-    # Example matches: "Figure 1:", "Figure (A).2.", "Figure A.1:"
-    figure_caption_pattern = re.compile(
-        r"^(?:Figure)\s+(?P<fig_label>"
-        r"(?:\d+"  # "1", "11", ...
-        r"|[A-Za-z]+\.\d+"  # "A.1", "S2.3"
-        r"|\(\s*[A-Za-z]+\s*\)\.\d+"  # "(A).2"
-        r")"
-        r")(?:\.|:)",  # Must end with "." or ":"
-        re.IGNORECASE,
+    cache_key = (
+        compute_file_hash(pdf_path),
+        os.path.abspath(img_folder_path),
+        num_pages,
+        min_text_length,
+        min_vertical_gap,
     )
+    with _extraction_cache_lock:
+        cached = _extraction_cache.get(cache_key)
+    if cached is not None and all(
+        os.path.exists(path) for item in cached for path in item["images"]
+    ):
+        logger.debug(f"Figure extraction cache hit for {pdf_path}")
+        return [dict(item) for item in cached]
+
+    result_pairs = _extract_figure_screenshots(
+        pdf_path=pdf_path,
+        img_folder_path=img_folder_path,
+        num_pages=num_pages,
+        min_text_length=min_text_length,
+        min_vertical_gap=min_vertical_gap,
+    )
+    with _extraction_cache_lock:
+        _extraction_cache[cache_key] = result_pairs
+        _extraction_cache.move_to_end(cache_key)
+        while len(_extraction_cache) > _MAX_CACHED_EXTRACTIONS:
+            _extraction_cache.popitem(last=False)
+    return [dict(item) for item in result_pairs]
 
-    # ---------- (C) DETECT SUB-FIGURE CAPTIONS (e.g. "(a)")  ----------
-    subfigure_pattern = re.compile(r"\(\s*[a-zA-Z]\s*\)")
-
-    def is_subfigure_caption(txt: str) -> bool:
-        return bool(subfigure_pattern.search(txt))
 
-    # ---------- (D) MAIN ROUTINE: LOOP OVER PAGES AND CAPTIONS ----------
+def _extract_figure_screenshots(
+    pdf_path: str,
+    img_folder_path: str,
+    num_pages: Optional[int],
+    min_text_length: int,
+    min_vertical_gap: int,
+) -> List[Dict[str, Any]]:
+    with pymupdf.open(pdf_path) as doc:
+        page_range = range(len(doc)) if num_pages is None else range(min(num_pages, len(doc)))
+
+        # ---------- (A) EXTRACT ALL TEXT BLOCKS FROM THE DOCUMENT ----------
+        # each block: { 'page': int, 'bbox': Rect, 'text': str, 'eligible_above': bool }
+        text_blocks: List[Dict[str, Any]] = []
+        blocks_by_page: Dict[int, List[Dict[str, Any]]] = {}
+        page_rects: Dict[int, Any] = {}
+        for page_num in page_range:
+            page = doc[page_num]
+            page_rects[page_num] = page.rect
+            page_blocks: List[Dict[str, Any]] = []
+            try:
+                # blocks: [x0, y0, x1, y1, text, block_no, ...]
+                for b in page.get_text("blocks"):
+                    txt = b[4].strip()
+                    if txt:
+                        block = {
+                            "page": page_num,
+                            "bbox": pymupdf.Rect(b[0], b[1], b[2], b[3]),
+                            "text": txt,
+                            # Large, non-subfigure text blocks bound a figure from above.
+                            "eligible_above": len(txt) >= min_text_length
+                            and not _SUBFIGURE_PATTERN.search(txt),
+                        }
+                        page_blocks.append(block)
+                        text_blocks.append(block)
+            except Exception as e:
+                logger.exception(f"Error extracting text from page {page_num}: {e}")
+            blocks_by_page[page_num] = page_blocks
+
+    # ---------- (B) INDEX FIGURE REFERENCES ACROSS THE WHOLE DOCUMENT ONCE ----------
+    references_by_label: Dict[str, List[int]] = {}
+    for block_idx, tb in enumerate(text_blocks):
+        for label in {
+            _normalize_figure_label(m.group("fig_label"))
+            for m in _FIGURE_REFERENCE_PATTERN.finditer(tb["text"])
+        }:
+            references_by_label.setdefault(label, []).append(block_idx)
+    block_positions = {id(tb): idx for idx, tb in enumerate(text_blocks)}
+
+    # ---------- (C) LOOP OVER PAGES AND CAPTIONS ----------
     result_pairs: List[Dict[str, Any]] = []
+    clips: List[Tuple[int, Tuple[float, float, float, float], str]] = []
 
     for page_num in page_range:
-        page = doc[page_num]
-        page_rect = page.rect
-
-        # All text blocks for this page
-        page_blocks = [b for b in text_blocks if b["page"] == page_num]
-        # Sort top-to-bottom
-        page_blocks.sort(key=lambda b: b["bbox"].y0)
+        page_blocks = sorted(blocks_by_page[page_num], key=lambda b: b["bbox"].y0)
+        spatial_index = _PageBlockIndex(page_blocks)
 
-        # ----- (D.1) Find figure captions -----
         for blk in page_blocks:
             caption_text = blk["text"]
-            m = figure_caption_pattern.match(caption_text)
+            m = _FIGURE_CAPTION_PATTERN.match(caption_text)
             if not m:
                 continue  # not a figure caption
 
             fig_label = m.group("fig_label")  # e.g. "1", "A.1", "(A).2", etc.
-            fig_x0, fig_y0, fig_x1, fig_y1 = blk["bbox"]
-
-            # (a) Find a large text block above the caption (on the same page)
-            above_blocks = []
-            for ab in page_blocks:
-                if ab["bbox"].y1 < fig_y0:
-                    # vertical gap
-                    ab_height_gap = fig_y0 - ab["bbox"].y1
-                    # horizontal overlap
-                    overlap_x = min(fig_x1, ab["bbox"].x1) - max(fig_x0, ab["bbox"].x0)
-                    width_min = min((fig_x1 - fig_x0), (ab["bbox"].x1 - ab["bbox"].x0))
-                    horiz_overlap_ratio = overlap_x / float(width_min) if width_min > 0 else 0.0
-
-                    if (
-                        len(ab["text"]) >= min_text_length
-                        and not is_subfigure_caption(ab["text"])
-                        and ab_height_gap >= min_vertical_gap
-                        and horiz_overlap_ratio > 0.3
-                    ):
-                        above_blocks.append(ab)
-
-            # pick the block with the largest bottom edge
-            if above_blocks:
-                above_block = max(above_blocks, key=lambda b: b["bbox"].y1)
-                clip_top = above_block["bbox"].y1
-            else:
-                clip_top = page_rect.y0
-
-            clip_left = fig_x0
-            clip_right = fig_x1
-            clip_bottom = fig_y0
-
-            # (b) Create figure screenshot
-            if (clip_bottom > clip_top) and (clip_right > clip_left):
-                clip_rect = pymupdf.Rect(clip_left, clip_top, clip_right, clip_bottom)
-                pix = page.get_pixmap(clip=clip_rect, dpi=150)
-
-                fig_label_escaped = re.escape(fig_label)
-                # unique filename
-                fig_hash = hashlib.md5(
-                    f"figure_{fig_label_escaped}_{page_num}_{clip_rect}".encode()
-                ).hexdigest()[:10]
-                fig_filename = f"figure_{fig_label_escaped}_Page_{page_num + 1}_{fig_hash}.png"
-                fig_filepath = os.path.join(img_folder_path, fig_filename)
-                pix.save(fig_filepath)
-
-                # (c) Now find references across the ENTIRE DOCUMENT
-                #     We'll build a pattern that matches:
-                #         Figure/Fig./Fig-ure + possible line break + fig_label
-                #     We also ensure we do NOT match if there's a digit/letter
-                #     immediately after fig_label (so "Figure 11" won't match "Figure 1").
-                fig_label_escaped = re.escape(fig_label)
-                # negative lookahead (?![0 - 9A-Za-z]) ensures no letter/digit follows
-                main_text_figure_pattern = re.compile(
-                    rf"(?:Fig(?:\.|-\s*ure)?|Figure)\s*{fig_label_escaped}(?![0 - 9A-Za-z])",
-                    re.IGNORECASE,
-                )
-
-                references_in_doc = []
-                for tb in text_blocks:
-                    # exclude the caption block itself
-                    if tb is blk:
-                        continue
-                    # see if it references this figure label
-                    if main_text_figure_pattern.search(tb["text"]):
-                        references_in_doc.append(tb["text"])
-
-                # (d) Create the final result item
-                result_pairs.append(
-                    {
-                        "img_name": f"figure_{fig_label_escaped}",
-                        "caption": caption_text,
-                        "images": [fig_filepath],
-                        "main_text_figrefs": references_in_doc,
-                    }
-                )
+            fig_x0, fig_y0, fig_x1, _ = blk["bbox"]
+
+            # (a) The figure spans from the nearest large text block above the caption
+            above_block = spatial_index.nearest_above(blk["bbox"], min_vertical_gap)
+            clip_top = above_block["bbox"].y1 if above_block else page_rects[page_num].y0
+            clip_left, clip_right, clip_bottom = fig_x0, fig_x1, fig_y0
+            if not ((clip_bottom > clip_top) and (clip_right > clip_left)):
+                continue
+
+            # (b) Schedule the figure screenshot under a unique filename
+            clip_rect = pymupdf.Rect(clip_left, clip_top, clip_right, clip_bottom)
+            fig_label_escaped = re.escape(fig_label)
+            fig_hash = hashlib.md5(
+                f"figure_{fig_label_escaped}_{page_num}_{clip_rect}".encode()
+            ).hexdigest()[:10]
+            fig_filename = f"figure_{fig_label_escaped}_Page_{page_num + 1}_{fig_hash}.png"
+            fig_filepath = os.path.join(img_folder_path, fig_filename)
+            clips.append((page_num, (clip_left, clip_top, clip_right, clip_bottom), fig_filepath))
+
+            # (c) References across the ENTIRE DOCUMENT, excluding the caption block itself
+            caption_idx = block_positions[id(blk)]
+            references_in_doc = [
+                text_blocks[idx]["text"]
+                for idx in references_by_label.get(_normalize_figure_label(fig_label), [])
+                if idx != caption_idx
+            ]
+
+            # (d) Create the final result item
+            result_pairs.append(
+                {
+                    "img_name": f"figure_{fig_label_escaped}",
+                    "caption": caption_text,
+                    "images": [fig_filepath],
+                    "main_text_figrefs": references_in_doc,
+                }
+            )
 
+    if clips:
+        _render_figure_clips(pdf_path, clips)
     return result_pairs
 
 
+def _figure_img_folder(pdf_path: str) -> str:
+    return os.path.join(
+        os.path.dirname(pdf_path),
+        f"{os.path.splitext(os.path.basename(pdf_path))[0]}_imgs",
+    )
+
+
 def extract_abstract(text: str) -> str:
     # Split text into lines
     lines = text.split("\n")
@@ -347,6 +476,58 @@ def extract_abstract(text: str) -> str:
     return abstract_text
 
 
+_T = TypeVar("_T")
+
+# Per-figure reviews are independent VLM calls; a small pool keeps provider rate limits happy.
+_MAX_CONCURRENT_FIGURE_REVIEWS = 4
+_MAX_CACHED_FIGURE_REVIEWS = 256
+
+_figure_review_cache: "OrderedDict[str, Any]" = OrderedDict()
+_figure_review_cache_lock = threading.Lock()
+
+
+def _figure_review_key(
+    kind: str, img: Dict[str, Any], model: str, *prompt_inputs: str | float
+) -> str:
+    """
+    Memoization key for a figure review: figure image hashes, caption, reference text,
+    model, plus any other prompt inputs (abstract, temperature, page info).
+    """
+    digest = hashlib.sha256()
+    for part in (kind, model, img["caption"], *img["main_text_figrefs"], *prompt_inputs):
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\0")
+    for image_path in img["images"]:
+        digest.update(compute_file_hash(image_path).encode("ascii"))
+    return digest.hexdigest()
+
+
+def _memoized_figure_review(key: str, review_fn: Callable[[], _T | None]) -> _T | None:
+    with _figure_review_cache_lock:
+        if key in _figure_review_cache:
+            _figure_review_cache.move_to_end(key)
+            return _figure_review_cache[key]  # type: ignore[no-any-return]
+    review = review_fn()
+    if review is not None:
+        with _figure_review_cache_lock:
+            _figure_review_cache[key] = review
+            while len(_figure_review_cache) > _MAX_CACHED_FIGURE_REVIEWS:
+                _figure_review_cache.popitem(last=False)
+    return review
+
+
+def _review_figures_concurrently(
+    img_pairs: List[Dict[str, Any]],
+    review_one: Callable[[Dict[str, Any]], _T | None],
+) -> List[_T | None]:
+    """Run `review_one` for every figure on a bounded thread pool, preserving figure order."""
+    if len(img_pairs) <= 1:
+        return [review_one(img) for img in img_pairs]
+    max_workers = min(_MAX_CONCURRENT_FIGURE_REVIEWS, len(img_pairs))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(review_one, img_pairs))
+
+
 def generate_vlm_img_cap_ref_review(
     img: Dict[str, Any],
     abstract: str,
@@ -400,27 +581,26 @@ def perform_imgs_cap_ref_review(
     temperature: float,
 ) -> List[FigureImageCaptionRefReview]:
     paper_txt = load_paper(pdf_path)
-    img_folder_path = os.path.join(
-        os.path.dirname(pdf_path),
-        f"{os.path.splitext(os.path.basename(pdf_path))[0]}_imgs",
-    )
-    if not os.path.exists(img_folder_path):
-        os.makedirs(img_folder_path)
-    img_pairs = extract_figure_screenshots(pdf_path, img_folder_path)
-    img_reviews: List[FigureImageCaptionRefReview] = []
+    img_pairs = extract_figure_screenshots(pdf_path, _figure_img_folder(pdf_path))
     abstract = extract_abstract(paper_txt)
-    for img in img_pairs:
-        review = generate_vlm_img_cap_ref_review(
-            img=img,
-            abstract=abstract,
-            model=model,
-            temperature=temperature,
+
+    def review_one(img: Dict[str, Any]) -> ImageCaptionRefReview | None:
+        return _memoized_figure_review(
+            _figure_review_key("cap_ref", img, model, abstract, temperature),
+            lambda: generate_vlm_img_cap_ref_review(
+                img=img,
+                abstract=abstract,
+                model=model,
+                temperature=temperature,
+            ),
         )
-        if review is not None:
-            img_reviews.append(
-                FigureImageCaptionRefReview(figure_name=img["img_name"], review=review)
-            )
-    return img_reviews
+
+    reviews = _review_figures_concurrently(img_pairs, review_one)
+    return [
+        FigureImageCaptionRefReview(figure_name=img["img_name"], review=review)
+        for img, review in zip(img_pairs, reviews)
+        if review is not None
+    ]
 
 
 def detect_duplicate_figures(
@@ -428,14 +608,7 @@ def detect_duplicate_figures(
     pdf_path: str,
     temperature: float,
 ) -> str | Dict[str, str]:
-    load_paper(pdf_path)
-    img_folder_path = os.path.join(
-        os.path.dirname(pdf_path),
-        f"{os.path.splitext(os.path.basename(pdf_path))[0]}_imgs",
-    )
-    if not os.path.exists(img_folder_path):
-        os.makedirs(img_folder_path)
-    img_pairs = extract_figure_screenshots(pdf_path, img_folder_path)
+    img_pairs = extract_figure_screenshots(pdf_path, _figure_img_folder(pdf_path))
 
     system_message = (
         "You are an expert at identifying duplicate or highly similar images. "
@@ -499,22 +672,22 @@ def perform_imgs_cap_ref_review_selection(
     temperature: float,
 ) -> Dict[str, Any]:
     paper_txt = load_paper(pdf_path)
-    img_folder_path = os.path.join(
-        os.path.dirname(pdf_path),
-        f"{os.path.splitext(os.path.basename(pdf_path))[0]}_imgs",
-    )
-    if not os.path.exists(img_folder_path):
-        os.makedirs(img_folder_path)
-    img_pairs = extract_figure_screenshots(pdf_path, img_folder_path)
-    img_reviews: Dict[str, Any] = {}
+    img_pairs = extract_figure_screenshots(pdf_path, _figure_img_folder(pdf_path))
     abstract = extract_abstract(paper_txt)
-    for img in img_pairs:
-        review = generate_vlm_img_selection_review(
-            img=img,
-            abstract=abstract,
-            model=model,
-            reflection_page_info=reflection_page_info,
-            temperature=temperature,
+
+    def review_one(img: Dict[str, Any]) -> Dict[str, Any] | None:
+        return _memoized_figure_review(
+            _figure_review_key(
+                "selection", img, model, abstract, reflection_page_info, temperature
+            ),
+            lambda: generate_vlm_img_selection_review(
+                img=img,
+                abstract=abstract,
+                model=model,
+                reflection_page_info=reflection_page_info,
+                temperature=temperature,
+            ),
         )
-        img_reviews[img["img_name"]] = review
-    return img_reviews
+
+    reviews = _review_figures_concurrently(img_pairs, review_one)
+    return {img["img_name"]: review for img, review in zip(img_pairs, reviews)}
@@ -8,17 +8,18 @@ import shutil
 import subprocess
 import traceback
 import unicodedata
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional
 
 from langchain_core.messages import BaseMessage
 from pydantic import BaseModel, Field
 
-from ai_scientist.citations_specs import CITATION_SEARCH_SCHEMA, CITATION_SELECTION_SCHEMA
-from ai_scientist.ideation.semantic_scholar import search_for_papers
+from ai_scientist.citations_specs import CITATION_SEARCH_BATCH_SCHEMA, CITATION_SELECTION_SCHEMA
+from ai_scientist.ideation.semantic_scholar import normalize_query, search_for_papers_batch
 from ai_scientist.latest_run_finder import find_latest_run_dir_name
 from ai_scientist.llm import get_structured_response_from_llm
+from ai_scientist.pdf_layout import get_pdf_layout_index
 from ai_scientist.perform_vlm_review import (
     detect_duplicate_figures,
     generate_vlm_img_review,
@@ -227,81 +228,61 @@ def compile_latex(cwd: str, pdf_file: str, timeout: int = 30) -> bool:
         return False
 
 
-def detect_pages_before_impact(latex_folder: str, timeout: int = 30) -> tuple[int, int] | None:
+def detect_pages_before_impact(pdf_file: str) -> tuple[int, int] | None:
     """
-    Temporarily copy the latex folder, compile, and detect on which page
-    the phrase "Impact Statement" appears.
+    Detect on which page the "Impact Statement" section starts in an already
+    compiled PDF, using the cached layout index instead of recompiling.
     Returns a tuple (page_number, line_number) if found, otherwise None.
     """
-    temp_dir = osp.join(latex_folder, f"_temp_compile_{uuid.uuid4().hex}")
-    try:
-        shutil.copytree(latex_folder, temp_dir, dirs_exist_ok=True)
-
-        # Compile in the temp folder
-        commands = [
-            ["pdflatex", "-interaction=nonstopmode", "template.tex"],
-            ["bibtex", "template"],
-            ["pdflatex", "-interaction=nonstopmode", "template.tex"],
-            ["pdflatex", "-interaction=nonstopmode", "template.tex"],
-        ]
-        for command in commands:
-            try:
-                subprocess.run(
-                    command,
-                    cwd=temp_dir,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=timeout,
-                )
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                return None
+    index = get_pdf_layout_index(pdf_file)
+    if index is None:
+        return None
+    return index.find_heading("Impact Statement", cleaned=False)
 
-        temp_pdf_file = osp.join(temp_dir, "template.pdf")
-        if not osp.exists(temp_pdf_file):
-            return None
 
-        # Try page-by-page extraction to detect "Impact Statement"
-        for i in range(1, 51):
-            page_txt = osp.join(temp_dir, f"page_{i}.txt")
-            subprocess.run(
-                [
-                    "pdftotext",
-                    "-f",
-                    str(i),
-                    "-l",
-                    str(i),
-                    "-q",
-                    temp_pdf_file,
-                    page_txt,
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+def _format_papers_for_selection(papers: list[Dict[Any, Any]]) -> str:
+    paper_strings = []
+    for i, paper in enumerate(papers):
+        paper_strings.append(
+            "{i}: {title}. {authors}. {venue}, {year}.\nAbstract: {abstract}".format(
+                i=i,
+                title=paper["title"],
+                authors=paper["authors"],
+                venue=paper["venue"],
+                year=paper["year"],
+                abstract=paper["abstract"],
             )
-            if not osp.exists(page_txt):
-                break
-            with open(page_txt, "r", encoding="utf - 8", errors="ignore") as fp:
-                page_content = fp.read()
-            lines = page_content.split("\n")
-            for idx, line in enumerate(lines):
-                if "Impact Statement" in line:
-                    return (i, idx + 1)
-        return None
-    except Exception:
-        return None
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        )
+    return "\n\n".join(paper_strings)
+
 
+def _clean_bibtex_entries(bibtexs: list[str]) -> list[str]:
+    cleaned_bibtexs = []
+    for bibtex in bibtexs:
+        newline_index = bibtex.find("\n")
+        cite_key_line = bibtex[:newline_index]
+        cite_key_line = remove_accents_and_clean(cite_key_line)
+        cleaned_bibtexs.append(cite_key_line + bibtex[newline_index:])
+    return cleaned_bibtexs
 
-def get_citation_addition(
+
+def get_citation_additions(
     model: str,
     context: tuple,
     current_round: int,
     total_rounds: int,
     idea_text: str,
     temperature: float,
-) -> str | None:
+    max_queries: int = 3,
+) -> tuple[list[str], int] | None:
+    """
+    Run one citation round: propose up to `max_queries` independent searches in a
+    single LLM call, resolve them concurrently through the cached Semantic Scholar
+    client, then select papers for every query in parallel.
+
+    Returns the formatted bibtex additions (empty when no paper was selected) with the number
+    of searches issued, or None when no more citations are needed or the proposal step failed.
+    """
     report, citations = context
     msg_history: list[BaseMessage] = []
     citation_system_msg_template = """You are an ambitious AI researcher who is looking to publish a paper to a top-tier ML conference that will contribute significantly to the field.
@@ -343,15 +324,17 @@ Your current list of citations is:
 {citations}
 ```
 
-Identify the most important citation that you still need to add, and the query to find the paper.
+Identify up to {max_queries} of the most important citations that you still need to add, and the query to find each paper.
+The citations must be independent of each other: each query should target a different paper.
 
-Return a JSON object matching the CitationSearchResponse schema:
-- "needs_more_citations": whether another citation is still required.
-- "description": purpose of the desired citation (what you are looking for).
-- "query": Semantic Scholar search query to find the paper.
-If "needs_more_citations" is false, leave the other fields blank."""
+Return a JSON object matching the CitationSearchBatchResponse schema:
+- "needs_more_citations": whether more citations are still required.
+- "queries": list of objects, each with:
+  - "description": purpose of the desired citation (what you are looking for).
+  - "query": Semantic Scholar search query to find the paper.
+If "needs_more_citations" is false, leave "queries" empty."""
 
-    citation_second_prompt_template = """Search has recovered the following articles:
+    citation_second_prompt_template = """Search for "{query}" ({description}) has recovered the following articles:
 
 {papers}
 
@@ -361,6 +344,7 @@ Return a JSON object matching the CitationSelectionResponse schema:
 - "description": brief summary of the selected work(s), their relevance, and where to cite them.
 If "should_add" is false, leave "selected_indices" empty."""
 
+    system_message = citation_system_msg_template.format(total_rounds=total_rounds)
     try:
         structured_response, msg_history = get_structured_response_from_llm(
             prompt=citation_first_prompt_template.format(
@@ -369,87 +353,77 @@ If "should_add" is false, leave "selected_indices" empty."""
                 Idea=idea_text,
                 report=report,
                 citations=citations,
+                max_queries=max_queries,
             ),
             model=model,
-            system_message=citation_system_msg_template.format(total_rounds=total_rounds),
+            system_message=system_message,
             temperature=temperature,
-            schema_class=CITATION_SEARCH_SCHEMA,
+            schema_class=CITATION_SEARCH_BATCH_SCHEMA,
             msg_history=msg_history,
         )
         if not structured_response.get("needs_more_citations", True):
             logger.info("No more citations needed.")
             return None
-        query = structured_response.get("query", "")
-        if not isinstance(query, str) or not query.strip():
-            logger.warning("Citation search response missing query.")
+        proposed: dict[str, dict[str, str]] = {}
+        for item in structured_response.get("queries", [])[:max_queries]:
+            query = item.get("query", "") if isinstance(item, dict) else ""
+            if not isinstance(query, str) or not query.strip():
+                continue
+            proposed.setdefault(
+                normalize_query(query), {"query": query, "description": item.get("description", "")}
+            )
+        if not proposed:
+            logger.warning("Citation search response missing queries.")
             return None
-        papers = search_for_papers(query)
+        queries = [entry["query"] for entry in proposed.values()]
+        search_results = search_for_papers_batch(queries, max_workers=len(queries))
     except Exception:
-        logger.exception("EXCEPTION in get_citation_addition (initial search):")
+        logger.exception("EXCEPTION in get_citation_additions (initial search):")
         return None
 
-    if papers is None:
-        logger.warning("No papers found.")
-        return None
-
-    paper_strings = []
-    for i, paper in enumerate(papers):
-        paper_strings.append(
-            "{i}: {title}. {authors}. {venue}, {year}.\nAbstract: {abstract}".format(
-                i=i,
-                title=paper["title"],
-                authors=paper["authors"],
-                venue=paper["venue"],
-                year=paper["year"],
-                abstract=paper["abstract"],
-            )
-        )
-    papers_str = "\n\n".join(paper_strings)
-
-    try:
-        selection_response, msg_history = get_structured_response_from_llm(
-            prompt=citation_second_prompt_template.format(
-                papers=papers_str,
-                current_round=current_round + 1,
-                total_rounds=total_rounds,
-            ),
-            model=model,
-            system_message=citation_system_msg_template.format(total_rounds=total_rounds),
-            temperature=temperature,
-            schema_class=CITATION_SELECTION_SCHEMA,
-            msg_history=msg_history,
-        )
-        if not selection_response.get("should_add", False):
-            logger.info("Do not add any.")
+    def _select(entry: dict[str, str]) -> str | None:
+        papers = search_results.get(entry["query"])
+        if not papers:
+            logger.warning("No papers found for query: %s", entry["query"])
             return None
-        selected_indices = selection_response.get("selected_indices", [])
-        if not isinstance(selected_indices, list) or not selected_indices:
-            logger.warning("Citation selection returned no indices.")
-            return None
-        if not all(isinstance(idx, int) and 0 <= idx < len(papers) for idx in selected_indices):
-            logger.warning("Received invalid citation indices: %s", selected_indices)
+        try:
+            selection_response, _ = get_structured_response_from_llm(
+                prompt=citation_second_prompt_template.format(
+                    query=entry["query"],
+                    description=entry["description"],
+                    papers=_format_papers_for_selection(papers),
+                ),
+                model=model,
+                system_message=system_message,
+                temperature=temperature,
+                schema_class=CITATION_SELECTION_SCHEMA,
+                msg_history=msg_history,
+            )
+            if not selection_response.get("should_add", False):
+                logger.info("Do not add any for query: %s", entry["query"])
+                return None
+            selected_indices = selection_response.get("selected_indices", [])
+            if not isinstance(selected_indices, list) or not selected_indices:
+                logger.warning("Citation selection returned no indices.")
+                return None
+            if not all(isinstance(idx, int) and 0 <= idx < len(papers) for idx in selected_indices):
+                logger.warning("Received invalid citation indices: %s", selected_indices)
+                return None
+            bibtexs = _clean_bibtex_entries(
+                [papers[i]["citationStyles"]["bibtex"] for i in selected_indices]
+            )
+            desc = selection_response.get("description", "")
+        except Exception:
+            logger.exception("EXCEPTION in get_citation_additions (selecting papers):")
             return None
-        bibtexs = [papers[i]["citationStyles"]["bibtex"] for i in selected_indices]
-
-        cleaned_bibtexs = []
-        for bibtex in bibtexs:
-            newline_index = bibtex.find("\n")
-            cite_key_line = bibtex[:newline_index]
-            cite_key_line = remove_accents_and_clean(cite_key_line)
-            cleaned_bibtexs.append(cite_key_line + bibtex[newline_index:])
-        bibtexs = cleaned_bibtexs
-
-        bibtex_string = "\n".join(bibtexs)
-        desc = selection_response.get("description", "")
-    except Exception:
-        logger.exception("EXCEPTION in get_citation_addition (selecting papers):")
-        return None
 
-    references_format = """% {description}
+        references_format = """% {description}
 {bibtex}"""
+        return references_format.format(bibtex="\n".join(bibtexs), description=desc)
 
-    references_prompt = references_format.format(bibtex=bibtex_string, description=desc)
-    return references_prompt
+    with ThreadPoolExecutor(max_workers=len(proposed)) as executor:
+        selections = list(executor.map(_select, proposed.values()))
+    return [addition for addition in selections if addition is not None], len(proposed)
 
 
 # --------------------------------------------------------------------------- #
@@ -595,9 +569,14 @@ def gather_citations(
     temperature: float,
     num_cite_rounds: int,
     run_dir_name: str,
+    queries_per_round: int = 3,
 ) -> str | None:
     """
     Resume-aware citation gathering that persists progress per run directory.
+
+    Each LLM round proposes up to `queries_per_round` independent searches, which are
+    resolved concurrently; every query issued consumes one of the `num_cite_rounds`, and a
+    round that raises consumes one.
     """
     cache_base = logs_dir / run_dir_name if run_dir_name else base_path
     cache_base.mkdir(parents=True, exist_ok=True)
@@ -625,18 +604,23 @@ def gather_citations(
     )
     filtered_summaries_str = json.dumps(filtered_summaries, indent=2)
 
-    for round_idx in range(current_round, num_cite_rounds):
+    round_idx = current_round
+    while round_idx < num_cite_rounds:
+        batch_size = max(1, min(queries_per_round, num_cite_rounds - round_idx))
         try:
             context_for_citation = (filtered_summaries_str, citations_text)
-            addition = get_citation_addition(
+            round_result = get_citation_additions(
                 model=model,
                 context=context_for_citation,
                 current_round=round_idx,
                 total_rounds=num_cite_rounds,
                 idea_text=idea_text,
                 temperature=temperature,
+                max_queries=batch_size,
             )
-            if addition is None:
+            additions, queries_issued = round_result if round_result is not None else ([], 0)
+            # Nothing selected this round ends the search, as a single-query round used to
+            if not additions:
                 citations_cache_path.write_text(citations_text, encoding="utf-8")
                 progress_path.write_text(
                     json.dumps(
@@ -647,22 +631,26 @@ def gather_citations(
                 )
                 break
 
-            title_match = re.search(r" title = {(.*?)}", addition, flags=re.IGNORECASE)
-            if title_match:
-                new_title = title_match.group(1).lower()
-                existing_titles = [
-                    t.lower()
-                    for t in re.findall(r" title = {(.*?)}", citations_text, flags=re.IGNORECASE)
-                ]
-                if new_title in existing_titles:
-                    logger.info("Skipping duplicate citation: %s", new_title)
-                    continue
+            for addition in additions:
+                title_match = re.search(r" title = {(.*?)}", addition, flags=re.IGNORECASE)
+                if title_match:
+                    new_title = title_match.group(1).lower()
+                    existing_titles = [
+                        t.lower()
+                        for t in re.findall(
+                            r" title = {(.*?)}", citations_text, flags=re.IGNORECASE
+                        )
+                    ]
+                    if new_title in existing_titles:
+                        logger.info("Skipping duplicate citation: %s", new_title)
+                        continue
+                citations_text = f"{citations_text}\n{addition}".strip()
 
-            citations_text = f"{citations_text}\n{addition}".strip()
+            round_idx += queries_issued
             citations_cache_path.write_text(citations_text, encoding="utf-8")
             progress_path.write_text(
                 json.dumps(
-                    {"completed_rounds": round_idx + 1, "status": "in_progress"},
+                    {"completed_rounds": round_idx, "status": "in_progress"},
                     indent=2,
                 ),
                 encoding="utf-8",
@@ -674,6 +662,7 @@ def gather_citations(
                 json.dumps({"completed_rounds": round_idx, "status": "error"}, indent=2),
                 encoding="utf-8",
             )
+            round_idx += 1
             continue
 
     return citations_text if citations_text else None
@@ -1014,7 +1003,7 @@ def perform_writeup(
             final_pdf_path = Path(reflection_pdf)
             compile_attempt += 1
 
-            impact_loc = detect_pages_before_impact(str(latex_folder))
+            impact_loc = detect_pages_before_impact(reflection_pdf)
             if impact_loc is not None:
                 page_num, line_num = impact_loc
                 reflection_page_info = (
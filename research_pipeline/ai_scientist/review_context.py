@@ -5,7 +5,7 @@ import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import requests
+from ai_scientist.ideation.semantic_scholar import fetch_paper_search
 
 logger = logging.getLogger(__name__)
 
@@ -69,27 +69,16 @@ def _semantic_scholar_scan(
     if not query:
         return "Semantic Scholar scan skipped (no title or abstract)."
 
-    headers: Dict[str, str] = {}
-    api_key = os.getenv("S2_API_KEY")
-    if api_key:
-        headers["X-API-KEY"] = api_key
-
     try:
-        response = requests.get(
-            "https://api.semanticscholar.org/graph/v1/paper/search",
-            headers=headers,
-            params={
-                "query": query,
-                "limit": str(max_results),
-                "fields": "title,authors,year,venue,citationCount,abstract",
-            },
+        payload = fetch_paper_search(
+            query,
+            result_limit=max_results,
+            fields="title,authors,year,venue,citationCount,abstract",
             timeout=10,
         )
-        response.raise_for_status()
     except Exception as exc:
         return f"Semantic Scholar scan failed: {exc}"
 
-    payload = response.json()
     data: List[Dict[str, Any]] = payload.get("data", []) if isinstance(payload, dict) else []
     if not data:
         return "Semantic Scholar scan returned no overlaps."
@@ -44,6 +44,7 @@ class WebhookClient:
         "substage_completed": "/substage-completed",
         "paper_generation_progress": "/paper-generation-progress",
         "best_node_selection": "/best-node-selection",
+        "node_timing": "/node-timing",
     }
     _RUN_STARTED_PATH = "/run-started"
     _RUN_FINISHED_PATH = "/run-finished"
@@ -4,17 +4,26 @@ AgentManager: Orchestrates the staged BFTS experiment lifecycle.
 High-level responsibilities:
 - Validate and ingest the task description (idea) and runtime config
 - Create and track stages/substages via StageMeta and stage classes
-- For each substage: create a ParallelAgent, run iterations, and evaluate completion
+- For each substage: create a ParallelAgent on the run-wide worker pool, run iterations,
+  and evaluate completion
 - On main stage completion: optionally run multi-seed evaluation and aggregate plots
 - Persist journals, emit progress/log events, and save checkpoints
 - Transition to subsequent substages and main stages until the experiment completes
+
+At every substage start the manager writes its stage state (substages, transitions,
+completed stages, the substage being run) to `<log_dir>/manager_state.json`. Together with
+the `journal.json` the step callback saves per substage, that is enough for
+`restore_run_state` to rebuild an interrupted run and continue inside the substage it was
+in, keeping its finished nodes.
 """
 
 import copy
 import json
 import logging
+import os
 import pickle
-from dataclasses import dataclass
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, cast
 
@@ -28,20 +37,27 @@ from ai_scientist.treesearch.events import (
     SubstageCompletedEvent,
 )
 
+from .blob_store import BLOB_DIR_NAME, BlobStore, activate_blob_store
 from .journal import Journal, Node
 from .metrics_extraction import analyze_progress, gather_stage_metrics, identify_issues
 from .multi_seed_evaluation import run_plot_aggregation
 from .parallel_agent import ParallelAgent
+from .phase_timing import summarize_phases
 from .stages.base import Stage as StageImpl
 from .stages.base import StageContext, StageMeta
 from .stages.stage1_baseline import Stage1Baseline
 from .stages.stage2_tuning import Stage2Tuning
 from .stages.stage3_plotting import Stage3Plotting
 from .stages.stage4_ablation import Stage4Ablation
+from .step_bookkeeping import StepBookkeeper
 from .utils.config import Config, TaskDescription
+from .utils.serialize import load_json
+from .worker_pool import WorkerPool
 
 logger = logging.getLogger(__name__)
 
+RUN_STATE_FILE_NAME = "manager_state.json"
+
 
 class SubstageGoalResponse(BaseModel):
     goals: str
@@ -88,13 +104,33 @@ class AgentManager:
         self._completed_stages: set[str] = set()
         self._final_progress_emitted: set[str] = set()
         self._substage_completed_emitted: set[str] = set()
+        # Worker processes are started once and shared by every substage's ParallelAgent
+        self.worker_pool = WorkerPool()
+        # Step callbacks run in the background between stage boundaries
+        self.bookkeeping = StepBookkeeper()
+        # Large node payloads of all journals live on disk (see blob_store.py)
+        storage_cfg = cfg.agent.node_storage
+        if storage_cfg.offload:
+            activate_blob_store(
+                BlobStore(Path(cfg.log_dir) / BLOB_DIR_NAME, min_bytes=storage_cfg.min_blob_bytes)
+            )
         # Stage slugs/goals are defined in the stage classes
         # Create initial stage
         # Initialize the experiment with the first stage
         self._create_initial_stage()
+        # Last completion verdict per (stage, "stage"/"substage") with the inputs it was
+        # evaluated for, and (checks, evaluations) counts
+        self._completion_verdicts: Dict[
+            Tuple[str, str], Tuple[Tuple[object, ...], Tuple[bool, str]]
+        ] = {}
+        self._completion_check_counts: Dict[Tuple[str, str], Tuple[int, int]] = {}
         # Track last iteration logs per stage to avoid duplicate spam when a stage stalls
         self._last_logged_iteration_by_stage: Dict[str, int] = {}
         self._last_logged_node_count_by_stage: Dict[str, int] = {}
+        # Set by restore_run_state: the substage whose first step is replaced by a completion
+        # check, and (restore start, substage, restored node count) until a new node lands
+        self._resumed_substage: Optional[str] = None
+        self._resumed_at: Optional[Tuple[float, str, int]] = None
 
     def get_max_iterations(self, stage_number: int) -> int:
         """Get max iterations for a stage from config or default"""
@@ -144,14 +180,19 @@ Your research idea:\n\n
 
         self.stages.append(initial_stage)
         self.current_stage = initial_stage
-        self.journals[initial_stage.name] = Journal(
+        self.journals[initial_stage.name] = self._new_journal(initial_stage.name)
+
+    def _new_journal(self, stage_name: str) -> Journal:
+        return Journal(
             summary_model=self.cfg.report.model,
             node_selection_model=self.cfg.agent.feedback.model,
             summary_temperature=self.cfg.report.temperature,
             node_selection_temperature=self.cfg.agent.feedback.temperature,
             event_callback=self.event_callback,
-            stage_name=initial_stage.name,
+            stage_name=stage_name,
             run_id=self.cfg.telemetry.run_id if self.cfg.telemetry else None,
+            summary_rebuild_every=self.cfg.agent.summary.rebuild_every,
+            summary_max_delta_nodes=self.cfg.agent.summary.max_delta_nodes,
         )
 
     def _curate_task_desc(self, stage: StageMeta) -> str:
@@ -209,6 +250,89 @@ Your research idea:\n\n
         with open(save_path, "wb") as f:
             pickle.dump(checkpoint, f)
 
+    def _run_state_path(self) -> Path:
+        return Path(self.cfg.log_dir) / RUN_STATE_FILE_NAME
+
+    def _save_run_state(self, current_substage: Optional[StageMeta]) -> None:
+        """Persist the stage state restore_run_state needs; journals are saved per step."""
+        state = {
+            "__version": "1",
+            "stages": [asdict(stage) for stage in self.stages],
+            "stage_history": [asdict(transition) for transition in self.stage_history],
+            "current_substage": current_substage.name if current_substage else None,
+            "completed_stages": sorted(self._completed_stages),
+            "final_progress_emitted": sorted(self._final_progress_emitted),
+            "substage_completed_emitted": sorted(self._substage_completed_emitted),
+        }
+        path = self._run_state_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(state, indent=2))
+        os.replace(tmp_path, path)
+
+    def _load_stage_journal(self, stage: StageMeta) -> Journal:
+        journal_path = Path(self.cfg.log_dir) / f"stage_{stage.name}" / "journal.json"
+        if not journal_path.exists():
+            # Interrupted before the substage's first step was saved
+            return self._new_journal(stage.name)
+        journal = load_json(path=journal_path, cls=Journal)
+        journal.event_callback = self.event_callback
+        journal.stage_name = stage.name
+        journal.summary_rebuild_every = self.cfg.agent.summary.rebuild_every
+        journal.summary_max_delta_nodes = self.cfg.agent.summary.max_delta_nodes
+        if self.cfg.telemetry:
+            journal.run_id = self.cfg.telemetry.run_id
+        return journal
+
+    def restore_run_state(self) -> bool:
+        """Rebuild the state of an interrupted run from `cfg.log_dir`.
+
+        Replaces the initial stage with the saved substages, their journals and transitions,
+        and makes the interrupted substage current so `run()` continues inside it. Returns
+        False if the run saved no state (it predates manager_state.json).
+        """
+        started = time.monotonic()
+        state_path = self._run_state_path()
+        if not state_path.exists():
+            return False
+        state = json.loads(state_path.read_text())
+        self.stages = [StageMeta(**stage) for stage in state["stages"]]
+        self.stage_history = [StageTransition(**t) for t in state["stage_history"]]
+        self._completed_stages = set(state["completed_stages"])
+        self._final_progress_emitted = set(state["final_progress_emitted"])
+        self._substage_completed_emitted = set(state["substage_completed_emitted"])
+        self.journals = {stage.name: self._load_stage_journal(stage) for stage in self.stages}
+        current_name = state["current_substage"]
+        self.current_stage = next((s for s in self.stages if s.name == current_name), None)
+        if self.current_stage is None:
+            logger.info(f"Run state at {state_path} has no unfinished substage")
+            return True
+        self.current_stage_number = self.current_stage.number
+        node_count = len(self.journals[current_name].nodes)
+        if node_count:
+            self._resumed_substage = current_name
+        self._resumed_at = (started, current_name, node_count)
+        logger.info(
+            f"Restored {len(self.stages)} substage(s) and "
+            f"{sum(len(j.nodes) for j in self.journals.values())} node(s) from {state_path} "
+            f"in {time.monotonic() - started:.1f}s; resuming {current_name} at node {node_count}"
+        )
+        return True
+
+    def _log_first_node_after_resume(self, stage_name: str, journal: Journal) -> None:
+        if self._resumed_at is None:
+            return
+        started, resumed_stage, node_count = self._resumed_at
+        if stage_name == resumed_stage and len(journal.nodes) <= node_count:
+            return
+        self._resumed_at = None
+        message = f"First new node {time.monotonic() - started:.1f}s after resuming {resumed_stage}"
+        logger.info(message)
+        try:
+            self.event_callback(RunLogEvent(message=message, level="info"))
+        except Exception:
+            pass
+
     def _create_agent_for_stage(self, stage: StageMeta) -> ParallelAgent:
         """Create a ParallelAgent configured for the given stage"""
         # Derive a stage-local copy of config and curated task description
@@ -260,6 +384,8 @@ Your research idea:\n\n
             best_stage2_node=best_stage2_node,
             best_stage1_node=best_stage1_node,
             event_callback=self.event_callback,
+            worker_pool=self.worker_pool,
+            max_iterations=stage.max_iterations,
         )
 
     def _check_substage_completion(
@@ -293,7 +419,12 @@ Your research idea:\n\n
             stage_obj = Stage4Ablation(meta=current_substage, context=ctx)
         else:
             raise ValueError(f"Unknown stage number: {main_stage_num}")
-        return stage_obj.evaluate_substage_completion()
+        return self._memoized_completion(
+            kind="substage",
+            stage=current_substage,
+            inputs=stage_obj.substage_completion_inputs(),
+            evaluate=stage_obj.evaluate_substage_completion,
+        )
 
     def _check_stage_completion(self, stage: StageMeta) -> Tuple[bool, str]:
         """Check if current stage is complete based on criteria"""
@@ -338,7 +469,33 @@ Your research idea:\n\n
             stage_obj = Stage4Ablation(meta=stage, context=ctx)
         else:
             raise ValueError(f"Unknown stage number: {main_stage_num}")
-        return stage_obj.evaluate_stage_completion()
+        return self._memoized_completion(
+            kind="stage",
+            stage=stage,
+            inputs=stage_obj.stage_completion_inputs(),
+            evaluate=stage_obj.evaluate_stage_completion,
+        )
+
+    def _memoized_completion(
+        self,
+        *,
+        kind: str,
+        stage: StageMeta,
+        inputs: Tuple[object, ...],
+        evaluate: Callable[[], Tuple[bool, str]],
+    ) -> Tuple[bool, str]:
+        """Evaluate a completion check only if its inputs changed since the last evaluation."""
+        key = (stage.name, kind)
+        checks, evaluations = self._completion_check_counts.get(key, (0, 0))
+        previous = self._completion_verdicts.get(key)
+        if previous is not None and previous[0] == inputs:
+            self._completion_check_counts[key] = (checks + 1, evaluations)
+            logger.debug(f"{kind.capitalize()} completion of {stage.name}: inputs unchanged")
+            return previous[1]
+        verdict = evaluate()
+        self._completion_verdicts[key] = (inputs, verdict)
+        self._completion_check_counts[key] = (checks + 1, evaluations + 1)
+        return verdict
 
     def _get_best_implementation(self, stage_name: str) -> Optional[Node]:
         """Get the best implementation from a completed stage"""
@@ -503,6 +660,9 @@ Your research idea:\n\n
         Returns True if preparation succeeded or was not needed; False if we expected
         a previous best but could not find it.
         """
+        if self.journals[current_substage.name].nodes:
+            # Restored mid-substage; it was seeded before the interruption
+            return True
         if self.stage_history:
             prev_stage = self.stage_history[-1].from_stage
             logger.debug(f"prev_stage: {prev_stage}")
@@ -538,7 +698,12 @@ Your research idea:\n\n
             seed_nodes = agent._run_multi_seed_evaluation(best_node)
             if step_callback:
                 step_callback(current_substage, self.journals[current_substage.name])
-            run_plot_aggregation(agent=agent, node=best_node, seed_nodes=seed_nodes)
+            run_plot_aggregation(
+                agent=agent,
+                node=best_node,
+                seed_nodes=seed_nodes,
+                agg_plotting_code=agent.take_seed_aggregation_code(),
+            )
             if step_callback:
                 step_callback(current_substage, self.journals[current_substage.name])
             logger.info(f"Stage {current_substage.name} multi-seed eval done.")
@@ -585,6 +750,13 @@ Your research idea:\n\n
             return
         try:
             best_node = journal.get_best_node()
+            cached_nodes = [n for n in journal.nodes if n.exec_cache_hit]
+            gpu_hours_saved = sum(n.exec_time or 0.0 for n in cached_nodes) / 3600
+            if cached_nodes:
+                logger.info(
+                    f"Stage {current_substage.name}: {len(cached_nodes)} execution(s) served "
+                    f"from the execution cache, ~{gpu_hours_saved:.2f} GPU-hours saved"
+                )
             summary: Dict[str, Any] = {
                 "goals": current_substage.goals,
                 "total_nodes": len(journal.nodes),
@@ -592,6 +764,9 @@ Your research idea:\n\n
                 "good_nodes": len(journal.good_nodes),
                 "best_metric": (str(best_node.metric) if best_node and best_node.metric else None),
                 "feedback": reason,
+                "skipped_executions": len(cached_nodes),
+                "gpu_hours_saved": round(gpu_hours_saved, 3),
+                "phase_timing": summarize_phases(n.phase_timings for n in journal.nodes),
             }
             self.event_callback(
                 SubstageCompletedEvent(
@@ -652,11 +827,17 @@ Your research idea:\n\n
                     # Best-effort logging; never block iteration on event errors
                     pass
 
-            # Drive one iteration of the agent to make forward progress.
-            agent.step()
+            if self._resumed_substage == stage_name:
+                # Restored mid-substage: the steps saved before the interruption may already
+                # have completed it, so check before stepping again
+                self._resumed_substage = None
+            else:
+                # Drive one iteration of the agent to make forward progress.
+                agent.step()
+                self._log_first_node_after_resume(stage_name=stage_name, journal=journal)
 
-            if step_callback:
-                step_callback(current_substage, self.journals[current_substage.name])
+                if step_callback:
+                    step_callback(current_substage, self.journals[current_substage.name])
 
             # Check if sub-stage is complete (check this before main stage completion)
             substage_complete, substage_feedback = self._check_substage_completion(
@@ -669,6 +850,21 @@ Your research idea:\n\n
             )
             logger.debug(f"Feedback from _check_stage_completion: {main_stage_feedback}")
 
+            if substage_complete or main_stage_complete:
+                # Stage boundary: let the bookkeeping of the steps so far land first
+                self.bookkeeping.flush()
+                substage_counts = self._completion_check_counts.get(
+                    (current_substage.name, "substage"), (0, 0)
+                )
+                stage_counts = self._completion_check_counts.get(
+                    (current_substage.name, "stage"), (0, 0)
+                )
+                logger.info(
+                    f"Completion checks for {current_substage.name}: substage evaluated "
+                    f"{substage_counts[1]}/{substage_counts[0]}, stage evaluated "
+                    f"{stage_counts[1]}/{stage_counts[0]} (others reused unchanged inputs)"
+                )
+
             # If substage completes, emit event (even if main stage also completes)
             if substage_complete:
                 self._emit_substage_completed_event(
@@ -723,15 +919,7 @@ Your research idea:\n\n
 
                     # Setup new sub-stage
                     self.stages.append(next_substage)
-                    self.journals[next_substage.name] = Journal(
-                        summary_model=self.cfg.report.model,
-                        node_selection_model=self.cfg.agent.feedback.model,
-                        summary_temperature=self.cfg.report.temperature,
-                        node_selection_temperature=self.cfg.agent.feedback.temperature,
-                        event_callback=self.event_callback,
-                        stage_name=next_substage.name,
-                        run_id=self.cfg.telemetry.run_id if self.cfg.telemetry else None,
-                    )
+                    self.journals[next_substage.name] = self._new_journal(next_substage.name)
                     return False, next_substage
 
                 # If no next sub-stage could be created, end this main stage
@@ -757,15 +945,7 @@ Your research idea:\n\n
             )
 
             self.stages.append(next_main_stage)
-            self.journals[next_main_stage.name] = Journal(
-                summary_model=self.cfg.report.model,
-                node_selection_model=self.cfg.agent.feedback.model,
-                summary_temperature=self.cfg.report.temperature,
-                node_selection_temperature=self.cfg.agent.feedback.temperature,
-                event_callback=self.event_callback,
-                stage_name=next_main_stage.name,
-                run_id=self.cfg.telemetry.run_id if self.cfg.telemetry else None,
-            )
+            self.journals[next_main_stage.name] = self._new_journal(next_main_stage.name)
             self.current_stage = next_main_stage
         else:
             # Exit the outer loop if no more main stages
@@ -773,6 +953,13 @@ Your research idea:\n\n
             logger.info("No more stages to run -- exiting the loop...")
             self.current_stage = None
 
+    def close(self) -> None:
+        """Drain step bookkeeping, stop the worker pool; call once the run (or resumed stage) ends."""
+        self.bookkeeping.close()
+        self.worker_pool.close()
+        # Nodes keep their refs to the store; only new payloads stay in memory again
+        activate_blob_store(None)
+
     def run(
         self,
         step_callback: Optional[Callable[[StageMeta, Journal], None]] = None,
@@ -789,6 +976,7 @@ Your research idea:\n\n
             )
             # Main stage complete - create next main stage
             self._advance_to_next_main_stage()
+        self._save_run_state(current_substage=None)
 
     def run_stage(
         self,
@@ -800,8 +988,10 @@ Your research idea:\n\n
         This executes the sub-stage loop until the main stage completes,
         performs any post-stage evaluation, and saves a checkpoint.
         """
+        deferred_callback = self.bookkeeping.defer(step_callback) if step_callback else None
         current_substage: Optional[StageMeta] = initial_substage
         while current_substage:
+            self._save_run_state(current_substage=current_substage)
             logger.info(f"Starting sub-stage: {current_substage.name}")
             logger.info(
                 f"Max iterations for {current_substage.name}: {current_substage.max_iterations}"
@@ -830,8 +1020,10 @@ Your research idea:\n\n
                 main_done, maybe_next_substage = self._run_substage(
                     current_substage=current_substage,
                     agent=agent,
-                    step_callback=step_callback,
+                    step_callback=deferred_callback,
                 )
+                # Includes the steps of the multi-seed evaluation
+                self.bookkeeping.flush()
                 if main_done:
                     # Don't set self.current_stage = None here - let _advance_to_next_main_stage() handle it
                     # This allows the next main stage to be created properly
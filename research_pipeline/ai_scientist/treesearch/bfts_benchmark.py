@@ -0,0 +1,962 @@
+"""
+Offline benchmark of the BFTS orchestration.
+
+Runs `perform_experiments_bfts` through all four stages without a network, a GPU or real
+experiments, so the overhead of the tree search itself can be measured at increasing
+journal sizes:
+
+- every LLM call is answered by ScriptedChatModel, which fills in the requested schema
+  from the prompt (reviews flag simulated failures, metric extraction reads the parse
+  script's output, stage-completion verdicts are "not complete" so each stage runs to its
+  iteration budget). It simulates a provider's prompt-prefix cache shared by all processes:
+  the leading blocks of a prompt that an earlier prompt started with are reported as cached
+  input tokens, and `--prefill-latency` is charged only for the uncached rest;
+- experiments run in FakeInterpreter, which sleeps for a configurable time, fails at a
+  configurable rate and writes the files a real experiment, metric-parsing or plotting
+  script would;
+- `--gpus` fake GPUs are reported to the scheduler; experiment runs log when they occupy
+  which GPU, from which the per-GPU idle time is computed.
+
+The fakes are installed in the parent and, through the worker pool's initializer, in every
+spawned worker. Results (step latency, `save_run` and checkpoint time and size, memory
+growth, telemetry throughput, GPU idle time, per-phase totals, prompt-cache hits and
+research-summary cost) are written as JSON:
+
+    python -m ai_scientist.treesearch.bfts_benchmark --sizes 10 100 1000 --output bench.json
+
+With `--interrupt-after N` the run is interrupted after N agent steps, as a preempted
+instance would be, and resumed from what it persisted (`AgentManager.restore_run_state`);
+the result then also reports the restore time and the time to the first new node.
+"""
+
+import argparse
+import functools
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import types
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import ExitStack, chdir, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Literal, Union, get_args, get_origin
+from unittest import mock
+
+import numpy as np
+import psutil
+from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import Runnable, RunnableLambda
+from omegaconf import OmegaConf
+from PIL import Image
+from pydantic import BaseModel
+
+from ai_scientist.llm import llm as llm_module
+from ai_scientist.llm import token_tracker
+from ai_scientist.llm import vlm as vlm_module
+from ai_scientist.telemetry import EventQueueEmitter
+from ai_scientist.telemetry.event_persistence import PersistableEvent
+
+from . import (
+    agent_manager,
+    multi_seed_evaluation,
+    parallel_agent,
+    perform_experiments_bfts_with_agentmanager,
+    worker_process,
+)
+from .agent_manager import AgentManager
+from .codegen_agent import PlanAndCodeSchema
+from .events import BaseEvent
+from .gpu_manager import GPUDevice, GPUSpec
+from .interpreter import ExecutionResult
+from .journal import Journal, NodeSelectionResponse
+from .parallel_agent import ParallelAgent
+from .phase_timing import summarize_phases
+from .stages.base import StageCompletionEvaluation, StageMeta
+from .stages.stage2_tuning import HyperparamTuningIdea, HyperparamTuningIdeaBatch
+from .stages.stage4_ablation import AblationIdea, AblationIdeaBatch
+from .utils.config import Config, load_task_desc
+from .vlm_function_specs import METRICS_CONTRACT_FILENAME, MetricParseResponse, TrainingReview
+from .worker_pool import WorkerPool
+
+logger = logging.getLogger("ai-scientist")
+
+# A provider-qualified name, so token tracking can attribute the (scripted) usage
+SCRIPTED_MODEL = "openai:bfts-benchmark-scripted"
+FAKE_GPU_NAME = "Benchmark GPU"
+FAKE_GPU_MEMORY_MIB = 81920
+CODE_KIND_PREFIX = "# bfts-benchmark: "
+SIMULATED_FAILURE = "RuntimeError: simulated benchmark failure"
+_DEFAULT_CONFIG = Path(__file__).resolve().parents[2] / "bfts_config.yaml"
+_CODE_KIND = re.compile(rf"^{re.escape(CODE_KIND_PREFIX)}(\w+)", re.MULTILINE)
+_GPU_INDEX = re.compile(r"Use GPU index (\d+)")
+_NODE_ID = re.compile(r"ID: (\S+)")
+_IDEA_COUNT = re.compile(r"propose (\d+) new")
+_VALIDATION_LOSS = re.compile(r"validation loss: ([0-9.]+)")
+
+
+@dataclass(frozen=True)
+class BenchmarkSettings:
+    """How the fakes behave; passed to every worker process."""
+
+    run_time_s: float
+    failure_rate: float
+    metrics_file_rate: float
+    llm_latency_s: float
+    prefill_s_per_1k_tokens: float
+    num_gpus: int
+    activity_log: str
+    prompt_cache_dir: str
+
+
+def _fraction(text: str, salt: str) -> float:
+    """Deterministic value in [0, 1) derived from `text`."""
+    digest = hashlib.sha256(f"{salt}\0{text}".encode("utf-8")).hexdigest()
+    return int(digest[:12], 16) / float(1 << 48)
+
+
+def _message_text(messages: Sequence[BaseMessage]) -> str:
+    parts: list[str] = []
+    for message in messages:
+        if isinstance(message.content, str):
+            parts.append(message.content)
+            continue
+        for block in message.content:
+            if isinstance(block, str):
+                parts.append(block)
+            elif isinstance(block, dict) and block.get("type") == "text":
+                parts.append(str(block.get("text", "")))
+    return "\n".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Scripted LLM
+# ---------------------------------------------------------------------------
+
+_idea_counter = itertools.count(1)
+
+# Providers cache prompt prefixes in fixed-size blocks (~256 tokens); a block is a hit when
+# the whole prompt up to and including it was seen before
+_PREFIX_BLOCK_CHARS = 1024
+
+
+def _cached_prefix_chars(prompt: str, *, cache_dir: Path) -> int:
+    """
+    Characters at the start of `prompt` a prefix-caching provider would serve from cache.
+    Each seen prefix is a marker file in `cache_dir`, so all processes share the cache.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    cached = 0
+    hit = True
+    for start in range(0, len(prompt) - _PREFIX_BLOCK_CHARS + 1, _PREFIX_BLOCK_CHARS):
+        digest.update(prompt[start : start + _PREFIX_BLOCK_CHARS].encode("utf-8"))
+        marker = cache_dir / digest.hexdigest()
+        if hit and marker.exists():
+            cached += _PREFIX_BLOCK_CHARS
+        else:
+            hit = False
+            marker.touch()
+    return cached
+
+
+def _placeholder(annotation: Any, field_name: str) -> Any:  # noqa: ANN401
+    """A valid value of type `annotation` for fields without a scripted answer."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {
+            info.alias or name: _placeholder(info.annotation, name)
+            for name, info in annotation.model_fields.items()
+        }
+    origin = get_origin(annotation)
+    args = [arg for arg in get_args(annotation) if arg is not type(None)]
+    if origin is list:
+        return [_placeholder(args[0], field_name)] if args else []
+    if origin is dict:
+        return {}
+    if origin is Literal:
+        return args[0]
+    if origin in (Union, types.UnionType):
+        return _placeholder(args[0], field_name)
+    if annotation is bool:
+        # valid_plots_received & co.: the fake artifacts are always usable
+        return field_name.startswith("valid_")
+    if annotation is int:
+        return 1
+    if annotation is float:
+        return 0.5
+    return f"Scripted {field_name.replace('_', ' ')}."
+
+
+def _code_kind(prompt: str) -> str:
+    if "DO NOT CREATE ANY PLOTS" in prompt:
+        return "parse"
+    if "Plotting code guideline" in prompt:
+        return "plot"
+    return "experiment"
+
+
+def _plan_and_code(prompt: str) -> dict[str, Any]:
+    kind = _code_kind(prompt)
+    lines = [f"{CODE_KIND_PREFIX}{kind}", f"# variant {uuid.uuid4().hex}"]
+    # Satisfies the agent's check that the code pins the GPU the worker was assigned
+    match = _GPU_INDEX.search(prompt)
+    gpu_index = match[1] if match else os.environ.get("CUDA_VISIBLE_DEVICES")
+    if gpu_index:
+        lines += [
+            f"# torch.cuda.set_device({gpu_index})",
+            f"# device = torch.device('cuda:{gpu_index}')",
+        ]
+    return {"plan": f"Scripted {kind} plan.", "code": "\n".join(lines) + "\n"}
+
+
+def _training_review(prompt: str) -> dict[str, Any]:
+    is_bug = SIMULATED_FAILURE in prompt
+    return {"is_bug": is_bug, "summary": "Simulated failure." if is_bug else ""}
+
+
+def _metric_parse(prompt: str) -> dict[str, Any]:
+    match = _VALIDATION_LOSS.search(prompt)
+    if match is None:
+        return {"valid_metrics_received": False, "metric_names": []}
+    return {"valid_metrics_received": True, "metric_names": [_loss_metric(float(match[1]))]}
+
+
+def _node_selection(prompt: str) -> dict[str, Any]:
+    match = _NODE_ID.search(prompt)
+    return {"selected_id": match[1] if match else "", "reasoning": "First candidate."}
+
+
+def _idea(prompt: str) -> dict[str, Any]:  # noqa: ARG001
+    number = next(_idea_counter)
+    return {"name": f"benchmark idea {os.getpid()}-{number}", "description": "Scripted idea."}
+
+
+def _idea_batch(prompt: str) -> dict[str, Any]:
+    match = _IDEA_COUNT.search(prompt)
+    return {"ideas": [_idea(prompt) for _ in range(int(match[1]) if match else 1)]}
+
+
+def _stage_completion(prompt: str) -> dict[str, Any]:  # noqa: ARG001
+    # Never complete early: every stage runs to its iteration budget
+    return {"is_complete": False, "reasoning": "Scripted.", "missing_criteria": ["budget"]}
+
+
+_RESPONDERS: dict[type[BaseModel], Callable[[str], dict[str, Any]]] = {
+    PlanAndCodeSchema: _plan_and_code,
+    TrainingReview: _training_review,
+    MetricParseResponse: _metric_parse,
+    NodeSelectionResponse: _node_selection,
+    HyperparamTuningIdea: _idea,
+    AblationIdea: _idea,
+    HyperparamTuningIdeaBatch: _idea_batch,
+    AblationIdeaBatch: _idea_batch,
+    StageCompletionEvaluation: _stage_completion,
+}
+
+
+class ScriptedChatModel(BaseChatModel):
+    """Chat model that answers every prompt locally; see the module docstring."""
+
+    model_name: str = SCRIPTED_MODEL
+    latency_s: float = 0.0
+    prefill_s_per_1k_tokens: float = 0.0
+    prompt_cache_dir: Path | None = None
+    structured_schema: type[BaseModel] | None = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "bfts-benchmark-scripted"
+
+    def _respond(self, prompt: str) -> str:
+        schema = self.structured_schema
+        if schema is None:
+            return "Scripted benchmark response: validation loss is tracked, lower is better."
+        responder = _RESPONDERS.get(schema)
+        data = responder(prompt) if responder else _placeholder(schema, schema.__name__)
+        return schema.model_validate(data).model_dump_json(by_alias=True)
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,  # noqa: ARG002
+        run_manager: CallbackManagerForLLMRun | None = None,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ANN401, ARG002
+    ) -> ChatResult:
+        prompt = _message_text(messages)
+        input_tokens = len(prompt) // 4
+        cached_tokens = (
+            _cached_prefix_chars(prompt, cache_dir=self.prompt_cache_dir) // 4
+            if self.prompt_cache_dir is not None
+            else 0
+        )
+        delay_s = self.latency_s + self.prefill_s_per_1k_tokens * (
+            (input_tokens - cached_tokens) / 1000
+        )
+        if delay_s > 0:
+            time.sleep(delay_s)
+        content = self._respond(prompt)
+        output_tokens = len(content) // 4
+        message = AIMessage(
+            content=content,
+            response_metadata={"model_name": self.model_name},
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+                "input_token_details": {"cache_read": cached_tokens},
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def with_structured_output(  # type: ignore[override]
+        self,
+        schema: type[BaseModel],
+        *,
+        include_raw: bool = False,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ANN401, ARG002
+    ) -> Runnable:
+        structured = self.model_copy(update={"structured_schema": schema})
+        return structured | RunnableLambda(
+            lambda message: schema.model_validate_json(str(message.content))
+        )
+
+
+def _scripted_chat_model(
+    *, model: str, temperature: float | None = None, **kwargs: Any  # noqa: ANN401, ARG001
+) -> ScriptedChatModel:
+    settings = _installed_settings
+    if settings is None:
+        return ScriptedChatModel()
+    return ScriptedChatModel(
+        latency_s=settings.llm_latency_s,
+        prefill_s_per_1k_tokens=settings.prefill_s_per_1k_tokens,
+        prompt_cache_dir=Path(settings.prompt_cache_dir),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Fake interpreter and GPUs
+# ---------------------------------------------------------------------------
+
+
+def _loss_metric(loss: float) -> dict[str, Any]:
+    return {
+        "metric_name": "validation loss",
+        "lower_is_better": True,
+        "description": "Simulated validation loss.",
+        "data": [{"dataset_name": "benchmark", "final_value": loss, "best_value": loss}],
+    }
+
+
+class FakeInterpreter:
+    """Drop-in for Interpreter that simulates runs of scripted code without executing it."""
+
+    def __init__(
+        self,
+        working_dir: str | Path,
+        timeout: int = 3600,
+        format_tb_ipython: bool = False,  # noqa: ARG002
+        agent_file_name: str = "runfile.py",  # noqa: ARG002
+        env_vars: dict[str, str] | None = None,  # noqa: ARG002
+    ) -> None:
+        self.working_dir = Path(working_dir).resolve()
+        self.timeout = timeout
+
+    def run(self, code: str, reset_session: bool = True) -> ExecutionResult:  # noqa: ARG002
+        settings = _installed_settings
+        assert settings is not None, "FakeInterpreter used before install_fakes()"
+        match = _CODE_KIND.search(code)
+        working = self.working_dir / "working"
+        working.mkdir(parents=True, exist_ok=True)
+        started = time.time()
+        if match is None:
+            # Not scripted code (e.g. an empty plotting script): runs and does nothing
+            return ExecutionResult(term_out=[], exec_time=0.0, exc_type=None)
+        kind = match[1]
+        if kind == "parse":
+            return self._parse(working, started)
+        if kind == "plot":
+            return self._plot(code, working, started)
+        return self._experiment(code, working, started, settings)
+
+    def _experiment(
+        self, code: str, working: Path, started: float, settings: BenchmarkSettings
+    ) -> ExecutionResult:
+        duration = settings.run_time_s * (0.5 + _fraction(code, "duration"))
+        time.sleep(duration)
+        gpu = os.environ.get("CUDA_VISIBLE_DEVICES")
+        if gpu:
+            record = {"gpu": gpu, "start": started, "end": time.time()}
+            with open(settings.activity_log, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        if _fraction(code, "failure") < settings.failure_rate:
+            return ExecutionResult(
+                term_out=["Traceback (most recent call last):\n", f"{SIMULATED_FAILURE}\n"],
+                exec_time=time.time() - started,
+                exc_type="RuntimeError",
+                exc_info={"args": ["simulated benchmark failure"]},
+                exc_stack=[],
+            )
+        loss = round(0.1 + 0.9 * _fraction(code, "loss"), 4)
+        np.save(working / "experiment_data.npy", np.array({"loss": loss}, dtype=object))
+        if _fraction(code, "metrics_file") < settings.metrics_file_rate:
+            contract = {"valid_metrics_received": True, "metric_names": [_loss_metric(loss)]}
+            (working / METRICS_CONTRACT_FILENAME).write_text(json.dumps(contract))
+        return ExecutionResult(
+            term_out=[f"Epoch 1: validation loss = {loss}\n"],
+            exec_time=time.time() - started,
+            exc_type=None,
+        )
+
+    def _parse(self, working: Path, started: float) -> ExecutionResult:
+        data_path = working / "experiment_data.npy"
+        if not data_path.exists():
+            return ExecutionResult(
+                term_out=[f"FileNotFoundError: {data_path.name}\n"],
+                exec_time=time.time() - started,
+                exc_type="FileNotFoundError",
+            )
+        loss = np.load(data_path, allow_pickle=True).item()["loss"]
+        return ExecutionResult(
+            term_out=["Dataset: benchmark\n", f"validation loss: {loss}\n"],
+            exec_time=time.time() - started,
+            exc_type=None,
+        )
+
+    def _plot(self, code: str, working: Path, started: float) -> ExecutionResult:
+        prefix = hashlib.sha256(code.encode("utf-8")).hexdigest()[:8]
+        for name in ("loss", "accuracy"):
+            Image.new("RGB", (16, 16), color=(40, 90, 160)).save(working / f"{prefix}_{name}.png")
+        return ExecutionResult(
+            term_out=["Saved 2 plots\n"], exec_time=time.time() - started, exc_type=None
+        )
+
+    def cleanup_session(self) -> None:
+        return None
+
+
+def _fake_gpu_devices() -> list[GPUDevice]:
+    settings = _installed_settings
+    num_gpus = settings.num_gpus if settings else 0
+    return [
+        GPUDevice(gpu_id=gpu_id, memory_total_mib=FAKE_GPU_MEMORY_MIB, name=FAKE_GPU_NAME)
+        for gpu_id in range(num_gpus)
+    ]
+
+
+def _fake_gpu_specs(gpu_id: int) -> GPUSpec:  # noqa: ARG001
+    return {"name": FAKE_GPU_NAME, "memory_total_mib": FAKE_GPU_MEMORY_MIB}
+
+
+_installed_settings: BenchmarkSettings | None = None
+
+
+def _fake_targets() -> list[tuple[object, str, object]]:
+    return [
+        (llm_module, "init_chat_model", _scripted_chat_model),
+        (vlm_module, "init_chat_model", _scripted_chat_model),
+        (worker_process, "Interpreter", FakeInterpreter),
+        (worker_process, "get_gpu_specs", _fake_gpu_specs),
+        (multi_seed_evaluation, "Interpreter", FakeInterpreter),
+        (parallel_agent, "detect_gpu_devices", _fake_gpu_devices),
+        # Token usage goes to the run's cost_track.csv, never to a configured database
+        (token_tracker, "pg_config", None),
+    ]
+
+
+def install_fakes(settings: BenchmarkSettings) -> None:
+    """Worker pool initializer: swap the fakes into this (worker) process for good."""
+    global _installed_settings
+    _installed_settings = settings
+    for target, name, value in _fake_targets():
+        setattr(target, name, value)
+
+
+# ---------------------------------------------------------------------------
+# Measurements
+# ---------------------------------------------------------------------------
+
+
+def _distribution(values: Sequence[float]) -> dict[str, float | int]:
+    if not values:
+        return {"count": 0}
+    ordered = sorted(values)
+    p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+    return {
+        "count": len(ordered),
+        "total_s": round(sum(ordered), 4),
+        "mean_s": round(statistics.fmean(ordered), 4),
+        "p50_s": round(statistics.median(ordered), 4),
+        "p95_s": round(p95, 4),
+        "max_s": round(ordered[-1], 4),
+    }
+
+
+def _rss_mib() -> tuple[float, float]:
+    """Resident memory of this process and of all its descendants, in MiB."""
+    process = psutil.Process()
+    own = process.memory_info().rss
+    children = 0
+    for child in process.children(recursive=True):
+        try:
+            children += child.memory_info().rss
+        except psutil.Error:
+            continue
+    return own / 2**20, children / 2**20
+
+
+def _log_event(event: BaseEvent) -> None:
+    logger.debug(event.to_dict())
+
+
+# Parent-side emit latencies; copies of the emitter in workers record into their own list
+_emit_latencies_s: list[float] = []
+
+
+@dataclass
+class _TimedEmitter:
+    emitter: EventQueueEmitter
+
+    def __call__(self, event: BaseEvent) -> None:
+        started = time.perf_counter()
+        self.emitter(event)
+        _emit_latencies_s.append(time.perf_counter() - started)
+
+
+class _Interrupted(Exception):
+    """Raised after `--interrupt-after` steps to simulate a preempted instance."""
+
+
+@dataclass
+class _RunRecorder:
+    """Measurements of one benchmark run, filled in by the instrumented pipeline."""
+
+    step_s: dict[str, list[float]] = field(default_factory=dict)
+    save_run_s: list[float] = field(default_factory=list)
+    journal_bytes: int = 0
+    checkpoint_s: list[float] = field(default_factory=list)
+    checkpoint_bytes: int = 0
+    journals: dict[str, Journal] = field(default_factory=dict)
+    # (total nodes so far, parent RSS MiB, workers RSS MiB) after every step
+    memory: list[tuple[int, float, float]] = field(default_factory=list)
+    persisted: Counter[str] = field(default_factory=Counter)
+    persisted_times: list[float] = field(default_factory=list)
+    # --interrupt-after: steps before the simulated interruption, the run's config (as seen
+    # by save_run), and when the resume started and produced its first new node
+    interrupt_after: int | None = None
+    steps_taken: int = 0
+    cfg: Config | None = None
+    resume_started: float | None = None
+    first_new_node_s: float | None = None
+
+    def node_count(self) -> int:
+        return sum(len(journal.nodes) for journal in self.journals.values())
+
+
+@contextmanager
+def _instrumented(recorder: _RunRecorder, settings: BenchmarkSettings) -> Iterator[None]:
+    """Install the fakes in this process and time the hot spots, undoing both on exit."""
+    global _installed_settings
+    original_step = ParallelAgent.step
+    original_save_run = perform_experiments_bfts_with_agentmanager.save_run
+    original_checkpoint = AgentManager._save_checkpoint
+
+    def timed_step(self: ParallelAgent) -> None:
+        started = time.perf_counter()
+        nodes_before = len(self.journal.nodes)
+        original_step(self)
+        recorder.step_s.setdefault(self.stage_name, []).append(time.perf_counter() - started)
+        recorder.journals[self.stage_name] = self.journal
+        recorder.memory.append((recorder.node_count(), *_rss_mib()))
+        recorder.steps_taken += 1
+        if (
+            recorder.resume_started is not None
+            and recorder.first_new_node_s is None
+            and len(self.journal.nodes) > nodes_before
+        ):
+            recorder.first_new_node_s = time.perf_counter() - recorder.resume_started
+        if recorder.resume_started is None and recorder.steps_taken == recorder.interrupt_after:
+            raise _Interrupted(f"interrupted after {recorder.steps_taken} steps")
+
+    def timed_save_run(cfg: Config, journal: Journal, stage_name: str) -> None:
+        recorder.cfg = cfg
+        started = time.perf_counter()
+        original_save_run(cfg, journal, stage_name=stage_name)
+        recorder.save_run_s.append(time.perf_counter() - started)
+        journal_path = cfg.log_dir / stage_name / "journal.json"
+        if journal_path.exists():
+            recorder.journal_bytes = max(recorder.journal_bytes, journal_path.stat().st_size)
+
+    def timed_checkpoint(self: AgentManager) -> None:
+        started = time.perf_counter()
+        original_checkpoint(self)
+        recorder.checkpoint_s.append(time.perf_counter() - started)
+        recorder.journals.update(self.journals)
+        for checkpoint in (Path(self.cfg.log_dir)).glob("stage_*/checkpoint.pkl"):
+            recorder.checkpoint_bytes = max(recorder.checkpoint_bytes, checkpoint.stat().st_size)
+
+    previous_settings = _installed_settings
+    _installed_settings = settings
+    try:
+        with ExitStack() as stack:
+            for target, name, value in _fake_targets():
+                stack.enter_context(mock.patch.object(target, name, value))
+            worker_pool = functools.partial(
+                WorkerPool, initializer=install_fakes, initargs=(settings,)
+            )
+            stack.enter_context(mock.patch.object(agent_manager, "WorkerPool", worker_pool))
+            stack.enter_context(mock.patch.object(ParallelAgent, "step", timed_step))
+            stack.enter_context(
+                mock.patch.object(
+                    perform_experiments_bfts_with_agentmanager, "save_run", timed_save_run
+                )
+            )
+            stack.enter_context(
+                mock.patch.object(AgentManager, "_save_checkpoint", timed_checkpoint)
+            )
+            yield
+    finally:
+        _installed_settings = previous_settings
+
+
+def _gpu_idle(activity_log: Path, *, started: float, finished: float) -> dict[str, Any]:
+    """Per-GPU busy/idle time over the run, from the experiment activity log."""
+    intervals: dict[str, list[tuple[float, float]]] = {}
+    if activity_log.exists():
+        for line in activity_log.read_text().splitlines():
+            record = json.loads(line)
+            intervals.setdefault(record["gpu"], []).append((record["start"], record["end"]))
+    window = max(finished - started, 1e-9)
+    per_gpu: dict[str, Any] = {}
+    for gpu, spans in sorted(intervals.items()):
+        busy = 0.0
+        current_start, current_end = None, None
+        for start, end in sorted(spans):
+            if current_end is None or start > current_end:
+                if current_end is not None and current_start is not None:
+                    busy += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None and current_start is not None:
+            busy += current_end - current_start
+        per_gpu[gpu] = {
+            "experiment_runs": len(spans),
+            "busy_s": round(busy, 3),
+            "idle_fraction": round(max(0.0, 1.0 - busy / window), 4),
+        }
+    fractions = [stats["idle_fraction"] for stats in per_gpu.values()]
+    return {
+        "per_gpu": per_gpu,
+        "mean_idle_fraction": round(statistics.fmean(fractions), 4) if fractions else None,
+    }
+
+
+def _memory_summary(samples: list[tuple[int, float, float]]) -> dict[str, Any]:
+    if not samples:
+        return {}
+    nodes = [float(sample[0]) for sample in samples]
+    parent = [sample[1] for sample in samples]
+    slope = None
+    if len(samples) >= 2 and len(set(nodes)) > 1:
+        slope = round(statistics.linear_regression(nodes, parent).slope * 100, 3)
+    return {
+        "parent_rss_start_mib": round(parent[0], 1),
+        "parent_rss_end_mib": round(parent[-1], 1),
+        "parent_rss_peak_mib": round(max(parent), 1),
+        "parent_rss_growth_mib_per_100_nodes": slope,
+        "workers_rss_peak_mib": round(max(sample[2] for sample in samples), 1),
+    }
+
+
+def _telemetry_summary(recorder: _RunRecorder, wall_s: float) -> dict[str, Any]:
+    times = sorted(recorder.persisted_times)
+    peak = 0
+    window_start = 0
+    for index, at in enumerate(times):
+        while at - times[window_start] > 1.0:
+            window_start += 1
+        peak = max(peak, index - window_start + 1)
+    latencies = _distribution(_emit_latencies_s)
+    return {
+        "parent_events": latencies.get("count", 0),
+        "parent_emit": latencies,
+        "persisted_records": sum(recorder.persisted.values()),
+        "persisted_by_kind": dict(recorder.persisted),
+        "persisted_per_s": round(sum(recorder.persisted.values()) / max(wall_s, 1e-9), 3),
+        "persisted_peak_per_s": peak,
+    }
+
+
+def _write_config(
+    *, base_config: Path, root: Path, target_nodes: int, args: argparse.Namespace
+) -> Path:
+    cfg = OmegaConf.load(base_config)
+    idea_path = Path(str(cfg.desc_file))
+    if not idea_path.is_absolute():
+        idea_path = base_config.parent / idea_path
+    overrides = {
+        "desc_file": str(idea_path.resolve()),
+        "workspace_dir": str(root / "workspaces"),
+        "log_dir": str(root / "workspaces" / "logs"),
+        "exp_name": f"bench-{target_nodes}",
+        "log_level": args.log_level,
+        "min_num_gpus": args.gpus,
+        "telemetry": None,
+        "generate_report": False,
+        "report": {"model": SCRIPTED_MODEL},
+        "agent": {
+            "num_workers": args.workers,
+            "stages": {f"stage{number}_max_iters": target_nodes for number in range(1, 5)},
+            "multi_seed_eval": {"num_seeds": args.seeds},
+            "code": {"model": SCRIPTED_MODEL},
+            "feedback": {"model": SCRIPTED_MODEL},
+            "vlm_feedback": {"model": SCRIPTED_MODEL},
+        },
+    }
+    config_path = root / "bfts_config.yaml"
+    OmegaConf.save(OmegaConf.merge(cfg, overrides), config_path)
+    return config_path
+
+
+def _resume_run(recorder: _RunRecorder, emitter: Callable[[BaseEvent], None]) -> dict[str, Any]:
+    """Resume the interrupted run from what it persisted and run it to the end."""
+    cfg = recorder.cfg
+    if cfg is None:
+        raise RuntimeError("The run was interrupted before it saved anything to resume from")
+    recorder.resume_started = time.perf_counter()
+    manager = AgentManager(
+        task_desc=load_task_desc(cfg),
+        cfg=cfg,
+        workspace_dir=Path(cfg.workspace_dir),
+        event_callback=emitter,
+    )
+
+    def step_callback(stage: StageMeta, journal: Journal) -> None:
+        perform_experiments_bfts_with_agentmanager.save_run(
+            cfg, journal, stage_name=f"stage_{stage.name}"
+        )
+
+    try:
+        manager.restore_run_state()
+        restore_s = time.perf_counter() - recorder.resume_started
+        restored_nodes = sum(len(journal.nodes) for journal in manager.journals.values())
+        recorder.journals.update(manager.journals)
+        manager.run(step_callback=step_callback)
+    finally:
+        manager.close()
+    return {
+        "interrupted_after_steps": recorder.interrupt_after,
+        "restored_nodes": restored_nodes,
+        "restore_s": round(restore_s, 3),
+        "time_to_first_new_node_s": (
+            round(recorder.first_new_node_s, 3) if recorder.first_new_node_s is not None else None
+        ),
+    }
+
+
+def _prompt_cache_summary(phases: dict[str, dict[str, Any]], *, nodes: int) -> dict[str, Any]:
+    """Input tokens of the nodes' LLM calls and how many of them the prompt cache served."""
+    input_tokens = sum(totals["input_tokens"] for totals in phases.values())
+    cached_tokens = sum(totals["cached_input_tokens"] for totals in phases.values())
+    return {
+        "llm_calls": sum(totals["llm_calls"] for totals in phases.values()),
+        "input_tokens": input_tokens,
+        "cached_input_tokens": cached_tokens,
+        "hit_rate": round(cached_tokens / input_tokens, 3) if input_tokens else None,
+        "uncached_input_tokens_per_node": round((input_tokens - cached_tokens) / max(nodes, 1), 1),
+    }
+
+
+def _research_summary_totals(journals: Iterable[Journal]) -> dict[str, Any]:
+    """Research summaries of all stages: how they were produced, their latency and prompts."""
+    totals: Counter[str] = Counter()
+    for journal in journals:
+        totals.update(asdict(journal.summary_stats))
+    queries = totals["full_rebuilds"] + totals["incremental_updates"]
+    return {
+        **{key: round(value, 3) for key, value in totals.items()},
+        "mean_latency_s": round(totals["latency_s"] / queries, 3) if queries else None,
+        "mean_prompt_tokens": round(totals["prompt_tokens"] / queries, 1) if queries else None,
+    }
+
+
+def run_benchmark(
+    *, target_nodes: int, root: Path, base_config: Path, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Run the pipeline once with a per-stage budget of `target_nodes` and measure it."""
+    root.mkdir(parents=True, exist_ok=True)
+    settings = BenchmarkSettings(
+        run_time_s=args.run_time,
+        failure_rate=args.failure_rate,
+        metrics_file_rate=args.metrics_file_rate,
+        llm_latency_s=args.llm_latency,
+        prefill_s_per_1k_tokens=args.prefill_latency,
+        num_gpus=args.gpus,
+        activity_log=str(root / "gpu_activity.jsonl"),
+        prompt_cache_dir=str(root / "prompt_cache"),
+    )
+    config_path = _write_config(
+        base_config=base_config, root=root, target_nodes=target_nodes, args=args
+    )
+    os.environ["WORKSPACE_DIR"] = str(root)
+    _emit_latencies_s.clear()
+    recorder = _RunRecorder(interrupt_after=args.interrupt_after)
+
+    manager = multiprocessing.get_context("spawn").Manager()
+    event_queue = manager.Queue()
+
+    def drain() -> None:
+        while True:
+            item = event_queue.get()
+            if item is None:
+                return
+            if isinstance(item, PersistableEvent):
+                recorder.persisted[item.kind] += 1
+                recorder.persisted_times.append(time.monotonic())
+
+    drainer = threading.Thread(target=drain, name="benchmark-telemetry", daemon=True)
+    drainer.start()
+    emitter = _TimedEmitter(EventQueueEmitter(queue=event_queue, fallback=_log_event))
+
+    logger.warning(f"Benchmarking BFTS with {target_nodes} node(s) per stage in {root}")
+    started_wall = time.time()
+    started = time.perf_counter()
+    # The journal stores artifact paths relative to the working directory
+    resume: dict[str, Any] | None = None
+    with chdir(root), _instrumented(recorder, settings):
+        try:
+            perform_experiments_bfts_with_agentmanager.perform_experiments_bfts(
+                config_path, event_callback=emitter
+            )
+        except _Interrupted as exc:
+            logger.warning(f"Benchmark run {exc}; resuming")
+            resume = _resume_run(recorder, emitter)
+    wall_s = time.perf_counter() - started
+    finished_wall = time.time()
+    event_queue.put(None)
+    drainer.join(timeout=30)
+    manager.shutdown()
+
+    all_steps = [duration for durations in recorder.step_s.values() for duration in durations]
+    nodes_by_stage = {name: len(journal.nodes) for name, journal in recorder.journals.items()}
+    total_nodes = sum(nodes_by_stage.values())
+    phases = summarize_phases(
+        node.phase_timings for journal in recorder.journals.values() for node in journal.nodes
+    )
+    return {
+        "target_nodes_per_stage": target_nodes,
+        "nodes": total_nodes,
+        "nodes_by_stage": nodes_by_stage,
+        "wall_s": round(wall_s, 3),
+        "nodes_per_s": round(total_nodes / max(wall_s, 1e-9), 3),
+        "steps": {
+            **_distribution(all_steps),
+            "by_stage": {name: _distribution(d) for name, d in recorder.step_s.items()},
+        },
+        "save_run": {**_distribution(recorder.save_run_s), "journal_bytes": recorder.journal_bytes},
+        "checkpoint": {
+            **_distribution(recorder.checkpoint_s),
+            "bytes": recorder.checkpoint_bytes,
+        },
+        "memory": _memory_summary(recorder.memory),
+        "telemetry": _telemetry_summary(recorder, wall_s),
+        "gpus": _gpu_idle(
+            Path(settings.activity_log), started=started_wall, finished=finished_wall
+        ),
+        "phases": phases,
+        "prompt_cache": _prompt_cache_summary(phases, nodes=total_nodes),
+        "research_summaries": _research_summary_totals(recorder.journals.values()),
+        "resume": resume,
+    }
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--config", type=Path, default=_DEFAULT_CONFIG)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--gpus", type=int, default=2)
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--run-time", type=float, default=0.05, help="mean experiment seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.2)
+    parser.add_argument(
+        "--metrics-file-rate",
+        type=float,
+        default=0.5,
+        help=f"fraction of experiments that write {METRICS_CONTRACT_FILENAME}",
+    )
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="seconds per LLM call")
+    parser.add_argument(
+        "--prefill-latency",
+        type=float,
+        default=0.0,
+        help="extra seconds per LLM call for each 1k input tokens not served from the cache",
+    )
+    parser.add_argument(
+        "--interrupt-after",
+        type=int,
+        default=None,
+        help="interrupt each run after this many agent steps and resume it",
+    )
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--work-dir", type=Path, default=None, help="kept after the run")
+    parser.add_argument("--output", type=Path, default=None, help="JSON file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    for variable in ("DATABASE_PUBLIC_URL", "RUN_ID"):
+        os.environ.pop(variable, None)
+    work_dir = args.work_dir or Path(tempfile.mkdtemp(prefix="bfts-benchmark-"))
+    try:
+        runs = [
+            run_benchmark(
+                target_nodes=size,
+                root=(work_dir / f"nodes_{size}").resolve(),
+                base_config=args.config.resolve(),
+                args=args,
+            )
+            for size in args.sizes
+        ]
+    finally:
+        if args.work_dir is None:
+            shutil.rmtree(work_dir, ignore_errors=True)
+    results = {
+        "benchmark": "bfts",
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "settings": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("config", "work_dir", "output")
+        },
+        "runs": runs,
+    }
+    payload = json.dumps(results, indent=2)
+    if args.output is None:
+        sys.stdout.write(payload + "\n")
+    else:
+        args.output.write_text(payload + "\n")
+        logger.warning(f"Benchmark results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
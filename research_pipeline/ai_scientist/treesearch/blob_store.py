@@ -0,0 +1,184 @@
+"""
+Content-addressed on-disk storage for the large payloads of journal nodes.
+
+The manager keeps every node of every stage's journal for the whole run, and most of a
+node's bytes are payloads it rarely reads: terminal output, experiment and plotting code,
+plot analyses and feedback. While a store is active (AgentManager activates one under
+`<log_dir>/blobs` with `agent.node_storage.offload`), assigning such a payload to a
+`blob_backed` attribute writes its JSON encoding to the store once, keyed by its sha256,
+and the object keeps only a small BlobRef; reading the attribute loads the payload back
+from disk. Identical payloads (code shared by seed runs, copies of best nodes carried into
+later stages) are stored once, and copying or pickling a node copies only the refs.
+Recently read payloads are kept decoded in a small bounded cache, so walking a lineage
+does not pay a disk read and JSON decode per node.
+
+A pickled ref records the store's directory, so checkpoints (and anything else pickled
+with refs) can only be loaded while `<log_dir>/blobs` is still next to them.
+
+Worker processes never activate a store, so nodes built there hold plain values.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from types import MemberDescriptorType
+from typing import Callable, TypeVar
+
+BLOB_DIR_NAME = "blobs"
+# Encoded size of the payloads a store keeps decoded in memory after reading them
+DEFAULT_READ_CACHE_BYTES = 16 * 1024 * 1024
+
+T = TypeVar("T", bound=type)
+
+
+class BlobStore:
+    """
+    Directory of payloads, one file per content digest:
+
+        <root>/<digest[:2]>/<digest>    # the payload as compact JSON
+
+    Files are written under a temporary name and renamed into place, so a reader never
+    sees a partial payload. Payloads are immutable, so the read cache never goes stale;
+    mutable values are handed out as copies so callers cannot change the cached one.
+    """
+
+    def __init__(
+        self, root: Path, *, min_bytes: int, read_cache_bytes: int = DEFAULT_READ_CACHE_BYTES
+    ) -> None:
+        self.root = root
+        self.min_bytes = min_bytes
+        self.read_cache_bytes = read_cache_bytes
+        self._reset_read_cache()
+
+    def _reset_read_cache(self) -> None:
+        self._read_cache: OrderedDict[str, tuple[object, int]] = OrderedDict()
+        self._read_cache_size = 0
+        self._read_cache_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        """Pickle only the location and limits; the read cache starts empty again."""
+        return {
+            "root": self.root,
+            "min_bytes": self.min_bytes,
+            "read_cache_bytes": self.read_cache_bytes,
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        self.root = state["root"]
+        self.min_bytes = state["min_bytes"]
+        self.read_cache_bytes = state.get("read_cache_bytes", DEFAULT_READ_CACHE_BYTES)
+        self._reset_read_cache()
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, value: object) -> "BlobRef | None":
+        """Store `value` and return its ref, or None if it is small enough to keep inline."""
+        payload = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        if len(payload) < self.min_bytes:
+            return None
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{digest}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        return BlobRef(store=self, digest=digest)
+
+    def get(self, digest: str) -> object:
+        with self._read_cache_lock:
+            cached = self._read_cache.get(digest)
+            if cached is not None:
+                self._read_cache.move_to_end(digest)
+        if cached is None:
+            payload = self._path(digest).read_bytes()
+            value = json.loads(payload)
+            self._remember(digest, value, len(payload))
+        else:
+            value = cached[0]
+        return value if isinstance(value, str) else copy.deepcopy(value)
+
+    def _remember(self, digest: str, value: object, size: int) -> None:
+        if size > self.read_cache_bytes:
+            return
+        with self._read_cache_lock:
+            if digest in self._read_cache:
+                return
+            self._read_cache[digest] = (value, size)
+            self._read_cache_size += size
+            while self._read_cache_size > self.read_cache_bytes:
+                _, (_, evicted_size) = self._read_cache.popitem(last=False)
+                self._read_cache_size -= evicted_size
+
+
+@dataclass(frozen=True, slots=True)
+class BlobRef:
+    """Handle to a payload in a BlobStore; immutable, so copies share it."""
+
+    store: BlobStore
+    digest: str
+
+    def load(self) -> object:
+        return self.store.get(self.digest)
+
+    def __copy__(self) -> "BlobRef":
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "BlobRef":
+        return self
+
+
+_active_store: BlobStore | None = None
+
+
+def activate_blob_store(store: BlobStore | None) -> None:
+    """Offload payloads assigned from now on to `store` (None keeps them in memory)."""
+    global _active_store
+    _active_store = store
+
+
+class _BlobBackedSlot:
+    """Wraps a slot so values assigned to it go to the active store and load on access."""
+
+    def __init__(self, slot: MemberDescriptorType) -> None:
+        self.slot = slot
+
+    def __get__(self, obj: object, objtype: type | None = None) -> object:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, objtype)
+        if isinstance(value, BlobRef):
+            return value.load()
+        return value
+
+    def __set__(self, obj: object, value: object) -> None:
+        store = _active_store
+        if store is not None and value is not None and not isinstance(value, BlobRef):
+            value = store.put(value) or value
+        self.slot.__set__(obj, value)
+
+
+def blob_backed(*names: str) -> Callable[[T], T]:
+    """Class decorator making the given slots of a slotted class blob-backed."""
+
+    def decorate(cls: T) -> T:
+        for name in names:
+            setattr(cls, name, _BlobBackedSlot(cls.__dict__[name]))
+        return cls
+
+    return decorate
+
+
+def get_raw(obj: object, name: str) -> object:
+    """The value stored for `name`, without loading a BlobRef."""
+    attr = type(obj).__dict__.get(name)
+    if isinstance(attr, _BlobBackedSlot):
+        return attr.slot.__get__(obj, type(obj))
+    return getattr(obj, name)
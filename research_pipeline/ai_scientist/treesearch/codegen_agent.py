@@ -18,7 +18,7 @@ import re
 import humanize
 from pydantic import BaseModel, Field
 
-from ai_scientist.llm import structured_query_with_schema
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, structured_query_with_schema
 
 from .gpu_manager import GPUSpec
 from .interpreter import ExecutionResult
@@ -26,7 +26,11 @@ from .journal import Node
 from .types import PromptType
 from .utils.config import Config
 from .utils.response import wrap_code
-from .vlm_function_specs import REVIEW_RESPONSE_SCHEMA, SUMMARY_RESPONSE_SCHEMA
+from .vlm_function_specs import (
+    METRICS_CONTRACT_FILENAME,
+    REVIEW_RESPONSE_SCHEMA,
+    SUMMARY_RESPONSE_SCHEMA,
+)
 
 logger = logging.getLogger("ai-scientist")
 
@@ -86,7 +90,8 @@ class MinimalAgent:
             "timm",
             "albumentations",
         ]
-        random.shuffle(pkgs)
+        # Shuffled once per stage, so the prompts of a stage keep a cacheable common prefix
+        random.Random(self.stage_name).shuffle(pkgs)
         pkg_str = ", ".join([f"`{p}`" for p in pkgs])
 
         # Add GPU info if available in config
@@ -223,6 +228,15 @@ class MinimalAgent:
                 "     ```python",
                 "     np.save(os.path.join(working_dir, 'experiment_data.npy'), experiment_data)",
                 "     ```",
+                "  5. Also write the final metrics with json.dump to"
+                f" os.path.join(working_dir, '{METRICS_CONTRACT_FILENAME}') in this exact format:",
+                "     ```python",
+                "     {'metric_names': [{'metric_name': 'validation accuracy', 'lower_is_better': False,",
+                "       'description': 'Top-1 accuracy on the validation split',",
+                "       'data': [{'dataset_name': 'dataset_name_1',",
+                "                 'final_value': 0.91, 'best_value': 0.93}]}]}",
+                "     ```",
+                "     Use one entry per metric with plain Python floats, and one data item per dataset.",
             ]
         )
 
@@ -246,11 +260,12 @@ class MinimalAgent:
                 " followed by a single markdown code block which implements the bugfix/solution."
             ),
             "Research idea": self.task_desc,
+            "Instructions": {},
+            PROMPT_CACHE_BREAKPOINT: None,
             "Previous (buggy) implementation": wrap_code(parent_node.code),
             "Execution output": wrap_code(parent_node.term_out, lang=""),
             "Feedback based on generated plots": parent_node.vlm_feedback_summary,
             "Feedback about execution time": parent_node.exec_time_feedback,
-            "Instructions": {},
         }
         debug_instructions: dict[str, str | list[str]] = {}
         debug_instructions |= {
@@ -362,6 +377,7 @@ class MinimalAgent:
                 "Analyze the execution output, determine if there were any bugs, and provide a summary of the findings. "
             ),
             "Research idea": self.task_desc,
+            PROMPT_CACHE_BREAKPOINT: None,
             "Implementation": wrap_code(node.code),
             "Execution output": wrap_code(node.term_out, lang=""),
         }
@@ -391,6 +407,7 @@ class MinimalAgent:
                 "Please summarize the findings from this experiment iteration."
             ),
             "Research idea": self.task_desc,
+            PROMPT_CACHE_BREAKPOINT: None,
             "Implementation": wrap_code(node.code),
             "Plan": node.plan,
             "Execution output": wrap_code(node.term_out, lang=""),
@@ -7,6 +7,7 @@ EventKind = Literal[
     "substage_completed",
     "paper_generation_progress",
     "best_node_selection",
+    "node_timing",
 ]
 PersistenceRecord = Tuple[EventKind, Dict[str, Any]]
 
@@ -181,6 +182,46 @@ class GpuShortageEvent(BaseEvent):
         }
 
 
+@dataclass(frozen=True)
+class NodeTimingEvent(BaseEvent):
+    """Event emitted when a worker finishes a node: time and LLM tokens per phase."""
+
+    stage: str
+    node_id: str
+    is_buggy: bool
+    total_s: float
+    phases: Dict[str, Dict[str, Any]]
+    profile_path: Optional[str] = None
+
+    def type(self) -> str:
+        return "ai.run.node_timing"
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "stage": self.stage,
+            "node_id": self.node_id,
+            "is_buggy": self.is_buggy,
+            "total_s": self.total_s,
+            "phases": self.phases,
+        }
+        if self.profile_path is not None:
+            data["profile_path"] = self.profile_path
+        return data
+
+    def persistence_record(self) -> PersistenceRecord:
+        return (
+            "node_timing",
+            {
+                "stage": self.stage,
+                "node_id": self.node_id,
+                "is_buggy": self.is_buggy,
+                "total_s": self.total_s,
+                "phases": self.phases,
+                "profile_path": self.profile_path,
+            },
+        )
+
+
 @dataclass(frozen=True)
 class PaperGenerationProgressEvent(BaseEvent):
     """Event emitted during paper generation (Stage 5) progress."""
@@ -0,0 +1,385 @@
+"""
+Opt-in cache of experiment executions.
+
+Debug and improve loops, resumed runs and repeated submissions regularly execute code
+that matches an earlier run up to whitespace and comments. With
+`agent.execution_cache.enabled`, a worker looks the run up by
+
+- the experiment code with formatting and comments normalized away (via its AST),
+- the seeds the code sets (unseeded code is only cached with `cache_unseeded`),
+- a fingerprint of the run's input files,
+- a fingerprint of the worker's working directory before the run (it is reused across
+  nodes, and generated code can read what earlier runs left there), and
+- an environment fingerprint (Python, dependency lock file, GPU model, timeout),
+
+and on a hit restores the stored ExecutionResult together with the files the original
+run wrote to its working directory instead of executing again. Timeouts and CUDA OOMs
+depend on load rather than on the code and are never stored.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import threading
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Callable
+
+from .gpu_manager import is_cuda_oom
+from .interpreter import ExecutionResult, _project_root
+from .utils.config import Config
+from .utils.experiment_data import COMPANION_SUFFIX
+
+logger = logging.getLogger("ai-scientist")
+
+CACHE_DIR_NAME = ".exec_cache"
+FORMAT_VERSION = 2
+_RESULT_FILE_NAME = "result.json"
+_META_FILE_NAME = "meta.json"
+_ARTIFACTS_DIR_NAME = "artifacts"
+# Run inputs that are not data (the idea file differs between otherwise identical runs).
+_NON_DATA_INPUTS = frozenset({"original_idea.json"})
+# Calls that make an experiment reproducible when given a constant seed.
+_SEED_FUNCTIONS = frozenset(
+    {"seed", "manual_seed", "manual_seed_all", "set_seed", "set_random_seed", "PRNGKey"}
+)
+_ENVIRONMENT_LOCK_FILES = ("uv.lock", "pyproject.toml")
+
+_file_digests: dict[tuple[str, int, int], str] = {}
+_file_digests_lock = threading.Lock()
+
+
+def _file_digest(path: Path) -> str:
+    stat = path.stat()
+    memo_key = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+    with _file_digests_lock:
+        cached = _file_digests.get(memo_key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    with _file_digests_lock:
+        _file_digests[memo_key] = digest.hexdigest()
+    return digest.hexdigest()
+
+
+def normalize_code(code: str) -> str:
+    """Code with comments and formatting removed; falls back to stripped lines if unparsable."""
+    try:
+        return ast.dump(ast.parse(code), annotate_fields=False)
+    except SyntaxError:
+        lines = (line.rstrip() for line in code.replace("\r\n", "\n").splitlines())
+        return "\n".join(line for line in lines if line)
+
+
+def _call_name(func: ast.expr) -> str | None:
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return None
+
+
+def _is_literal(node: ast.expr) -> bool:
+    """A constant other than None (which asks for an entropy seed), possibly negated or nested."""
+    if isinstance(node, ast.Constant):
+        return node.value is not None
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        return _is_literal(node.operand)
+    if isinstance(node, (ast.Tuple, ast.List)):
+        return all(_is_literal(element) for element in node.elts)
+    return False
+
+
+def _constant_names(tree: ast.AST) -> set[str]:
+    """Names whose every binding in `tree` is a plain assignment of a literal."""
+    literal_targets: dict[int, str] = {}
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Assign, ast.AnnAssign)) and node.value is not None:
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if _is_literal(node.value):
+                literal_targets.update(
+                    (id(target), target.id) for target in targets if isinstance(target, ast.Name)
+                )
+    other: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, (ast.Store, ast.Del)):
+            if id(node) not in literal_targets:
+                other.add(node.id)
+        elif isinstance(node, ast.arg):
+            other.add(node.arg)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            other.update((alias.asname or alias.name).split(".")[0] for alias in node.names)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            other.add(node.name)
+        elif isinstance(node, (ast.Global, ast.Nonlocal)):
+            other.update(node.names)
+    return set(literal_targets.values()) - other
+
+
+def seed_signature(code: str) -> str | None:
+    """
+    The seeding calls the code makes (e.g. `torch.manual_seed(0)`), or None if unseeded.
+
+    Only seeds that are literals, or names bound to nothing but literals, count: a seed
+    derived from the clock, the environment or a function parameter does not make the
+    run reproducible, and any such seeding call makes the whole code unseeded. Inside a
+    seeding helper (`def set_seed(seed): torch.manual_seed(seed)`) the helper's own
+    parameters are fine, since the calls to the helper are checked instead.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    constants = _constant_names(tree)
+
+    def is_constant(node: ast.expr) -> bool:
+        return _is_literal(node) or (isinstance(node, ast.Name) and node.id in constants)
+
+    forwarded: set[int] = set()
+    for helper in ast.walk(tree):
+        if (
+            isinstance(helper, (ast.FunctionDef, ast.AsyncFunctionDef))
+            and helper.name in _SEED_FUNCTIONS
+        ):
+            params = {arg.arg for arg in ast.walk(helper.args) if isinstance(arg, ast.arg)}
+            params -= {
+                node.id
+                for node in ast.walk(helper)
+                if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load)
+            }
+            forwarded.update(
+                id(node)
+                for node in ast.walk(helper)
+                if isinstance(node, ast.Name) and node.id in params
+            )
+
+    calls: set[str] = set()
+    for node in ast.walk(tree):
+        if not (
+            isinstance(node, ast.Call)
+            and _call_name(node.func) in _SEED_FUNCTIONS
+            and (node.args or node.keywords)
+        ):
+            continue
+        arguments = [*node.args, *(keyword.value for keyword in node.keywords)]
+        if all(id(arg) in forwarded for arg in arguments):
+            continue
+        if not all(is_constant(arg) or id(arg) in forwarded for arg in arguments):
+            return None
+        calls.add(ast.unparse(node))
+    return ";".join(sorted(calls)) or None
+
+
+def _directory_fingerprint(root: Path, *, skip: Callable[[Path], bool]) -> str:
+    digest = hashlib.sha256()
+    if root.is_dir():
+        for path in sorted(p for p in root.rglob("*") if p.is_file()):
+            relative = path.relative_to(root)
+            if skip(relative):
+                continue
+            digest.update(f"{relative.as_posix()}\0{_file_digest(path)}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(input_dir: Path) -> str:
+    """Content hash of the run's input files."""
+    return _directory_fingerprint(
+        input_dir, skip=lambda relative: relative.as_posix() in _NON_DATA_INPUTS
+    )
+
+
+def working_dir_fingerprint(working_dir: Path) -> str:
+    """Content hash of what earlier runs left in the working directory."""
+    return _directory_fingerprint(working_dir, skip=_is_companion_file)
+
+
+def _is_companion_file(relative: Path) -> bool:
+    return any(part.endswith(COMPANION_SUFFIX) for part in relative.parts[:-1])
+
+
+def environment_fingerprint(*, gpu_name: str | None, timeout: int) -> str:
+    """Hash of everything outside the code that changes what an execution produces."""
+    parts = [
+        sys.version,
+        platform.system(),
+        platform.machine(),
+        f"gpu={gpu_name}",
+        f"timeout={timeout}",
+    ]
+    for name in _ENVIRONMENT_LOCK_FILES:
+        lock_file = _project_root() / name
+        if lock_file.is_file():
+            parts.append(f"{name}={_file_digest(lock_file)}")
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ExecutionCacheKey:
+    code_hash: str
+    seed: str | None
+    dataset_fingerprint: str
+    working_dir_fingerprint: str
+    environment_fingerprint: str
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps(
+            [
+                FORMAT_VERSION,
+                self.code_hash,
+                self.seed,
+                self.dataset_fingerprint,
+                self.working_dir_fingerprint,
+                self.environment_fingerprint,
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_cache_key(
+    *,
+    code: str,
+    input_dir: Path,
+    working_dir: Path,
+    gpu_name: str | None,
+    timeout: int,
+    cache_unseeded: bool,
+) -> ExecutionCacheKey | None:
+    """Key for executing `code`, or None if its result is not reproducible enough to reuse."""
+    seed = seed_signature(code)
+    if seed is None and not cache_unseeded:
+        return None
+    return ExecutionCacheKey(
+        code_hash=hashlib.sha256(normalize_code(code).encode("utf-8")).hexdigest(),
+        seed=seed,
+        dataset_fingerprint=dataset_fingerprint(input_dir),
+        working_dir_fingerprint=working_dir_fingerprint(working_dir),
+        environment_fingerprint=environment_fingerprint(gpu_name=gpu_name, timeout=timeout),
+    )
+
+
+def snapshot_working_dir(working_dir: Path) -> dict[str, tuple[int, int]]:
+    """Size and mtime of every file in `working_dir`, skipping experiment data companions."""
+    snapshot: dict[str, tuple[int, int]] = {}
+    if not working_dir.is_dir():
+        return snapshot
+    for path in working_dir.rglob("*"):
+        relative = path.relative_to(working_dir)
+        if not path.is_file() or _is_companion_file(relative):
+            continue
+        stat = path.stat()
+        snapshot[relative.as_posix()] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def is_cacheable(result: ExecutionResult) -> bool:
+    return result.exc_type != "TimeoutError" and not is_cuda_oom(result.exc_type, result.term_out)
+
+
+class ExecutionCache:
+    """
+    Directory of executions, one entry per key digest:
+
+        <cache_dir>/<digest[:2]>/<digest>/
+            result.json     # the ExecutionResult
+            meta.json       # key components, source node and creation time
+            artifacts/      # files the run created or changed in its working directory
+
+    Entries are written under a temporary name and renamed into place, so workers sharing
+    the directory never read a partial entry.
+    """
+
+    def __init__(self, cache_dir: Path, *, max_artifact_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_artifact_bytes = max_artifact_bytes
+
+    def _entry_dir(self, key: ExecutionCacheKey) -> Path:
+        digest = key.digest
+        return self.cache_dir / digest[:2] / digest
+
+    def load(self, key: ExecutionCacheKey, *, working_dir: Path) -> ExecutionResult | None:
+        """Restore a cached execution's artifacts into `working_dir` and return its result."""
+        entry_dir = self._entry_dir(key)
+        try:
+            result = ExecutionResult.from_json((entry_dir / _RESULT_FILE_NAME).read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(f"Ignoring unreadable execution cache entry {entry_dir}", exc_info=True)
+            return None
+        artifacts_dir = entry_dir / _ARTIFACTS_DIR_NAME
+        for artifact in (p for p in artifacts_dir.rglob("*") if p.is_file()):
+            target = working_dir / artifact.relative_to(artifacts_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # A fresh mtime keeps stale experiment data companions from matching the copy
+            shutil.copyfile(artifact, target)
+        return replace(result, from_cache=True)
+
+    def store(
+        self,
+        key: ExecutionCacheKey,
+        result: ExecutionResult,
+        *,
+        working_dir: Path,
+        before: dict[str, tuple[int, int]],
+        node_id: str,
+    ) -> bool:
+        """Store `result` and the files that changed since the `before` snapshot."""
+        if not is_cacheable(result):
+            return False
+        after = snapshot_working_dir(working_dir)
+        produced = [name for name, meta in after.items() if before.get(name) != meta]
+        total_bytes = sum(after[name][0] for name in produced)
+        if total_bytes > self.max_artifact_bytes:
+            logger.info(
+                f"Not caching execution of node {node_id}: artifacts are {total_bytes >> 20} MiB"
+            )
+            return False
+        entry_dir = self._entry_dir(key)
+        if entry_dir.exists():
+            return False
+        staging = entry_dir.with_name(f"{entry_dir.name}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+        try:
+            artifacts_dir = staging / _ARTIFACTS_DIR_NAME
+            artifacts_dir.mkdir(parents=True)
+            for name in produced:
+                target = artifacts_dir / name
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(working_dir / name, target)
+            (staging / _RESULT_FILE_NAME).write_text(replace(result, from_cache=False).to_json())
+            meta = {
+                "format": FORMAT_VERSION,
+                "code_hash": key.code_hash,
+                "seed": key.seed,
+                "dataset_fingerprint": key.dataset_fingerprint,
+                "working_dir_fingerprint": key.working_dir_fingerprint,
+                "environment_fingerprint": key.environment_fingerprint,
+                "node_id": node_id,
+                "created": time.time(),
+            }
+            (staging / _META_FILE_NAME).write_text(json.dumps(meta, indent=2))
+            os.replace(staging, entry_dir)
+        except OSError:
+            # Most likely another worker stored the same entry first
+            logger.debug(f"Could not store execution cache entry {entry_dir}", exc_info=True)
+            shutil.rmtree(staging, ignore_errors=True)
+            return False
+        return True
+
+
+def open_execution_cache(cfg: Config) -> ExecutionCache | None:
+    """The run's execution cache, or None if it is disabled."""
+    cache_cfg = cfg.agent.execution_cache
+    if not cache_cfg.enabled:
+        return None
+    cache_dir = Path(cache_cfg.dir) if cache_cfg.dir else Path(cfg.workspace_dir) / CACHE_DIR_NAME
+    return ExecutionCache(cache_dir, max_artifact_bytes=cache_cfg.max_artifact_mib << 20)
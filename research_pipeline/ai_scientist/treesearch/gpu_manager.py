@@ -1,38 +1,281 @@
 """
-GPU discovery and simple process-level allocation utilities.
+GPU discovery and memory-aware placement of experiment processes.
 
 Notes:
 - Avoids importing torch; uses nvidia-smi
-- Provides a minimal manager to reserve/release GPUs per process id
+- GPUScheduler packs several experiment processes onto one GPU when their expected
+  memory footprints fit, and falls back to exclusive placement after OOM failures
+- Devices are passed in explicitly, so the scheduler can run on a simulated inventory
 """
 
 import subprocess
-from typing import Dict, Set, TypedDict
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, TypedDict
 
+# Fraction added on top of an observed peak before it is used as a reservation.
+DEFAULT_MEMORY_HEADROOM = 0.2
+_OOM_MARKERS = ("CUDA out of memory", "OutOfMemoryError", "CUBLAS_STATUS_ALLOC_FAILED")
 
-class GPUManager:
-    """Manages GPU allocation across processes."""
 
-    def __init__(self, num_gpus: int):
-        self.num_gpus = num_gpus
-        self.available_gpus: Set[int] = set(range(num_gpus))
+@dataclass(frozen=True)
+class GPUDevice:
+    gpu_id: int
+    memory_total_mib: int
+    name: str = "Unknown"
+
+
+@dataclass(frozen=True)
+class GPUPlacement:
+    """Where a task was placed and how much of the device it reserved."""
+
+    gpu_id: int
+    reserved_mib: int
+    exclusive: bool
+    queued_s: float
+
+
+@dataclass(frozen=True)
+class GPUSchedulerStats:
+    placements: int
+    colocated_placements: int
+    exclusive_placements: int
+    memory_utilization: float
+    slot_utilization: float
+    mean_queue_delay_s: float
+    max_queue_delay_s: float
+
+    def describe(self) -> str:
+        return (
+            f"{self.placements} placement(s) ({self.colocated_placements} co-located, "
+            f"{self.exclusive_placements} exclusive), reserved memory "
+            f"{self.memory_utilization:.0%}, slots {self.slot_utilization:.0%}, queue delay "
+            f"mean {self.mean_queue_delay_s:.1f}s / max {self.max_queue_delay_s:.1f}s"
+        )
+
+
+@dataclass
+class _DeviceState:
+    device: GPUDevice
+    reserved_mib: int = 0
+    tasks: int = 0
+    exclusive: bool = False
+
+
+def is_cuda_oom(exc_type: Optional[str], term_out: Optional[Sequence[str]]) -> bool:
+    """True if an execution result looks like it failed from running out of GPU memory."""
+    if exc_type is not None and "OutOfMemory" in exc_type:
+        return True
+    return any(marker in line for line in term_out or () for marker in _OOM_MARKERS)
+
+
+class GPUScheduler:
+    """
+    Places experiment processes on GPUs by slot count and expected memory footprint.
+
+    Each device offers `slots_per_gpu` concurrent tasks. A task reserves its expected
+    footprint (an observed peak plus headroom, or an even share of the device when
+    nothing has been observed yet) and is placed on the device with the most free
+    memory that can hold it. Exclusive tasks wait for an idle device and block it for
+    others. A task that does not fit anywhere waits until running tasks release.
+    """
+
+    def __init__(
+        self,
+        devices: Sequence[GPUDevice],
+        *,
+        slots_per_gpu: int = 1,
+        memory_headroom: float = DEFAULT_MEMORY_HEADROOM,
+        default_footprint_mib: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if slots_per_gpu < 1:
+            raise ValueError("slots_per_gpu must be at least 1")
+        self.slots_per_gpu = slots_per_gpu
+        self.memory_headroom = memory_headroom
+        self.default_footprint_mib = default_footprint_mib
+        self._clock = clock
+        self._devices: Dict[int, _DeviceState] = {
+            device.gpu_id: _DeviceState(device=device) for device in devices
+        }
         self.gpu_assignments: Dict[str, int] = {}
+        self._placements: Dict[str, GPUPlacement] = {}
+        self._condition = threading.Condition()
+        # Accounting for utilization and queueing statistics
+        self._started_at = clock()
+        self._last_change = self._started_at
+        self._reserved_mib_seconds = 0.0
+        self._slot_seconds = 0.0
+        self._queue_delays: List[float] = []
+        self._colocated = 0
+        self._exclusive = 0
 
-    def acquire_gpu(self, process_id: str) -> int:
-        """Assign a GPU to a process, returning the GPU id."""
-        if not self.available_gpus:
+    @property
+    def num_gpus(self) -> int:
+        return len(self._devices)
+
+    @property
+    def total_slots(self) -> int:
+        return self.num_gpus * self.slots_per_gpu
+
+    def estimate_footprint_mib(self, gpu_id: int, observed_peak_mib: Optional[int]) -> int:
+        """Reservation for a task on `gpu_id`, given the peak observed for its lineage."""
+        device = self._devices[gpu_id].device
+        if observed_peak_mib is not None and observed_peak_mib > 0:
+            estimate = int(observed_peak_mib * (1 + self.memory_headroom))
+        elif self.default_footprint_mib is not None:
+            estimate = self.default_footprint_mib
+        else:
+            estimate = device.memory_total_mib // self.slots_per_gpu
+        return min(estimate, device.memory_total_mib)
+
+    def _fits(self, state: _DeviceState, reserve_mib: int, exclusive: bool) -> bool:
+        if state.exclusive:
+            return False
+        if exclusive:
+            return state.tasks == 0
+        if state.tasks >= self.slots_per_gpu:
+            return False
+        return state.reserved_mib + reserve_mib <= state.device.memory_total_mib
+
+    def _choose_device(
+        self, observed_peak_mib: Optional[int], exclusive: bool
+    ) -> Optional[tuple[_DeviceState, int]]:
+        best: Optional[tuple[_DeviceState, int]] = None
+        for state in self._devices.values():
+            reserve_mib = state.device.memory_total_mib
+            if not exclusive:
+                reserve_mib = self.estimate_footprint_mib(state.device.gpu_id, observed_peak_mib)
+            if not self._fits(state, reserve_mib, exclusive):
+                continue
+            free_mib = state.device.memory_total_mib - state.reserved_mib
+            if best is None or free_mib > best[0].device.memory_total_mib - best[0].reserved_mib:
+                best = (state, reserve_mib)
+        return best
+
+    def _account(self) -> None:
+        now = self._clock()
+        elapsed = now - self._last_change
+        self._reserved_mib_seconds += elapsed * sum(
+            state.reserved_mib for state in self._devices.values()
+        )
+        self._slot_seconds += elapsed * sum(state.tasks for state in self._devices.values())
+        self._last_change = now
+
+    def try_acquire(
+        self,
+        task_id: str,
+        *,
+        observed_peak_mib: Optional[int] = None,
+        exclusive: bool = False,
+    ) -> Optional[GPUPlacement]:
+        """Place `task_id` if capacity is available right now, otherwise return None."""
+        with self._condition:
+            return self._place(task_id, observed_peak_mib, exclusive, queued_s=0.0)
+
+    def _place(
+        self,
+        task_id: str,
+        observed_peak_mib: Optional[int],
+        exclusive: bool,
+        queued_s: float,
+    ) -> Optional[GPUPlacement]:
+        if task_id in self._placements:
+            raise RuntimeError(f"Task {task_id} already holds GPU {self.gpu_assignments[task_id]}")
+        choice = self._choose_device(observed_peak_mib, exclusive)
+        if choice is None:
+            return None
+        state, reserve_mib = choice
+        self._account()
+        if state.tasks > 0:
+            self._colocated += 1
+        if exclusive:
+            self._exclusive += 1
+        state.tasks += 1
+        state.reserved_mib += reserve_mib
+        state.exclusive = exclusive
+        placement = GPUPlacement(
+            gpu_id=state.device.gpu_id,
+            reserved_mib=reserve_mib,
+            exclusive=exclusive,
+            queued_s=queued_s,
+        )
+        self._placements[task_id] = placement
+        self.gpu_assignments[task_id] = placement.gpu_id
+        self._queue_delays.append(queued_s)
+        return placement
+
+    def acquire(
+        self,
+        task_id: str,
+        *,
+        observed_peak_mib: Optional[int] = None,
+        exclusive: bool = False,
+        timeout: Optional[float] = None,
+    ) -> GPUPlacement:
+        """
+        Place `task_id`, waiting for running tasks to release capacity if necessary.
+        Raises RuntimeError if there are no GPUs or nothing frees up within `timeout`.
+        """
+        if not self._devices:
             raise RuntimeError("No GPUs available")
-        gpu_id = min(self.available_gpus)
-        self.available_gpus.remove(gpu_id)
-        self.gpu_assignments[process_id] = gpu_id
-        return gpu_id
+        started = self._clock()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                placement = self._place(
+                    task_id, observed_peak_mib, exclusive, queued_s=self._clock() - started
+                )
+                if placement is not None:
+                    return placement
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise RuntimeError(f"No GPU capacity became available within {timeout}s")
+                self._condition.wait(timeout=remaining)
+
+    def release(self, task_id: str) -> None:
+        """Release the GPU reservation held by `task_id`, if any."""
+        with self._condition:
+            placement = self._placements.pop(task_id, None)
+            if placement is None:
+                return
+            del self.gpu_assignments[task_id]
+            self._account()
+            state = self._devices[placement.gpu_id]
+            state.tasks -= 1
+            state.reserved_mib -= placement.reserved_mib
+            if placement.exclusive:
+                state.exclusive = False
+            self._condition.notify_all()
+
+    def release_all(self) -> None:
+        for task_id in list(self.gpu_assignments):
+            self.release(task_id)
 
-    def release_gpu(self, process_id: str) -> None:
-        """Release a GPU previously assigned to a process."""
-        if process_id in self.gpu_assignments:
-            gpu_id = self.gpu_assignments[process_id]
-            self.available_gpus.add(gpu_id)
-            del self.gpu_assignments[process_id]
+    def stats(self) -> GPUSchedulerStats:
+        with self._condition:
+            self._account()
+            elapsed = self._last_change - self._started_at
+            total_mib = sum(state.device.memory_total_mib for state in self._devices.values())
+            delays = self._queue_delays
+            return GPUSchedulerStats(
+                placements=len(delays),
+                colocated_placements=self._colocated,
+                exclusive_placements=self._exclusive,
+                memory_utilization=(
+                    self._reserved_mib_seconds / (total_mib * elapsed)
+                    if total_mib and elapsed > 0
+                    else 0.0
+                ),
+                slot_utilization=(
+                    self._slot_seconds / (self.total_slots * elapsed)
+                    if self.total_slots and elapsed > 0
+                    else 0.0
+                ),
+                mean_queue_delay_s=sum(delays) / len(delays) if delays else 0.0,
+                max_queue_delay_s=max(delays, default=0.0),
+            )
 
 
 class GPUSpec(TypedDict):
@@ -92,3 +335,14 @@ def get_gpu_specs(gpu_id: int) -> GPUSpec:
     except ValueError:
         return {"name": name or "Unknown", "memory_total_mib": 0}
     return {"name": name, "memory_total_mib": mem_total_mib}
+
+
+def detect_gpu_devices() -> List[GPUDevice]:
+    """Return the local NVIDIA GPUs with their total memory, queried via nvidia-smi."""
+    devices: List[GPUDevice] = []
+    for gpu_id in range(get_gpu_count()):
+        spec = get_gpu_specs(gpu_id)
+        devices.append(
+            GPUDevice(gpu_id=gpu_id, memory_total_mib=spec["memory_total_mib"], name=spec["name"])
+        )
+    return devices
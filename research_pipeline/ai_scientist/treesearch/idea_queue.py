@@ -0,0 +1,136 @@
+"""
+Queue of pre-proposed Stage 2 hyperparameter / Stage 4 ablation ideas.
+
+Idea proposals depend only on the stage's base code and the names already tried, not on
+the results of running experiments. ParallelAgent therefore asks for all ideas a step
+needs in one batched LLM call and, once the step is submitted, proposes the next batch
+in a background thread while the experiments run. Every hand-out is de-duplicated
+against the tried names, so an idea proposed ahead of time is never run twice.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Generic, Protocol, TypeVar
+
+logger = logging.getLogger("ai-scientist")
+
+
+class _NamedIdea(Protocol):
+    @property
+    def name(self) -> str: ...
+
+
+IdeaT = TypeVar("IdeaT", bound=_NamedIdea)
+
+
+def idea_key(name: str) -> str:
+    """Name used to compare ideas: case- and whitespace-insensitive."""
+    return " ".join(name.casefold().split())
+
+
+def distinct_ideas(ideas: Iterable[IdeaT], *, exclude: Iterable[str]) -> list[IdeaT]:
+    """`ideas` without blank names, names in `exclude`, or repeats, in their original order."""
+    seen = {idea_key(name) for name in exclude}
+    result: list[IdeaT] = []
+    for idea in ideas:
+        key = idea_key(idea.name)
+        if key and key not in seen:
+            seen.add(key)
+            result.append(idea)
+    return result
+
+
+class IdeaQueue(Generic[IdeaT]):
+    """
+    Hands out distinct ideas, `prefetch` of which are kept proposed ahead of time.
+
+    `propose_batch(tried, count)` proposes up to `count` new ideas in one LLM call;
+    `propose_one(tried)` is the single-idea fallback for slots a batch left empty.
+    """
+
+    def __init__(
+        self,
+        *,
+        propose_batch: Callable[[list[str], int], list[IdeaT]],
+        propose_one: Callable[[list[str]], IdeaT],
+        prefetch: int,
+        label: str,
+    ) -> None:
+        self._propose_batch = propose_batch
+        self._propose_one = propose_one
+        self._prefetch = prefetch
+        self._label = label
+        self._ready: deque[IdeaT] = deque()
+        self._refill: Future[list[IdeaT]] | None = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idea-queue")
+
+    def _drain(self, count: int, excluded: set[str]) -> list[IdeaT]:
+        taken: list[IdeaT] = []
+        while self._ready and len(taken) < count:
+            idea = self._ready.popleft()
+            key = idea_key(idea.name)
+            if key not in excluded:
+                excluded.add(key)
+                taken.append(idea)
+        return taken
+
+    def _collect_refill(self) -> None:
+        if self._refill is None:
+            return
+        refill, self._refill = self._refill, None
+        try:
+            self._ready.extend(refill.result())
+        except Exception as exc:
+            logger.warning(f"Background {self._label} idea proposal failed: {exc}")
+
+    def take(
+        self, count: int, *, tried: Iterable[str], later_demand: int | None = None
+    ) -> list[IdeaT]:
+        """
+        Return `count` ideas not in `tried` and not handed out before, then start a refill.
+
+        `later_demand` bounds how many ideas later takes can still use (None: unbounded);
+        the refill never proposes beyond it, so the final step starts no refill at all.
+        """
+        started = time.monotonic()
+        tried_names = list(tried)
+        excluded = {idea_key(name) for name in tried_names}
+        taken = self._drain(count, excluded)
+        from_queue = len(taken)
+        if len(taken) < count:
+            self._collect_refill()
+            taken += self._drain(count - len(taken), excluded)
+            from_queue = len(taken)
+        if len(taken) < count:
+            known = tried_names + [idea.name for idea in taken]
+            proposed = distinct_ideas(self._propose_batch(known, count - len(taken)), exclude=known)
+            taken += proposed[: count - len(taken)]
+        while len(taken) < count:
+            known = tried_names + [idea.name for idea in taken]
+            taken.append(self._propose_one(known))
+        logger.info(
+            f"Proposed {count} {self._label} idea(s) in {time.monotonic() - started:.1f}s "
+            f"({from_queue} pre-proposed)"
+        )
+        self._start_refill(tried_names + [idea.name for idea in taken], later_demand)
+        return taken
+
+    def _start_refill(self, known: list[str], later_demand: int | None) -> None:
+        target = self._prefetch if later_demand is None else min(self._prefetch, later_demand)
+        missing = target - len(self._ready)
+        if missing <= 0 or self._refill is not None:
+            return
+        known = known + [idea.name for idea in self._ready]
+
+        def refill() -> list[IdeaT]:
+            return distinct_ideas(self._propose_batch(known, missing), exclude=known)
+
+        self._refill = self._executor.submit(refill)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._refill = None
+        self._ready.clear()
@@ -27,6 +27,9 @@ import IPython.core.ultratb
 import shutup  # type: ignore[import-untyped]
 from dataclasses_json import DataClassJsonMixin
 
+from .phase_timing import phase_span
+from .utils.experiment_data import install_numpy_load_hook
+
 logger = logging.getLogger("ai-scientist")
 
 try:
@@ -176,6 +179,26 @@ class ExecutionResult(DataClassJsonMixin):
     exc_type: str | None
     exc_info: dict | None = None
     exc_stack: list[tuple] | None = None
+    # Peak CUDA memory reserved by the executed code, when it used torch on a GPU
+    gpu_peak_memory_mib: int | None = None
+    # True when served from the execution cache instead of running the code
+    from_cache: bool = False
+
+
+def _gpu_peak_memory_mib() -> int | None:
+    """Peak CUDA memory reserved in this process so far, without importing torch."""
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return None
+    try:
+        if not torch.cuda.is_initialized():
+            return None
+        peak = sum(
+            torch.cuda.max_memory_reserved(device) for device in range(torch.cuda.device_count())
+        )
+    except Exception:
+        return None
+    return int(peak // (1024 * 1024))
 
 
 def exception_summary(
@@ -243,6 +266,8 @@ def _repl_run_session(
     # Suppress PyMuPDF layout warning
     warnings.filterwarnings("ignore", message=".*pymupdf_layout.*", category=UserWarning)
     warnings.filterwarnings("ignore", message="Consider using the pymupdf_layout package.*")
+    # Serve experiment_data.npy loads from the memory-mapped companion format
+    install_numpy_load_hook()
 
     for key, value in env_vars.items():
         os.environ[key] = str(value)
@@ -276,9 +301,11 @@ def _repl_run_session(
             result_outq.put(tb_str)
             if e_cls_name == "KeyboardInterrupt":
                 e_cls_name = "TimeoutError"
-            event_outq.put(("state:finished", e_cls_name, exc_info, exc_stack))
+            event_outq.put(
+                ("state:finished", e_cls_name, exc_info, exc_stack, _gpu_peak_memory_mib())
+            )
         else:
-            event_outq.put(("state:finished", None, None, None))
+            event_outq.put(("state:finished", None, None, None, _gpu_peak_memory_mib()))
 
         # EOF marker for parent to stop reading output
         result_outq.put("<|EOF|>")
@@ -325,6 +352,7 @@ class Interpreter:
                 str | None,
                 dict[str, Any] | None,
                 list[tuple[str, int, str, str | None]] | None,
+                int | None,
             ]
         ]
 
@@ -334,6 +362,7 @@ class Interpreter:
         # Suppress PyMuPDF layout warning
         warnings.filterwarnings("ignore", message=".*pymupdf_layout.*", category=UserWarning)
         warnings.filterwarnings("ignore", message="Consider using the pymupdf_layout package.*")
+        install_numpy_load_hook()
 
         for key, value in self.env_vars.items():
             os.environ[key] = str(value)
@@ -388,9 +417,11 @@ class Interpreter:
                 if e_cls_name == "KeyboardInterrupt":
                     e_cls_name = "TimeoutError"
 
-                event_outq.put(("state:finished", e_cls_name, exc_info, exc_stack))
+                event_outq.put(
+                    ("state:finished", e_cls_name, exc_info, exc_stack, _gpu_peak_memory_mib())
+                )
             else:
-                event_outq.put(("state:finished", None, None, None))
+                event_outq.put(("state:finished", None, None, None, _gpu_peak_memory_mib()))
 
             # put EOF marker to indicate that we're done
             result_outq.put("<|EOF|>")
@@ -412,9 +443,10 @@ class Interpreter:
                 sys.executable,
                 setup_timeout,
             )
-            self._venv_python = _ensure_managed_venv(
-                working_dir=self.working_dir, timeout_seconds=setup_timeout
-            )
+            with phase_span("venv_setup"):
+                self._venv_python = _ensure_managed_venv(
+                    working_dir=self.working_dir, timeout_seconds=setup_timeout
+                )
 
         # Temporarily point multiprocessing to the managed venv's python for this start()
         old_executable = getattr(multiprocessing, "get_executable", lambda: sys.executable)()
@@ -599,7 +631,7 @@ class Interpreter:
                         logger.warning("Child failed to terminate, killing it..")
                         self.cleanup_session()
 
-                        state = ("state:finished", "TimeoutError", {}, [])
+                        state = ("state:finished", "TimeoutError", {}, [], None)
                         exec_time = self.timeout
                         break
 
@@ -623,6 +655,7 @@ class Interpreter:
         e_cls_name = state[1] if len(state) > 1 else None
         exc_info = state[2] if len(state) > 2 else None
         exc_stack = state[3] if len(state) > 3 else None
+        gpu_peak_memory_mib = state[4] if len(state) > 4 else None
 
         if e_cls_name == "TimeoutError":
             output.append(
@@ -633,4 +666,6 @@ class Interpreter:
                 f"Execution time: {humanize.naturaldelta(exec_time)} seconds (time limit is {humanize.naturaldelta(self.timeout)})."
             )
         logger.debug(f"Child execution completed (exc_type={e_cls_name}, exec_time={exec_time})")
-        return ExecutionResult(output, exec_time, e_cls_name, exc_info, exc_stack)
+        return ExecutionResult(
+            output, exec_time, e_cls_name, exc_info, exc_stack, gpu_peak_memory_mib
+        )
@@ -2,24 +2,33 @@ import copy
 import json
 import logging
 import os
+import threading
 import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any, Callable, List, Literal, Optional, cast
 
-from dataclasses_json import DataClassJsonMixin
 from pydantic import BaseModel
 
-from ai_scientist.llm import query, structured_query_with_schema
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, query, structured_query_with_schema
 
+from .blob_store import blob_backed, get_raw
 from .events import BaseEvent, BestNodeSelectedEvent, RunLogEvent
 from .interpreter import ExecutionResult
+from .phase_timing import PhaseRecorder, PhaseSpan
 from .utils.metric import MetricValue, WorstMetricValue
 from .utils.response import trim_long_string
 
 logger = logging.getLogger(__name__)
 
+_SUMMARY_REQUEST = (
+    "Please provide a comprehensive summary of the experimental progress that includes:\n"
+    "1. Key patterns of success across working experiments\n"
+    "2. Common failure patterns and pitfalls to avoid\n"
+    "3. Specific recommendations for future experiments based on both successes and failures"
+)
+
 
 class NodeSelectionResponse(BaseModel):
     selected_id: str
@@ -28,9 +37,63 @@ class NodeSelectionResponse(BaseModel):
 
 NODE_SELECTION_SCHEMA = NodeSelectionResponse
 
+# Large payloads the manager rarely reads; kept in the active blob store (see blob_store.py)
+_BLOB_BACKED_FIELDS = (
+    "code",
+    "plot_code",
+    "_term_out",
+    "parse_metrics_code",
+    "parse_term_out",
+    "plot_term_out",
+    "plot_analyses",
+    "vlm_feedback_summary",
+    "exec_time_feedback",
+)
+
+
+@dataclass
+class SummaryStats:
+    """Latency and prompt size of a journal's research summaries (shared with its snapshots)."""
 
-@dataclass(eq=False)
-class Node(DataClassJsonMixin):
+    cache_hits: int = 0
+    full_rebuilds: int = 0
+    incremental_updates: int = 0
+    latency_s: float = 0.0
+    prompt_tokens: int = 0
+    cached_prompt_tokens: int = 0
+    output_tokens: int = 0
+
+
+@dataclass
+class _SummaryMemory:
+    """The last research summary and the nodes folded into it."""
+
+    text: str
+    # node id -> "good" or "buggy", for every node the text accounts for
+    node_states: dict[str, str]
+    updates_since_rebuild: int = 0
+
+
+@dataclass(frozen=True)
+class _SummaryPlan:
+    """A research summary decided on under the journal lock and requested outside it."""
+
+    include_code: bool
+    cache_key: str
+    kind: Literal["rebuild", "update"]
+    system_message: dict[str, Any]
+    user_message: str | None
+    # Nodes in the prompt: all of them for a rebuild, the new ones for an update
+    node_count: int
+    node_states: dict[str, str]
+    # The memory the decision was based on
+    base: _SummaryMemory | None
+    updates_since_rebuild: int
+
+
+@blob_backed(*_BLOB_BACKED_FIELDS)
+@dataclass(eq=False, slots=True)
+class Node:
     """A single node in the solution tree.
 
     Contains code, execution results, and evaluation information.
@@ -57,6 +120,8 @@ class Node(DataClassJsonMixin):
     exc_type: str | None = field(default=None, kw_only=True)
     exc_info: dict | None = field(default=None, kw_only=True)
     exc_stack: list[tuple] | None = field(default=None, kw_only=True)
+    gpu_peak_memory_mib: int | None = field(default=None, kw_only=True)
+    exec_cache_hit: bool = field(default=False, kw_only=True)
 
     # ---- parsing info ----
     parse_metrics_plan: str = field(default="", kw_only=True)
@@ -97,6 +162,10 @@ class Node(DataClassJsonMixin):
     # ---- execution time feedback ----
     exec_time_feedback: str = field(default="", kw_only=True)
 
+    # ---- worker phase timings (see phase_timing.py) ----
+    phase_timings: list[dict[str, Any]] = field(default_factory=list, kw_only=True)
+    profile_path: str | None = field(default=None, kw_only=True)
+
     # ---- ablation study ----
     ablation_name: str | None = field(default=None, kw_only=True)
 
@@ -125,10 +194,11 @@ class Node(DataClassJsonMixin):
         result = cls.__new__(cls)
         memo[id(self)] = result
 
-        # Copy all attributes except parent and children to avoid circular references
-        for k, v in self.__dict__.items():
-            if k not in ("parent", "children"):
-                setattr(result, k, copy.deepcopy(v, memo))
+        # Copy all attributes except parent and children to avoid circular references;
+        # blob-backed payloads are copied as their (shared) refs
+        for f in fields(self):
+            if f.name not in ("parent", "children"):
+                setattr(result, f.name, copy.deepcopy(get_raw(self, f.name), memo))
 
         # Handle parent and children separately
         result.parent = self.parent  # Keep the same parent reference
@@ -137,15 +207,19 @@ class Node(DataClassJsonMixin):
         return result
 
     def __getstate__(self) -> dict:
-        """Return state for pickling"""
-        state = self.__dict__.copy()
-        state["id"] = self.id
-        return state
+        """Return state for pickling (blob-backed payloads as refs)"""
+        return {f.name: get_raw(self, f.name) for f in fields(self)}
 
     def __setstate__(self, state: dict) -> None:
         """Set state during unpickling"""
-        # Ensure all required attributes are present
-        self.__dict__.update(state)
+        # Fields added since the state was pickled get their defaults
+        for f in fields(self):
+            if f.name in state:
+                setattr(self, f.name, state[f.name])
+            elif f.default is not MISSING:
+                setattr(self, f.name, f.default)
+            elif f.default_factory is not MISSING:
+                setattr(self, f.name, f.default_factory())
 
     @property
     def stage_name(self) -> Literal["draft", "debug", "improve"]:
@@ -166,6 +240,8 @@ class Node(DataClassJsonMixin):
         self.exc_type = exec_result.exc_type
         self.exc_info = exec_result.exc_info
         self.exc_stack = exec_result.exc_stack
+        self.gpu_peak_memory_mib = exec_result.gpu_peak_memory_mib
+        self.exec_cache_hit = exec_result.from_cache
 
     def absorb_plot_exec_result(self, plot_exec_result: ExecutionResult) -> None:
         """Absorb the result of executing the plotting code from this node."""
@@ -209,7 +285,7 @@ class Node(DataClassJsonMixin):
             return 0
         return self.parent.debug_depth + 1
 
-    def to_dict(self) -> dict[str, object]:  # type: ignore[override]
+    def to_dict(self) -> dict[str, object]:
         """Convert node to dictionary for serialization"""
         return {
             "code": self.code,
@@ -231,6 +307,8 @@ class Node(DataClassJsonMixin):
             "exc_type": self.exc_type,
             "exc_info": self.exc_info,
             "exc_stack": self.exc_stack,
+            "gpu_peak_memory_mib": self.gpu_peak_memory_mib,
+            "exec_cache_hit": self.exec_cache_hit,
             "analysis": self.analysis,
             "exp_results_dir": (
                 str(Path(self.exp_results_dir).resolve().relative_to(os.getcwd()))
@@ -246,7 +324,8 @@ class Node(DataClassJsonMixin):
             "is_buggy": self.is_buggy,
             "is_buggy_plots": self.is_buggy_plots,
             "parent_id": None if self.parent is None else self.parent.id,
-            "children": [child.id for child in self.children] if self.children else [],
+            # list() copies the set in one go; children may be added from another thread
+            "children": [child.id for child in list(self.children)],
             "plot_data": self.plot_data,
             "plots_generated": self.plots_generated,
             "plots": self.plots,
@@ -273,10 +352,35 @@ class Node(DataClassJsonMixin):
             "is_seed_node": self.is_seed_node,
             "is_seed_agg_node": self.is_seed_agg_node,
             "exec_time_feedback": self.exec_time_feedback,
+            "phase_timings": self.phase_timings,
+            "profile_path": self.profile_path,
+        }
+
+    def to_parent_dict(self) -> dict[str, object]:
+        """
+        The subset of to_dict() a worker reads when this node is the parent of a new node.
+        Terminal output is only needed (and only sent, already trimmed) for debugging; the
+        metric and metric-parse output let seed runs extract their metrics without the LLM.
+        """
+        return {
+            "id": self.id,
+            "plan": self.plan,
+            "code": self.code,
+            "plot_code": self.plot_code,
+            "plot_plan": self.plot_plan,
+            "_term_out": [self.term_out] if self.is_buggy else None,
+            "exc_type": self.exc_type,
+            "is_buggy": self.is_buggy,
+            "parse_metrics_plan": self.parse_metrics_plan,
+            "parse_metrics_code": self.parse_metrics_code,
+            "parse_term_out": self.parse_term_out,
+            "metric": ({"value": self.metric.value} if self.metric and not self.is_buggy else None),
+            "vlm_feedback_summary": self.vlm_feedback_summary,
+            "exec_time_feedback": self.exec_time_feedback,
         }
 
     @classmethod
-    def from_dict(cls, data: dict, journal: Optional["Journal"] = None) -> "Node":  # type: ignore[override]
+    def from_dict(cls, data: dict, journal: Optional["Journal"] = None) -> "Node":
         """Create a Node from a dictionary, optionally linking to journal for relationships"""
         # Remove relationship IDs from constructor data
         parent_id = data.pop("parent_id", None)
@@ -330,19 +434,34 @@ class Journal:
     _best_cache_total_nodes_count_map: dict[str, int] = field(default_factory=dict, repr=False)
     # Fingerprint of node states; when this changes, invalidate the best-node cache
     _node_state_signature: str | None = field(default=None, repr=False)
+    # Research summaries fold new nodes into the previous one; every summary_rebuild_every
+    # updates (0: always), or when more than summary_max_delta_nodes are new, they are
+    # rebuilt from all nodes
+    summary_rebuild_every: int = 10
+    summary_max_delta_nodes: int = 8
+    summary_stats: SummaryStats = field(default_factory=SummaryStats, repr=False)
     # Memoization for research summary calls, keyed by good-node IDs and include_code flag
     _summary_cache: dict[str, str] = field(default_factory=dict, repr=False)
+    # Latest summary per include_code flag, the base of the next incremental update
+    _summary_memory: dict[bool, _SummaryMemory] = field(default_factory=dict, repr=False)
+    # Good nodes (with their metric values) as of the last good_nodes_version() call
+    _good_nodes_signature: list[tuple[str, object]] = field(default_factory=list, repr=False)
+    _good_nodes_version: int = field(default=0, repr=False)
+    # Serializes best-node selection and summaries between the journal and its snapshots
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
 
     def __getstate__(self) -> dict:
         state = self.__dict__.copy()
         # Remove callback to avoid pickling closures/clients
         state.pop("event_callback", None)
+        state.pop("_lock", None)
         return state
 
     def __setstate__(self, state: dict) -> None:
         self.__dict__.update(state)
         # Provide a no-op callback after restore; managers can overwrite
         self.event_callback = lambda _event: None
+        self._lock = threading.RLock()
 
     def __getitem__(self, idx: int) -> Node:
         return self.nodes[idx]
@@ -356,6 +475,22 @@ class Journal:
         node.step = len(self.nodes)
         self.nodes.append(node)
 
+    def snapshot(self) -> "Journal":
+        """
+        The journal as it is now, for bookkeeping that runs while the search continues.
+
+        The snapshot has its own node list but shares the best-node and summary caches (and
+        the lock guarding them), so a selection made on either is reused by the other.
+
+        The Node objects themselves are not copied: the search keeps updating them after
+        the snapshot is taken (e.g. a later node adding itself to its parent's
+        `children`), so a reader may see those later changes. Treat them as read-only; only the
+        set and order of nodes is fixed at snapshot time.
+        """
+        with self._lock:
+            self._invalidate_stale_best_cache()
+            return replace(self, nodes=list(self.nodes))
+
     def _emit_best_node_reasoning(self, *, node: Node, reasoning: str) -> None:
         """Persist LLM reasoning for the selected best node when telemetry is enabled."""
         if self.run_id is None:
@@ -399,6 +534,18 @@ class Journal:
         logger.debug(f"all nodes ID and is_buggy/is_buggy_plots flags: {list_of_nodes}")
         return [n for n in self.nodes if n.is_buggy is False and n.is_buggy_plots is False]
 
+    def good_nodes_version(self) -> int:
+        """A counter that changes whenever a node becomes good or a good node's metric changes."""
+        signature = [
+            (n.id, n.metric.value if n.metric is not None else None)
+            for n in self.nodes
+            if n.is_buggy is False and n.is_buggy_plots is False
+        ]
+        if signature != self._good_nodes_signature:
+            self._good_nodes_signature = signature
+            self._good_nodes_version += 1
+        return self._good_nodes_version
+
     def get_node_by_id(self, node_id: str) -> Optional[Node]:
         """Get a node by its ID."""
         for node in self.nodes:
@@ -426,10 +573,29 @@ class Journal:
             )
         return "|".join(parts)
 
+    def _invalidate_stale_best_cache(self) -> None:
+        """Invalidate the best-node cache only when node states change."""
+        current_state_sig = self._compute_nodes_state_signature()
+        if self._node_state_signature is None:
+            self._node_state_signature = current_state_sig
+        elif self._node_state_signature != current_state_sig:
+            logger.debug("Node state changed; invalidating best-node cache.")
+            self._best_cache.clear()
+            self._best_cache_time_map.clear()
+            self._best_cache_candidate_ids_map.clear()
+            self._best_cache_total_nodes_count_map.clear()
+            self._node_state_signature = current_state_sig
+
     def get_best_node(
         self, only_good: bool = True, use_val_metric_only: bool = False
     ) -> None | Node:
         """Return the best solution found so far."""
+        with self._lock:
+            return self._select_best_node(
+                only_good=only_good, use_val_metric_only=use_val_metric_only
+            )
+
+    def _select_best_node(self, *, only_good: bool, use_val_metric_only: bool) -> None | Node:
         total_nodes_count = len(self.nodes)
         buggy_count = len([n for n in self.nodes if n.is_buggy is True])
         plot_buggy_count = len([n for n in self.nodes if n.is_buggy_plots is True])
@@ -438,17 +604,7 @@ class Journal:
             f"total_nodes={total_nodes_count}, buggy={buggy_count}, plot_buggy={plot_buggy_count}"
         )
 
-        # Invalidate cache only when node states change
-        current_state_sig = self._compute_nodes_state_signature()
-        if self._node_state_signature is None:
-            self._node_state_signature = current_state_sig
-        elif self._node_state_signature != current_state_sig:
-            logger.debug("Node state changed; invalidating best-node cache.")
-            self._best_cache.clear()
-            self._best_cache_time_map.clear()
-            self._best_cache_candidate_ids_map.clear()
-            self._best_cache_total_nodes_count_map.clear()
-            self._node_state_signature = current_state_sig
+        self._invalidate_stale_best_cache()
 
         if only_good:
             nodes = self.good_nodes
@@ -710,15 +866,31 @@ class Journal:
     def generate_summary(self, include_code: bool = False) -> str:
         """Generate a summary of the research progress using LLM.
 
-        Includes both successes and failures.
+        Includes both successes and failures. The LLM call runs outside the journal lock;
+        only deciding what to ask and recording the answer hold it.
         """
+        with self._lock:
+            plan = self._plan_summary(include_code=include_code)
+        if isinstance(plan, str):
+            return plan
+        summary_text, span = self._query_summary(
+            system_message=plan.system_message, user_message=plan.user_message
+        )
+        with self._lock:
+            self._commit_summary(plan=plan, summary_text=summary_text, span=span)
+        return summary_text
+
+    def _plan_summary(self, *, include_code: bool) -> "_SummaryPlan | str":
+        """The summary to request, or the summary itself when no LLM call is needed."""
         if not self.nodes:
             return "No experiments conducted yet."
 
         # Build cache key from the current sets of good and buggy nodes plus include_code flag.
         # We only reuse a cached summary if both lists are unchanged.
-        good_ids = sorted([n.id for n in self.good_nodes])
-        buggy_ids = sorted([n.id for n in self.buggy_nodes])
+        good_nodes = self.good_nodes
+        buggy_nodes = self.buggy_nodes
+        good_ids = sorted([n.id for n in good_nodes])
+        buggy_ids = sorted([n.id for n in buggy_nodes])
         cache_key = (
             f"include_code={include_code}"
             f"|good_ids={','.join(good_ids)}"
@@ -733,65 +905,214 @@ class Journal:
                 f"buggy_nodes_count={len(buggy_ids)}. "
                 "Reusing previous summary (good and buggy sets unchanged)."
             )
+            self.summary_stats.cache_hits += 1
             return cached_summary
+
+        node_states = {node_id: "good" for node_id in good_ids}
+        node_states |= {node_id: "buggy" for node_id in buggy_ids}
+        memory = self._summary_memory.get(include_code)
+        if memory is None:
+            return self._rebuild_plan(
+                include_code=include_code,
+                cache_key=cache_key,
+                good_nodes=good_nodes,
+                buggy_nodes=buggy_nodes,
+                node_states=node_states,
+                base=None,
+            )
+        new_nodes = [
+            n for n in good_nodes + buggy_nodes if memory.node_states.get(n.id) != node_states[n.id]
+        ]
+        missing = memory.node_states.keys() - node_states.keys()
+        if missing and not new_nodes:
+            # A snapshot taken before the last summary sees a subset of its nodes; the newer
+            # summary already covers them
+            logger.debug(
+                f"Summary of {len(node_states)} node(s) reuses the newer summary of "
+                f"{len(memory.node_states)} node(s)."
+            )
+            self.summary_stats.cache_hits += 1
+            return memory.text
+        rebuild = (
+            bool(missing)
+            or any(n.id in memory.node_states for n in new_nodes)
+            or len(new_nodes) > self.summary_max_delta_nodes
+            or memory.updates_since_rebuild >= self.summary_rebuild_every
+        )
         logger.debug(
             "Summary cache MISS: "
             f"include_code={include_code}, "
             f"good_nodes_count={len(good_ids)}, "
             f"buggy_nodes_count={len(buggy_ids)}. "
-            "Invoking LLM to generate summary."
+            + (
+                "Invoking LLM to rebuild the summary."
+                if rebuild
+                else f"Invoking LLM to fold {len(new_nodes)} new node(s) into the summary."
+            )
+        )
+        if rebuild:
+            return self._rebuild_plan(
+                include_code=include_code,
+                cache_key=cache_key,
+                good_nodes=good_nodes,
+                buggy_nodes=buggy_nodes,
+                node_states=node_states,
+                base=memory,
+            )
+        return _SummaryPlan(
+            include_code=include_code,
+            cache_key=cache_key,
+            kind="update",
+            system_message=self._summary_update_prompt(
+                memory=memory, new_nodes=new_nodes, include_code=include_code
+            ),
+            user_message=None,
+            node_count=len(new_nodes),
+            node_states=node_states,
+            base=memory,
+            updates_since_rebuild=memory.updates_since_rebuild + 1,
         )
 
-        prompt = {
+    def _rebuild_plan(
+        self,
+        *,
+        include_code: bool,
+        cache_key: str,
+        good_nodes: list[Node],
+        buggy_nodes: list[Node],
+        node_states: dict[str, str],
+        base: _SummaryMemory | None,
+    ) -> "_SummaryPlan":
+        return _SummaryPlan(
+            include_code=include_code,
+            cache_key=cache_key,
+            kind="rebuild",
+            system_message=self._full_summary_prompt(
+                good_nodes=good_nodes, buggy_nodes=buggy_nodes, include_code=include_code
+            ),
+            user_message=_SUMMARY_REQUEST,
+            node_count=len(node_states),
+            node_states=node_states,
+            base=base,
+            updates_since_rebuild=0,
+        )
+
+    def _commit_summary(self, *, plan: "_SummaryPlan", summary_text: str, span: PhaseSpan) -> None:
+        """Record a summary the LLM wrote for `plan` in the stats, memory and cache."""
+        stats = self.summary_stats
+        if plan.kind == "rebuild":
+            stats.full_rebuilds += 1
+        else:
+            stats.incremental_updates += 1
+        stats.latency_s += span.duration_s
+        stats.prompt_tokens += span.input_tokens
+        stats.cached_prompt_tokens += span.cached_input_tokens
+        stats.output_tokens += span.output_tokens
+        logger.info(
+            f"Research summary ({plan.kind}, {plan.node_count} node(s)) for stage "
+            f"{self.stage_name}: {span.duration_s:.1f}s, {span.input_tokens} prompt tokens "
+            f"({span.cached_input_tokens} cached)"
+        )
+
+        # Another summary may have been recorded while this one was being written; keep
+        # whichever accounts for more nodes
+        current = self._summary_memory.get(plan.include_code)
+        if (
+            current is None
+            or current is plan.base
+            or current.node_states.keys() <= plan.node_states.keys()
+        ):
+            self._summary_memory[plan.include_code] = _SummaryMemory(
+                text=summary_text,
+                node_states=plan.node_states,
+                updates_since_rebuild=plan.updates_since_rebuild,
+            )
+
+        self._summary_cache[plan.cache_key] = summary_text
+        logger.debug(
+            "Summary cached. Key reflects include_code and current good and buggy nodes "
+            f"(include_code={plan.include_code}, nodes_count={len(plan.node_states)})."
+        )
+
+    @staticmethod
+    def _summary_entry(node: Node, *, include_code: bool) -> str:
+        if not node.is_buggy:
+            entry = f"Design: {node.plan}\n  "
+            entry += f"Results: {node.analysis}\n"
+            entry += f"Metric: {str(node.metric)}\n"
+        else:
+            entry = f"Design: {node.plan}\n  "
+            entry += f"Error Analysis: {node.analysis}\n"
+            entry += f"Error Type: {node.exc_type if node.exc_type is not None else 'Unknown'}\n"
+            entry += f"Debug Depth: {node.debug_depth}\n"
+        if include_code:
+            entry += f"Code: {node.code}\n"
+        return entry
+
+    def _full_summary_prompt(
+        self, *, good_nodes: list[Node], buggy_nodes: list[Node], include_code: bool
+    ) -> dict[str, str]:
+        return {
             "Introduction": (
                 "You are an AI researcher summarizing experimental progress. "
                 "Please analyze both successful and failed experiments to provide insights "
                 "for future improvements."
             ),
-            "Successful Experiments": "",
-            "Failed Experiments": "",
+            "Successful Experiments": "".join(
+                self._summary_entry(node, include_code=include_code) for node in good_nodes
+            ),
+            "Failed Experiments": "".join(
+                self._summary_entry(node, include_code=include_code) for node in buggy_nodes
+            ),
         }
 
-        for node in self.good_nodes:
-            exp_info = f"Design: {node.plan}\n  "
-            exp_info += f"Results: {node.analysis}\n"
-            exp_info += f"Metric: {str(node.metric)}\n"
-            if include_code:
-                exp_info += f"Code: {node.code}\n"
-            prompt["Successful Experiments"] += exp_info
-
-        for node in self.buggy_nodes:
-            failure_info = f"Design: {node.plan}\n  "
-            failure_info += f"Error Analysis: {node.analysis}\n"
-            failure_info += (
-                f"Error Type: {node.exc_type if node.exc_type is not None else 'Unknown'}\n"
-            )
-            failure_info += f"Debug Depth: {node.debug_depth}\n"
-            if include_code:
-                failure_info += f"Code: {node.code}\n"
-            prompt["Failed Experiments"] += failure_info
-
-        summary_resp = query(
-            system_message=prompt,
-            user_message=(
-                "Please provide a comprehensive summary of the experimental progress that includes:\n"
-                "1. Key patterns of success across working experiments\n"
-                "2. Common failure patterns and pitfalls to avoid\n"
-                "3. Specific recommendations for future experiments based on both successes and failures"
+    def _summary_update_prompt(
+        self, *, memory: _SummaryMemory, new_nodes: list[Node], include_code: bool
+    ) -> dict[str, Any]:
+        return {
+            "Introduction": (
+                "You are an AI researcher keeping a running summary of experimental progress. "
+                "New experiments have finished since the summary below was written; update it "
+                "with their results."
             ),
-            model=self.summary_model,
-            temperature=self.summary_temperature,
-        )
+            "Instructions": [
+                "Keep the three parts of the summary: key patterns of success across working "
+                "experiments, common failure patterns and pitfalls to avoid, and specific "
+                "recommendations for future experiments.",
+                "Revise the points the new experiments confirm or contradict and add what they "
+                "show that the summary does not cover yet.",
+                "Keep the summary about as long as it is; condense older detail rather than "
+                "appending.",
+                "Respond with the updated summary only.",
+            ],
+            PROMPT_CACHE_BREAKPOINT: None,
+            "Current summary": memory.text,
+            "New successful experiments": "".join(
+                self._summary_entry(node, include_code=include_code)
+                for node in new_nodes
+                if not node.is_buggy
+            ),
+            "New failed experiments": "".join(
+                self._summary_entry(node, include_code=include_code)
+                for node in new_nodes
+                if node.is_buggy
+            ),
+        }
 
+    def _query_summary(
+        self, *, system_message: dict[str, Any], user_message: str | None
+    ) -> tuple[str, PhaseSpan]:
+        """Ask the summary model; the span carries the call's latency and tokens."""
+        recorder = PhaseRecorder()
+        with recorder.active(), recorder.span("research_summary") as span:
+            summary_resp = query(
+                system_message=system_message,
+                user_message=user_message,
+                model=self.summary_model,
+                temperature=self.summary_temperature,
+            )
         summary_text = summary_resp if isinstance(summary_resp, str) else json.dumps(summary_resp)
-        # Cache and return
-        self._summary_cache[cache_key] = summary_text
-        logger.debug(
-            "Summary cached. Key reflects include_code and current good and buggy nodes "
-            f"(include_code={include_code}, good_nodes_count={len(good_ids)}, "
-            f"buggy_nodes_count={len(buggy_ids)})."
-        )
-        return summary_text
+        return summary_text, span
 
     def to_dict(self) -> dict[str, object]:
         """Convert journal to a JSON-serializable dictionary"""
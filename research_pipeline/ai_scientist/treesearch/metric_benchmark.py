@@ -0,0 +1,169 @@
+"""
+Microbenchmark of metric comparisons on synthetic metric sets.
+
+Best-node selection, node sorting, stage-completion checks and stage metrics compare
+MetricValues many times per step. Each comparison uses the value's cached MetricKey; this
+benchmark times the hot operations on journals of increasing size, next to the same
+operations with the key recomputed on every comparison (how comparisons worked before):
+
+- `max`/`sort`: max() and sorted() over the metrics;
+- `equality`: every metric against its neighbour;
+- `best_node`: `Journal.get_best_node(use_val_metric_only=True)` on a fresh journal.
+
+Metrics use the nested `metric_names` format with `--metrics` metrics over `--datasets`
+datasets; `--buggy-rate` of the nodes carry a WorstMetricValue.
+
+    python -m ai_scientist.treesearch.metric_benchmark --sizes 100 1000 10000
+"""
+
+import argparse
+import functools
+import json
+import logging
+import platform
+import random
+import sys
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from .journal import Journal, Node
+from .utils.metric import MetricValue, WorstMetricValue
+
+logger = logging.getLogger("ai-scientist")
+
+
+def _synthetic_metric(rng: random.Random, *, metrics: int, datasets: int) -> MetricValue:
+    return MetricValue(
+        value={
+            "metric_names": [
+                {
+                    "metric_name": f"metric_{m}",
+                    "lower_is_better": True,
+                    "description": "synthetic",
+                    "data": [
+                        {
+                            "dataset_name": f"dataset_{d}",
+                            "final_value": rng.random(),
+                            "best_value": rng.random(),
+                        }
+                        for d in range(datasets)
+                    ],
+                }
+                for m in range(metrics)
+            ]
+        }
+    )
+
+
+def _synthetic_metrics(args: argparse.Namespace, size: int) -> list[MetricValue]:
+    rng = random.Random(args.seed)
+    return [
+        (
+            WorstMetricValue()
+            if rng.random() < args.buggy_rate
+            else _synthetic_metric(rng, metrics=args.metrics, datasets=args.datasets)
+        )
+        for _ in range(size)
+    ]
+
+
+def _recomputed_gt(a: MetricValue, b: MetricValue) -> bool:
+    """MetricValue.__gt__ with the key recomputed on both sides."""
+    if a.value is None:
+        return False
+    if b.value is None:
+        return True
+    a_mean = a._compute_mean_value()
+    b_mean = b._compute_mean_value()
+    if a_mean == b_mean:
+        return False
+    comp = a_mean > b_mean
+    return comp if a._should_maximize() else not comp
+
+
+def _recomputed_cmp(a: MetricValue, b: MetricValue) -> int:
+    if _recomputed_gt(a, b):
+        return 1
+    return -1 if _recomputed_gt(b, a) else 0
+
+
+def _best_of(repeat: int, operation: Callable[[], object]) -> float:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        operation()
+        durations.append(time.perf_counter() - started)
+    return round(min(durations), 6)
+
+
+def _best_node(metrics: list[MetricValue]) -> Node | None:
+    journal = Journal(
+        summary_model="",
+        node_selection_model="",
+        summary_temperature=0.0,
+        node_selection_temperature=0.0,
+        event_callback=lambda _event: None,
+    )
+    for metric in metrics:
+        journal.append(Node(metric=metric, is_buggy=False, is_buggy_plots=False))
+    return journal.get_best_node(use_val_metric_only=True)
+
+
+def run_benchmark(*, size: int, args: argparse.Namespace) -> dict[str, Any]:
+    """Time the comparison-heavy operations on `size` synthetic metrics."""
+    metrics = _synthetic_metrics(args, size)
+    # Keys are computed on first use; the timings below are for warm keys
+    started = time.perf_counter()
+    for metric in metrics:
+        _ = metric.key
+    key_build_s = time.perf_counter() - started
+    recomputed_key = functools.cmp_to_key(_recomputed_cmp)
+    pairs = list(zip(metrics, metrics[1:]))
+    return {
+        "size": size,
+        "key_build_s": round(key_build_s, 6),
+        "max_s": _best_of(args.repeat, lambda: max(metrics)),
+        "max_recomputed_s": _best_of(args.repeat, lambda: max(metrics, key=recomputed_key)),
+        "sort_s": _best_of(args.repeat, lambda: sorted(metrics)),
+        "sort_recomputed_s": _best_of(args.repeat, lambda: sorted(metrics, key=recomputed_key)),
+        "equality_s": _best_of(args.repeat, lambda: [a == b for a, b in pairs]),
+        "best_node_s": _best_of(args.repeat, lambda: _best_node(metrics)),
+    }
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--metrics", type=int, default=3, help="metrics per value")
+    parser.add_argument("--datasets", type=int, default=3, help="datasets per metric")
+    parser.add_argument("--buggy-rate", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=5, help="timings are the best of these")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="JSON file (default: stdout)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    args = _parse_args(argv)
+    logging.getLogger("ai-scientist").setLevel(logging.WARNING)
+    logging.getLogger("ai_scientist").setLevel(logging.WARNING)
+    results = {
+        "benchmark": "metric_comparisons",
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "settings": {key: value for key, value in vars(args).items() if key != "output"},
+        "runs": [run_benchmark(size=size, args=args) for size in args.sizes],
+    }
+    payload = json.dumps(results, indent=2)
+    if args.output is None:
+        sys.stdout.write(payload + "\n")
+    else:
+        args.output.write_text(payload + "\n")
+        logger.warning(f"Benchmark results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
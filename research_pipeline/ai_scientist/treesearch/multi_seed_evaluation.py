@@ -4,10 +4,14 @@ Helpers for multi-seed evaluation and plot aggregation.
 Responsibilities:
 - Build aggregation nodes that summarize multi-seed runs
 - Prompt the LLM to generate aggregation plotting code using seed results
+
+The aggregation code reads the seeds' data files from `experiment_data_path_list`, which
+is defined when the code runs. That lets ParallelAgent generate the code as soon as the
+first seed finishes, while the remaining seeds are still running.
 """
 
 from pathlib import Path
-from typing import List, Protocol, Tuple
+from typing import List, Optional, Protocol, Tuple
 
 from .interpreter import Interpreter
 from .journal import Node
@@ -38,7 +42,16 @@ def generate_seed_eval_aggregation_node(*, node: Node, agg_plotting_code: str) -
     )
 
 
+def _experiment_data_paths(seed_nodes: List[Node]) -> List[str]:
+    return [
+        f"{seed_node.exp_results_dir}/experiment_data.npy"
+        for seed_node in seed_nodes
+        if seed_node.exp_results_dir
+    ]
+
+
 def aggregate_seed_eval_results(*, agent: SupportsSeedAgent, seed_nodes: List[Node]) -> str:
+    """Generate aggregation plotting code; any completed seed is enough to write it."""
     # Build a guidance list the LLM should follow when writing aggregation code
     prompt_guideline: list[str] = []
     prompt_guideline += [
@@ -58,6 +71,7 @@ def aggregate_seed_eval_results(*, agent: SupportsSeedAgent, seed_nodes: List[No
         "Always include a title for each plot, and be sure to use clear subtitles—such as 'Left: Ground Truth, Right: Generated Samples'—while also specifying the type of dataset being used.",
         "Make sure to use descriptive names for figures when saving e.g. always include the dataset name and the type of plot in the name",
         "When there are many similar figures to plot (e.g. generated samples at each epoch), make sure to plot only at a suitable interval of epochs so that you only plot at most 5 figures.",
+        "Load the data of every seed from the paths in the list `experiment_data_path_list`, which is already defined when your code runs; do not redefine it",
         "Example to extract data from experiment_data: experiment_data['dataset_name_1']['metrics']['train']",
         "Make sure to add legend for standard error bars and means if applicable",
     ]
@@ -74,16 +88,15 @@ def aggregate_seed_eval_results(*, agent: SupportsSeedAgent, seed_nodes: List[No
     plotting_instructions |= {
         "Plotting code guideline": prompt_guideline,
     }
+    # Seed runs reuse their parent's plotting code, so usually there is only one to show
+    plot_codes = list(dict.fromkeys(seed_node.plot_code or "" for seed_node in seed_nodes))
     plotting_instructions |= {
-        "Plotting code reference": (
-            "plotting code 1:\n" + (seed_nodes[0].plot_code or "") + "\n\n"
-            "plotting code 2:\n" + (seed_nodes[1].plot_code or "") + "\n\n"
-            "plotting code 3:\n" + (seed_nodes[2].plot_code or "") + "\n\n"
+        "Plotting code reference": "".join(
+            f"plotting code {idx}:\n{plot_code}\n\n"
+            for idx, plot_code in enumerate(plot_codes, start=1)
         ),
-        "Experiment Data Path": (
-            f"{seed_nodes[0].exp_results_dir or ''}/experiment_data.npy\n"
-            f"{seed_nodes[1].exp_results_dir or ''}/experiment_data.npy\n"
-            f"{seed_nodes[2].exp_results_dir or ''}/experiment_data.npy\n"
+        "Example entry of experiment_data_path_list": "\n".join(
+            _experiment_data_paths(seed_nodes)[:1]
         ),
     }
     plotting_prompt["Instructions"] = plotting_instructions
@@ -92,12 +105,20 @@ def aggregate_seed_eval_results(*, agent: SupportsSeedAgent, seed_nodes: List[No
     return code
 
 
-def run_plot_aggregation(*, agent: SupportsSeedAgent, node: Node, seed_nodes: List[Node]) -> Node:
+def run_plot_aggregation(
+    *,
+    agent: SupportsSeedAgent,
+    node: Node,
+    seed_nodes: List[Node],
+    agg_plotting_code: Optional[str] = None,
+) -> Node:
+    """Aggregate seed results into plots; `agg_plotting_code` may have been generated early."""
     if not seed_nodes:
         return node
     try:
         # Create aggregation plotting code
-        agg_plotting_code = aggregate_seed_eval_results(agent=agent, seed_nodes=seed_nodes)
+        if not agg_plotting_code:
+            agg_plotting_code = aggregate_seed_eval_results(agent=agent, seed_nodes=seed_nodes)
 
         # Create a special aggregation node
         agg_node = generate_seed_eval_aggregation_node(
@@ -115,7 +136,9 @@ def run_plot_aggregation(*, agent: SupportsSeedAgent, node: Node, seed_nodes: Li
         )
         try:
             working_dir = process_interpreter.working_dir
-            _ = process_interpreter.run(agg_plotting_code, True)
+            data_paths = _experiment_data_paths(seed_nodes)
+            executed_code = f"experiment_data_path_list = {data_paths!r}\n\n{agg_plotting_code}"
+            _ = process_interpreter.run(executed_code, True)
             process_interpreter.cleanup_session()
             # Save aggregated plots
             plots_dir = Path(working_dir) / "working"
@@ -133,7 +156,7 @@ def run_plot_aggregation(*, agent: SupportsSeedAgent, node: Node, seed_nodes: Li
 
                 # Save plotting code
                 with open(exp_results_dir / "aggregation_plotting_code.py", "w") as f:
-                    f.write(agg_plotting_code)
+                    f.write(executed_code)
 
                 # Move generated plots
                 for plot_file in plots_dir.glob("*.png"):
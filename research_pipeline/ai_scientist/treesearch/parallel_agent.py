@@ -2,47 +2,53 @@
 ParallelAgent: Executes breadth-first experiment iterations in parallel.
 
 High-level responsibilities:
-- Manage process pool and optional GPU assignment per worker
+- Submit to the run-wide worker pool with memory-aware GPU placement per task
 - Select nodes to process (draft/debug/improve) with exploration/exploitation
 - Submit work to workers and collect results with timeouts
 - Emit structured progress/log events during the run
 - Support multi-seed evaluation and resource cleanup
 """
 
+import itertools
 import logging
-import multiprocessing
 import pickle
 import random
+import time
 import traceback
+from collections import deque
 from collections.abc import Callable
-from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
 from types import TracebackType
 from typing import List, Optional
 
 from ai_scientist.llm import query, structured_query_with_schema
 
 from .codegen_agent import PlanAndCodeSchema
-from .events import BaseEvent, GpuShortageEvent, RunLogEvent
-from .gpu_manager import GPUManager, get_gpu_count
+from .events import BaseEvent, GpuShortageEvent, NodeTimingEvent, RunLogEvent
+from .gpu_manager import GPUScheduler, detect_gpu_devices, is_cuda_oom
+from .idea_queue import IdeaQueue
 from .journal import Journal, Node
-from .stages.stage2_tuning import Stage2Tuning
-from .stages.stage4_ablation import Stage4Ablation
+from .multi_seed_evaluation import aggregate_seed_eval_results
+from .phase_timing import summarize_phases
+from .stages.stage2_tuning import HyperparamTuningIdea, Stage2Tuning
+from .stages.stage4_ablation import AblationIdea, Stage4Ablation
 from .types import PromptType
 from .utils.config import Config
 from .utils.metric import WorstMetricValue
+from .worker_context import WorkerContext, WorkerContextRef, publish_worker_context
+from .worker_pool import WorkerPool
 from .worker_process import process_node
 
 logger = logging.getLogger("ai-scientist")
 
 
-def _safe_pickle_test(obj: object, name: str = "object") -> bool:
-    """Test if an object can be pickled"""
-    try:
-        pickle.dumps(obj)
-        return True
-    except Exception as e:
-        logger.error(f"Cannot pickle {name}: {str(e)}")
-        return False
+@dataclass
+class _SubmissionStats:
+    tasks: int = 0
+    pickled_bytes: int = 0
+    pickle_seconds: float = 0.0
 
 
 class ParallelAgent:
@@ -56,6 +62,8 @@ class ParallelAgent:
         best_stage2_node: Node | None,
         best_stage1_node: Node | None,
         event_callback: Callable[[BaseEvent], None],
+        worker_pool: WorkerPool | None = None,
+        max_iterations: int | None = None,
     ):
         # Store run context (idea, configuration, journal, stage)
         self.task_desc = task_desc
@@ -63,6 +71,8 @@ class ParallelAgent:
         self.journal = journal
         self.stage_name = stage_name
         self.event_callback = event_callback
+        # Node budget of the sub-stage; bounds how many ideas are worth proposing ahead
+        self.max_iterations = max_iterations
         # Best nodes carried from previous stages to seed new work
         self.best_stage1_node = best_stage1_node  # to initialize hyperparam tuning (stage 2)
         self.best_stage2_node = best_stage2_node  # to initialize plotting code (stage 3)
@@ -70,7 +80,8 @@ class ParallelAgent:
 
         # Configure parallelism and optional GPUs
         self.num_workers = cfg.agent.num_workers
-        self.num_gpus = get_gpu_count()
+        gpu_devices = detect_gpu_devices()
+        self.num_gpus = len(gpu_devices)
         logger.info(f"num_gpus: {self.num_gpus}")
         if self.num_gpus < self.cfg.min_num_gpus:
             self._handle_gpu_shortage(
@@ -82,18 +93,32 @@ class ParallelAgent:
         else:
             logger.info(f"Detected {self.num_gpus} GPUs")
 
-        self.gpu_manager = GPUManager(self.num_gpus) if self.num_gpus > 0 else None
+        scheduler_cfg = cfg.agent.gpu_scheduler
+        self.gpu_scheduler = (
+            GPUScheduler(
+                gpu_devices,
+                slots_per_gpu=scheduler_cfg.slots_per_gpu,
+                memory_headroom=scheduler_cfg.memory_headroom,
+                default_footprint_mib=scheduler_cfg.default_footprint_mib,
+            )
+            if self.num_gpus > 0
+            else None
+        )
+        self._gpu_task_ids = itertools.count()
 
-        if self.num_gpus > 0:
-            self.num_workers = min(self.num_workers, self.num_gpus)
-            logger.info(f"Limiting workers to {self.num_workers} to match GPU count")
+        if self.gpu_scheduler is not None:
+            self.num_workers = min(self.num_workers, self.gpu_scheduler.total_slots)
+            logger.info(
+                f"Limiting workers to {self.num_workers} to match GPU slots "
+                f"({self.num_gpus} GPU(s) x {scheduler_cfg.slots_per_gpu})"
+            )
 
-        # Create process pool for parallel execution
+        # Submit into the run-wide worker pool, or a private one when used standalone
         self.timeout = self.cfg.exec.timeout
-        mp_context = multiprocessing.get_context("spawn")
-        self.executor: ProcessPoolExecutor = ProcessPoolExecutor(
-            max_workers=self.num_workers, mp_context=mp_context
-        )
+        self._owns_worker_pool = worker_pool is None
+        self.worker_pool = worker_pool if worker_pool is not None else WorkerPool()
+        self.worker_pool.prepare(self.num_workers)
+        self._published_contexts: set[str] = set()
         self._is_shutdown = False
         # Define the evaluation metric once at initialization
         self.evaluation_metrics = self._define_global_metrics()
@@ -103,6 +128,20 @@ class ParallelAgent:
         self._hyperparam_tuning_state: dict[str, set[str]] = {  # store hyperparam tuning ideas
             "tried_hyperparams": set(),
         }
+        # A journal restored mid-substage already holds tried ideas; don't propose them again.
+        # Like _take_new_ideas, count an idea as tried whether or not its node turned out buggy
+        if self.stage_name and self.stage_name.startswith("2_"):
+            self._hyperparam_tuning_state["tried_hyperparams"].update(
+                node.hyperparam_name for node in self.journal.nodes if node.hyperparam_name
+            )
+        elif self.stage_name and self.stage_name.startswith("4_"):
+            self._ablation_state["completed_ablations"].update(
+                node.ablation_name for node in self.journal.nodes if node.ablation_name
+            )
+        # Stage 2/4 ideas, proposed in batches and refilled while experiments run
+        self._hyperparam_ideas: IdeaQueue[HyperparamTuningIdea] | None = None
+        self._ablation_ideas: IdeaQueue[AblationIdea] | None = None
+        self._seed_aggregation_code: Future[str] | None = None
 
     def _handle_gpu_shortage(self, *, available_gpus: int, required_gpus: int) -> None:
         message = (
@@ -192,83 +231,214 @@ class ParallelAgent:
         logger.error("Final plan + code extraction attempt failed, giving up...")
         return "", last_completion
 
+    @staticmethod
+    def _gpu_demand(node: Node | None) -> tuple[int | None, bool]:
+        """
+        Expected GPU memory use of an experiment derived from `node`: the peak observed
+        for the nearest run in its lineage, and whether that run ran out of GPU memory.
+        """
+        current = node
+        while current is not None:
+            # Successful runs never count as OOM; skip loading their terminal output
+            if current.exc_type is not None and is_cuda_oom(current.exc_type, current._term_out):
+                return current.gpu_peak_memory_mib, True
+            if current.gpu_peak_memory_mib is not None:
+                return current.gpu_peak_memory_mib, False
+            current = current.parent
+        return None, False
+
+    def _acquire_gpu(self, node: Node | None, label: str) -> tuple[int | None, str | None]:
+        """Place a task on a GPU, waiting for capacity. Returns (gpu_id, task_id) or Nones."""
+        if self.gpu_scheduler is None:
+            return None, None
+        task_id = f"{label}_{next(self._gpu_task_ids)}"
+        observed_peak_mib, oom = self._gpu_demand(node)
+        try:
+            placement = self.gpu_scheduler.acquire(
+                task_id,
+                observed_peak_mib=observed_peak_mib,
+                exclusive=oom,
+                timeout=self.timeout,
+            )
+        except RuntimeError as e:
+            logger.warning(f"Could not acquire GPU for {label}: {e}. Running on CPU")
+            return None, None
+        logger.info(
+            f"Assigned GPU {placement.gpu_id} to {task_id} "
+            f"(reserved {placement.reserved_mib} MiB"
+            f"{', exclusive after OOM' if placement.exclusive else ''}, "
+            f"queued {placement.queued_s:.1f}s)"
+        )
+        return placement.gpu_id, task_id
+
+    def _release_gpu_when_done(self, future: Future, task_id: str | None) -> None:
+        # Released when the worker actually finishes, even if collecting its result timed out.
+        if self.gpu_scheduler is None or task_id is None:
+            return
+        scheduler = self.gpu_scheduler
+        future.add_done_callback(lambda _: scheduler.release(task_id))
+
+    def _publish_context(
+        self, *, memory_summary: str, best_stage3_plot_code: str | None
+    ) -> WorkerContextRef:
+        context_ref = publish_worker_context(
+            WorkerContext(
+                task_desc=self.task_desc,
+                cfg=self.cfg,
+                evaluation_metrics=self.evaluation_metrics,
+                stage_name=self.stage_name,
+                memory_summary=memory_summary,
+                best_stage3_plot_code=best_stage3_plot_code,
+            ),
+            workspace_dir=self.cfg.workspace_dir,
+        )
+        self._published_contexts.add(context_ref.path)
+        return context_ref
+
+    def _submit_process_node(
+        self, stats: _SubmissionStats, **task_kwargs: object
+    ) -> Future[dict[str, object]]:
+        """Submit one process_node task, recording how much of it has to be pickled."""
+        measured = {key: value for key, value in task_kwargs.items() if key != "event_callback"}
+        started = time.perf_counter()
+        try:
+            stats.pickled_bytes += len(pickle.dumps(measured, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            logger.error(f"Cannot pickle task arguments: {str(e)}")
+        stats.pickle_seconds += time.perf_counter() - started
+        stats.tasks += 1
+        return self.worker_pool.submit(process_node, **task_kwargs)
+
+    @staticmethod
+    def _log_submission_stats(stats: _SubmissionStats, context_ref: WorkerContextRef) -> None:
+        logger.info(
+            f"Submitted {stats.tasks} task(s): {stats.pickled_bytes / 1024:.1f} KiB of task "
+            f"arguments pickled in {stats.pickle_seconds * 1000:.1f}ms "
+            f"(shared context {context_ref.version}: {context_ref.size_bytes / 1024:.1f} KiB)"
+        )
+
+    def _try_acquire_gpu(
+        self, node: Node | None, label: str
+    ) -> tuple[int | None, str | None] | None:
+        """Like _acquire_gpu, but returns None instead of waiting when no slot is free."""
+        if self.gpu_scheduler is None:
+            return None, None
+        task_id = f"{label}_{next(self._gpu_task_ids)}"
+        observed_peak_mib, oom = self._gpu_demand(node)
+        placement = self.gpu_scheduler.try_acquire(
+            task_id, observed_peak_mib=observed_peak_mib, exclusive=oom
+        )
+        if placement is None:
+            return None
+        logger.info(f"Assigned GPU {placement.gpu_id} to {task_id}")
+        return placement.gpu_id, task_id
+
+    def _start_seed_aggregation_code(self, seed_node: Node) -> None:
+        """Write the aggregation plotting code from the first finished seed, in the background."""
+        if self._seed_aggregation_code is not None:
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="seed-aggregation")
+        self._seed_aggregation_code = executor.submit(
+            aggregate_seed_eval_results, agent=self, seed_nodes=[seed_node]
+        )
+        executor.shutdown(wait=False)
+
+    def take_seed_aggregation_code(self) -> str | None:
+        """Aggregation plotting code generated during the last multi-seed evaluation, if any."""
+        future, self._seed_aggregation_code = self._seed_aggregation_code, None
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            logger.warning(f"Early seed aggregation code generation failed: {e}")
+            return None
+
     def _run_multi_seed_evaluation(self, node: Node) -> List[Node]:
         """Run multiple seeds of the same node to get statistical metrics.
-        Returns a list of nodes with different random seeds."""
-        # Convert node to dict for parallel processing
-        node_data = node.to_dict()
+        Returns a list of nodes with different random seeds.
+
+        Seeds are dispatched as GPU slots free up (never silently moved to CPU) and
+        consumed in completion order; the first finished seed starts generating the
+        aggregation plotting code while the others run."""
+        started = time.monotonic()
+        # Convert node to the fields workers read for parallel processing
+        base_node_data = node.to_parent_dict()
         node_code = node.code
+        context_ref = self._publish_context(memory_summary="", best_stage3_plot_code=None)
+        submission_stats = _SubmissionStats()
+        self._seed_aggregation_code = None
 
-        # Submit parallel jobs for different seeds
+        pending_seeds = deque(range(self.cfg.agent.multi_seed_eval["num_seeds"]))
+        running: dict[Future, int] = {}
         seed_nodes: List[Node] = []
-        futures: list = []
-        seed_process_ids: list[str | None] = []  # Track process IDs for GPU release
-        for seed in range(self.cfg.agent.multi_seed_eval["num_seeds"]):
-            gpu_id = None
-            process_id = f"seed_{seed}_worker"
-            if self.gpu_manager is not None:
-                try:
-                    gpu_id = self.gpu_manager.acquire_gpu(process_id)
-                    logger.info(f"Assigned GPU {gpu_id} to seed {seed}")
-                    seed_process_ids.append(process_id)
-                except RuntimeError as e:
-                    logger.warning(f"Could not acquire GPU for seed {seed}: {e}. Running on CPU")
-                    seed_process_ids.append(None)
-
-            # Add seed to node code
-            node_data["code"] = (
-                f"# Set random seed\nimport random\nimport numpy as np\nimport torch\n\nseed = {seed}\nrandom.seed(seed)\nnp.random.seed(seed)\ntorch.manual_seed(seed)\nif torch.cuda.is_available():\n    torch.cuda.manual_seed(seed)\n\n"
-                + node_code
-            )
-
-            new_ablation_idea = None
-            new_hyperparam_idea = None
-            best_stage3_plot_code = None
-            seed_eval = True
-            memory_summary = ""
-            logger.info("Starting multi-seed eval...")
-            futures.append(
-                self.executor.submit(
-                    process_node,
+        logger.info(f"Starting multi-seed eval ({len(pending_seeds)} seed(s))...")
+        while pending_seeds or running:
+            # Fan out onto free device slots; only block on a slot when nothing is running
+            while pending_seeds:
+                seed = pending_seeds[0]
+                placement = self._try_acquire_gpu(node, f"seed_{seed}")
+                if placement is None:
+                    if running:
+                        break
+                    placement = self._acquire_gpu(node, f"seed_{seed}")
+                gpu_id, gpu_task_id = placement
+                pending_seeds.popleft()
+
+                # Add seed to node code (a fresh dict per seed; submission pickles lazily)
+                node_data = dict(base_node_data)
+                node_data["code"] = (
+                    f"# Set random seed\nimport random\nimport numpy as np\nimport torch\n\nseed = {seed}\nrandom.seed(seed)\nnp.random.seed(seed)\ntorch.manual_seed(seed)\nif torch.cuda.is_available():\n    torch.cuda.manual_seed(seed)\n\n"
+                    + node_code
+                )
+                future = self._submit_process_node(
+                    submission_stats,
+                    context_ref=context_ref,
                     node_data=node_data,
-                    task_desc=self.task_desc,
-                    cfg=self.cfg,
                     gpu_id=gpu_id,
-                    memory_summary=memory_summary,
-                    evaluation_metrics=self.evaluation_metrics,
-                    stage_name=self.stage_name,
-                    new_ablation_idea=new_ablation_idea,
-                    new_hyperparam_idea=new_hyperparam_idea,
-                    best_stage3_plot_code=best_stage3_plot_code,
-                    seed_eval=seed_eval,
+                    new_ablation_idea=None,
+                    new_hyperparam_idea=None,
+                    seed_eval=True,
                     event_callback=self.event_callback,
                 )
-            )
-
-        # Collect results and release GPUs
-        for idx, future in enumerate(futures):
-            try:
-                result_data = future.result(timeout=self.timeout)
-                result_node = Node.from_dict(result_data, self.journal)
-                parent_id_str = result_node.parent.id if result_node.parent is not None else "N/A"
-                logger.debug(f"Parent node id: {parent_id_str}")
-                logger.debug(f"Sanity check: actual parent node id: {node.id}")
-                # Add node to journal's list and assign its step number
-                self.journal.append(result_node)
-                node_found = self.journal.get_node_by_id(result_node.id)
-                if node_found is not None:
-                    seed_nodes.append(node_found)
-                logger.debug("Added result node to journal")
-            except Exception as e:
-                logger.error(f"Error in multi-seed evaluation: {str(e)}")
-            finally:
-                # Release GPU after this seed completes
-                if self.gpu_manager is not None and idx < len(seed_process_ids):
-                    proc_id = seed_process_ids[idx]
-                    if proc_id is not None:
-                        self.gpu_manager.release_gpu(proc_id)
-                        logger.info(f"Released GPU for {proc_id}")
+                self._release_gpu_when_done(future, gpu_task_id)
+                running[future] = seed
+
+            done, _ = wait(running, timeout=self.timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                logger.error(
+                    f"Multi-seed evaluation: no seed finished within {self.timeout}s; "
+                    f"giving up on seeds {sorted(running.values())}"
+                )
+                break
+            for future in done:
+                seed = running.pop(future)
+                try:
+                    result_data = future.result()
+                    result_node = Node.from_dict(result_data, self.journal)
+                    parent_id_str = (
+                        result_node.parent.id if result_node.parent is not None else "N/A"
+                    )
+                    logger.debug(f"Parent node id: {parent_id_str}")
+                    logger.debug(f"Sanity check: actual parent node id: {node.id}")
+                    # Add node to journal's list and assign its step number
+                    self.journal.append(result_node)
+                    self._emit_node_timing(result_node)
+                    node_found = self.journal.get_node_by_id(result_node.id)
+                    if node_found is not None:
+                        seed_nodes.append(node_found)
+                        if not node_found.is_buggy:
+                            self._start_seed_aggregation_code(node_found)
+                    logger.debug(f"Added result node of seed {seed} to journal")
+                except Exception as e:
+                    logger.error(f"Error in multi-seed evaluation (seed {seed}): {str(e)}")
+        self._log_submission_stats(submission_stats, context_ref)
 
+        logger.info(
+            f"Multi-seed evaluation finished {len(seed_nodes)} seed(s) in "
+            f"{time.monotonic() - started:.1f}s"
+        )
+        self._log_gpu_scheduler_stats()
         return seed_nodes
 
     def _get_leaves(self, node: Node) -> List[Node]:
@@ -402,6 +572,85 @@ class ParallelAgent:
 
         return nodes_to_process
 
+    def _hyperparam_idea_queue(self) -> IdeaQueue[HyperparamTuningIdea]:
+        if self._hyperparam_ideas is None:
+            base_stage1_code = self.best_stage1_node.code if self.best_stage1_node else ""
+            model = self.cfg.agent.code.model
+            temperature = self.cfg.agent.code.temperature
+            self._hyperparam_ideas = IdeaQueue(
+                propose_batch=lambda tried, count: Stage2Tuning.propose_hyperparam_ideas(
+                    base_stage1_code=base_stage1_code,
+                    tried=tried,
+                    count=count,
+                    model=model,
+                    temperature=temperature,
+                ),
+                propose_one=lambda tried: Stage2Tuning.propose_next_hyperparam_idea(
+                    base_stage1_code=base_stage1_code,
+                    tried=tried,
+                    model=model,
+                    temperature=temperature,
+                ),
+                prefetch=self.num_workers,
+                label="hyperparameter tuning",
+            )
+        return self._hyperparam_ideas
+
+    def _ablation_idea_queue(self) -> IdeaQueue[AblationIdea]:
+        if self._ablation_ideas is None:
+            base_stage3_code = self.best_stage3_node.code if self.best_stage3_node else ""
+            model = self.cfg.agent.code.model
+            temperature = self.cfg.agent.code.temperature
+            self._ablation_ideas = IdeaQueue(
+                propose_batch=lambda completed, count: Stage4Ablation.propose_ablation_ideas(
+                    base_stage3_code=base_stage3_code,
+                    completed=completed,
+                    count=count,
+                    model=model,
+                    temperature=temperature,
+                ),
+                propose_one=lambda completed: Stage4Ablation.propose_next_ablation_idea(
+                    base_stage3_code=base_stage3_code,
+                    completed=completed,
+                    model=model,
+                    temperature=temperature,
+                ),
+                prefetch=self.num_workers,
+                label="ablation",
+            )
+        return self._ablation_ideas
+
+    def _take_new_ideas(
+        self, node_data_list: list[dict[str, object] | None]
+    ) -> list[HyperparamTuningIdea | AblationIdea | None]:
+        """
+        The Stage 2/4 idea for each submission (None where the node is drafted or debugged),
+        taken from the idea queue in one go and recorded as tried.
+        """
+        needs_idea = [
+            node_data is not None and node_data.get("is_buggy") is False
+            for node_data in node_data_list
+        ]
+        count = sum(needs_idea)
+        # Nodes the later steps can still add before the sub-stage reaches its budget
+        later_demand = None
+        if self.max_iterations is not None:
+            later_demand = max(self.max_iterations - len(self.journal) - len(node_data_list), 0)
+        ideas: list[HyperparamTuningIdea] | list[AblationIdea]
+        if count and self.stage_name and self.stage_name.startswith("2_"):
+            tried = self._hyperparam_tuning_state["tried_hyperparams"]
+            ideas = self._hyperparam_idea_queue().take(
+                count, tried=tried, later_demand=later_demand
+            )
+        elif count and self.stage_name and self.stage_name.startswith("4_"):
+            tried = self._ablation_state["completed_ablations"]
+            ideas = self._ablation_idea_queue().take(count, tried=tried, later_demand=later_demand)
+        else:
+            return [None] * len(node_data_list)
+        tried.update(idea.name for idea in ideas)
+        remaining = iter(ideas)
+        return [next(remaining) if needed else None for needed in needs_idea]
+
     def step(self) -> None:
         """Drive one iteration: select nodes, submit work, collect results, update state."""
         logger.debug("Selecting nodes to process")
@@ -446,89 +695,44 @@ class ParallelAgent:
                 )
             )
 
-        # Convert nodes to serializable dicts for worker submission
-        node_data_list: list[dict[str, object] | None] = []
-        for node in nodes_to_process:
-            if node:
-                try:
-                    node_dict = node.to_dict()
-                    _safe_pickle_test(node_dict, f"node {node.id} data")
-                    node_data_list.append(node_dict)
-                except Exception as e:
-                    logger.error(f"Error preparing node {node.id}: {str(e)}")
-                    raise
-            else:
-                node_data_list.append(None)  # None means new draft
+        # Convert nodes to the compact dicts workers read (None means new draft)
+        node_data_list: list[dict[str, object] | None] = [
+            node.to_parent_dict() if node else None for node in nodes_to_process
+        ]
 
         memory_summary = self.journal.generate_summary(include_code=False)
+        context_ref = self._publish_context(
+            memory_summary=memory_summary,
+            best_stage3_plot_code=(
+                self.best_stage3_node.plot_code if self.best_stage3_node else None
+            ),
+        )
+        submission_stats = _SubmissionStats()
 
         # Submit tasks to process pool
         logger.debug("Submitting tasks to process pool")
 
         futures: list[Future] = []
-        for node_data in node_data_list:
-            gpu_id = None
-            if self.gpu_manager is not None:
-                try:
-                    # Get current process ID for GPU assignment
-                    process_id = f"worker_{len(futures)}"
-                    gpu_id = self.gpu_manager.acquire_gpu(process_id)
-                    logger.info(f"Assigned GPU {gpu_id} to process {process_id}")
-                except RuntimeError as e:
-                    logger.warning(f"Could not acquire GPU: {e}. Running on CPU")
-
-            is_not_buggy = (
-                node_data is not None
-                and isinstance(node_data, dict)
-                and node_data.get("is_buggy") is False
-            )
-            if self.stage_name and self.stage_name.startswith("2_") and is_not_buggy:
-                base_stage1_code = self.best_stage1_node.code if self.best_stage1_node else ""
-                tried_list = list(self._hyperparam_tuning_state["tried_hyperparams"])
-                new_hyperparam_idea = Stage2Tuning.propose_next_hyperparam_idea(
-                    base_stage1_code=base_stage1_code,
-                    tried=tried_list,
-                    model=self.cfg.agent.code.model,
-                    temperature=self.cfg.agent.code.temperature,
-                )
-                self._hyperparam_tuning_state["tried_hyperparams"].add(new_hyperparam_idea.name)
-                new_ablation_idea = None
-            elif self.stage_name and self.stage_name.startswith("4_") and is_not_buggy:
-                base_stage3_code = self.best_stage3_node.code if self.best_stage3_node else ""
-                completed_list = list(self._ablation_state["completed_ablations"])
-                new_ablation_idea = Stage4Ablation.propose_next_ablation_idea(
-                    base_stage3_code=base_stage3_code,
-                    completed=completed_list,
-                    model=self.cfg.agent.code.model,
-                    temperature=self.cfg.agent.code.temperature,
-                )
-                self._ablation_state["completed_ablations"].add(new_ablation_idea.name)
-                new_hyperparam_idea = None
-            else:
-                new_ablation_idea = None
-                new_hyperparam_idea = None
+        new_ideas = self._take_new_ideas(node_data_list)
+        for node, node_data, new_idea in zip(nodes_to_process, node_data_list, new_ideas):
+            gpu_id, gpu_task_id = self._acquire_gpu(node, "worker")
+            new_hyperparam_idea = new_idea if isinstance(new_idea, HyperparamTuningIdea) else None
+            new_ablation_idea = new_idea if isinstance(new_idea, AblationIdea) else None
 
-            best_stage3_plot_code = (
-                self.best_stage3_node.plot_code if self.best_stage3_node else None
-            )
             seed_eval = False
-            futures.append(
-                self.executor.submit(
-                    process_node,
-                    node_data=node_data,
-                    task_desc=self.task_desc,
-                    cfg=self.cfg,
-                    gpu_id=gpu_id,
-                    memory_summary=memory_summary,
-                    evaluation_metrics=self.evaluation_metrics,
-                    stage_name=self.stage_name,
-                    new_ablation_idea=new_ablation_idea,
-                    new_hyperparam_idea=new_hyperparam_idea,
-                    best_stage3_plot_code=best_stage3_plot_code,
-                    seed_eval=seed_eval,
-                    event_callback=self.event_callback,
-                )
+            future = self._submit_process_node(
+                submission_stats,
+                context_ref=context_ref,
+                node_data=node_data,
+                gpu_id=gpu_id,
+                new_ablation_idea=new_ablation_idea,
+                new_hyperparam_idea=new_hyperparam_idea,
+                seed_eval=seed_eval,
+                event_callback=self.event_callback,
             )
+            self._release_gpu_when_done(future, gpu_task_id)
+            futures.append(future)
+        self._log_submission_stats(submission_stats, context_ref)
 
         # Collect results as they complete and update journal/state
         logger.debug("Waiting for results")
@@ -562,6 +766,7 @@ class ParallelAgent:
                 # Add node to journal's list and assign its step number
                 self.journal.append(result_node)
                 logger.debug("Added result node to journal")
+                self._emit_node_timing(result_node)
 
                 if result_node.is_buggy:
                     self.event_callback(
@@ -592,45 +797,55 @@ class ParallelAgent:
 
                 traceback.print_exc()
                 raise
-            finally:
-                # Release GPU for this process if it was using one
-                process_id = f"worker_{i}"
-                if self.gpu_manager is not None and process_id in self.gpu_manager.gpu_assignments:
-                    self.gpu_manager.release_gpu(process_id)
-                    logger.info(f"Released GPU for process {process_id}")
+
+        self._log_gpu_scheduler_stats()
+
+    def _emit_node_timing(self, node: Node) -> None:
+        if not node.phase_timings:
+            return
+        self.event_callback(
+            NodeTimingEvent(
+                stage=self.stage_name,
+                node_id=node.id,
+                is_buggy=bool(node.is_buggy),
+                total_s=round(
+                    max(span["start_s"] + span["duration_s"] for span in node.phase_timings), 3
+                ),
+                phases=summarize_phases([node.phase_timings]),
+                profile_path=node.profile_path,
+            )
+        )
+
+    def _log_gpu_scheduler_stats(self) -> None:
+        if self.gpu_scheduler is not None:
+            logger.info(f"GPU scheduler: {self.gpu_scheduler.stats().describe()}")
 
     def __enter__(self) -> "ParallelAgent":
         return self
 
     def cleanup(self) -> None:
-        """Cleanup parallel workers and resources"""
-        # Release GPUs, shutdown executor, and terminate lingering processes
+        """Release GPUs and hand the worker pool back (or close it if this agent owns it)"""
         if not self._is_shutdown:
-            logger.info("Shutting down parallel executor...")
+            logger.info("Finishing parallel agent...")
             try:
                 # Release all GPUs
-                if self.gpu_manager is not None:
-                    for process_id in list(self.gpu_manager.gpu_assignments.keys()):
-                        self.gpu_manager.release_gpu(process_id)
-
-                # Shutdown executor first
-                self.executor.shutdown(wait=False, cancel_futures=True)
-
-                # Force terminate all worker processes
-                if self.executor._processes:
-                    # Get copy of processes
-                    processes = list(self.executor._processes.values())
-
-                    # Then terminate processes if they're still alive
-                    for process in processes:
-                        if process.is_alive():
-                            process.terminate()
-                            process.join(timeout=1)
-
-                logger.info("Executor shutdown complete")
+                if self.gpu_scheduler is not None:
+                    self.gpu_scheduler.release_all()
+                for idea_queue in (self._hyperparam_ideas, self._ablation_ideas):
+                    if idea_queue is not None:
+                        idea_queue.close()
+
+                if self._owns_worker_pool:
+                    self.worker_pool.close()
+                else:
+                    self.worker_pool.finish_substage()
+                # Contexts hold the full config; drop them once no task can still read them
+                for path in self._published_contexts:
+                    Path(path).unlink(missing_ok=True)
+                logger.info("Parallel agent finished")
 
             except Exception as e:
-                logger.exception(f"Error during executor shutdown: {e}")
+                logger.exception(f"Error during worker pool cleanup: {e}")
             finally:
                 self._is_shutdown = True
 
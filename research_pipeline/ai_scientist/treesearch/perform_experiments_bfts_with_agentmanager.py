@@ -16,6 +16,7 @@ import json
 import logging
 import shutil
 import time
+from dataclasses import asdict
 from pathlib import Path
 from typing import Callable
 
@@ -50,7 +51,7 @@ def perform_experiments_bfts(
     def cleanup() -> None:
         if global_step == 0:
             # Remove workspace if the run produced no steps
-            shutil.rmtree(cfg.workspace_dir)
+            shutil.rmtree(cfg.workspace_dir, ignore_errors=True)
 
     atexit.register(cleanup)
 
@@ -69,6 +70,8 @@ def perform_experiments_bfts(
     # to ensure iteration counts start from 1 for each main stage.
     last_reported_iteration_by_stage: dict[str, int] = {}
     baseline_nodes_by_stage: dict[str, int] = {}
+    # Number of leading journal nodes per stage whose notes summary has been written.
+    summarized_nodes_by_stage: dict[str, int] = {}
 
     def step_callback(stage: StageMeta, journal: Journal) -> None:
         # Persist progress snapshot and emit progress events after each step
@@ -85,14 +88,20 @@ def perform_experiments_bfts(
             notes_dir = cfg.log_dir / f"stage_{stage.name}" / "notes"
             notes_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save latest node summary
-            latest_node = None
-            if journal.nodes:
-                latest_node = journal.nodes[-1]
-                if latest_node._agent is not None:
-                    summary = latest_node._agent._generate_node_summary(latest_node)
-                    with open(notes_dir / f"node_{latest_node.id}_summary.json", "w") as f:
+            if stage.name not in baseline_nodes_by_stage:
+                baseline_nodes_by_stage[stage.name] = 0 if stage.number == 1 else 1
+            baseline = baseline_nodes_by_stage[stage.name]
+
+            # Save a summary for every node added since the last callback; coalesced
+            # bookkeeping can deliver several new nodes at once.
+            first_new = summarized_nodes_by_stage.get(stage.name, baseline)
+            for node in journal.nodes[first_new:]:
+                if node._agent is not None:
+                    summary = node._agent._generate_node_summary(node)
+                    with open(notes_dir / f"node_{node.id}_summary.json", "w") as f:
                         json.dump(summary, f, indent=2)
+            summarized_nodes_by_stage[stage.name] = max(first_new, len(journal.nodes))
+            latest_node = journal.nodes[-1] if journal.nodes else None
 
             # Generate and save stage progress summary
             best_node = journal.get_best_node()
@@ -106,6 +115,7 @@ def perform_experiments_bfts(
                 "good_nodes": good_nodes_count,
                 "best_metric": (str(best_node.metric) if best_node else "None"),
                 "current_findings": journal.generate_summary(include_code=False),
+                "summary_stats": asdict(journal.summary_stats),
             }
 
             with open(notes_dir / "stage_progress.json", "w") as f:
@@ -120,9 +130,6 @@ def perform_experiments_bfts(
             # - For stages > 1, treats the single carried-over best node from the
             #   previous stage as baseline (not counted as a new iteration).
             non_seed_nodes = [n for n in journal.nodes if not n.is_seed_node]
-            if stage.name not in baseline_nodes_by_stage:
-                baseline_nodes_by_stage[stage.name] = 0 if stage.number == 1 else 1
-            baseline = baseline_nodes_by_stage[stage.name]
             effective_iteration = max(len(non_seed_nodes) - baseline, 0)
 
             if stage.max_iterations > 0:
@@ -212,7 +219,10 @@ def perform_experiments_bfts(
             f"Step {min(len(journal), stage.max_iterations)}/{stage.max_iterations} at stage_{stage.name}"
         )
 
-    manager.run(step_callback=step_callback)
+    try:
+        manager.run(step_callback=step_callback)
+    finally:
+        manager.close()
 
     if cfg.generate_report:
         logger.info("Generating final report from all stages...")
@@ -0,0 +1,252 @@
+"""
+Per-phase timing of the work a tree-search worker does for one node.
+
+process_node activates a PhaseRecorder for every node; code anywhere below it (codegen,
+the interpreter, plotting, ...) marks a phase with `with phase_span("execution"):`. A span
+records its wall-clock duration and the LLM tokens used while it was the innermost open
+span; the spans end up on the node (`Node.phase_timings`) and with it in the journal.
+Spans may nest (the venv setup happens inside the execution phase), so durations are
+inclusive. Outside an active recorder `phase_span` does nothing.
+
+A sampled fraction of nodes is also profiled (`agent.profiling`): "cprofile" profiles the
+worker thread in-process and writes a pstats file; "py-spy" samples the worker and the
+experiment processes it spawns with an external `py-spy record` and writes a speedscope
+file.
+"""
+
+import contextvars
+import cProfile
+import logging
+import os
+import random
+import shutil
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from ai_scientist.llm.token_tracker import add_usage_listener
+
+logger = logging.getLogger("ai-scientist")
+
+_PY_SPY_STOP_TIMEOUT_S = 30.0
+
+
+@dataclass
+class PhaseSpan:
+    name: str
+    parent: str | None
+    # offset from the start of the node's processing
+    start_s: float
+    duration_s: float = 0.0
+    # True if the span ran off the node's main thread, overlapping the phases there
+    background: bool = False
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    # Part of input_tokens the provider served from its prompt cache
+    cached_input_tokens: int = 0
+
+
+_active_recorder: contextvars.ContextVar["PhaseRecorder | None"] = contextvars.ContextVar(
+    "phase_recorder", default=None
+)
+_active_span: contextvars.ContextVar[PhaseSpan | None] = contextvars.ContextVar(
+    "phase_span", default=None
+)
+
+
+class PhaseRecorder:
+    """Collects the spans of one node's processing; safe to use from helper threads."""
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._thread_id = threading.get_ident()
+        self._spans: list[PhaseSpan] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def active(self) -> Iterator["PhaseRecorder"]:
+        token = _active_recorder.set(self)
+        try:
+            yield self
+        finally:
+            _active_recorder.reset(token)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[PhaseSpan]:
+        parent = _active_span.get()
+        started = time.monotonic()
+        span = PhaseSpan(
+            name=name,
+            parent=parent.name if parent is not None else None,
+            start_s=started - self._started,
+            background=threading.get_ident() != self._thread_id,
+        )
+        token = _active_span.set(span)
+        try:
+            yield span
+        finally:
+            _active_span.reset(token)
+            span.duration_s = time.monotonic() - started
+            with self._lock:
+                self._spans.append(span)
+
+    def spans(self) -> list[dict[str, Any]]:
+        """Finished spans in start order, as journal-ready dicts."""
+        with self._lock:
+            spans = sorted(self._spans, key=lambda span: span.start_s)
+        return [
+            {
+                **asdict(span),
+                "start_s": round(span.start_s, 4),
+                "duration_s": round(span.duration_s, 4),
+            }
+            for span in spans
+        ]
+
+
+@contextmanager
+def phase_span(name: str) -> Iterator[PhaseSpan | None]:
+    """Record `name` as a phase of the node being processed, if any."""
+    recorder = _active_recorder.get()
+    if recorder is None:
+        yield None
+        return
+    with recorder.span(name) as span:
+        yield span
+
+
+def record_llm_usage(
+    model: str, input_tokens: int, output_tokens: int, cached_input_tokens: int  # noqa: ARG001
+) -> None:
+    """Token-usage listener: attribute an LLM call to the innermost open span."""
+    span = _active_span.get()
+    if span is None:
+        return
+    span.llm_calls += 1
+    span.input_tokens += input_tokens
+    span.output_tokens += output_tokens
+    span.cached_input_tokens += cached_input_tokens
+
+
+# Every process that opens spans (workers, and the manager for research summaries) imports
+# this module, so registering here attributes all of its LLM calls to the open span
+add_usage_listener(record_llm_usage)
+
+
+def summarize_phases(phase_timings: Iterable[list[dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+    """Per-phase totals over the `phase_timings` of several nodes."""
+    summary: dict[str, dict[str, Any]] = {}
+    for spans in phase_timings:
+        for span in spans:
+            totals = summary.setdefault(
+                span["name"],
+                {
+                    "count": 0,
+                    "total_s": 0.0,
+                    "llm_calls": 0,
+                    "input_tokens": 0,
+                    "output_tokens": 0,
+                    "cached_input_tokens": 0,
+                },
+            )
+            totals["count"] += 1
+            totals["total_s"] += span.get("duration_s", 0.0)
+            totals["llm_calls"] += span.get("llm_calls", 0)
+            totals["input_tokens"] += span.get("input_tokens", 0)
+            totals["output_tokens"] += span.get("output_tokens", 0)
+            totals["cached_input_tokens"] += span.get("cached_input_tokens", 0)
+    for totals in summary.values():
+        totals["total_s"] = round(totals["total_s"], 3)
+    return summary
+
+
+def describe_phases(spans: list[dict[str, Any]]) -> str:
+    """One-line rendering of a node's top-level phases for the logs."""
+    parts = []
+    for name, totals in summarize_phases([[s for s in spans if s["parent"] is None]]).items():
+        tokens = totals["input_tokens"] + totals["output_tokens"]
+        parts.append(f"{name} {totals['total_s']:.1f}s" + (f" ({tokens} tok)" if tokens else ""))
+    return ", ".join(parts)
+
+
+class NodeProfiler:
+    """Profiles the processing of one node if it is sampled; see the module docstring."""
+
+    def __init__(self, *, sample_rate: float, mode: str, profile_dir: Path) -> None:
+        self.sampled = sample_rate > 0 and random.random() < sample_rate
+        self.mode = mode
+        self.profile_dir = profile_dir
+        self._profile: cProfile.Profile | None = None
+        self._py_spy: subprocess.Popen[bytes] | None = None
+        self._py_spy_output: Path | None = None
+
+    def start(self) -> None:
+        if not self.sampled:
+            return
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        if self.mode == "py-spy":
+            py_spy = shutil.which("py-spy")
+            if py_spy is not None:
+                self._start_py_spy(py_spy)
+                return
+            logger.warning("py-spy not found on PATH; profiling this node with cProfile instead")
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def _start_py_spy(self, py_spy: str) -> None:
+        self._py_spy_output = self.profile_dir / f".pid{os.getpid()}.{time.monotonic_ns()}.tmp"
+        command = [
+            py_spy,
+            "record",
+            "--pid",
+            str(os.getpid()),
+            "--subprocesses",
+            "--nonblocking",
+            "--format",
+            "speedscope",
+            "--output",
+            str(self._py_spy_output),
+        ]
+        try:
+            self._py_spy = subprocess.Popen(
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+        except OSError as exc:
+            logger.warning(f"Could not start py-spy ({exc}); this node is not profiled")
+
+    def stop(self, *, node_id: str) -> str | None:
+        """Stop profiling and return the profile's path, or None if nothing was written."""
+        if self._profile is not None:
+            self._profile.disable()
+            path = self.profile_dir / f"{node_id}.prof"
+            self._profile.dump_stats(path)
+            self._profile = None
+            logger.info(f"Wrote cProfile profile of node {node_id} to {path}")
+            return str(path)
+        if self._py_spy is None or self._py_spy_output is None:
+            return None
+        process, output, self._py_spy = self._py_spy, self._py_spy_output, None
+        # py-spy writes its output when interrupted
+        process.send_signal(signal.SIGINT)
+        try:
+            _, stderr = process.communicate(timeout=_PY_SPY_STOP_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            _, stderr = process.communicate()
+        if not output.is_file():
+            logger.warning(
+                f"py-spy wrote no profile for node {node_id}: "
+                f"{stderr.decode('utf-8', errors='replace').strip()[-500:]}"
+            )
+            return None
+        path = self.profile_dir / f"{node_id}.speedscope.json"
+        os.replace(output, path)
+        logger.info(f"Wrote py-spy profile of node {node_id} to {path}")
+        return str(path)
@@ -5,7 +5,7 @@ from typing import List, Protocol, Tuple
 
 from pydantic import BaseModel, Field
 
-from ai_scientist.llm import structured_query_with_schema
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, structured_query_with_schema
 
 from .journal import Node
 from .types import PromptType
@@ -50,7 +50,7 @@ def generate_plotting_code(
         "Always include a title for each plot, and be sure to use clear subtitles—such as 'Left: Ground Truth, Right: Generated Samples'—while also specifying the type of dataset being used.",
         "Make sure to use descriptive names for figures when saving e.g. always include the dataset name and the type of plot in the name",
         "When there are many similar figures to plot (e.g. generated samples at each epoch), make sure to plot only at a suitable interval of epochs so that you only plot at most 5 figures.",
-        "Use the following experiment code to infer the data to plot: " + node.code,
+        "Use the experiment code given below to infer the data to plot",
         "Example to extract data from experiment_data: experiment_data['dataset_name_1']['metrics']['train']",
     ]
     prompt_guideline += [
@@ -85,6 +85,8 @@ def generate_plotting_code(
 
     plotting_prompt: PromptType = {
         "Instructions": {},
+        PROMPT_CACHE_BREAKPOINT: None,
+        "Experiment code": node.code,
     }
     plotting_instructions: dict[str, str | list[str]] = {}
     plotting_instructions |= {
@@ -58,5 +58,16 @@ class Stage:
     def evaluate_stage_completion(self) -> Tuple[bool, str]:
         raise NotImplementedError
 
+    def substage_completion_inputs(self) -> Tuple[object, ...]:
+        """
+        The journal state evaluate_substage_completion depends on. While it is unchanged the
+        manager reuses the previous verdict instead of evaluating (and querying the LLM) again.
+        """
+        return (self._context.journal.good_nodes_version(),)
+
+    def stage_completion_inputs(self) -> Tuple[object, ...]:
+        """Like substage_completion_inputs, for evaluate_stage_completion."""
+        return (self._context.journal.good_nodes_version(),)
+
     def best_carryover_nodes(self) -> Dict[int, Node]:
         return self._context.best_nodes_by_stage
@@ -1,6 +1,6 @@
 import logging
 
-from ai_scientist.llm import structured_query_with_schema
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, structured_query_with_schema
 
 from ..codegen_agent import MinimalAgent
 from ..journal import Journal, Node
@@ -35,8 +35,9 @@ class Stage1Baseline(Stage):
                 "We will explore more advanced variations in later stages."
             ),
             "Research idea": agent.task_desc,
-            "Memory": agent.memory_summary if agent.memory_summary else "",
             "Instructions": {},
+            PROMPT_CACHE_BREAKPOINT: None,
+            "Memory": agent.memory_summary if agent.memory_summary else "",
         }
 
         instructions: dict[str, str | list[str]] = {}
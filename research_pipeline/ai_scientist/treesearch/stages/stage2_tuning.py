@@ -3,8 +3,9 @@ from typing import List, Protocol, Tuple
 
 from pydantic import BaseModel, Field
 
-from ai_scientist.llm import structured_query_with_schema
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, structured_query_with_schema
 
+from ..idea_queue import distinct_ideas
 from ..journal import Journal, Node
 from ..types import PromptType
 from ..utils.config import Config as AppConfig
@@ -29,6 +30,12 @@ class HyperparamTuningIdea(BaseModel):
     )
 
 
+class HyperparamTuningIdeaBatch(BaseModel):
+    ideas: List[HyperparamTuningIdea] = Field(
+        description="Distinct hyperparameter tuning ideas, one per requested experiment.",
+    )
+
+
 class SupportsStage2Agent(Protocol):
     def plan_and_code_query(self, *, prompt: PromptType, retries: int = 3) -> Tuple[str, str]:
         pass
@@ -53,13 +60,12 @@ class Stage2Tuning(Stage):
         prompt: PromptType = {
             "Introduction": (
                 "You are an experienced AI researcher. You are provided with a previously developed "
-                "baseline implementation. Your task is to implement hyperparameter tuning for the following idea: "
-                + hyperparam_idea.name
-                + ". "
-                + hyperparam_idea.description
+                "baseline implementation. Your task is to implement hyperparameter tuning for the idea described below."
             ),
-            "Base code you are working on": wrap_code(parent_node.code),
             "Instructions": {},
+            PROMPT_CACHE_BREAKPOINT: None,
+            "Hyperparameter tuning idea": hyperparam_idea.name + ". " + hyperparam_idea.description,
+            "Base code you are working on": wrap_code(parent_node.code),
         }
         hp_instructions: dict[str, str | list[str]] = {}
         hp_instructions |= {
@@ -97,14 +103,31 @@ class Stage2Tuning(Stage):
         )
 
     @staticmethod
-    def propose_next_hyperparam_idea(
-        *, base_stage1_code: str, tried: List[str], model: str, temperature: float
-    ) -> HyperparamTuningIdea:
-        hyperparam_tuning_prompt: dict[str, object] = {
+    def _hyperparam_prompt(
+        *, base_stage1_code: str, tried: List[str], count: int
+    ) -> dict[str, object]:
+        if count == 1:
+            ask = (
+                "propose ONE new hyperparameter tuning idea to see if it improves the performance."
+            )
+            requirements = [
+                "1. Identify ONE specific hyperparameter to tune.",
+                "2. Ensure the hyperparameter is different from previous attempts.",
+            ]
+        else:
+            ask = (
+                f"propose {count} new, mutually different hyperparameter tuning ideas "
+                "to see if they improve the performance."
+            )
+            requirements = [
+                f"1. Identify {count} specific hyperparameters to tune, one per idea.",
+                "2. Ensure each hyperparameter is different from previous attempts and from the other ideas.",
+            ]
+        return {
             "Introduction": (
                 "You are an AI researcher conducting hyperparameter tuning for baseline experiments. "
                 "Based on the current implementation and previous hyperparameter tuning attempts (if any), "
-                "propose ONE new hyperparameter tuning idea to see if it improves the performance."
+                f"{ask}"
                 "You should first check if simply training longer (more epochs) improves the performance."
                 "Then try tuning common hyperparameters such as learning rate, batch size, etc."
                 "Only propose algorithm-specific and/or model-specific hyperparameters after you have tried the above."
@@ -113,14 +136,17 @@ class Stage2Tuning(Stage):
             "Previous Hyperparam Tuning Attempts": {
                 "Has been tried": tried if tried else "Nothing has been tried yet.",
             },
-            "Instructions": {
-                "Requirements": [
-                    "1. Identify ONE specific hyperparameter to tune.",
-                    "2. Ensure the hyperparameter is different from previous attempts.",
-                ]
-            },
+            "Instructions": {"Requirements": requirements},
         }
 
+    @staticmethod
+    def propose_next_hyperparam_idea(
+        *, base_stage1_code: str, tried: List[str], model: str, temperature: float
+    ) -> HyperparamTuningIdea:
+        hyperparam_tuning_prompt = Stage2Tuning._hyperparam_prompt(
+            base_stage1_code=base_stage1_code, tried=tried, count=1
+        )
+
         retry_count = 0
         retry_limit = 5
         while retry_count < retry_limit:
@@ -146,6 +172,38 @@ class Stage2Tuning(Stage):
             name="increase learning rate", description="increase learning rate"
         )
 
+    @staticmethod
+    def propose_hyperparam_ideas(
+        *, base_stage1_code: str, tried: List[str], count: int, model: str, temperature: float
+    ) -> List[HyperparamTuningIdea]:
+        """Propose up to `count` distinct, untried ideas in one structured call."""
+        prompt = Stage2Tuning._hyperparam_prompt(
+            base_stage1_code=base_stage1_code, tried=tried, count=count
+        )
+        for _ in range(3):
+            try:
+                result = structured_query_with_schema(
+                    system_message=prompt,
+                    model=model,
+                    temperature=temperature,
+                    schema_class=HyperparamTuningIdeaBatch,
+                )
+            except Exception:
+                continue
+            ideas = distinct_ideas(
+                (
+                    HyperparamTuningIdea(
+                        name=idea.name.strip(), description=idea.description.strip()
+                    )
+                    for idea in result.ideas
+                    if idea.description.strip()
+                ),
+                exclude=tried,
+            )
+            if ideas:
+                return ideas[:count]
+        return []
+
     @staticmethod
     def update_hyperparam_state(*, stage_name: str, result_node: Node, state_set: set[str]) -> None:
         if not stage_name or not stage_name.startswith("2_"):
@@ -126,3 +126,8 @@ class Stage3Plotting(Stage):
             cfg=self._context.cfg,
             max_stage3_iterations=self._meta.max_iterations,
         )
+
+    def stage_completion_inputs(self) -> tuple[object, ...]:
+        # The check also depends on the iteration count and leaves execution-time feedback
+        # on the latest node
+        return (*super().stage_completion_inputs(), len(self._context.journal.nodes))
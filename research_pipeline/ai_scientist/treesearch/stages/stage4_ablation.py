@@ -3,8 +3,9 @@ from typing import List, Protocol, Tuple
 
 from pydantic import BaseModel, Field
 
-from ai_scientist.llm import structured_query_with_schema
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, structured_query_with_schema
 
+from ..idea_queue import distinct_ideas
 from ..journal import Journal, Node
 from ..types import PromptType
 from ..utils.config import Config as AppConfig
@@ -29,6 +30,12 @@ class AblationIdea(BaseModel):
     )
 
 
+class AblationIdeaBatch(BaseModel):
+    ideas: List[AblationIdea] = Field(
+        description="Distinct ablation studies, one per requested experiment.",
+    )
+
+
 class SupportsStage4Agent(Protocol):
     def plan_and_code_query(self, *, prompt: PromptType, retries: int = 3) -> Tuple[str, str]:
         pass
@@ -51,13 +58,12 @@ class Stage4Ablation(Stage):
         prompt: PromptType = {
             "Introduction": (
                 "You are an experienced AI researcher. You are provided with a previously developed "
-                "baseline implementation. Your task is to implement the ablation study for the following idea: "
-                + ablation_idea.name
-                + ". "
-                + ablation_idea.description
+                "baseline implementation. Your task is to implement the ablation study for the idea described below."
             ),
-            "Base code you are working on": wrap_code(parent_node.code),
             "Instructions": {},
+            PROMPT_CACHE_BREAKPOINT: None,
+            "Ablation idea": ablation_idea.name + ". " + ablation_idea.description,
+            "Base code you are working on": wrap_code(parent_node.code),
         }
         abl_instructions: dict[str, str | list[str]] = {}
         abl_instructions |= {
@@ -95,14 +101,22 @@ class Stage4Ablation(Stage):
         )
 
     @staticmethod
-    def propose_next_ablation_idea(
-        *, base_stage3_code: str, completed: List[str], model: str, temperature: float
-    ) -> AblationIdea:
-        ablation_prompt: dict[str, object] = {
+    def _ablation_prompt(
+        *, base_stage3_code: str, completed: List[str], count: int
+    ) -> dict[str, object]:
+        if count == 1:
+            ask = "propose ONE new ablation study that tests a different aspect of the model."
+            first_requirement = "1. Identify ONE specific component/feature to ablate."
+        else:
+            ask = f"propose {count} new ablation studies, each testing a different aspect of the model."
+            first_requirement = (
+                f"1. Identify {count} different components/features to ablate, one per study."
+            )
+        return {
             "Introduction": (
                 "You are an AI researcher conducting ablation studies. "
                 "Based on the current implementation and previous ablations (if any), "
-                "propose ONE new ablation study that tests a different aspect of the model."
+                f"{ask}"
             ),
             "Base code you are working on": wrap_code(base_stage3_code),
             "Previous Ablations": {
@@ -110,7 +124,7 @@ class Stage4Ablation(Stage):
             },
             "Instructions": {
                 "Requirements": [
-                    "1. Identify ONE specific component/feature to ablate.",
+                    first_requirement,
                     "2. Ensure the ablation is different from previous completed or running attempts.",
                     "3. The ablation should be a new idea, not a variation of previous ideas.",
                     "4. If you have only used a single synthetic dataset throughout the experiment, one of your ablations should be to use multiple synthetic datasets (at least 3 different datasets).",
@@ -118,6 +132,14 @@ class Stage4Ablation(Stage):
             },
         }
 
+    @staticmethod
+    def propose_next_ablation_idea(
+        *, base_stage3_code: str, completed: List[str], model: str, temperature: float
+    ) -> AblationIdea:
+        ablation_prompt = Stage4Ablation._ablation_prompt(
+            base_stage3_code=base_stage3_code, completed=completed, count=1
+        )
+
         retry_count = 0
         retry_limit = 5
         while retry_count < retry_limit:
@@ -140,6 +162,36 @@ class Stage4Ablation(Stage):
             retry_count += 1
         return AblationIdea(name="add one more layer", description="add one more layer")
 
+    @staticmethod
+    def propose_ablation_ideas(
+        *, base_stage3_code: str, completed: List[str], count: int, model: str, temperature: float
+    ) -> List[AblationIdea]:
+        """Propose up to `count` distinct, untried ablations in one structured call."""
+        prompt = Stage4Ablation._ablation_prompt(
+            base_stage3_code=base_stage3_code, completed=completed, count=count
+        )
+        for _ in range(3):
+            try:
+                result = structured_query_with_schema(
+                    system_message=prompt,
+                    model=model,
+                    temperature=temperature,
+                    schema_class=AblationIdeaBatch,
+                )
+            except Exception:
+                continue
+            ideas = distinct_ideas(
+                (
+                    AblationIdea(name=idea.name.strip(), description=idea.description.strip())
+                    for idea in result.ideas
+                    if idea.description.strip()
+                ),
+                exclude=completed,
+            )
+            if ideas:
+                return ideas[:count]
+        return []
+
     @staticmethod
     def update_ablation_state(*, stage_name: str, result_node: Node, state_set: set[str]) -> None:
         if not stage_name or not stage_name.startswith("4_"):
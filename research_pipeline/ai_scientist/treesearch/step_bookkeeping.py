@@ -0,0 +1,120 @@
+"""
+Per-step bookkeeping off the search's critical path.
+
+After every agent step the runner's step_callback writes notes, asks for the best node and
+a research summary (both possibly LLM calls), saves the journal, config and tree
+visualization and emits progress. Nothing in it feeds the next step, so AgentManager hands
+it to a StepBookkeeper instead of running it between steps:
+
+- each submission carries a snapshot of the journal (`Journal.snapshot`), so the callback
+  sees the journal as it was right after that step;
+- one thread runs the callbacks in submission order, so a stage's persisted journal never
+  goes back to an older state;
+- a submission for a stage whose previous one has not started yet replaces it, so a burst
+  of steps is saved once, in its newest state;
+- the manager waits for the queue to drain only at substage and stage boundaries (`flush`).
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from .journal import Journal
+from .stages.base import StageMeta
+
+logger = logging.getLogger("ai-scientist")
+
+StepCallback = Callable[[StageMeta, Journal], None]
+
+
+@dataclass(frozen=True)
+class _StepSnapshot:
+    callback: StepCallback
+    stage: StageMeta
+    journal: Journal
+
+
+class StepBookkeeper:
+    """Runs step callbacks on a background thread; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._pending: "OrderedDict[str, _StepSnapshot]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self.submitted = 0
+        self.coalesced = 0
+        self.callback_s = 0.0
+        self.flush_wait_s = 0.0
+
+    def defer(self, callback: StepCallback) -> StepCallback:
+        """A step callback that queues `callback` instead of running it."""
+
+        def submit(stage: StageMeta, journal: Journal) -> None:
+            self.submit(callback=callback, stage=stage, journal=journal)
+
+        return submit
+
+    def submit(self, *, callback: StepCallback, stage: StageMeta, journal: Journal) -> None:
+        snapshot = _StepSnapshot(callback=callback, stage=stage, journal=journal.snapshot())
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("StepBookkeeper is closed")
+            if stage.name in self._pending:
+                self.coalesced += 1
+                self._pending.move_to_end(stage.name)
+            self._pending[stage.name] = snapshot
+            self.submitted += 1
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="step-bookkeeping", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                _, snapshot = self._pending.popitem(last=False)
+                self._busy = True
+            started = time.monotonic()
+            try:
+                snapshot.callback(snapshot.stage, snapshot.journal)
+            except Exception:
+                logger.exception(f"Step bookkeeping failed for stage {snapshot.stage.name}")
+            finally:
+                with self._cond:
+                    self.callback_s += time.monotonic() - started
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Wait until every submitted step has been processed."""
+        started = time.monotonic()
+        with self._cond:
+            while self._pending or self._busy:
+                self._cond.wait()
+        self.flush_wait_s += time.monotonic() - started
+
+    def close(self) -> None:
+        """Process the remaining steps and stop the thread."""
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        if self.submitted:
+            logger.info(
+                f"Step bookkeeping: {self.submitted} steps ({self.coalesced} coalesced), "
+                f"{self.callback_s:.1f}s off the critical path, "
+                f"{self.flush_wait_s:.1f}s waited at stage boundaries"
+            )
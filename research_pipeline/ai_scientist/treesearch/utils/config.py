@@ -3,7 +3,7 @@
 import json
 import logging
 import shutil
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Hashable, List, Optional, cast
 
@@ -104,6 +104,57 @@ class SearchConfig:
     num_drafts: int
 
 
+@dataclass
+class GPUSchedulerConfig:
+    # concurrent experiment processes per GPU; their memory footprints must still fit
+    slots_per_gpu: int = 1
+    # fraction added to a lineage's observed peak memory when reserving for its children
+    memory_headroom: float = 0.2
+    # reservation for tasks without an observed peak (default: an even share of the GPU)
+    default_footprint_mib: Optional[int] = None
+
+
+@dataclass
+class ExecutionCacheConfig:
+    # reuse results of identical, seeded experiment code instead of re-running it
+    enabled: bool = False
+    # defaults to <workspace_dir>/.exec_cache; point runs at one directory to share entries
+    dir: Optional[str] = None
+    # also reuse runs of code that sets no seed (their results are a single sample)
+    cache_unseeded: bool = False
+    # runs whose new working-directory files exceed this are not stored
+    max_artifact_mib: int = 1024
+
+
+@dataclass
+class ProfilingConfig:
+    # fraction of nodes whose processing is profiled (0 disables profiling)
+    sample_rate: float = 0.0
+    # "cprofile" (worker thread, pstats file) or "py-spy" (worker and experiment processes,
+    # speedscope file; needs py-spy on PATH)
+    mode: str = "cprofile"
+    # defaults to <log_dir>/profiles
+    dir: Optional[str] = None
+
+
+@dataclass
+class NodeStorageConfig:
+    # keep large node payloads (terminal output, code, plot analyses, feedback) in a
+    # content-addressed store under <log_dir>/blobs and load them on access
+    offload: bool = True
+    # payloads smaller than this stay in memory
+    min_blob_bytes: int = 1024
+
+
+@dataclass
+class SummaryConfig:
+    # the research summary given to workers as memory is updated with the nodes finished
+    # since the last one; after this many updates it is rebuilt from all nodes (0: always)
+    rebuild_every: int = 10
+    # more new nodes than this since the last summary also trigger a full rebuild
+    max_delta_nodes: int = 8
+
+
 @dataclass
 class AgentConfig:
     steps: int
@@ -118,6 +169,13 @@ class AgentConfig:
     num_workers: int
     type: str
     multi_seed_eval: dict[str, int]
+    gpu_scheduler: GPUSchedulerConfig = field(default_factory=GPUSchedulerConfig)
+    # Generate metric-parsing and plotting code while the experiment is still running
+    speculative_codegen: bool = False
+    execution_cache: ExecutionCacheConfig = field(default_factory=ExecutionCacheConfig)
+    profiling: ProfilingConfig = field(default_factory=ProfilingConfig)
+    node_storage: NodeStorageConfig = field(default_factory=NodeStorageConfig)
+    summary: SummaryConfig = field(default_factory=SummaryConfig)
 
 
 @dataclass
@@ -232,6 +290,21 @@ def prep_cfg(cfg: object) -> Config:
     if cfg_obj.min_num_gpus < 0:
         raise ValueError("min_num_gpus must be non-negative")
 
+    if cfg_obj.agent.gpu_scheduler.slots_per_gpu < 1:
+        raise ValueError("agent.gpu_scheduler.slots_per_gpu must be at least 1")
+    if cfg_obj.agent.execution_cache.max_artifact_mib < 0:
+        raise ValueError("agent.execution_cache.max_artifact_mib must be non-negative")
+    if not 0.0 <= cfg_obj.agent.profiling.sample_rate <= 1.0:
+        raise ValueError("agent.profiling.sample_rate must be between 0 and 1")
+    if cfg_obj.agent.profiling.mode not in ("cprofile", "py-spy"):
+        raise ValueError("agent.profiling.mode must be either 'cprofile' or 'py-spy'")
+    if cfg_obj.agent.node_storage.min_blob_bytes < 0:
+        raise ValueError("agent.node_storage.min_blob_bytes must be non-negative")
+    if cfg_obj.agent.summary.rebuild_every < 0:
+        raise ValueError("agent.summary.rebuild_every must be non-negative")
+    if cfg_obj.agent.summary.max_delta_nodes < 1:
+        raise ValueError("agent.summary.max_delta_nodes must be at least 1")
+
     # Apply logging level from config uniformly
     apply_log_level(level_name=cfg_obj.log_level)
 
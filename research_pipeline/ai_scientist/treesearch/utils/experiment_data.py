@@ -0,0 +1,270 @@
+"""
+Companion on-disk format for experiment_data.npy result files.
+
+Generated experiments save their results with ``np.save`` as a pickled dict. Every
+consumer (metric parsing, per-node plotting, multi-seed aggregation, final plot
+aggregation) then unpickles the whole file, in its own process. The companion format
+stores the same structure next to the original:
+
+    experiment_data.npy
+    experiment_data.npy.parts/
+        index.json      # nested structure, keys, shapes, dtypes, small values inline
+        000001.npy      # one member per large array, loadable with mmap_mode
+        000002.pkl      # leaves that have no array/JSON form
+
+Large arrays are memory-mapped on load, so readers only page in the slices they touch.
+``load_experiment_data`` reads either form; ``install_numpy_load_hook`` makes plain
+``np.load(path, allow_pickle=True)`` calls in generated code use the companion when it
+is fresh, and write it after the first full load of a large file.
+"""
+
+import json
+import logging
+import os
+import pickle
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+COMPANION_SUFFIX = ".parts"
+INDEX_FILE_NAME = "index.json"
+FORMAT_VERSION = 1
+# Below this size a plain unpickle is already cheap, so no companion is written.
+MIN_COMPANION_SOURCE_BYTES = 1 << 20
+# Numeric arrays up to this many elements are stored inline in the index.
+MAX_INLINE_ARRAY_ELEMENTS = 256
+
+# Exact types stored as JSON; numpy scalars such as np.float64 subclass float and must keep
+# their dtype, so they are not matched by isinstance.
+_JSON_SCALAR_TYPES = (bool, int, float, str)
+
+_hook_lock = threading.Lock()
+_original_np_load: Optional[Callable[..., Any]] = None
+
+
+def _is_json_scalar(value: Any) -> bool:  # noqa: ANN401
+    return value is None or type(value) in _JSON_SCALAR_TYPES
+
+
+def companion_dir(npy_path: str | os.PathLike[str]) -> Path:
+    return Path(f"{os.fspath(npy_path)}{COMPANION_SUFFIX}")
+
+
+def _source_signature(npy_path: Path) -> Optional[Dict[str, int]]:
+    try:
+        stat = npy_path.stat()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _read_index(npy_path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        index = json.loads((companion_dir(npy_path) / INDEX_FILE_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(index, dict) or index.get("format") != FORMAT_VERSION:
+        return None
+    return index
+
+
+def _fresh_index(npy_path: Path) -> Optional[Dict[str, Any]]:
+    index = _read_index(npy_path)
+    if index is None:
+        return None
+    signature = _source_signature(npy_path)
+    if signature is not None and index.get("source") != signature:
+        return None
+    return index
+
+
+def has_fresh_companion(npy_path: str | os.PathLike[str]) -> bool:
+    """
+    True if a companion exists and matches the source file. A companion without a
+    source .npy (a "new-format only" result) is always considered fresh.
+    """
+    return _fresh_index(Path(npy_path)) is not None
+
+
+class _Encoder:
+    def __init__(self, parts_dir: Path) -> None:
+        self.parts_dir = parts_dir
+        self.members = 0
+
+    def _member(self, suffix: str) -> Path:
+        self.members += 1
+        return self.parts_dir / f"{self.members:06d}{suffix}"
+
+    def encode(self, value: Any) -> Dict[str, Any]:  # noqa: ANN401
+        if _is_json_scalar(value):
+            return {"type": "json", "value": value}
+        if isinstance(value, np.generic) and value.dtype.kind in "biuf":
+            return {"type": "scalar", "dtype": value.dtype.str, "value": value.item()}
+        if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+            if value.dtype.kind in "biuf" and value.size <= MAX_INLINE_ARRAY_ELEMENTS:
+                return {
+                    "type": "inline_array",
+                    "dtype": value.dtype.str,
+                    "shape": list(value.shape),
+                    "data": value.ravel().tolist(),
+                }
+            member = self._member(".npy")
+            np.save(member, value, allow_pickle=False)
+            return {
+                "type": "array",
+                "file": member.name,
+                "dtype": value.dtype.str,
+                "shape": list(value.shape),
+            }
+        if type(value) is dict and all(_is_json_scalar(key) for key in value):
+            return {
+                "type": "dict",
+                "items": [[key, self.encode(item)] for key, item in value.items()],
+            }
+        if type(value) is list and all(_is_json_scalar(item) for item in value):
+            return {"type": "json", "value": value}
+        if type(value) in (list, tuple):
+            return {
+                "type": "list" if isinstance(value, list) else "tuple",
+                "items": [self.encode(item) for item in value],
+            }
+        member = self._member(".pkl")
+        with open(member, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return {"type": "pickle", "file": member.name}
+
+
+def _decode(node: Dict[str, Any], parts_dir: Path, mmap_mode: Optional[str]) -> Any:  # noqa: ANN401
+    kind = node["type"]
+    if kind == "json":
+        return node["value"]
+    if kind == "scalar":
+        return np.dtype(node["dtype"]).type(node["value"])
+    if kind == "inline_array":
+        return np.array(node["data"], dtype=np.dtype(node["dtype"])).reshape(node["shape"])
+    if kind == "array":
+        load = _original_np_load or np.load
+        return load(parts_dir / node["file"], mmap_mode=mmap_mode, allow_pickle=False)
+    if kind == "dict":
+        return {key: _decode(item, parts_dir, mmap_mode) for key, item in node["items"]}
+    if kind == "list":
+        return [_decode(item, parts_dir, mmap_mode) for item in node["items"]]
+    if kind == "tuple":
+        return tuple(_decode(item, parts_dir, mmap_mode) for item in node["items"])
+    if kind == "pickle":
+        with open(parts_dir / node["file"], "rb") as f:
+            return pickle.load(f)
+    raise ValueError(f"Unknown experiment data node type: {kind}")
+
+
+def write_companion(npy_path: str | os.PathLike[str], data: Any) -> bool:  # noqa: ANN401
+    """
+    Write the companion for `npy_path` holding `data` (the unpickled content). The
+    directory is built under a temporary name and renamed into place, so concurrent
+    readers only ever see a complete companion. Returns False if it could not be written.
+    """
+    path = Path(npy_path)
+    target = companion_dir(path)
+    staging = target.with_name(f"{target.name}.{os.getpid()}.{time.monotonic_ns()}.tmp")
+    try:
+        staging.mkdir(parents=True)
+        encoder = _Encoder(staging)
+        index = {
+            "format": FORMAT_VERSION,
+            "source": _source_signature(path),
+            "root": encoder.encode(data),
+        }
+        (staging / INDEX_FILE_NAME).write_text(json.dumps(index))
+        if target.exists():
+            shutil.rmtree(target, ignore_errors=True)
+        os.replace(staging, target)
+    except Exception:
+        logger.debug(f"Could not write experiment data companion for {path}", exc_info=True)
+        shutil.rmtree(staging, ignore_errors=True)
+        return False
+    return True
+
+
+def load_experiment_data(
+    npy_path: str | os.PathLike[str], *, mmap_mode: Optional[str] = "r"
+) -> Any:  # noqa: ANN401
+    """
+    Load experiment data saved either as a pickled .npy or in the companion format.
+    With a fresh companion, large arrays come back memory-mapped with `mmap_mode`.
+    """
+    path = Path(npy_path)
+    index = _fresh_index(path)
+    if index is not None:
+        return _decode(index["root"], companion_dir(path), mmap_mode)
+    load = _original_np_load or np.load
+    loaded = load(path, allow_pickle=True)
+    if isinstance(loaded, np.ndarray) and loaded.dtype.hasobject and loaded.shape == ():
+        return loaded.item()
+    return loaded
+
+
+def _as_object_scalar(value: Any) -> np.ndarray:  # noqa: ANN401
+    wrapped = np.empty((), dtype=object)
+    wrapped[()] = value
+    return wrapped
+
+
+def _companion_aware_load(file: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+    assert _original_np_load is not None
+    if (
+        args
+        or not kwargs.get("allow_pickle")
+        or kwargs.get("mmap_mode") is not None
+        or not isinstance(file, (str, os.PathLike))
+        or not os.fspath(file).endswith(".npy")
+    ):
+        return _original_np_load(file, *args, **kwargs)
+    path = Path(file)
+    if has_fresh_companion(path):
+        try:
+            return _as_object_scalar(load_experiment_data(path, mmap_mode="c"))
+        except Exception:
+            logger.debug(f"Ignoring unreadable experiment data companion for {path}", exc_info=True)
+    loaded = _original_np_load(file, **kwargs)
+    if (
+        isinstance(loaded, np.ndarray)
+        and loaded.dtype.hasobject
+        and loaded.shape == ()
+        and isinstance(loaded.item(), dict)
+        and path.stat().st_size >= MIN_COMPANION_SOURCE_BYTES
+    ):
+        write_companion(path, loaded.item())
+    return loaded
+
+
+def install_numpy_load_hook() -> None:
+    """
+    Route ``np.load(<file>.npy, allow_pickle=True)`` through the companion format.
+
+    Companions are opened copy-on-write (mmap_mode="c"), so callers that modify the
+    returned arrays in place keep working exactly as with a regular load. Calls with
+    any other arguments or file types go straight to numpy.
+    """
+    global _original_np_load
+    with _hook_lock:
+        if _original_np_load is not None:
+            return
+        _original_np_load = np.load
+        np.load = _companion_aware_load
+
+
+def move_with_companion(src: Path, dst: Path) -> None:
+    """Rename an experiment data file together with its companion, if it has one."""
+    src_parts = companion_dir(src)
+    src.resolve().rename(dst)
+    if src_parts.is_dir():
+        dst_parts = companion_dir(dst)
+        if dst_parts.exists():
+            shutil.rmtree(dst_parts, ignore_errors=True)
+        src_parts.rename(dst_parts)
@@ -1,6 +1,7 @@
 import logging
+import math
 from dataclasses import dataclass, field
-from functools import total_ordering
+from functools import cached_property, total_ordering
 from typing import Any, Self
 
 import numpy as np
@@ -9,6 +10,17 @@ from dataclasses_json import DataClassJsonMixin
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class MetricKey:
+    """What comparisons of a MetricValue depend on, computed once per value."""
+
+    # False for a missing value (e.g. WorstMetricValue), which compares worse than any other
+    valid: bool
+    # Mean final value over all metrics and datasets; NaN if there is none
+    mean: float
+    maximize: bool
+
+
 @dataclass
 @total_ordering
 class MetricValue(DataClassJsonMixin):
@@ -34,6 +46,10 @@ class MetricValue(DataClassJsonMixin):
           ...
         ]
       }
+
+    The value is normalized once, on construction, and comparisons use its cached `key`;
+    reassigning `value` or `maximize` recomputes it, mutating the nested dict in place
+    does not.
     """
 
     value: float | int | np.number | np.floating | dict | None
@@ -63,25 +79,34 @@ class MetricValue(DataClassJsonMixin):
                 assert isinstance(self.value, (float, int, np.number, np.floating))
                 self.value = float(self.value)
 
+    def __setattr__(self, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        if name in ("value", "maximize"):
+            self.__dict__.pop("key", None)
+
+    @cached_property
+    def key(self) -> MetricKey:
+        return MetricKey(
+            valid=self.value is not None,
+            mean=self._compute_mean_value(),
+            maximize=self._should_maximize(),
+        )
+
     def __gt__(self, other: Self) -> bool:
-        if self.value is None:
+        self_key = self.key
+        other_key = other.key
+        if not self_key.valid:
             return False
-        if other.value is None:
+        if not other_key.valid:
             return True
 
         assert type(self) is type(other)
 
-        # Get mean values for comparison
-        self_val = self.get_mean_value()
-        other_val = other.get_mean_value()
-
-        if self_val == other_val:
+        if self_key.mean == other_key.mean:
             return False
 
-        # Determine if we should maximize or minimize
-        should_maximize = self._should_maximize()
-        comp: bool = self_val > other_val
-        return comp if should_maximize else not comp
+        comp: bool = self_key.mean > other_key.mean
+        return comp if self_key.maximize else not comp
 
     def _should_maximize(self) -> bool:
         """Determine if we should maximize based on the metric format"""
@@ -136,6 +161,11 @@ class MetricValue(DataClassJsonMixin):
             return True
         if self.value is None or other.value is None:
             return False
+        # Equal values have equal means, so differing means settle it without walking the dicts
+        self_mean = self.key.mean
+        other_mean = other.key.mean
+        if self_mean != other_mean and not (math.isnan(self_mean) and math.isnan(other_mean)):
+            return False
 
         # For new format, compare entire dictionaries
         if isinstance(self.value, dict) and isinstance(other.value, dict):
@@ -193,6 +223,9 @@ class MetricValue(DataClassJsonMixin):
 
     def get_mean_value(self) -> float:
         """Get the mean value across all metrics and datasets"""
+        return self.key.mean
+
+    def _compute_mean_value(self) -> float:
         if self.value is None:
             return float("nan")
         if isinstance(self.value, dict):
@@ -1,7 +1,7 @@
-import copy
 import json
+import os
 from pathlib import Path
-from typing import Any, TypeVar, cast, overload
+from typing import Any, TypeVar, overload
 
 import dataclasses_json
 
@@ -11,18 +11,16 @@ from ..journal import Journal, Node
 def dumps_json(obj: dataclasses_json.DataClassJsonMixin | Journal) -> str:
     """Serialize dataclasses (such as Journals) to JSON."""
     if isinstance(obj, Journal):
-        journal_copy = copy.deepcopy(obj)
+        # Parent links are stored once in node2parent rather than on each node; the node
+        # dicts are fresh, so this needs no copy of the journal
+        journal_dict: dict[str, Any] = obj.to_dict()
         node2parent: dict[str, str] = {}
-        for n in journal_copy.nodes:
-            if n.parent is not None:
-                # Handle both Node objects and string IDs
-                parent_id = n.parent.id if isinstance(n.parent, Node) else cast(str, n.parent)
-                node2parent[n.id] = parent_id
-        for n in journal_copy.nodes:
-            n.parent = None
-            n.children = set()
-
-        journal_dict: dict[str, Any] = journal_copy.to_dict()
+        for node_dict in journal_dict["nodes"]:
+            parent_id = node_dict["parent_id"]
+            if parent_id is not None:
+                node2parent[node_dict["id"]] = parent_id
+            node_dict["parent_id"] = None
+            node_dict["children"] = []
         journal_dict["node2parent"] = node2parent
         journal_dict["__version"] = "2"
         return json.dumps(journal_dict, separators=(",", ":"))
@@ -32,8 +30,12 @@ def dumps_json(obj: dataclasses_json.DataClassJsonMixin | Journal) -> str:
 
 
 def dump_json(obj: dataclasses_json.DataClassJsonMixin | Journal, path: Path) -> None:
-    with open(path, "w") as f:
+    # Written aside and renamed into place: a run resumed after a crash must not find a
+    # truncated journal
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w") as f:
         f.write(dumps_json(obj=obj))
+    os.replace(tmp_path, path)
 
 
 G = TypeVar("G", bound=dataclasses_json.DataClassJsonMixin)
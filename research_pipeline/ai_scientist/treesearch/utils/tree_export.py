@@ -52,8 +52,12 @@ def _normalize_vlm_feedback(val: object) -> str | list[str]:
 
 
 def get_edges(journal: Journal) -> Iterator[tuple[int, int]]:
+    # A journal snapshot may predate children the live journal has added since
+    node_ids = {node.id for node in journal.nodes}
     for node in journal.nodes:
-        for c in node.children:
+        for c in list(node.children):
+            if c.id not in node_ids:
+                continue
             yield (node.step if node.step is not None else -1, c.step if c.step is not None else -1)
 
 
@@ -108,3 +108,7 @@ VLM_FEEDBACK_SCHEMA = PlotFeedback
 METRIC_PARSE_SCHEMA = MetricParseResponse
 PLOT_SELECTION_SCHEMA = PlotSelectionResponse
 SUMMARY_RESPONSE_SCHEMA = ExperimentSummary
+
+# Experiments may write their final metrics in METRIC_PARSE_SCHEMA form to this file in
+# the working directory; when present and valid it replaces the LLM metric parsing step.
+METRICS_CONTRACT_FILENAME = "metrics.json"
@@ -0,0 +1,83 @@
+"""
+Versioned worker context shared through the workspace instead of every task submission.
+
+The config, task description, metric definitions and memory summary are the same for all
+tasks of a step (and mostly of a substage). ParallelAgent publishes them once as a pickle
+named by its content hash; tasks carry only a small WorkerContextRef, and each worker
+process loads a given version from disk once and keeps it in memory.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from .utils.config import Config
+
+logger = logging.getLogger("ai-scientist")
+
+CONTEXT_DIR_NAME = ".worker_context"
+# Versions kept in memory per worker; a step publishes at most a couple of versions.
+_MAX_CACHED_CONTEXTS = 4
+
+
+@dataclass(frozen=True)
+class WorkerContext:
+    task_desc: str
+    cfg: Config
+    evaluation_metrics: str
+    stage_name: str
+    memory_summary: str
+    best_stage3_plot_code: str | None
+
+
+@dataclass(frozen=True)
+class WorkerContextRef:
+    path: str
+    version: str
+    size_bytes: int
+
+
+def publish_worker_context(context: WorkerContext, *, workspace_dir: Path) -> WorkerContextRef:
+    """Write `context` under `workspace_dir` (once per distinct content) and return its ref."""
+    payload = pickle.dumps(context, protocol=pickle.HIGHEST_PROTOCOL)
+    version = hashlib.sha256(payload).hexdigest()[:16]
+    context_dir = workspace_dir / CONTEXT_DIR_NAME
+    path = context_dir / f"{version}.pkl"
+    if not path.exists():
+        context_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+        logger.debug(f"Published worker context {version} ({len(payload)} bytes)")
+    return WorkerContextRef(path=str(path), version=version, size_bytes=len(payload))
+
+
+_context_cache: "OrderedDict[str, WorkerContext]" = OrderedDict()
+_context_cache_lock = threading.Lock()
+
+
+def load_worker_context(ref: WorkerContextRef) -> WorkerContext:
+    """Return the context for `ref`, reading it from disk only on the first use in this process."""
+    with _context_cache_lock:
+        cached = _context_cache.get(ref.version)
+        if cached is not None:
+            _context_cache.move_to_end(ref.version)
+            return cached
+    started = time.monotonic()
+    context = pickle.loads(Path(ref.path).read_bytes())
+    if not isinstance(context, WorkerContext):
+        raise TypeError(f"Unexpected worker context payload in {ref.path}")
+    logger.debug(
+        f"Loaded worker context {ref.version} in {(time.monotonic() - started) * 1000:.1f}ms"
+    )
+    with _context_cache_lock:
+        _context_cache[ref.version] = context
+        while len(_context_cache) > _MAX_CACHED_CONTEXTS:
+            _context_cache.popitem(last=False)
+    return context
@@ -0,0 +1,200 @@
+"""
+Run-wide process pool for tree-search workers.
+
+Spawned workers re-import the LLM clients, numpy and the ai_scientist package before they
+can process their first node. AgentManager owns one WorkerPool for the whole run and every
+substage's ParallelAgent submits into it, so that cost is paid once per worker rather than
+once per substage. Between substages the pool is health-checked: broken pools, dead
+workers and workers still busy with a previous substage's tasks are replaced.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures import wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Any
+
+from . import worker_process
+
+logger = logging.getLogger("ai-scientist")
+
+# Workers are replaced after this many tasks to bound leaks from long runs (CUDA contexts,
+# imported experiment modules, fragmented heaps).
+DEFAULT_MAX_TASKS_PER_WORKER = 50
+WARMUP_TIMEOUT_S = 300.0
+
+
+def _warm_worker() -> int:
+    """
+    Runs once per new worker. Unpickling this function imports this module and with it
+    worker_process and its dependencies, so the first real task starts hot.
+    """
+    logger.debug(f"Worker {os.getpid()} warmed up ({worker_process.__name__} loaded)")
+    return os.getpid()
+
+
+@dataclass(frozen=True)
+class WorkerPoolStats:
+    num_workers: int
+    starts: int
+    recycles: int
+    substages: int
+    startup_s: float
+    teardown_s: float
+
+    def describe(self) -> str:
+        reused = max(self.substages - self.starts, 0)
+        per_start = (self.startup_s + self.teardown_s) / self.starts if self.starts else 0.0
+        return (
+            f"{self.num_workers} worker(s), {self.starts} start(s), {self.recycles} recycle(s) "
+            f"over {self.substages} substage(s); startup {self.startup_s:.1f}s, teardown "
+            f"{self.teardown_s:.1f}s, ~{reused * per_start:.1f}s saved by reuse"
+        )
+
+
+class WorkerPool:
+    """A spawn-context ProcessPoolExecutor that survives across substages."""
+
+    def __init__(
+        self,
+        *,
+        max_tasks_per_worker: int | None = DEFAULT_MAX_TASKS_PER_WORKER,
+        warmup_timeout_s: float = WARMUP_TIMEOUT_S,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+    ) -> None:
+        self.mp_context = multiprocessing.get_context("spawn")
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.warmup_timeout_s = warmup_timeout_s
+        # Runs in every new worker before its first task (e.g. to install test doubles)
+        self.initializer = initializer
+        self.initargs = initargs
+        self.num_workers = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._inflight: set[Future] = set()
+        self._starts = 0
+        self._recycles = 0
+        self._substages = 0
+        self._startup_s = 0.0
+        self._teardown_s = 0.0
+
+    def _start(self, num_workers: int) -> None:
+        started = time.monotonic()
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=self.mp_context,
+            max_tasks_per_child=self.max_tasks_per_worker,
+            initializer=self.initializer,
+            initargs=self.initargs,
+        )
+        self.num_workers = num_workers
+        self._starts += 1
+        warmups = [self._executor.submit(_warm_worker) for _ in range(num_workers)]
+        done, not_done = wait(warmups, timeout=self.warmup_timeout_s)
+        failed = [f for f in done if f.exception() is not None]
+        if failed or not_done:
+            logger.warning(
+                f"Worker pool warm-up incomplete ({len(failed)} failed, "
+                f"{len(not_done)} still starting)"
+            )
+        elapsed = time.monotonic() - started
+        self._startup_s += elapsed
+        logger.info(f"Started worker pool with {num_workers} worker(s) in {elapsed:.1f}s")
+
+    def _terminate(self) -> None:
+        if self._executor is None:
+            return
+        started = time.monotonic()
+        executor = self._executor
+        self._executor = None
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=1)
+        self._inflight.clear()
+        self._teardown_s += time.monotonic() - started
+
+    def _is_usable(self) -> bool:
+        return self._executor is not None and not self._executor._broken
+
+    def prepare(self, num_workers: int) -> None:
+        """
+        Make the pool ready for a new substage with `num_workers` workers. A healthy pool of
+        the right size is reused as-is; otherwise it is (re)started.
+        """
+        self._substages += 1
+        if self._is_usable() and self.num_workers == num_workers and self.health_check():
+            logger.info(f"Reusing warm worker pool ({self.num_workers} worker(s))")
+            return
+        if self._executor is not None:
+            logger.info("Recycling worker pool before the next substage")
+            self._recycles += 1
+            self._terminate()
+        self._start(num_workers)
+
+    def submit(self, fn: Callable[..., Any], /, **kwargs: Any) -> Future:  # noqa: ANN401
+        """Submit a task, restarting the pool once if it turned out to be broken."""
+        if self._executor is None:
+            self._start(self.num_workers or 1)
+        assert self._executor is not None
+        try:
+            future = self._executor.submit(fn, **kwargs)
+        except BrokenProcessPool:
+            logger.warning("Worker pool is broken; restarting it")
+            self._recycles += 1
+            self._terminate()
+            self._start(self.num_workers)
+            assert self._executor is not None
+            future = self._executor.submit(fn, **kwargs)
+        self._inflight.add(future)
+        future.add_done_callback(self._inflight.discard)
+        return future
+
+    def finish_substage(self) -> None:
+        """
+        Called when a substage ends. Queued tasks are cancelled; if any task is still
+        running (e.g. a result that timed out), the workers are replaced so the next
+        substage starts with the full pool.
+        """
+        running = [future for future in list(self._inflight) if not future.cancel()]
+        running = [future for future in running if not future.done()]
+        if running:
+            logger.info(f"{len(running)} task(s) still running at substage end; recycling pool")
+            self._recycles += 1
+            self._terminate()
+
+    def health_check(self, timeout: float = 30.0) -> bool:
+        """Round-trip a trivial task through the pool. Returns False if it fails."""
+        if not self._is_usable():
+            return False
+        assert self._executor is not None
+        try:
+            self._executor.submit(os.getpid).result(timeout=timeout)
+        except (BrokenProcessPool, FutureTimeoutError):
+            logger.warning("Worker pool failed its health check")
+            return False
+        return True
+
+    def stats(self) -> WorkerPoolStats:
+        return WorkerPoolStats(
+            num_workers=self.num_workers,
+            starts=self._starts,
+            recycles=self._recycles,
+            substages=self._substages,
+            startup_s=self._startup_s,
+            teardown_s=self._teardown_s,
+        )
+
+    def close(self) -> None:
+        if self._executor is None:
+            return
+        self._terminate()
+        logger.info(f"Worker pool closed: {self.stats().describe()}")
@@ -1,18 +1,29 @@
+import contextvars
+import copy
+import json
 import logging
+import math
 import multiprocessing
 import os
 import pickle
+import re
+import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
-from ai_scientist.llm import structured_query_with_schema
+from pydantic import ValidationError
+
+from ai_scientist.llm import PROMPT_CACHE_BREAKPOINT, structured_query_with_schema
 
 from .codegen_agent import MinimalAgent
 from .events import BaseEvent, RunLogEvent
+from .execution_cache import build_cache_key, open_execution_cache, snapshot_working_dir
 from .gpu_manager import GPUSpec, get_gpu_specs
 from .interpreter import ExecutionResult, Interpreter
 from .journal import Node
+from .phase_timing import NodeProfiler, PhaseRecorder, describe_phases, phase_span
 from .plotting import analyze_plots_with_vlm, generate_plotting_code
 from .stages.stage1_baseline import Stage1Baseline
 from .stages.stage2_tuning import HyperparamTuningIdea, Stage2Tuning
@@ -20,12 +31,21 @@ from .stages.stage4_ablation import AblationIdea, Stage4Ablation
 from .types import PromptType
 from .utils.config import Config as AppConfig
 from .utils.config import apply_log_level
+from .utils.experiment_data import move_with_companion
 from .utils.metric import MetricValue, WorstMetricValue
 from .utils.response import wrap_code
-from .vlm_function_specs import METRIC_PARSE_SCHEMA
+from .vlm_function_specs import METRIC_PARSE_SCHEMA, METRICS_CONTRACT_FILENAME, MetricParseResponse
+from .worker_context import WorkerContextRef, load_worker_context
 
 logger = logging.getLogger("ai-scientist")
 
+# Per-process counters for how often metrics came from the experiment's metrics.json.
+_metrics_contract_stats = {"hits": 0, "misses": 0}
+_speculative_codegen_stats = {"used": 0, "discarded": 0, "overlapped_s": 0.0}
+_NUMBER_PATTERN = re.compile(
+    r"[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?|(?<![A-Za-z])[-+]?(?:nan|inf)\b", re.IGNORECASE
+)
+
 
 def _ensure_worker_log_level(*, cfg: AppConfig) -> None:
     """Best-effort logging configuration for the worker process."""
@@ -132,6 +152,69 @@ def _load_parent_node(*, node_data: dict[str, object] | None) -> Node | None:
     return None
 
 
+class _SpeculativeCodegen:
+    """
+    LLM code generations that depend only on a node's experiment code (metric parsing and
+    plotting scripts) are started in background threads right before the experiment runs,
+    so they overlap with the GPU run instead of delaying the next node. Results are taken
+    only when the node reaches the step that needs them; generations for nodes that turn
+    out buggy, or whose metrics come from metrics.json, are discarded.
+
+    Each generation runs on its own shallow copy of the worker agent and writes only to
+    a scratch node. What the copies still share is safe across threads: the config and
+    prompt inputs are never mutated, every query builds a fresh LangChain client, and
+    token and phase accounting take their own locks.
+    """
+
+    def __init__(self) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="speculative-codegen")
+        self._futures: dict[str, Future[tuple[str, str]]] = {}
+        self._finished_at: dict[str, float] = {}
+        self._started_at = time.monotonic()
+
+    def start(self, kind: str, generate: Callable[[], tuple[str, str]]) -> None:
+        # Run in a copy of the caller's context so phase spans and token counts reach the node
+        future = self._executor.submit(contextvars.copy_context().run, generate)
+        future.add_done_callback(lambda _: self._finished_at.setdefault(kind, time.monotonic()))
+        self._futures[kind] = future
+
+    def take(self, kind: str) -> tuple[str, str] | None:
+        """Return the (plan, code) generated for `kind`, or None if it was not started or failed."""
+        future = self._futures.pop(kind, None)
+        if future is None:
+            return None
+        requested_at = time.monotonic()
+        try:
+            plan, code = future.result()
+        except Exception as exc:
+            logger.warning(f"Speculative {kind} code generation failed; regenerating: {exc}")
+            return None
+        finished_at = self._finished_at.get(kind, requested_at)
+        overlapped_s = max(min(finished_at, requested_at) - self._started_at, 0.0)
+        _speculative_codegen_stats["used"] += 1
+        _speculative_codegen_stats["overlapped_s"] += overlapped_s
+        logger.info(
+            f"Using speculative {kind} code ({overlapped_s:.1f}s of LLM time overlapped with "
+            f"execution, waited {max(finished_at - requested_at, 0.0):.1f}s)"
+        )
+        return plan, code
+
+    def discard(self) -> None:
+        """Drop generations nobody asked for. Running LLM calls finish in the background."""
+        for kind, future in self._futures.items():
+            future.cancel()
+            _speculative_codegen_stats["discarded"] += 1
+            logger.debug(f"Discarded speculative {kind} code")
+        self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if _speculative_codegen_stats["used"] or _speculative_codegen_stats["discarded"]:
+            logger.info(
+                f"Speculative codegen in this worker: {_speculative_codegen_stats['used']} used, "
+                f"{_speculative_codegen_stats['discarded']} discarded, "
+                f"{_speculative_codegen_stats['overlapped_s']:.1f}s overlapped with execution"
+            )
+
+
 def _create_child_node(
     *,
     worker_agent: MinimalAgent,
@@ -205,13 +288,14 @@ def _improve_existing_implementation(
             "implementation. Your task is to improve it based on the current experimental stage."
         ),
         "Research idea": worker_agent.task_desc,
+        "Instructions": {},
+        PROMPT_CACHE_BREAKPOINT: None,
         "Memory": worker_agent.memory_summary if worker_agent.memory_summary else "",
         "Feedback based on generated plots": parent_node.vlm_feedback_summary,
         "Feedback about execution time": parent_node.exec_time_feedback,
-        "Instructions": {},
-    }
-    prompt["Previous solution"] = {
-        "Code": wrap_code(code=parent_node.code),
+        "Previous solution": {
+            "Code": wrap_code(code=parent_node.code),
+        },
     }
 
     improve_instructions: dict[str, str | list[str]] = {}
@@ -229,13 +313,80 @@ def _improve_existing_implementation(
     )
 
 
+def _start_speculative_codegen(
+    *,
+    speculative: _SpeculativeCodegen,
+    worker_agent: MinimalAgent,
+    child_node: Node,
+    parent_node: Node | None,
+    seed_eval: bool,
+    best_stage3_plot_code: str | None,
+) -> None:
+    experiment_code = child_node.code
+    parse_agent = copy.copy(worker_agent)
+    plotting_agent = copy.copy(worker_agent)
+    reuses_parent_parse_code = (
+        seed_eval and parent_node is not None and bool(parent_node.parse_metrics_code)
+    )
+    # Code that writes metrics.json almost never needs the LLM parsing path
+    if not reuses_parent_parse_code and METRICS_CONTRACT_FILENAME not in experiment_code:
+        speculative.start(
+            "metric parsing",
+            lambda: _generate_parse_metrics_code(
+                worker_agent=parse_agent, experiment_code=experiment_code
+            ),
+        )
+    if not seed_eval and _should_run_plotting_and_vlm(stage_name=worker_agent.stage_name):
+        speculative.start(
+            "plotting",
+            lambda: _generate_speculative_plotting_code(
+                worker_agent=plotting_agent,
+                experiment_code=experiment_code,
+                best_stage3_plot_code=best_stage3_plot_code,
+            ),
+        )
+
+
 def _execute_experiment(
     *,
     child_node: Node,
     cfg: AppConfig,
+    working_dir: str,
     process_interpreter: Interpreter,
+    gpu_spec: GPUSpec | None,
     event_callback: Callable[[BaseEvent], None],
 ) -> ExecutionResult:
+    # The working directory is reused across nodes; never read a previous node's metrics.
+    Path(working_dir, METRICS_CONTRACT_FILENAME).unlink(missing_ok=True)
+    execution_cache = open_execution_cache(cfg)
+    cache_key = None
+    if execution_cache is not None:
+        cache_key = build_cache_key(
+            code=child_node.code,
+            input_dir=Path(cfg.workspace_dir) / "input",
+            working_dir=Path(working_dir),
+            gpu_name=gpu_spec["name"] if gpu_spec else None,
+            timeout=cfg.exec.timeout,
+            cache_unseeded=cfg.agent.execution_cache.cache_unseeded,
+        )
+    if execution_cache is not None and cache_key is not None:
+        cached_result = execution_cache.load(cache_key, working_dir=Path(working_dir))
+        if cached_result is not None:
+            logger.info(
+                f"✓ Reused cached execution of identical code "
+                f"(skipped {cached_result.exec_time:.1f}s of GPU time)"
+            )
+            event_callback(
+                RunLogEvent(
+                    message=(
+                        "Identical experiment code already ran; reusing its results "
+                        f"({cached_result.exec_time:.1f}s saved)"
+                    ),
+                    level="info",
+                )
+            )
+            return cached_result
+    working_dir_before = snapshot_working_dir(Path(working_dir)) if cache_key else {}
     logger.info(f"→ Executing experiment code (timeout: {cfg.exec.timeout}s)...")
     logger.debug("Starting first interpreter: executing experiment code")
     event_callback(RunLogEvent(message="Executing experiment code on GPU...", level="info"))
@@ -247,6 +398,14 @@ def _execute_experiment(
             message=f"Code execution completed ({exec_result.exec_time:.1f}s)", level="info"
         )
     )
+    if execution_cache is not None and cache_key is not None:
+        execution_cache.store(
+            cache_key,
+            exec_result,
+            working_dir=Path(working_dir),
+            before=working_dir_before,
+            node_id=child_node.id,
+        )
     return exec_result
 
 
@@ -260,14 +419,19 @@ def _analyze_results_and_metrics(
     process_interpreter: Interpreter,
     seed_eval: bool,
     exec_result: ExecutionResult,
+    speculative: _SpeculativeCodegen,
     event_callback: Callable[[BaseEvent], None],
 ) -> None:
     logger.info("→ Analyzing results and extracting metrics...")
     event_callback(RunLogEvent(message="Analyzing results and extracting metrics", level="info"))
-    worker_agent.parse_exec_result(
-        node=child_node,
-        exec_result=exec_result,
-    )
+    if seed_eval:
+        _review_seed_exec_result(child_node=child_node, exec_result=exec_result)
+    else:
+        with phase_span("result_review"):
+            worker_agent.parse_exec_result(
+                node=child_node,
+                exec_result=exec_result,
+            )
     parse_and_assign_metrics(
         worker_agent=worker_agent,
         child_node=child_node,
@@ -276,11 +440,40 @@ def _analyze_results_and_metrics(
         working_dir=working_dir,
         process_interpreter=process_interpreter,
         seed_eval=seed_eval,
+        speculative=speculative,
         event_callback=event_callback,
     )
     logger.info(f"✓ Metrics extracted. Buggy: {child_node.is_buggy}")
 
 
+def _plot_code_from_prev_stage(
+    *, worker_agent: MinimalAgent, best_stage3_plot_code: str | None
+) -> str | None:
+    if (
+        worker_agent.stage_name
+        and worker_agent.stage_name.startswith("4_")
+        and best_stage3_plot_code
+    ):
+        return best_stage3_plot_code
+    return None
+
+
+def _generate_speculative_plotting_code(
+    *, worker_agent: MinimalAgent, experiment_code: str, best_stage3_plot_code: str | None
+) -> tuple[str, str]:
+    # Generated on a scratch node so the real node is untouched if the result is discarded
+    scratch_node = Node(code=experiment_code)
+    with phase_span("plotting_codegen"):
+        plotting_code = generate_plotting_code(
+            agent=worker_agent,
+            node=scratch_node,
+            plot_code_from_prev_stage=_plot_code_from_prev_stage(
+                worker_agent=worker_agent, best_stage3_plot_code=best_stage3_plot_code
+            ),
+        )
+    return scratch_node.plot_plan or "", plotting_code
+
+
 def _select_plotting_code(
     *,
     worker_agent: MinimalAgent,
@@ -288,26 +481,26 @@ def _select_plotting_code(
     parent_node: Node | None,
     seed_eval: bool,
     best_stage3_plot_code: str | None,
+    speculative: _SpeculativeCodegen,
 ) -> str:
     if seed_eval:
         assert parent_node is not None
         return parent_node.plot_code or ""
 
-    plot_code_from_prev_stage: str | None
-    if (
-        worker_agent.stage_name
-        and worker_agent.stage_name.startswith("4_")
-        and best_stage3_plot_code
-    ):
-        plot_code_from_prev_stage = best_stage3_plot_code
-    else:
-        plot_code_from_prev_stage = None
+    # Only the first attempt can use the speculative code; retries regenerate
+    prefetched = speculative.take("plotting")
+    if prefetched is not None:
+        child_node.plot_plan, child_node.plot_code = prefetched
+        return child_node.plot_code
 
-    return generate_plotting_code(
-        agent=worker_agent,
-        node=child_node,
-        plot_code_from_prev_stage=plot_code_from_prev_stage,
-    )
+    with phase_span("plotting_codegen"):
+        return generate_plotting_code(
+            agent=worker_agent,
+            node=child_node,
+            plot_code_from_prev_stage=_plot_code_from_prev_stage(
+                worker_agent=worker_agent, best_stage3_plot_code=best_stage3_plot_code
+            ),
+        )
 
 
 def _execute_plotting_with_retries(
@@ -318,6 +511,7 @@ def _execute_plotting_with_retries(
     process_interpreter: Interpreter,
     seed_eval: bool,
     best_stage3_plot_code: str | None,
+    speculative: _SpeculativeCodegen,
     event_callback: Callable[[BaseEvent], None],
 ) -> str:
     logger.info("→ Generating visualization plots...")
@@ -331,13 +525,15 @@ def _execute_plotting_with_retries(
             parent_node=parent_node,
             seed_eval=seed_eval,
             best_stage3_plot_code=best_stage3_plot_code,
+            speculative=speculative,
         )
         event_callback(RunLogEvent(message="Executing plotting code", level="info"))
-        plot_exec_result = process_interpreter.run(
-            code=plotting_code,
-            reset_session=True,
-        )
-        process_interpreter.cleanup_session()
+        with phase_span("plotting_execution"):
+            plot_exec_result = process_interpreter.run(
+                code=plotting_code,
+                reset_session=True,
+            )
+            process_interpreter.cleanup_session()
         child_node.absorb_plot_exec_result(plot_exec_result)
         if child_node.plot_exc_type and retry_count < 3:
             term_lines = child_node.plot_term_out or []
@@ -402,7 +598,7 @@ def _move_experiment_artifacts(
         f.write(child_node.code)
     for exp_data_file in plots_dir.glob("*.npy"):
         exp_data_path = exp_results_dir / exp_data_file.name
-        exp_data_file.resolve().rename(exp_data_path)
+        move_with_companion(exp_data_file, exp_data_path)
 
     plot_files_found = list(plots_dir.glob("*.png"))
     logger.debug(f"Found {len(plot_files_found)} plot files to move for node {child_node.id}")
@@ -473,6 +669,7 @@ def _run_plotting_and_vlm(
     process_interpreter: Interpreter,
     seed_eval: bool,
     best_stage3_plot_code: str | None,
+    speculative: _SpeculativeCodegen,
     event_callback: Callable[[BaseEvent], None],
 ) -> None:
     logger.debug(
@@ -481,22 +678,25 @@ def _run_plotting_and_vlm(
         f"plot_paths={len(child_node.plot_paths) if child_node.plot_paths else 0}"
     )
     try:
-        plotting_code = _execute_plotting_with_retries(
-            worker_agent=worker_agent,
-            child_node=child_node,
-            parent_node=parent_node,
-            process_interpreter=process_interpreter,
-            seed_eval=seed_eval,
-            best_stage3_plot_code=best_stage3_plot_code,
-            event_callback=event_callback,
-        )
-        _move_experiment_artifacts(
-            cfg=cfg,
-            child_node=child_node,
-            working_dir=working_dir,
-            plotting_code=plotting_code,
-            event_callback=event_callback,
-        )
+        with phase_span("plotting"):
+            plotting_code = _execute_plotting_with_retries(
+                worker_agent=worker_agent,
+                child_node=child_node,
+                parent_node=parent_node,
+                process_interpreter=process_interpreter,
+                seed_eval=seed_eval,
+                best_stage3_plot_code=best_stage3_plot_code,
+                speculative=speculative,
+                event_callback=event_callback,
+            )
+        with phase_span("artifact_move"):
+            _move_experiment_artifacts(
+                cfg=cfg,
+                child_node=child_node,
+                working_dir=working_dir,
+                plotting_code=plotting_code,
+                event_callback=event_callback,
+            )
     except Exception as e:
         tb = traceback.format_exc()
         event_callback(
@@ -522,13 +722,236 @@ def _run_plotting_and_vlm(
         logger.warning("   2. Plots were populated from a previous attempt/retry")
         logger.warning("   3. plot_paths list was cleared/reset somewhere")
         return
-    _run_vlm_analysis(
-        worker_agent=worker_agent,
+    with phase_span("vlm_analysis"):
+        _run_vlm_analysis(
+            worker_agent=worker_agent,
+            child_node=child_node,
+            event_callback=event_callback,
+        )
+
+
+def _review_seed_exec_result(*, child_node: Node, exec_result: ExecutionResult) -> None:
+    """
+    Seed runs re-execute already reviewed code with a different seed, so the LLM review
+    is skipped: a seed run is buggy exactly when it raised (or later yields no metrics).
+    """
+    child_node.absorb_exec_result(exec_result)
+    child_node.is_buggy = child_node.exc_type is not None
+    child_node.analysis = (
+        f"Seed run failed with {child_node.exc_type}."
+        if child_node.is_buggy
+        else "Seed run of a previously reviewed implementation completed without errors."
+    )
+
+
+def _metrics_from_reused_parse_output(
+    *, parent_node: Node, term_out: list[str]
+) -> MetricParseResponse | None:
+    """
+    Map a seed run's metric-parse output onto the parent's structured metrics: the parse
+    code is the same, so when both outputs differ only in their numbers, each parent value
+    is replaced by the number printed at the same position. Returns None (and the LLM is
+    used) when the layout differs or a value cannot be located unambiguously.
+    """
+    parent_value = parent_node.metric.value if parent_node.metric is not None else None
+    if not isinstance(parent_value, dict) or not parent_node.parse_term_out:
+        return None
+    parent_output = "".join(parent_node.parse_term_out)
+    seed_output = "".join(term_out)
+    if _NUMBER_PATTERN.sub("#", parent_output) != _NUMBER_PATTERN.sub("#", seed_output):
+        return None
+    parent_numbers = [float(m.group()) for m in _NUMBER_PATTERN.finditer(parent_output)]
+    seed_numbers = [float(m.group()) for m in _NUMBER_PATTERN.finditer(seed_output)]
+
+    def seed_value(value: object) -> float | None:
+        if not isinstance(value, (int, float)):
+            return None
+        candidates = {seed_numbers[i] for i, n in enumerate(parent_numbers) if n == value}
+        return candidates.pop() if len(candidates) == 1 else None
+
+    metric_names = []
+    for info in parent_value.get("metric_names", []):
+        data = []
+        for point in info.get("data", []):
+            final_value = seed_value(point.get("final_value"))
+            best_value = seed_value(point.get("best_value"))
+            if final_value is None or best_value is None:
+                return None
+            data.append({**point, "final_value": final_value, "best_value": best_value})
+        metric_names.append({**info, "data": data})
+    try:
+        metrics_model = MetricParseResponse.model_validate(
+            {"valid_metrics_received": True, "metric_names": metric_names}
+        )
+    except ValidationError:
+        return None
+    data_points = [point for info in metrics_model.metric_names for point in info.data]
+    if not data_points or not all(
+        math.isfinite(p.final_value) and math.isfinite(p.best_value) for p in data_points
+    ):
+        return None
+    return metrics_model
+
+
+def _read_metrics_contract(*, working_path: Path) -> MetricParseResponse | None:
+    """
+    Load metrics the experiment wrote to metrics.json, validated against the metric parse
+    schema. Returns None (and the LLM parsing path is used) if the file is missing,
+    malformed, empty or holds non-finite values.
+    """
+    contract_path = working_path / METRICS_CONTRACT_FILENAME
+    if not contract_path.is_file():
+        return None
+    try:
+        raw = json.loads(contract_path.read_text())
+        if isinstance(raw, dict) and "valid_metrics_received" not in raw:
+            raw = {"valid_metrics_received": True, **raw}
+        metrics_model = MetricParseResponse.model_validate(raw)
+    except (OSError, ValueError, ValidationError) as exc:
+        logger.info(f"Ignoring invalid {METRICS_CONTRACT_FILENAME}: {exc}")
+        return None
+    data_points = [point for info in metrics_model.metric_names for point in info.data]
+    if not metrics_model.valid_metrics_received or not data_points:
+        logger.info(f"Ignoring {METRICS_CONTRACT_FILENAME} without metric values")
+        return None
+    if not all(math.isfinite(p.final_value) and math.isfinite(p.best_value) for p in data_points):
+        logger.info(f"Ignoring {METRICS_CONTRACT_FILENAME} with non-finite metric values")
+        return None
+    return metrics_model
+
+
+def _record_metrics_contract_outcome(*, hit: bool) -> None:
+    _metrics_contract_stats["hits" if hit else "misses"] += 1
+    total = _metrics_contract_stats["hits"] + _metrics_contract_stats["misses"]
+    logger.info(
+        f"Metrics read from {METRICS_CONTRACT_FILENAME}: {'yes' if hit else 'no'} "
+        f"(fast path hit rate {_metrics_contract_stats['hits']}/{total} in this worker)"
+    )
+
+
+def _assign_metrics(*, child_node: Node, metrics_model: MetricParseResponse) -> None:
+    metrics_response = metrics_model.model_dump(by_alias=True)
+    metric_names = metrics_response.get("metric_names", [])
+    child_node.metric = MetricValue(value={"metric_names": metric_names})
+    _assign_datasets_from_metrics_response(
         child_node=child_node,
-        event_callback=event_callback,
+        metrics_response=metrics_response,
     )
 
 
+def _generate_parse_metrics_code(
+    *, worker_agent: MinimalAgent, experiment_code: str
+) -> tuple[str, str]:
+    parse_metrics_prompt: PromptType = {
+        "Introduction": (
+            "You are an AI researcher analyzing experimental results stored in numpy files. "
+            "Write code to load and analyze the metrics from experiment_data.npy."
+        ),
+        "Instructions": [
+            "0. Make sure to get the working directory from os.path.join(os.getcwd(), 'working')",
+            "1. Load the experiment_data.npy file, which is located in the working directory",
+            "2. Extract metrics for each dataset. Refer to the original code to understand the data structure.",
+            "3. Always print the name of the dataset before printing the metrics",
+            "4. Always print the name of the metric before printing the value with precise labels (e.g., 'train accuracy', 'validation loss', 'test F1 score').",
+            "5. Only print the best or final value for each metric for each dataset",
+            "6. DO NOT CREATE ANY PLOTS",
+            "Important code structure requirements:",
+            "  - Do NOT put any execution code inside if __name__ == '" + "__main__" + "':",
+            "  - All code should be at the global scope or in functions that are called from the global scope",
+            "  - The script should execute immediately when run, without requiring any special entry point",
+        ],
+        "Example data loading code": [
+            (
+                "\nimport numpy as np\nimport os\n"
+                "experiment_data = np.load(os.path.join(os.getcwd(), 'working', 'experiment_data.npy'), allow_pickle=True).item()\n"
+            )
+        ],
+        PROMPT_CACHE_BREAKPOINT: None,
+        "Context": [
+            "Original Code: " + experiment_code,
+        ],
+    }
+    logger.debug("Generating metric parsing code to extract metrics from experiment results")
+    with phase_span("metric_parse_codegen"):
+        return worker_agent.plan_and_code_query(prompt=parse_metrics_prompt)
+
+
+def _parse_metrics_with_llm(
+    *,
+    worker_agent: MinimalAgent,
+    child_node: Node,
+    parent_node: Node | None,
+    cfg: AppConfig,
+    process_interpreter: Interpreter,
+    seed_eval: bool,
+    speculative: _SpeculativeCodegen,
+) -> None:
+    """
+    Generate/execute metrics parsing code and let the LLM structure its output. Seed runs
+    reuse the parent's parse code and, when possible, its metric structure (no LLM call).
+    """
+    # Prepare or reuse metrics parsing code
+    if seed_eval and parent_node is not None and parent_node.parse_metrics_code:
+        parse_metrics_plan = parent_node.parse_metrics_plan
+        parse_metrics_code = parent_node.parse_metrics_code
+    elif (prefetched := speculative.take("metric parsing")) is not None:
+        parse_metrics_plan, parse_metrics_code = prefetched
+    else:
+        parse_metrics_plan, parse_metrics_code = _generate_parse_metrics_code(
+            worker_agent=worker_agent, experiment_code=child_node.code
+        )
+    child_node.parse_metrics_plan = parse_metrics_plan
+    child_node.parse_metrics_code = parse_metrics_code
+
+    # Execute metric parsing code
+    logger.debug(
+        "Starting second interpreter: executing metric parsing code to load .npy files and extract metrics"
+    )
+    with phase_span("metric_parse_execution"):
+        metrics_exec_result = process_interpreter.run(code=parse_metrics_code, reset_session=True)
+        process_interpreter.cleanup_session()
+    child_node.parse_term_out = metrics_exec_result.term_out
+    child_node.parse_exc_type = metrics_exec_result.exc_type
+    child_node.parse_exc_info = metrics_exec_result.exc_info
+    child_node.parse_exc_stack = metrics_exec_result.exc_stack
+
+    if metrics_exec_result.exc_type is None and seed_eval and parent_node is not None:
+        reused_metrics = _metrics_from_reused_parse_output(
+            parent_node=parent_node, term_out=metrics_exec_result.term_out
+        )
+        if reused_metrics is not None:
+            logger.info("Seed metrics mapped from the parent's parse output without the LLM")
+            _assign_metrics(child_node=child_node, metrics_model=reused_metrics)
+            return
+
+    if metrics_exec_result.exc_type is None:
+        # Extract structured metrics from stdout
+        metrics_prompt = {
+            "Introduction": (
+                "Parse the metrics from the execution output. You only need the final or best value "
+                "of each metric for each dataset."
+            ),
+            PROMPT_CACHE_BREAKPOINT: None,
+            "Execution Output": metrics_exec_result.term_out,
+        }
+        with phase_span("metric_extraction"):
+            metrics_model = structured_query_with_schema(
+                system_message=metrics_prompt,
+                user_message=None,
+                model=cfg.agent.feedback.model,
+                temperature=cfg.agent.feedback.temperature,
+                schema_class=METRIC_PARSE_SCHEMA,
+            )
+        if metrics_model.valid_metrics_received:
+            _assign_metrics(child_node=child_node, metrics_model=metrics_model)
+        else:
+            child_node.metric = WorstMetricValue()
+            child_node.is_buggy = True
+    else:
+        child_node.metric = WorstMetricValue()
+        child_node.is_buggy = True
+
+
 def parse_and_assign_metrics(
     *,
     worker_agent: MinimalAgent,
@@ -538,9 +961,14 @@ def parse_and_assign_metrics(
     working_dir: str,
     process_interpreter: Interpreter,
     seed_eval: bool,
+    speculative: _SpeculativeCodegen,
     event_callback: Callable[[BaseEvent], None],
 ) -> None:
-    """Generate/execute metrics parsing code and assign structured metrics to the node."""
+    """
+    Assign structured metrics to the node. Metrics the experiment wrote to metrics.json
+    are used directly; otherwise parsing code is generated/executed and its output is
+    structured by the LLM.
+    """
     try:
         working_path = Path(working_dir)
         data_files = list(working_path.glob("*.npy"))
@@ -552,89 +980,21 @@ def parse_and_assign_metrics(
                 )
             )
 
-        # Prepare or reuse metrics parsing code
-        if seed_eval and parent_node is not None:
-            parse_metrics_plan = parent_node.parse_metrics_plan
-            parse_metrics_code = parent_node.parse_metrics_code
+        contract = _read_metrics_contract(working_path=working_path)
+        _record_metrics_contract_outcome(hit=contract is not None)
+        if contract is not None:
+            child_node.parse_term_out = [f"Metrics read from {METRICS_CONTRACT_FILENAME}"]
+            _assign_metrics(child_node=child_node, metrics_model=contract)
         else:
-            parse_metrics_prompt: PromptType = {
-                "Introduction": (
-                    "You are an AI researcher analyzing experimental results stored in numpy files. "
-                    "Write code to load and analyze the metrics from experiment_data.npy."
-                ),
-                "Context": [
-                    "Original Code: " + child_node.code,
-                ],
-                "Instructions": [
-                    "0. Make sure to get the working directory from os.path.join(os.getcwd(), 'working')",
-                    "1. Load the experiment_data.npy file, which is located in the working directory",
-                    "2. Extract metrics for each dataset. Refer to the original code to understand the data structure.",
-                    "3. Always print the name of the dataset before printing the metrics",
-                    "4. Always print the name of the metric before printing the value with precise labels (e.g., 'train accuracy', 'validation loss', 'test F1 score').",
-                    "5. Only print the best or final value for each metric for each dataset",
-                    "6. DO NOT CREATE ANY PLOTS",
-                    "Important code structure requirements:",
-                    "  - Do NOT put any execution code inside if __name__ == '" + "__main__" + "':",
-                    "  - All code should be at the global scope or in functions that are called from the global scope",
-                    "  - The script should execute immediately when run, without requiring any special entry point",
-                ],
-                "Example data loading code": [
-                    (
-                        "\nimport numpy as np\nimport os\n"
-                        "experiment_data = np.load(os.path.join(os.getcwd(), 'working', 'experiment_data.npy'), allow_pickle=True).item()\n"
-                    )
-                ],
-            }
-            logger.debug(
-                "Generating metric parsing code to extract metrics from experiment results"
-            )
-            parse_metrics_plan, parse_metrics_code = worker_agent.plan_and_code_query(
-                prompt=parse_metrics_prompt
+            _parse_metrics_with_llm(
+                worker_agent=worker_agent,
+                child_node=child_node,
+                parent_node=parent_node,
+                cfg=cfg,
+                process_interpreter=process_interpreter,
+                seed_eval=seed_eval,
+                speculative=speculative,
             )
-        child_node.parse_metrics_plan = parse_metrics_plan
-        child_node.parse_metrics_code = parse_metrics_code
-
-        # Execute metric parsing code
-        logger.debug(
-            "Starting second interpreter: executing metric parsing code to load .npy files and extract metrics"
-        )
-        metrics_exec_result = process_interpreter.run(code=parse_metrics_code, reset_session=True)
-        process_interpreter.cleanup_session()
-        child_node.parse_term_out = metrics_exec_result.term_out
-        child_node.parse_exc_type = metrics_exec_result.exc_type
-        child_node.parse_exc_info = metrics_exec_result.exc_info
-        child_node.parse_exc_stack = metrics_exec_result.exc_stack
-
-        if metrics_exec_result.exc_type is None:
-            # Extract structured metrics from stdout
-            metrics_prompt = {
-                "Introduction": (
-                    "Parse the metrics from the execution output. You only need the final or best value "
-                    "of each metric for each dataset."
-                ),
-                "Execution Output": metrics_exec_result.term_out,
-            }
-            metrics_model = structured_query_with_schema(
-                system_message=metrics_prompt,
-                user_message=None,
-                model=cfg.agent.feedback.model,
-                temperature=cfg.agent.feedback.temperature,
-                schema_class=METRIC_PARSE_SCHEMA,
-            )
-            metrics_response = metrics_model.model_dump(by_alias=True)
-            if metrics_model.valid_metrics_received:
-                metric_names = metrics_response.get("metric_names", [])
-                child_node.metric = MetricValue(value={"metric_names": metric_names})
-                _assign_datasets_from_metrics_response(
-                    child_node=child_node,
-                    metrics_response=metrics_response,
-                )
-            else:
-                child_node.metric = WorstMetricValue()
-                child_node.is_buggy = True
-        else:
-            child_node.metric = WorstMetricValue()
-            child_node.is_buggy = True
 
         # Emit validation outcome
         if child_node.is_buggy:
@@ -652,56 +1012,113 @@ def parse_and_assign_metrics(
 
 def process_node(
     *,
+    context_ref: WorkerContextRef,
     node_data: dict[str, object] | None,
-    task_desc: str,
-    cfg: AppConfig,
-    evaluation_metrics: str,
-    memory_summary: str,
-    stage_name: str,
     seed_eval: bool,
     event_callback: Callable[[BaseEvent], None],
     gpu_id: Optional[int] = None,
     new_ablation_idea: Optional[AblationIdea] = None,
     new_hyperparam_idea: Optional[HyperparamTuningIdea] = None,
-    best_stage3_plot_code: Optional[str] = None,
 ) -> dict[str, object]:
-    _ensure_worker_log_level(cfg=cfg)
-
-    process_id = multiprocessing.current_process().name
-    workspace, working_dir = _prepare_workspace(cfg=cfg, process_id=process_id)
+    # Every phase below is timed into the recorder and stored on the returned node
+    recorder = PhaseRecorder()
+    with recorder.active():
+        return _process_node(
+            recorder=recorder,
+            context_ref=context_ref,
+            node_data=node_data,
+            seed_eval=seed_eval,
+            event_callback=event_callback,
+            gpu_id=gpu_id,
+            new_ablation_idea=new_ablation_idea,
+            new_hyperparam_idea=new_hyperparam_idea,
+        )
 
-    gpu_spec = _configure_gpu_for_worker(gpu_id=gpu_id)
 
-    worker_agent = _create_worker_agent(
-        task_desc=task_desc,
-        cfg=cfg,
-        gpu_id=gpu_id,
-        gpu_spec=gpu_spec,
-        memory_summary=memory_summary,
-        evaluation_metrics=evaluation_metrics,
-        stage_name=stage_name,
+def _create_node_profiler(*, cfg: AppConfig) -> NodeProfiler:
+    profiling = cfg.agent.profiling
+    profile_dir = Path(profiling.dir) if profiling.dir else Path(cfg.log_dir) / "profiles"
+    return NodeProfiler(
+        sample_rate=profiling.sample_rate, mode=profiling.mode, profile_dir=profile_dir
     )
 
-    process_interpreter = _create_interpreter(cfg=cfg, workspace=workspace)
+
+def _process_node(
+    *,
+    recorder: PhaseRecorder,
+    context_ref: WorkerContextRef,
+    node_data: dict[str, object] | None,
+    seed_eval: bool,
+    event_callback: Callable[[BaseEvent], None],
+    gpu_id: Optional[int],
+    new_ablation_idea: Optional[AblationIdea],
+    new_hyperparam_idea: Optional[HyperparamTuningIdea],
+) -> dict[str, object]:
+    with phase_span("workspace_prep"):
+        # Run/step-level inputs come from the shared context; only the node travels per task
+        context = load_worker_context(context_ref)
+        cfg = context.cfg
+        task_desc = context.task_desc
+        evaluation_metrics = context.evaluation_metrics
+        memory_summary = context.memory_summary
+        stage_name = context.stage_name
+        best_stage3_plot_code = context.best_stage3_plot_code
+        _ensure_worker_log_level(cfg=cfg)
+
+        process_id = multiprocessing.current_process().name
+        workspace, working_dir = _prepare_workspace(cfg=cfg, process_id=process_id)
+
+        gpu_spec = _configure_gpu_for_worker(gpu_id=gpu_id)
+
+    profiler = _create_node_profiler(cfg=cfg)
+    profiler.start()
+
+    with phase_span("agent_setup"):
+        worker_agent = _create_worker_agent(
+            task_desc=task_desc,
+            cfg=cfg,
+            gpu_id=gpu_id,
+            gpu_spec=gpu_spec,
+            memory_summary=memory_summary,
+            evaluation_metrics=evaluation_metrics,
+            stage_name=stage_name,
+        )
+
+        process_interpreter = _create_interpreter(cfg=cfg, workspace=workspace)
+    speculative = _SpeculativeCodegen()
 
     try:
         parent_node = _load_parent_node(node_data=node_data)
 
-        child_node = _create_child_node(
-            worker_agent=worker_agent,
-            parent_node=parent_node,
-            seed_eval=seed_eval,
-            new_ablation_idea=new_ablation_idea,
-            new_hyperparam_idea=new_hyperparam_idea,
-            event_callback=event_callback,
-        )
+        with phase_span("codegen"):
+            child_node = _create_child_node(
+                worker_agent=worker_agent,
+                parent_node=parent_node,
+                seed_eval=seed_eval,
+                new_ablation_idea=new_ablation_idea,
+                new_hyperparam_idea=new_hyperparam_idea,
+                event_callback=event_callback,
+            )
 
-        exec_result = _execute_experiment(
-            child_node=child_node,
-            cfg=cfg,
-            process_interpreter=process_interpreter,
-            event_callback=event_callback,
-        )
+        if cfg.agent.speculative_codegen:
+            _start_speculative_codegen(
+                speculative=speculative,
+                worker_agent=worker_agent,
+                child_node=child_node,
+                parent_node=parent_node,
+                seed_eval=seed_eval,
+                best_stage3_plot_code=best_stage3_plot_code,
+            )
+
+        with phase_span("execution"):
+            exec_result = _execute_experiment(
+                child_node=child_node,
+                cfg=cfg,
+                working_dir=working_dir,
+                process_interpreter=process_interpreter,
+                gpu_spec=gpu_spec,
+                event_callback=event_callback,
+            )
 
         _analyze_results_and_metrics(
             worker_agent=worker_agent,
@@ -712,6 +1129,7 @@ def process_node(
             process_interpreter=process_interpreter,
             seed_eval=seed_eval,
             exec_result=exec_result,
+            speculative=speculative,
             event_callback=event_callback,
         )
 
@@ -726,12 +1144,16 @@ def process_node(
                     process_interpreter=process_interpreter,
                     seed_eval=seed_eval,
                     best_stage3_plot_code=best_stage3_plot_code,
+                    speculative=speculative,
                     event_callback=event_callback,
                 )
             elif child_node.is_buggy_plots is None:
                 # If plotting/VLM is skipped (e.g., Stage 1), treat plots as non-buggy
                 child_node.is_buggy_plots = False
 
+        child_node.profile_path = profiler.stop(node_id=child_node.id)
+        child_node.phase_timings = recorder.spans()
+        logger.info(f"Node {child_node.id} phases: {describe_phases(child_node.phase_timings)}")
         result_data = child_node.to_dict()
         # sanity pickle
 
@@ -742,5 +1164,8 @@ def process_node(
         traceback.print_exc()
         raise
     finally:
+        # No-op unless the node failed before its profile was written
+        profiler.stop(node_id=f"failed_{os.getpid()}_{int(time.time())}")
+        speculative.discard()
         if process_interpreter:
             process_interpreter.cleanup_session()
@@ -38,7 +38,7 @@ from ai_scientist.perform_writeup import perform_writeup
 from ai_scientist.review_context import build_auto_review_context
 from ai_scientist.review_storage import FigureReviewRecorder, ReviewResponseRecorder
 from ai_scientist.telemetry import EventPersistenceManager, EventQueueEmitter, WebhookClient
-from ai_scientist.treesearch.agent_manager import AgentManager
+from ai_scientist.treesearch.agent_manager import RUN_STATE_FILE_NAME, AgentManager
 from ai_scientist.treesearch.bfts_utils import idea_to_markdown
 from ai_scientist.treesearch.events import BaseEvent, GpuShortageEvent
 from ai_scientist.treesearch.journal import Journal
@@ -348,6 +348,7 @@ def setup_artifact_publisher(
         aws_region=aws_region,
         aws_s3_bucket_name=aws_s3_bucket_name,
         database_url=telemetry_cfg.database_url,
+        aws_endpoint_url=os.environ.get("AWS_S3_ENDPOINT_URL"),
     )
 
     def _callback(spec: ArtifactSpec) -> None:
@@ -356,6 +357,36 @@ def setup_artifact_publisher(
     return publisher, _callback
 
 
+def resume_run_from_state(
+    cfg: Config,
+    idea_json_path: str,
+    event_callback: Callable[[BaseEvent], None],
+) -> None:
+    """Continue an interrupted run inside the substage it was in, keeping its finished nodes."""
+    fake_config = copy.deepcopy(cfg)
+    fake_config.desc_file = Path(idea_json_path)
+    task_desc = load_task_desc(cfg=fake_config)
+
+    manager = AgentManager(
+        task_desc=task_desc,
+        cfg=cfg,
+        workspace_dir=Path(cfg.workspace_dir),
+        event_callback=event_callback,
+    )
+
+    def step_callback(stage: StageMeta, journal: Journal) -> None:
+        try:
+            save_run(cfg=cfg, journal=journal, stage_name=f"stage_{stage.name}")
+        except Exception:
+            traceback.print_exc()
+
+    try:
+        manager.restore_run_state()
+        manager.run(step_callback=step_callback)
+    finally:
+        manager.close()
+
+
 def resume_run(
     base_cfg: Config,
     idea_json_path: str,
@@ -372,13 +403,21 @@ def resume_run(
             raise FileNotFoundError(str(run_dir))
 
         cfg_obj = load_cfg_from_run(run_dir=run_dir)
-        cfg_obj = prep_cfg(cfg=cfg_obj)
         if all_summaries_exist(run_dir=run_dir):
             logger.info(
                 "All summary files found; skipping stage execution and proceeding to reports."
             )
             return run_dir
 
+        if (run_dir / RUN_STATE_FILE_NAME).exists():
+            # The saved config already points at this run's log and workspace directories
+            apply_log_level(level_name=cfg_obj.log_level)
+            resume_run_from_state(
+                cfg=cfg_obj, idea_json_path=idea_json_path, event_callback=event_callback
+            )
+            return run_dir
+
+        cfg_obj = prep_cfg(cfg=cfg_obj)
         s1 = stage_exists(run_dir=run_dir, prefix="stage_1_")
         s2 = stage_exists(run_dir=run_dir, prefix="stage_2_")
         s3 = stage_exists(run_dir=run_dir, prefix="stage_3_")
@@ -518,10 +557,13 @@ def resume_run(
             except Exception:
                 traceback.print_exc()
 
-        manager.run_stage(
-            initial_substage=next_meta,
-            step_callback=step_callback,
-        )
+        try:
+            manager.run_stage(
+                initial_substage=next_meta,
+                step_callback=step_callback,
+            )
+        finally:
+            manager.close()
         return run_dir
     except Exception:
         logger.exception("Resume failed; exiting.")
@@ -953,7 +995,12 @@ def execute_launcher(args: argparse.Namespace) -> None:
                     path=Path(base_cfg.workspace_dir),
                     packaging="zip",
                     archive_name=f"{run_dir_path.name}-workspace.zip",
-                    exclude_dir_names=(".ai_scientist_venv", ".venv"),
+                    exclude_dir_names=(
+                        ".ai_scientist_venv",
+                        ".venv",
+                        ".worker_context",
+                        ".exec_cache",
+                    ),
                 )
             )
 
@@ -0,0 +1 @@
+"""Tests package for the research pipeline."""
@@ -0,0 +1,61 @@
+"""
+Unit tests for deciding which aggregator plot blocks may be skipped.
+
+A plot block gets a fingerprint (and may be skipped) only when nothing after it
+depends on a name it assigns or mutates.
+"""
+
+import textwrap
+
+import pytest
+
+from ai_scientist.aggregator_session import plan_script_units
+
+PLOT_BLOCK = """
+try:
+    {body}
+    plt.savefig("figures/{name}.png")
+except Exception:
+    pass
+"""
+
+
+def _script(*blocks: str, tail: str = "") -> str:
+    return (
+        "import matplotlib.pyplot as plt\nsummary = {}\nitems = []\ncount = 0\n"
+        + "".join(blocks)
+        + textwrap.dedent(tail)
+    )
+
+
+def _fingerprinted(source: str) -> list[bool]:
+    return [unit.fingerprint is not None for unit in plan_script_units(source, "agg.py")]
+
+
+def test_independent_plot_blocks_are_skippable() -> None:
+    source = _script(
+        PLOT_BLOCK.format(body="fig, ax = plt.subplots()", name="a"),
+        PLOT_BLOCK.format(body="fig, ax = plt.subplots()", name="b"),
+    )
+    assert _fingerprinted(source) == [False, False, False, False, True, True]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        "summary['a'] = 1",
+        "summary.best = 1",
+        "del summary['a']",
+        "items.append(1)",
+        "summary.update(a=1)",
+        "count += 1",
+    ],
+)
+def test_plot_block_mutating_a_later_read_is_not_skippable(body: str) -> None:
+    source = _script(PLOT_BLOCK.format(body=body, name="a"), tail="print(summary, items, count)\n")
+    assert _fingerprinted(source)[4] is False
+
+
+def test_plot_block_mutating_an_unread_name_is_skippable() -> None:
+    source = _script(PLOT_BLOCK.format(body="items.append(1)", name="a"), tail="print(summary)\n")
+    assert _fingerprinted(source)[4] is True
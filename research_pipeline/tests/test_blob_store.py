@@ -0,0 +1,140 @@
+"""
+Round-trip tests for journal nodes whose large payloads live in a BlobStore.
+
+Validates that offloaded payloads survive pickling (as in checkpoints), deepcopy and the
+journal JSON, and that the bounded read cache never hands out its own mutable values.
+"""
+
+import copy
+import pickle
+import shutil
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from ai_scientist.treesearch.blob_store import (
+    BLOB_DIR_NAME,
+    BlobRef,
+    BlobStore,
+    activate_blob_store,
+    get_raw,
+)
+from ai_scientist.treesearch.journal import Journal, Node
+from ai_scientist.treesearch.utils.serialize import dumps_json, loads_json
+
+CODE = "import torch\n" + "x = torch.zeros(10)\n" * 100
+TERM_OUT = [f"epoch {idx}: loss {1 / (idx + 1):.4f}\n" for idx in range(200)]
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[BlobStore]:
+    blob_store = BlobStore(tmp_path / "logs" / BLOB_DIR_NAME, min_bytes=256)
+    activate_blob_store(blob_store)
+    yield blob_store
+    activate_blob_store(None)
+
+
+def _journal(nodes: list[Node]) -> Journal:
+    return Journal(
+        summary_model="model",
+        node_selection_model="model",
+        summary_temperature=0.0,
+        node_selection_temperature=0.0,
+        event_callback=lambda _event: None,
+        stage_name="1_initial_implementation_1_preliminary",
+        nodes=nodes,
+    )
+
+
+def test_large_payloads_are_offloaded_and_small_ones_stay_inline(store: BlobStore) -> None:
+    node = Node(code=CODE, plan="short plan")
+    node._term_out = TERM_OUT
+    node.plot_code = "plt.plot([1])"
+
+    assert isinstance(get_raw(node, "code"), BlobRef)
+    assert isinstance(get_raw(node, "_term_out"), BlobRef)
+    assert get_raw(node, "plot_code") == "plt.plot([1])"
+    assert node.code == CODE and node._term_out == TERM_OUT
+    assert len(list(store.root.rglob("*"))) == 4  # two shard directories, two payloads
+
+
+def test_pickled_checkpoint_loads_while_the_blob_directory_is_kept(store: BlobStore) -> None:
+    parent = Node(code=CODE)
+    child = Node(code=CODE, parent=parent)
+    child._term_out = TERM_OUT
+    checkpoint = pickle.dumps({"journal": _journal([parent, child])})
+    activate_blob_store(None)
+
+    restored = pickle.loads(checkpoint)["journal"]
+
+    assert [node.code for node in restored.nodes] == [CODE, CODE]
+    assert restored.nodes[1]._term_out == TERM_OUT
+    assert restored.nodes[1].parent is restored.nodes[0]
+
+    shutil.rmtree(store.root)
+    with pytest.raises(FileNotFoundError):
+        _ = pickle.loads(checkpoint)["journal"].nodes[0].code
+
+
+def test_deepcopy_shares_refs_and_keeps_values(store: BlobStore) -> None:
+    node = Node(code=CODE)
+    node._term_out = TERM_OUT
+
+    copied = copy.deepcopy(node)
+
+    assert get_raw(copied, "code") is get_raw(node, "code")
+    assert copied.code == CODE and copied._term_out == TERM_OUT
+    assert len(list(store.root.rglob("*"))) == 4
+
+
+def test_journal_json_contains_values_not_refs(store: BlobStore) -> None:
+    parent = Node(code=CODE)
+    child = Node(code=CODE + "# child\n", parent=parent)
+    child._term_out = TERM_OUT
+    assert isinstance(get_raw(child, "code"), BlobRef)
+    assert store.root.exists()
+
+    text = dumps_json(_journal([parent, child]))
+    activate_blob_store(None)
+    restored = loads_json(text, Journal)
+
+    assert "BlobRef" not in text
+    assert [node.code for node in restored.nodes] == [CODE, CODE + "# child\n"]
+    assert restored.nodes[1]._term_out == TERM_OUT
+    assert restored.nodes[1].parent is not None
+    assert restored.nodes[1].parent.id == parent.id
+
+
+def test_read_cache_serves_repeat_reads_without_the_file(store: BlobStore) -> None:
+    node = Node(code=CODE)
+    node._term_out = TERM_OUT
+    assert node.code == CODE and node._term_out == TERM_OUT
+
+    shutil.rmtree(store.root)
+
+    assert node.code == CODE
+    term_out = node._term_out
+    assert isinstance(term_out, list)
+    term_out.append("mutated by a caller\n")
+    assert node._term_out == TERM_OUT
+
+
+def test_read_cache_evicts_least_recently_read_payloads(tmp_path: Path) -> None:
+    blob_store = BlobStore(tmp_path, min_bytes=0, read_cache_bytes=2500)
+    refs = [blob_store.put("x" * 1000 + str(idx)) for idx in range(3)]
+    assert all(ref is not None for ref in refs)
+    first, second, third = (ref for ref in refs if ref is not None)
+    first.load()
+    second.load()
+    first.load()
+    third.load()  # evicts `second`, the least recently read
+
+    for ref in refs:
+        assert ref is not None
+        blob_store._path(ref.digest).unlink()
+
+    assert first.load() == "x" * 1000 + "0"
+    assert third.load() == "x" * 1000 + "2"
+    with pytest.raises(FileNotFoundError):
+        second.load()
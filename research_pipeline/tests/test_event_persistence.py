@@ -0,0 +1,69 @@
+"""
+Unit tests for routing structured events to the telemetry sinks.
+
+Validates that:
+- Every event kind with a persistence record has a webhook endpoint
+- Node timing events are enqueued and posted to /node-timing
+"""
+
+import queue
+from typing import Any, cast
+
+import pytest
+
+from ai_scientist.telemetry import event_persistence
+from ai_scientist.telemetry.event_persistence import (
+    EventQueueEmitter,
+    PersistableEvent,
+    WebhookClient,
+)
+from ai_scientist.treesearch.events import EventKind, NodeTimingEvent
+
+
+def _node_timing_event() -> NodeTimingEvent:
+    return NodeTimingEvent(
+        stage="1_initial_implementation_1_preliminary",
+        node_id="node-1",
+        is_buggy=False,
+        total_s=12.5,
+        phases={"execution": {"count": 1, "duration_s": 10.0}},
+    )
+
+
+def test_every_event_kind_has_a_webhook_endpoint() -> None:
+    kinds = set(EventKind.__args__)  # type: ignore[attr-defined]
+    assert kinds == set(WebhookClient._EVENT_PATHS)
+
+
+def test_node_timing_event_is_enqueued_for_persistence() -> None:
+    events: queue.Queue[PersistableEvent | None] = queue.Queue()
+    emitter = EventQueueEmitter(queue=cast(Any, events), fallback=lambda _event: None)
+
+    emitter(_node_timing_event())
+
+    persisted = events.get_nowait()
+    assert persisted is not None and persisted.kind == "node_timing"
+    assert persisted.data["node_id"] == "node-1"
+    assert persisted.data["phases"] == {"execution": {"count": 1, "duration_s": 10.0}}
+
+
+def test_node_timing_event_is_posted_to_its_webhook(monkeypatch: pytest.MonkeyPatch) -> None:
+    posted: list[tuple[str, dict[str, Any]]] = []
+
+    class _Response:
+        def raise_for_status(self) -> None:
+            return None
+
+    def _post(url: str, *, json: dict[str, Any], **_kwargs: object) -> _Response:
+        posted.append((url, json))
+        return _Response()
+
+    monkeypatch.setattr(event_persistence.requests, "post", _post)
+    client = WebhookClient(base_url="https://example.test/events/", token="t", run_id="run-1")
+    kind, payload = _node_timing_event().persistence_record()
+
+    client.publish(kind=kind, payload=payload)
+
+    assert posted == [
+        ("https://example.test/events/node-timing", {"run_id": "run-1", "event": payload})
+    ]
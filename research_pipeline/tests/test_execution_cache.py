@@ -0,0 +1,231 @@
+"""
+Tests for the execution cache that stands in for re-running identical experiment code.
+
+Validates code normalization, which seeding calls make a run reproducible, which results
+may be stored, the store/load round trip of results and working-directory artifacts, and
+that the key changes with the code, seeds, inputs, working directory and environment.
+"""
+
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from ai_scientist.treesearch.execution_cache import (
+    ExecutionCache,
+    ExecutionCacheKey,
+    build_cache_key,
+    is_cacheable,
+    normalize_code,
+    seed_signature,
+    snapshot_working_dir,
+)
+from ai_scientist.treesearch.interpreter import ExecutionResult
+
+SEEDED = "import torch\ntorch.manual_seed(0)\nprint(torch.rand(1))\n"
+
+
+def _code(source: str) -> str:
+    return textwrap.dedent(source).lstrip()
+
+
+def test_normalize_code_ignores_comments_and_formatting() -> None:
+    reformatted = "import torch  # the model\n\n\ntorch.manual_seed( 0 )\nprint(torch.rand(1,))\n"
+
+    assert normalize_code(reformatted) == normalize_code(SEEDED)
+    assert normalize_code(SEEDED.replace("rand", "randn")) != normalize_code(SEEDED)
+
+
+def test_normalize_code_falls_back_to_lines_for_invalid_code() -> None:
+    assert normalize_code("def f(:\r\n    pass   \n\n") == "def f(:\n    pass"
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "np.random.seed(0)",
+        "torch.manual_seed(-1)",
+        "random.seed('experiment')",
+        "jax.random.PRNGKey(seed=42)",
+        "SEED = 42\ntorch.manual_seed(SEED)\nnp.random.seed(SEED)",
+        "SEED: int = 7\nrandom.seed(SEED)",
+        """
+        def set_seed(seed):
+            torch.manual_seed(seed)
+            np.random.seed(seed)
+
+        set_seed(3)
+        """,
+    ],
+)
+def test_constant_seeds_are_recognized(code: str) -> None:
+    assert seed_signature(_code(code)) is not None
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "print('no seed')",
+        "random.seed()",
+        "np.random.seed(None)",
+        "import time\nnp.random.seed(int(time.time()))",
+        "np.random.seed(os.getpid())",
+        "SEED = 42\nSEED = int(os.environ['SEED'])\ntorch.manual_seed(SEED)",
+        "for seed in range(3):\n    random.seed(seed)",
+        "np.random.seed(0)\ntorch.manual_seed(time.time_ns())",
+        """
+        def run(seed):
+            torch.manual_seed(seed)
+
+        run(0)
+        """,
+        """
+        def set_seed(seed):
+            torch.manual_seed(seed)
+
+        set_seed(int(time.time()))
+        """,
+        """
+        def set_seed(seed):
+            seed = int(time.time())
+            torch.manual_seed(seed)
+
+        set_seed(0)
+        """,
+        "def set_seed(seed):\n    torch.manual_seed(seed)\n",
+        "np.random.seed(0",
+    ],
+)
+def test_nondeterministic_or_missing_seeds_are_rejected(code: str) -> None:
+    assert seed_signature(_code(code)) is None
+
+
+@pytest.mark.parametrize(
+    ("result", "cacheable"),
+    [
+        (ExecutionResult(term_out=["ok"], exec_time=1.0, exc_type=None), True),
+        (ExecutionResult(term_out=["boom"], exec_time=1.0, exc_type="ValueError"), True),
+        (ExecutionResult(term_out=[], exec_time=60.0, exc_type="TimeoutError"), False),
+        (ExecutionResult(term_out=[], exec_time=1.0, exc_type="OutOfMemoryError"), False),
+        (
+            ExecutionResult(
+                term_out=["RuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB"],
+                exec_time=1.0,
+                exc_type="RuntimeError",
+            ),
+            False,
+        ),
+    ],
+)
+def test_is_cacheable(result: ExecutionResult, cacheable: bool) -> None:
+    assert is_cacheable(result) is cacheable
+
+
+@pytest.fixture
+def workspace(tmp_path: Path) -> Path:
+    (tmp_path / "input").mkdir()
+    (tmp_path / "input" / "data.csv").write_text("x,y\n1,2\n")
+    (tmp_path / "working").mkdir()
+    return tmp_path
+
+
+def _key(
+    workspace: Path,
+    code: str = SEEDED,
+    *,
+    gpu_name: str = "A100",
+    timeout: int = 3600,
+    cache_unseeded: bool = False,
+) -> ExecutionCacheKey | None:
+    return build_cache_key(
+        code=code,
+        input_dir=workspace / "input",
+        working_dir=workspace / "working",
+        gpu_name=gpu_name,
+        timeout=timeout,
+        cache_unseeded=cache_unseeded,
+    )
+
+
+def _digest(
+    workspace: Path, code: str = SEEDED, *, gpu_name: str = "A100", timeout: int = 3600
+) -> str:
+    key = _key(workspace, code, gpu_name=gpu_name, timeout=timeout)
+    assert key is not None
+    return key.digest
+
+
+def test_key_is_stable_across_formatting_and_idea_files(workspace: Path) -> None:
+    before = _digest(workspace)
+    (workspace / "input" / "original_idea.json").write_text("{}")
+
+    assert _digest(workspace, SEEDED.replace("(0)", "( 0 )  # seed")) == before
+
+
+def test_key_changes_with_code_seed_inputs_and_environment(workspace: Path) -> None:
+    base = _digest(workspace)
+
+    assert _digest(workspace, SEEDED.replace("rand(1)", "rand(2)")) != base
+    assert _digest(workspace, SEEDED.replace("manual_seed(0)", "manual_seed(1)")) != base
+    assert _digest(workspace, timeout=60) != base
+    assert _digest(workspace, gpu_name="H100") != base
+    (workspace / "input" / "data.csv").write_text("x,y\n1,3\n")
+    assert _digest(workspace) != base
+
+
+def test_key_changes_with_working_dir_contents(workspace: Path) -> None:
+    base = _digest(workspace)
+    (workspace / "working" / "checkpoint.pt").write_bytes(b"weights")
+    with_checkpoint = _digest(workspace)
+    (workspace / "working" / "checkpoint.pt").write_bytes(b"other weights")
+
+    assert with_checkpoint != base
+    assert _digest(workspace) not in (base, with_checkpoint)
+
+
+def test_unseeded_code_is_only_keyed_on_request(workspace: Path) -> None:
+    unseeded = "print(1)\n"
+
+    assert _key(workspace, unseeded) is None
+    key = _key(workspace, unseeded, cache_unseeded=True)
+    assert key is not None and key.seed is None
+
+
+def test_store_and_load_round_trip(workspace: Path, tmp_path: Path) -> None:
+    working = workspace / "working"
+    (working / "old.txt").write_text("left by an earlier node")
+    key = _key(workspace)
+    assert key is not None
+    before = snapshot_working_dir(working)
+    (working / "experiment_data.npy").write_bytes(b"results")
+    (working / "plots").mkdir()
+    (working / "plots" / "loss.png").write_bytes(b"png")
+    result = ExecutionResult(term_out=["loss 0.1\n"], exec_time=12.5, exc_type=None)
+    cache = ExecutionCache(tmp_path / "cache", max_artifact_bytes=1 << 20)
+
+    assert cache.store(key, result, working_dir=working, before=before, node_id="n1")
+    assert not cache.store(key, result, working_dir=working, before=before, node_id="n2")
+
+    fresh = tmp_path / "fresh"
+    fresh.mkdir()
+    loaded = cache.load(key, working_dir=fresh)
+    assert loaded is not None and loaded.from_cache
+    assert loaded.term_out == result.term_out and loaded.exec_time == result.exec_time
+    assert (fresh / "experiment_data.npy").read_bytes() == b"results"
+    assert (fresh / "plots" / "loss.png").read_bytes() == b"png"
+    assert not (fresh / "old.txt").exists()
+
+
+def test_missed_and_refused_entries(workspace: Path, tmp_path: Path) -> None:
+    working = workspace / "working"
+    key = _key(workspace)
+    assert key is not None
+    cache = ExecutionCache(tmp_path / "cache", max_artifact_bytes=4)
+    before = snapshot_working_dir(working)
+    (working / "experiment_data.npy").write_bytes(b"too large")
+    ok = ExecutionResult(term_out=[], exec_time=1.0, exc_type=None)
+    timeout = ExecutionResult(term_out=[], exec_time=1.0, exc_type="TimeoutError")
+
+    assert not cache.store(key, ok, working_dir=working, before=before, node_id="n1")
+    assert not cache.store(key, timeout, working_dir=working, before=before, node_id="n1")
+    assert cache.load(key, working_dir=working) is None
@@ -0,0 +1,184 @@
+"""
+Tests for the companion format of experiment_data.npy and the np.load hook that serves it.
+
+Validates that a companion round-trips nested results with their numpy types (including
+numpy scalars inside lists), that large arrays come back memory-mapped copy-on-write, that
+a companion is ignored once its source changes, that calls the hook does not handle reach
+numpy untouched, and that move_with_companion moves both files.
+"""
+
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from ai_scientist.treesearch.utils import experiment_data
+from ai_scientist.treesearch.utils.experiment_data import (
+    MAX_INLINE_ARRAY_ELEMENTS,
+    MIN_COMPANION_SOURCE_BYTES,
+    companion_dir,
+    has_fresh_companion,
+    install_numpy_load_hook,
+    load_experiment_data,
+    move_with_companion,
+    write_companion,
+)
+
+LARGE = MIN_COMPANION_SOURCE_BYTES // 8 + 1024
+
+
+def _results() -> dict[str, Any]:
+    return {
+        "dataset": {
+            "losses": {
+                "train": [np.float64(0.5), np.float64(0.25)],
+                "val": [[np.float32(1.5), np.int64(3)], [np.float64(2.0)]],
+            },
+            "metrics": {"best": np.float64(0.75), "epochs": 10, "name": "acc"},
+            "predictions": np.arange(LARGE, dtype=np.float64),
+            "small": np.array([[1, 2], [3, 4]], dtype=np.int32),
+            "config": (np.int64(7), "adam", None, 1e-3),
+            "tags": {"a", "b"},
+            "plain": [1, 2.5, "x", None, True],
+        }
+    }
+
+
+def _assert_same(actual: Any, expected: Any) -> None:  # noqa: ANN401
+    assert type(actual) is type(expected) or (
+        isinstance(expected, np.ndarray) and isinstance(actual, np.ndarray)
+    ), f"{type(actual)} != {type(expected)}"
+    if isinstance(expected, dict):
+        assert list(actual) == list(expected)
+        for key, value in expected.items():
+            _assert_same(actual[key], value)
+    elif isinstance(expected, (list, tuple)):
+        assert len(actual) == len(expected)
+        for actual_item, expected_item in zip(actual, expected):
+            _assert_same(actual_item, expected_item)
+    elif isinstance(expected, np.ndarray):
+        assert actual.dtype == expected.dtype
+        np.testing.assert_array_equal(actual, expected)
+    else:
+        assert actual == expected
+        if isinstance(expected, np.generic):
+            assert actual.dtype == expected.dtype
+
+
+@pytest.fixture
+def hook(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(np, "load", np.load)
+    monkeypatch.setattr(experiment_data, "_original_np_load", None)
+    install_numpy_load_hook()
+
+
+def _save(path: Path, data: dict[str, Any]) -> None:
+    np.save(path, np.array(data, dtype=object), allow_pickle=True)
+
+
+def test_companion_round_trip_keeps_numpy_types(tmp_path: Path) -> None:
+    path = tmp_path / "experiment_data.npy"
+    data = _results()
+    _save(path, data)
+
+    assert write_companion(path, data)
+    loaded = load_experiment_data(path)
+
+    _assert_same(loaded, data)
+    assert isinstance(loaded["dataset"]["predictions"], np.memmap)
+    assert loaded["dataset"]["predictions"].size > MAX_INLINE_ARRAY_ELEMENTS
+
+
+@pytest.mark.usefixtures("hook")
+def test_hook_writes_companion_and_serves_copy_on_write_arrays(tmp_path: Path) -> None:
+    path = tmp_path / "experiment_data.npy"
+    data = _results()
+    _save(path, data)
+
+    first = np.load(path, allow_pickle=True).item()
+    assert has_fresh_companion(path)
+    second = np.load(path, allow_pickle=True).item()
+
+    _assert_same(first, data)
+    _assert_same(second, data)
+    predictions = second["dataset"]["predictions"]
+    assert isinstance(predictions, np.memmap) and predictions.mode == "c"
+    predictions[:] = -1.0
+    third = np.load(path, allow_pickle=True).item()
+    np.testing.assert_array_equal(third["dataset"]["predictions"], data["dataset"]["predictions"])
+
+
+@pytest.mark.usefixtures("hook")
+def test_stale_companion_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path / "experiment_data.npy"
+    _save(path, _results())
+    np.load(path, allow_pickle=True)
+    assert has_fresh_companion(path)
+
+    rewritten = {"dataset": {"metrics": {"best": np.float64(0.9)}}}
+    _save(path, rewritten)
+
+    assert not has_fresh_companion(path)
+    _assert_same(np.load(path, allow_pickle=True).item(), rewritten)
+    _assert_same(load_experiment_data(path), rewritten)
+
+
+@pytest.mark.usefixtures("hook")
+def test_small_files_get_no_companion(tmp_path: Path) -> None:
+    path = tmp_path / "experiment_data.npy"
+    data = {"metrics": [np.float64(0.5)]}
+    _save(path, data)
+
+    _assert_same(np.load(path, allow_pickle=True).item(), data)
+    assert not companion_dir(path).exists()
+
+
+@pytest.mark.usefixtures("hook")
+def test_other_calls_go_straight_to_numpy(tmp_path: Path) -> None:
+    array_path = tmp_path / "array.npy"
+    np.save(array_path, np.arange(LARGE, dtype=np.float64))
+    loaded = np.load(array_path, allow_pickle=True)
+    assert type(loaded) is np.ndarray and loaded.size == LARGE
+    assert not companion_dir(array_path).exists()
+    assert isinstance(np.load(array_path, mmap_mode="r"), np.memmap)
+
+    archive_path = tmp_path / "arrays.npz"
+    np.savez(archive_path, x=np.arange(3))
+    with np.load(archive_path) as archive:
+        np.testing.assert_array_equal(archive["x"], np.arange(3))
+
+    data_path = tmp_path / "experiment_data.npy"
+    _save(data_path, _results())
+    np.load(data_path, allow_pickle=True)
+    assert has_fresh_companion(data_path)
+    with pytest.raises(ValueError):
+        np.load(data_path)
+
+
+def test_move_with_companion(tmp_path: Path) -> None:
+    src = tmp_path / "experiment_data.npy"
+    dst = tmp_path / "seed_1" / "experiment_data.npy"
+    dst.parent.mkdir()
+    data = _results()
+    _save(src, data)
+    write_companion(src, data)
+    companion_dir(dst).mkdir()
+    (companion_dir(dst) / "stale").write_text("old")
+
+    move_with_companion(src, dst)
+
+    assert not src.exists() and not companion_dir(src).exists()
+    assert has_fresh_companion(dst)
+    assert not (companion_dir(dst) / "stale").exists()
+    _assert_same(load_experiment_data(dst), data)
+
+
+def test_move_without_companion(tmp_path: Path) -> None:
+    src = tmp_path / "experiment_data.npy"
+    dst = tmp_path / "moved.npy"
+    _save(src, {"metrics": [1.0]})
+
+    move_with_companion(src, dst)
+
+    assert dst.exists() and not companion_dir(dst).exists()
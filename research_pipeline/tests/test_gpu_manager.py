@@ -0,0 +1,121 @@
+"""
+Unit tests for GPUScheduler placement on a simulated device inventory.
+
+Validates that:
+- Tasks co-locate on a GPU only while slots and memory allow it
+- Reservations follow the observed peak plus headroom
+- Lineages that ran out of memory get an idle GPU to themselves
+- Queueing delay and utilization are accounted in the stats
+"""
+
+import threading
+import time
+
+import pytest
+
+from ai_scientist.treesearch.gpu_manager import GPUDevice, GPUScheduler, is_cuda_oom
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _devices(count: int, memory_total_mib: int = 16000) -> list[GPUDevice]:
+    return [GPUDevice(gpu_id=gpu_id, memory_total_mib=memory_total_mib) for gpu_id in range(count)]
+
+
+def test_tasks_spread_then_colocate_until_slots_run_out() -> None:
+    scheduler = GPUScheduler(_devices(2), slots_per_gpu=2)
+
+    placed = [scheduler.try_acquire(f"t{idx}", observed_peak_mib=4000) for idx in range(5)]
+
+    assert [p.gpu_id if p else None for p in placed] == [0, 1, 0, 1, None]
+    assert all(p.reserved_mib == 4800 for p in placed if p)
+    assert scheduler.stats().colocated_placements == 2
+
+    scheduler.release("t0")
+    replacement = scheduler.try_acquire("t4", observed_peak_mib=4000)
+    assert replacement is not None and replacement.gpu_id == 0
+
+
+def test_placement_requires_the_footprint_to_fit_in_free_memory() -> None:
+    scheduler = GPUScheduler(_devices(1), slots_per_gpu=3, memory_headroom=0.25)
+
+    large = scheduler.try_acquire("large", observed_peak_mib=8000)
+    assert large is not None and large.reserved_mib == 10000
+    # A slot is free, but a second large footprint does not fit next to the first.
+    assert scheduler.try_acquire("large-2", observed_peak_mib=8000) is None
+    small = scheduler.try_acquire("small", observed_peak_mib=2000)
+    assert small is not None and small.gpu_id == 0
+
+
+def test_unobserved_tasks_reserve_an_even_share_of_the_device() -> None:
+    scheduler = GPUScheduler(_devices(1, memory_total_mib=24000), slots_per_gpu=3)
+
+    assert scheduler.estimate_footprint_mib(0, None) == 8000
+    assert scheduler.estimate_footprint_mib(0, 100000) == 24000
+
+
+def test_oom_lineage_waits_for_an_idle_gpu_and_blocks_it() -> None:
+    scheduler = GPUScheduler(_devices(1), slots_per_gpu=2)
+    oom = is_cuda_oom(None, ["RuntimeError: CUDA out of memory. Tried to allocate 2.00 GiB"])
+    assert oom
+    assert not is_cuda_oom("ValueError", ["shape mismatch"])
+
+    assert scheduler.try_acquire("running", observed_peak_mib=1000) is not None
+    assert scheduler.try_acquire("retry", observed_peak_mib=1000, exclusive=oom) is None
+
+    scheduler.release("running")
+    placement = scheduler.try_acquire("retry", observed_peak_mib=1000, exclusive=oom)
+    assert placement is not None
+    assert placement.exclusive and placement.reserved_mib == 16000
+    assert scheduler.try_acquire("other", observed_peak_mib=1000) is None
+    assert scheduler.stats().exclusive_placements == 1
+
+
+def test_acquire_waits_for_capacity_and_records_the_queue_delay() -> None:
+    scheduler = GPUScheduler(_devices(1))
+    scheduler.acquire("first")
+    placements = []
+    waiter = threading.Thread(target=lambda: placements.append(scheduler.acquire("second")))
+    waiter.start()
+    time.sleep(0.2)
+    assert not placements
+
+    scheduler.release("first")
+    waiter.join(timeout=5)
+
+    assert placements and placements[0].queued_s >= 0.1
+    stats = scheduler.stats()
+    assert stats.placements == 2
+    assert stats.max_queue_delay_s == placements[0].queued_s
+    assert stats.mean_queue_delay_s == pytest.approx(placements[0].queued_s / 2, abs=0.01)
+
+
+def test_acquire_times_out_without_capacity() -> None:
+    scheduler = GPUScheduler(_devices(1))
+    scheduler.acquire("first")
+
+    with pytest.raises(RuntimeError, match="No GPU capacity"):
+        scheduler.acquire("second", timeout=0.05)
+    with pytest.raises(RuntimeError, match="No GPUs available"):
+        GPUScheduler([]).acquire("any")
+
+
+def test_stats_report_time_weighted_utilization() -> None:
+    clock = FakeClock()
+    scheduler = GPUScheduler(_devices(2), slots_per_gpu=2, clock=clock)
+
+    scheduler.try_acquire("a", observed_peak_mib=10000)
+    clock.now = 10.0
+    scheduler.release("a")
+    clock.now = 20.0
+    stats = scheduler.stats()
+
+    # 12000 of 32000 MiB for half of the time; 1 of 4 slots for half of the time.
+    assert stats.memory_utilization == pytest.approx(12000 / 32000 / 2)
+    assert stats.slot_utilization == pytest.approx(1 / 4 / 2)
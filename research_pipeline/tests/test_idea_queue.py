@@ -0,0 +1,148 @@
+"""
+Unit tests for de-duplicating and pre-proposing Stage 2/4 ideas.
+
+Validates that:
+- distinct_ideas drops blank names, excluded names and repeats, case-insensitively
+- IdeaQueue hands out pre-proposed ideas first, then a batch, then single proposals
+- Ideas tried since they were pre-proposed are never handed out
+- No refill is started beyond what later steps can still use
+"""
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+
+from ai_scientist.treesearch.idea_queue import IdeaQueue, distinct_ideas, idea_key
+
+
+@dataclass(frozen=True)
+class Idea:
+    name: str
+
+
+class FakeProposer:
+    """Proposes numbered ideas and records every batch request."""
+
+    def __init__(self, *, batch_limit: int | None = None) -> None:
+        self.batch_calls: list[int] = []
+        self.single_calls = 0
+        self.batch_limit = batch_limit
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _new(self) -> Idea:
+        with self._lock:
+            self._next += 1
+            return Idea(name=f"idea {self._next}")
+
+    def propose_batch(self, _tried: list[str], count: int) -> list[Idea]:
+        self.batch_calls.append(count)
+        limit = count if self.batch_limit is None else min(count, self.batch_limit)
+        return [self._new() for _ in range(limit)]
+
+    def propose_one(self, _tried: list[str]) -> Idea:
+        self.single_calls += 1
+        return self._new()
+
+
+def _queue(proposer: FakeProposer, prefetch: int = 2) -> IdeaQueue[Idea]:
+    return IdeaQueue(
+        propose_batch=proposer.propose_batch,
+        propose_one=proposer.propose_one,
+        prefetch=prefetch,
+        label="test",
+    )
+
+
+def test_idea_key_ignores_case_and_whitespace() -> None:
+    assert idea_key("  Learning   Rate ") == idea_key("learning rate")
+
+
+def test_distinct_ideas_drops_blank_excluded_and_repeated_names() -> None:
+    ideas = [Idea("Dropout"), Idea(" "), Idea("lr decay"), Idea("LR  Decay"), Idea("batch")]
+
+    result = distinct_ideas(ideas, exclude=["BATCH"])
+
+    assert [idea.name for idea in result] == ["Dropout", "lr decay"]
+
+
+def test_take_uses_pre_proposed_ideas_before_asking_again() -> None:
+    proposer = FakeProposer()
+    queue = _queue(proposer)
+
+    first = queue.take(2, tried=[])
+    second = queue.take(2, tried=[idea.name for idea in first])
+    assert queue._refill is not None
+    queue._refill.result()
+    queue.close()
+
+    assert [idea.name for idea in first] == ["idea 1", "idea 2"]
+    assert [idea.name for idea in second] == ["idea 3", "idea 4"]
+    # One synchronous batch for the first take, then one background refill per take
+    assert proposer.batch_calls == [2, 2, 2]
+    assert proposer.single_calls == 0
+
+
+def test_take_skips_pre_proposed_ideas_tried_in_the_meantime() -> None:
+    proposer = FakeProposer()
+    queue = _queue(proposer)
+    queue.take(1, tried=[])
+
+    # The refill proposed "idea 2" and "idea 3"; "idea 2" was tried elsewhere since
+    taken = queue.take(2, tried=["idea 1", "IDEA 2"])
+    queue.close()
+
+    assert [idea.name for idea in taken] == ["idea 3", "idea 4"]
+
+
+def test_take_falls_back_to_single_proposals_when_a_batch_comes_up_short() -> None:
+    proposer = FakeProposer(batch_limit=1)
+    queue = _queue(proposer, prefetch=0)
+
+    taken = queue.take(3, tried=[])
+    queue.close()
+
+    assert len({idea.name for idea in taken}) == 3
+    assert proposer.batch_calls == [3]
+    assert proposer.single_calls == 2
+
+
+def test_failed_refill_falls_back_to_a_fresh_batch() -> None:
+    proposer = FakeProposer()
+    queue = _queue(proposer)
+    queue.take(1, tried=[])
+    assert queue._refill is not None
+    queue._refill.result()
+    failed = Future[list[Idea]]()
+    failed.set_exception(RuntimeError("rate limited"))
+    queue._refill = failed
+    queue._ready.clear()
+
+    taken = queue.take(1, tried=["idea 1"])
+    queue.close()
+
+    assert [idea.name for idea in taken] == ["idea 4"]
+    assert proposer.batch_calls[:3] == [1, 2, 1]
+
+
+def test_no_refill_when_later_steps_cannot_use_the_ideas() -> None:
+    proposer = FakeProposer()
+    queue = _queue(proposer, prefetch=4)
+
+    queue.take(2, tried=[], later_demand=0)
+
+    assert queue._refill is None
+    assert proposer.batch_calls == [2]
+    queue.close()
+
+
+def test_refill_is_capped_by_later_demand() -> None:
+    proposer = FakeProposer()
+    queue = _queue(proposer, prefetch=4)
+
+    queue.take(2, tried=[], later_demand=1)
+    assert queue._refill is not None
+    queue._refill.result()
+    queue.close()
+
+    assert proposer.batch_calls == [2, 1]
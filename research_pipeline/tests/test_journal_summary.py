@@ -0,0 +1,185 @@
+"""
+Tests for how Journal.generate_summary decides between reusing, updating and rebuilding.
+
+Validates that new nodes are folded into the previous summary, that a state change, too
+many new nodes, the rebuild interval or a node missing from the summary forces a full
+rebuild, that an older snapshot reuses the newer summary, and that the LLM is called
+without holding the journal lock.
+"""
+
+import threading
+from typing import Any
+
+import pytest
+
+from ai_scientist.treesearch.journal import Journal, Node
+
+
+class FakeSummaryModel:
+    """Stands in for `query`, recording the prompts the journal sends."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.journal: Journal | None = None
+        self.lock_free_during_call: list[bool] = []
+
+    def __call__(
+        self,
+        *,
+        system_message: dict[str, Any],
+        user_message: str | None,
+        model: str,
+        temperature: float,
+    ) -> str:
+        assert model == "model" and temperature == 0.0
+        if self.journal is not None:
+            self.lock_free_during_call.append(_lock_free_elsewhere(self.journal))
+        self.calls.append({"system_message": system_message, "user_message": user_message})
+        return f"summary {len(self.calls)}"
+
+    @property
+    def kinds(self) -> list[str]:
+        return ["rebuild" if call["user_message"] else "update" for call in self.calls]
+
+
+def _lock_free_elsewhere(journal: Journal) -> bool:
+    acquired: list[bool] = []
+
+    def try_acquire() -> None:
+        got = journal._lock.acquire(timeout=1.0)
+        if got:
+            journal._lock.release()
+        acquired.append(got)
+
+    thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+    return acquired[0]
+
+
+@pytest.fixture
+def model(monkeypatch: pytest.MonkeyPatch) -> FakeSummaryModel:
+    fake = FakeSummaryModel()
+    monkeypatch.setattr("ai_scientist.treesearch.journal.query", fake)
+    return fake
+
+
+def _journal(nodes: list[Node], *, rebuild_every: int = 10, max_delta_nodes: int = 8) -> Journal:
+    return Journal(
+        summary_model="model",
+        node_selection_model="model",
+        summary_temperature=0.0,
+        node_selection_temperature=0.0,
+        event_callback=lambda _event: None,
+        nodes=nodes,
+        summary_rebuild_every=rebuild_every,
+        summary_max_delta_nodes=max_delta_nodes,
+    )
+
+
+def _node(*, buggy: bool = False) -> Node:
+    return Node(
+        plan="plan", code="print(1)", analysis="analysis", is_buggy=buggy, is_buggy_plots=False
+    )
+
+
+def test_first_summary_is_rebuilt_and_then_cached(model: FakeSummaryModel) -> None:
+    journal = _journal([_node(), _node(buggy=True)])
+
+    assert journal.generate_summary() == "summary 1"
+    assert journal.generate_summary() == "summary 1"
+
+    assert model.kinds == ["rebuild"]
+    assert journal.summary_stats.full_rebuilds == 1
+    assert journal.summary_stats.cache_hits == 1
+
+
+def test_new_nodes_are_folded_into_the_previous_summary(model: FakeSummaryModel) -> None:
+    journal = _journal([_node()])
+    journal.generate_summary()
+    journal.nodes.extend([_node(), _node(buggy=True)])
+
+    assert journal.generate_summary() == "summary 2"
+
+    assert model.kinds == ["rebuild", "update"]
+    prompt = model.calls[1]["system_message"]
+    assert prompt["Current summary"] == "summary 1"
+    assert prompt["New successful experiments"].count("Design:") == 1
+    assert prompt["New failed experiments"].count("Design:") == 1
+    assert journal.summary_stats.incremental_updates == 1
+
+
+def test_a_summarized_node_changing_state_forces_a_rebuild(model: FakeSummaryModel) -> None:
+    node = _node(buggy=True)
+    journal = _journal([_node(), node])
+    journal.generate_summary()
+    node.is_buggy = False
+
+    journal.generate_summary()
+
+    assert model.kinds == ["rebuild", "rebuild"]
+
+
+def test_more_new_nodes_than_max_delta_forces_a_rebuild(model: FakeSummaryModel) -> None:
+    journal = _journal([_node()], max_delta_nodes=2)
+    journal.generate_summary()
+    journal.nodes.extend([_node(), _node()])
+    journal.generate_summary()
+    journal.nodes.extend([_node(), _node(), _node()])
+
+    journal.generate_summary()
+
+    assert model.kinds == ["rebuild", "update", "rebuild"]
+
+
+@pytest.mark.parametrize(
+    ("rebuild_every", "expected"),
+    [
+        (0, ["rebuild", "rebuild", "rebuild"]),
+        (1, ["rebuild", "update", "rebuild"]),
+        (2, ["rebuild", "update", "update"]),
+    ],
+)
+def test_rebuild_every_bounds_consecutive_updates(
+    model: FakeSummaryModel, rebuild_every: int, expected: list[str]
+) -> None:
+    journal = _journal([_node()], rebuild_every=rebuild_every)
+    for _ in range(3):
+        journal.generate_summary()
+        journal.nodes.append(_node())
+
+    assert model.kinds == expected
+
+
+def test_an_older_snapshot_reuses_the_newer_summary(model: FakeSummaryModel) -> None:
+    journal = _journal([_node()])
+    older = journal.snapshot()
+    journal.nodes.append(_node())
+    journal.generate_summary()
+
+    assert older.generate_summary() == "summary 1"
+
+    assert model.kinds == ["rebuild"]
+    assert journal.generate_summary() == "summary 1"
+
+
+def test_a_missing_node_with_new_ones_forces_a_rebuild(model: FakeSummaryModel) -> None:
+    journal = _journal([_node()])
+    older = journal.snapshot()
+    journal.nodes.append(_node())
+    journal.generate_summary()
+    older.nodes.append(_node())
+
+    older.generate_summary()
+
+    assert model.kinds == ["rebuild", "rebuild"]
+
+
+def test_the_llm_is_called_outside_the_journal_lock(model: FakeSummaryModel) -> None:
+    journal = _journal([_node()])
+    model.journal = journal
+    journal.generate_summary()
+    journal.nodes.append(_node())
+    journal.generate_summary()
+
+    assert model.lock_free_during_call == [True, True]
@@ -0,0 +1,133 @@
+"""
+Tests for the hash-keyed PDF layout index shared by the writeup checks and the reviewer.
+
+Validates that the index is built once per PDF content and rebuilt when the content
+changes, that section spans come from the PDF outline or, without one, from heading
+lines, and that heading lookups skip mentions of the title in earlier body text.
+"""
+
+from pathlib import Path
+from typing import Iterator
+
+import pymupdf  # type: ignore[import-untyped]
+import pytest
+
+from ai_scientist import pdf_layout
+from ai_scientist.pdf_layout import get_pdf_layout_index
+
+PAGES = [
+    ["1 Introduction", "We study things; see the references for prior work."],
+    ["2 Method", "Our method.", "2.1 Details", "More detail."],
+    ["3 Results", "It works."],
+    ["References", "[1] A paper."],
+]
+
+
+def _write_pdf(
+    path: Path, pages: list[list[str]], *, toc: list[list[object]] | None = None
+) -> None:
+    doc = pymupdf.open()
+    for lines in pages:
+        page = doc.new_page()
+        for idx, line in enumerate(lines):
+            page.insert_text((72, 72 + 20 * idx), line)
+    if toc is not None:
+        doc.set_toc(toc)
+    doc.save(str(path))
+    doc.close()
+
+
+@pytest.fixture(autouse=True)
+def empty_cache() -> Iterator[None]:
+    pdf_layout._index_cache.clear()
+    yield
+    pdf_layout._index_cache.clear()
+
+
+@pytest.fixture
+def builds(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    built: list[str] = []
+    build = pdf_layout.build_pdf_layout_index
+
+    def counting_build(pdf_path: str, pdf_hash: str | None = None) -> pdf_layout.PdfLayoutIndex:
+        built.append(pdf_path)
+        return build(pdf_path, pdf_hash=pdf_hash)
+
+    monkeypatch.setattr(pdf_layout, "build_pdf_layout_index", counting_build)
+    return built
+
+
+def test_index_is_built_once_per_pdf_content(tmp_path: Path, builds: list[str]) -> None:
+    pdf = tmp_path / "paper.pdf"
+    _write_pdf(pdf, PAGES)
+    copy = tmp_path / "copy.pdf"
+    copy.write_bytes(pdf.read_bytes())
+
+    first = get_pdf_layout_index(str(pdf))
+    assert first is not None and first.page_count == 4
+    assert get_pdf_layout_index(str(pdf)) is first
+    assert get_pdf_layout_index(str(copy)) is first
+    assert builds == [str(pdf)]
+
+
+def test_rewritten_pdf_is_reindexed(tmp_path: Path, builds: list[str]) -> None:
+    pdf = tmp_path / "paper.pdf"
+    _write_pdf(pdf, PAGES)
+    first = get_pdf_layout_index(str(pdf))
+    _write_pdf(pdf, PAGES[:2])
+
+    second = get_pdf_layout_index(str(pdf))
+
+    assert first is not None and second is not None
+    assert second.page_count == 2 and second.pdf_hash != first.pdf_hash
+    assert len(builds) == 2
+
+
+def test_missing_pdf_has_no_index(tmp_path: Path) -> None:
+    assert get_pdf_layout_index(str(tmp_path / "missing.pdf")) is None
+
+
+def test_section_spans_come_from_the_outline(tmp_path: Path) -> None:
+    pdf = tmp_path / "paper.pdf"
+    toc: list[list[object]] = [
+        [1, "1 Introduction", 1],
+        [1, "2 Method", 2],
+        [2, "2.1 Details", 2],
+        [1, "3 Results", 3],
+        [1, "References", 4],
+    ]
+    _write_pdf(pdf, PAGES, toc=toc)
+    index = get_pdf_layout_index(str(pdf))
+    assert index is not None
+
+    method = index.section_span("method")
+    assert method is not None and (method.start_page, method.end_page) == (2, 3)
+    details = index.section_span("Details")
+    assert details is not None and details.level == 2 and details.end_page == 3
+    references = index.section_span("References")
+    assert references is not None and (references.start_page, references.end_page) == (4, 4)
+    assert index.section_span("Appendix") is None
+
+
+def test_section_spans_fall_back_to_heading_lines(tmp_path: Path) -> None:
+    pdf = tmp_path / "paper.pdf"
+    _write_pdf(pdf, PAGES)
+    index = get_pdf_layout_index(str(pdf))
+    assert index is not None
+
+    results = index.section_span("Results")
+    assert results is not None and (results.start_page, results.end_page) == (3, 4)
+    details = index.section_span("2.1 Details")
+    assert details is not None and details.level == 2
+
+
+def test_find_heading_skips_earlier_mentions(tmp_path: Path) -> None:
+    pdf = tmp_path / "paper.pdf"
+    _write_pdf(pdf, PAGES)
+    index = get_pdf_layout_index(str(pdf))
+    assert index is not None
+
+    assert index.find_phrase("references") == (1, 2)
+    assert index.find_heading("References") == (4, 1)
+    assert index.find_heading("Appendix", "It works") == (3, 2)
+    assert index.find_phrase("Our method", start_page=3) is None
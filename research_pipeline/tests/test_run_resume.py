@@ -0,0 +1,154 @@
+"""
+Tests for resuming an interrupted run inside the substage it was in.
+
+Validates that a run saved mid-substage and restored through `resume_run_from_state` comes
+back in the interrupted substage with every finished node, and that the agent built for it
+treats the ideas of all restored nodes as tried, including those whose nodes were buggy.
+"""
+
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from omegaconf import OmegaConf
+
+from ai_scientist.treesearch.agent_manager import AgentManager
+from ai_scientist.treesearch.events import BaseEvent
+from ai_scientist.treesearch.journal import Journal, Node
+from ai_scientist.treesearch.parallel_agent import ParallelAgent
+from ai_scientist.treesearch.stages.base import StageMeta
+from ai_scientist.treesearch.utils.config import Config, load_task_desc, prep_cfg, save_run
+from ai_scientist.treesearch.utils.metric import MetricValue
+from ai_scientist.treesearch.worker_pool import WorkerPool
+from launch_scientist_bfts import resume_run_from_state
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+IDEA_PATH = REPO_ROOT / "idea_example.json"
+
+
+@pytest.fixture
+def cfg(tmp_path: Path) -> Config:
+    raw = OmegaConf.merge(
+        OmegaConf.load(REPO_ROOT / "bfts_config.yaml"),
+        {
+            "desc_file": str(IDEA_PATH),
+            "workspace_dir": str(tmp_path / "workspaces"),
+            "log_dir": str(tmp_path / "logs"),
+            "exp_name": "resume",
+            "min_num_gpus": 0,
+            "telemetry": None,
+        },
+    )
+    return prep_cfg(raw)
+
+
+@pytest.fixture(autouse=True)
+def offline(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Build agents without worker processes or the LLM metric definition."""
+    monkeypatch.setattr(WorkerPool, "prepare", lambda _pool, _num_workers: None)
+    monkeypatch.setattr(ParallelAgent, "_define_global_metrics", lambda _agent: "accuracy")
+
+
+def _node(
+    *, buggy: bool = False, hyperparam: str | None = None, ablation: str | None = None
+) -> Node:
+    return Node(
+        plan="plan",
+        code="print(1)",
+        is_buggy=buggy,
+        is_buggy_plots=False,
+        metric=MetricValue(value=0.5),
+        hyperparam_name=hyperparam,
+        ablation_name=ablation,
+    )
+
+
+def _interrupt_in_stage(cfg: Config, stage_number: int, nodes: list[Node]) -> StageMeta:
+    """Run the manager's bookkeeping up to `stage_number`, add `nodes` there and stop."""
+    events: list[BaseEvent] = []
+    manager = AgentManager(
+        task_desc=load_task_desc(cfg),
+        cfg=cfg,
+        workspace_dir=Path(cfg.workspace_dir),
+        event_callback=events.append,
+    )
+    try:
+        for _ in range(stage_number - 1):
+            assert manager.current_stage is not None
+            manager.journals[manager.current_stage.name].append(_node())
+            manager._advance_to_next_main_stage()
+        stage = manager.current_stage
+        assert stage is not None and stage.number == stage_number
+        manager._save_run_state(current_substage=stage)
+        journal = manager.journals[stage.name]
+        # The best node of the previous stage seeds the substage, then its steps land
+        manager._prepare_substage(current_substage=stage)
+        for node in nodes:
+            journal.append(node)
+        for saved_stage in manager.stages:
+            save_run(
+                cfg, manager.journals[saved_stage.name], stage_name=f"stage_{saved_stage.name}"
+            )
+    finally:
+        manager.close()
+    return stage
+
+
+def _resume(
+    cfg: Config, monkeypatch: pytest.MonkeyPatch
+) -> tuple[StageMeta, dict[str, Journal], ParallelAgent]:
+    """Resume through resume_run_from_state, building the interrupted substage's agent."""
+    resumed: list[tuple[StageMeta, dict[str, Journal], ParallelAgent]] = []
+
+    def build_agent_instead_of_running(
+        manager: AgentManager,
+        step_callback: Callable[[StageMeta, Journal], None] | None = None,
+    ) -> None:
+        assert step_callback is not None
+        assert manager.current_stage is not None
+        with manager._create_agent_for_stage(manager.current_stage) as agent:
+            resumed.append((manager.current_stage, dict(manager.journals), agent))
+
+    monkeypatch.setattr(AgentManager, "run", build_agent_instead_of_running)
+    resume_run_from_state(cfg=cfg, idea_json_path=str(IDEA_PATH), event_callback=lambda _e: None)
+    assert len(resumed) == 1
+    return resumed[0]
+
+
+def test_resumed_tuning_substage_keeps_nodes_and_tried_hyperparams(
+    cfg: Config, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    interrupted = _interrupt_in_stage(
+        cfg,
+        2,
+        [
+            _node(hyperparam="learning_rate"),
+            _node(buggy=True, hyperparam="batch_size"),
+            _node(buggy=True, hyperparam="batch_size"),
+        ],
+    )
+
+    stage, journals, agent = _resume(cfg, monkeypatch)
+
+    assert stage.name == interrupted.name
+    assert [len(journal.nodes) for journal in journals.values()] == [1, 4]
+    assert [node.is_buggy for node in journals[stage.name].nodes] == [False, False, True, True]
+    assert agent._hyperparam_tuning_state["tried_hyperparams"] == {"learning_rate", "batch_size"}
+    assert agent._ablation_state["completed_ablations"] == set()
+
+
+def test_resumed_ablation_substage_keeps_nodes_and_tried_ablations(
+    cfg: Config, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    interrupted = _interrupt_in_stage(
+        cfg,
+        4,
+        [_node(buggy=True, ablation="no_dropout"), _node(ablation="frozen_embeddings")],
+    )
+
+    stage, journals, agent = _resume(cfg, monkeypatch)
+
+    assert stage.name == interrupted.name
+    assert [len(journal.nodes) for journal in journals.values()] == [1, 1, 1, 3]
+    assert agent._ablation_state["completed_ablations"] == {"no_dropout", "frozen_embeddings"}
+    assert agent._hyperparam_tuning_state["tried_hyperparams"] == set()
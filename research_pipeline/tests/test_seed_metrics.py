@@ -0,0 +1,228 @@
+"""
+Tests for how seed runs are reviewed and get their metrics without the LLM.
+
+Validates that a seed run is buggy exactly when it raised, that metric values are mapped
+by position from the parent's metric-parse output, that a value printed at positions
+whose seed numbers disagree is treated as ambiguous, and that any layout mismatch falls
+back to the LLM metric extraction.
+"""
+
+from types import SimpleNamespace
+from typing import Any, cast
+
+import pytest
+
+from ai_scientist.treesearch import worker_process
+from ai_scientist.treesearch.codegen_agent import MinimalAgent
+from ai_scientist.treesearch.interpreter import ExecutionResult, Interpreter
+from ai_scientist.treesearch.journal import Node
+from ai_scientist.treesearch.utils.config import Config
+from ai_scientist.treesearch.utils.metric import MetricValue
+from ai_scientist.treesearch.vlm_function_specs import MetricParseResponse
+from ai_scientist.treesearch.worker_process import (
+    _metrics_from_reused_parse_output,
+    _parse_metrics_with_llm,
+    _review_seed_exec_result,
+    _SpeculativeCodegen,
+)
+
+PARENT_OUTPUT = [
+    "Dataset: cifar10\n",
+    "train accuracy: final 0.91, best 0.93\n",
+    "validation loss: final 0.35, best 3e-1\n",
+]
+SEED_OUTPUT = [
+    "Dataset: cifar10\n",
+    "train accuracy: final 0.89, best 0.92\n",
+    "validation loss: final 0.37, best 3.1e-1\n",
+]
+
+
+def _metric(name: str, final_value: float, best_value: float) -> dict[str, Any]:
+    return {
+        "metric_name": name,
+        "lower_is_better": name.endswith("loss"),
+        "description": f"The {name}.",
+        "data": [{"dataset_name": "cifar10", "final_value": final_value, "best_value": best_value}],
+    }
+
+
+def _parent(
+    output: list[str] | None = PARENT_OUTPUT,
+    metrics: list[dict[str, Any]] | None = None,
+) -> Node:
+    if metrics is None:
+        metrics = [_metric("train accuracy", 0.91, 0.93), _metric("validation loss", 0.35, 0.3)]
+    return Node(
+        plan="plan",
+        code="print(1)",
+        parse_metrics_plan="parse plan",
+        parse_metrics_code="print('metrics')",
+        parse_term_out=output,
+        metric=MetricValue(value={"metric_names": metrics}),
+    )
+
+
+def _values(metrics: MetricParseResponse | None) -> list[tuple[str, float, float]]:
+    assert metrics is not None
+    return [
+        (info.metric_name, point.final_value, point.best_value)
+        for info in metrics.metric_names
+        for point in info.data
+    ]
+
+
+@pytest.mark.parametrize(
+    ("exc_type", "buggy", "analysis"),
+    [(None, False, "completed without errors"), ("ValueError", True, "failed with ValueError")],
+)
+def test_seed_runs_are_buggy_exactly_when_they_raised(
+    exc_type: str | None, buggy: bool, analysis: str
+) -> None:
+    child = Node(plan="plan", code="print(1)")
+    result = ExecutionResult(term_out=["done\n"], exec_time=3.0, exc_type=exc_type)
+
+    _review_seed_exec_result(child_node=child, exec_result=result)
+
+    assert child.is_buggy is buggy
+    assert analysis in child.analysis
+    assert child.exc_type == exc_type and child.exec_time == 3.0
+
+
+def test_values_are_mapped_by_position() -> None:
+    metrics = _metrics_from_reused_parse_output(parent_node=_parent(), term_out=SEED_OUTPUT)
+
+    assert _values(metrics) == [
+        ("train accuracy", 0.89, 0.92),
+        ("validation loss", 0.37, 0.31),
+    ]
+    assert metrics is not None and metrics.metric_names[1].lower_is_better
+
+
+def test_a_repeated_parent_value_maps_when_the_seed_agrees() -> None:
+    parent = _parent(
+        output=["accuracy 0.5 0.5\n", "loss 0.5 0.5\n"],
+        metrics=[_metric("accuracy", 0.5, 0.5), _metric("loss", 0.5, 0.5)],
+    )
+
+    metrics = _metrics_from_reused_parse_output(
+        parent_node=parent, term_out=["accuracy 0.6 0.6\n", "loss 0.6 0.6\n"]
+    )
+
+    assert _values(metrics) == [("accuracy", 0.6, 0.6), ("loss", 0.6, 0.6)]
+
+
+def test_an_ambiguous_repeated_value_is_not_mapped() -> None:
+    parent = _parent(
+        output=["accuracy 0.5 0.7\n", "loss 0.5 0.2\n"],
+        metrics=[_metric("accuracy", 0.5, 0.7), _metric("loss", 0.5, 0.2)],
+    )
+
+    metrics = _metrics_from_reused_parse_output(
+        parent_node=parent, term_out=["accuracy 0.6 0.7\n", "loss 0.4 0.2\n"]
+    )
+
+    assert metrics is None
+
+
+@pytest.mark.parametrize(
+    "seed_output",
+    [
+        [*SEED_OUTPUT, "test accuracy: 0.88\n"],
+        [line.replace("validation", "val") for line in SEED_OUTPUT],
+        [SEED_OUTPUT[0], SEED_OUTPUT[2], SEED_OUTPUT[1]],
+        [line.replace("0.37", "nan") for line in SEED_OUTPUT],
+        [],
+    ],
+    ids=["extra-line", "renamed-metric", "reordered", "non-finite", "empty"],
+)
+def test_a_different_layout_is_not_mapped(seed_output: list[str]) -> None:
+    assert _metrics_from_reused_parse_output(parent_node=_parent(), term_out=seed_output) is None
+
+
+def test_parent_values_missing_from_the_output_are_not_mapped() -> None:
+    parent = _parent(
+        metrics=[_metric("train accuracy", 0.91, 0.95), _metric("validation loss", 0.35, 0.3)]
+    )
+
+    assert _metrics_from_reused_parse_output(parent_node=parent, term_out=SEED_OUTPUT) is None
+
+
+def test_parents_without_structured_metrics_are_not_mapped() -> None:
+    no_output = _parent(output=None)
+    scalar_metric = _parent()
+    scalar_metric.metric = MetricValue(value=0.5)
+
+    for parent in (no_output, scalar_metric):
+        assert _metrics_from_reused_parse_output(parent_node=parent, term_out=SEED_OUTPUT) is None
+
+
+class FakeInterpreter:
+    """Returns a fixed metric-parse output for whatever code it is asked to run."""
+
+    def __init__(self, term_out: list[str]) -> None:
+        self.term_out = term_out
+        self.codes: list[str] = []
+
+    def run(self, code: str, reset_session: bool = True) -> ExecutionResult:
+        assert reset_session
+        self.codes.append(code)
+        return ExecutionResult(term_out=self.term_out, exec_time=0.1, exc_type=None)
+
+    def cleanup_session(self) -> None:
+        pass
+
+
+LLM_METRICS = MetricParseResponse.model_validate(
+    {"valid_metrics_received": True, "metric_names": [_metric("train accuracy", 0.1, 0.2)]}
+)
+
+
+def _parse_seed_metrics(
+    monkeypatch: pytest.MonkeyPatch, seed_output: list[str]
+) -> tuple[Node, list[object]]:
+    llm_calls: list[object] = []
+
+    def fake_structured_query(**kwargs: object) -> MetricParseResponse:
+        llm_calls.append(kwargs["system_message"])
+        return LLM_METRICS
+
+    monkeypatch.setattr(worker_process, "structured_query_with_schema", fake_structured_query)
+    interpreter = FakeInterpreter(seed_output)
+    child = Node(plan="plan", code="print(1)")
+    cfg = SimpleNamespace(agent=SimpleNamespace(feedback=SimpleNamespace(model="m", temperature=0)))
+    _parse_metrics_with_llm(
+        worker_agent=cast(MinimalAgent, None),
+        child_node=child,
+        parent_node=_parent(),
+        cfg=cast(Config, cfg),
+        process_interpreter=cast(Interpreter, interpreter),
+        seed_eval=True,
+        speculative=_SpeculativeCodegen(),
+    )
+    assert interpreter.codes == ["print('metrics')"]
+    assert child.parse_metrics_code == "print('metrics')"
+    return child, llm_calls
+
+
+def test_seed_metrics_skip_the_llm_when_the_layout_matches(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    child, llm_calls = _parse_seed_metrics(monkeypatch, SEED_OUTPUT)
+
+    assert llm_calls == []
+    assert child.metric is not None
+    assert child.metric.value["metric_names"][0]["data"][0]["final_value"] == 0.89
+    assert child.datasets_successfully_tested == ["cifar10"]
+
+
+def test_seed_metrics_fall_back_to_the_llm_when_the_layout_differs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    child, llm_calls = _parse_seed_metrics(monkeypatch, ["accuracy was 0.89 this time\n"])
+
+    assert len(llm_calls) == 1
+    assert child.metric is not None
+    assert child.metric.value == {
+        "metric_names": LLM_METRICS.model_dump(by_alias=True)["metric_names"]
+    }
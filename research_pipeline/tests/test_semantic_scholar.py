@@ -0,0 +1,167 @@
+"""
+Tests for the Semantic Scholar search cache, the offline corpus and citation round budgets.
+
+Validates query normalization, that cached responses are keyed by the normalized query,
+limit and fields, expire after their TTL and are never stored when empty, that the local
+corpus ranks papers by token overlap, and that citation gathering charges a round only
+for the searches it actually issued.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from ai_scientist import perform_writeup
+from ai_scientist.ideation.semantic_scholar import (
+    LocalSemanticScholarCorpus,
+    SearchResultCache,
+    normalize_query,
+)
+
+FIELDS = "title,abstract,citationCount"
+RESPONSE = {"total": 1, "offset": 0, "data": [{"paperId": "p1", "title": "Attention"}]}
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("Transformer  Attention", "transformer attention"),
+        ("  self-attention, revisited! ", "self attention revisited"),
+        ("BERT: pre-training\tof deep\ntransformers", "bert pre training of deep transformers"),
+        ("", ""),
+    ],
+)
+def test_normalize_query(query: str, expected: str) -> None:
+    assert normalize_query(query) == expected
+
+
+def test_cache_round_trip_is_keyed_by_normalized_query(tmp_path: Path) -> None:
+    cache = SearchResultCache(tmp_path)
+    cache.put("Transformer attention", 10, FIELDS, RESPONSE)
+
+    assert cache.get("transformer,  ATTENTION", 10, FIELDS) == RESPONSE
+    assert cache.get("transformer attention", 5, FIELDS) is None
+    assert cache.get("transformer attention", 10, "title") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_entries_expire_after_the_ttl(tmp_path: Path) -> None:
+    cache = SearchResultCache(tmp_path, ttl_seconds=60)
+    cache.put("attention", 10, FIELDS, RESPONSE)
+    path = next(tmp_path.glob("*.json"))
+    entry = json.loads(path.read_text(encoding="utf-8"))
+    entry["stored_at"] = time.time() - 120
+    path.write_text(json.dumps(entry), encoding="utf-8")
+
+    assert cache.get("attention", 10, FIELDS) is None
+
+
+@pytest.mark.parametrize("response", [{"total": 0, "offset": 0, "data": []}, {"total": 0}, {}])
+def test_empty_responses_are_not_cached(tmp_path: Path, response: dict[str, Any]) -> None:
+    cache = SearchResultCache(tmp_path)
+    cache.put("attention", 10, FIELDS, response)
+
+    assert list(tmp_path.iterdir()) == []
+    assert cache.get("attention", 10, FIELDS) is None
+
+
+def test_unreadable_cache_entry_is_a_miss(tmp_path: Path) -> None:
+    cache = SearchResultCache(tmp_path)
+    cache.put("attention", 10, FIELDS, RESPONSE)
+    next(tmp_path.glob("*.json")).write_text("{not json", encoding="utf-8")
+
+    assert cache.get("attention", 10, FIELDS) is None
+    assert cache.misses == 1
+
+
+@pytest.fixture
+def corpus_path(tmp_path: Path) -> Path:
+    papers = [
+        {
+            "paperId": "a",
+            "title": "Attention is all you need",
+            "abstract": "Transformers.",
+            "citationCount": 100,
+            "venue": "NeurIPS",
+        },
+        {
+            "paperId": "b",
+            "title": "Sparse attention",
+            "abstract": "Efficient transformers.",
+            "citationCount": 5,
+            "venue": "ICML",
+        },
+        {"paperId": "c", "title": "Dropout", "abstract": None, "citationCount": 1000},
+        "not a paper",
+    ]
+    path = tmp_path / "corpus.json"
+    path.write_text(json.dumps({"data": papers}), encoding="utf-8")
+    return path
+
+
+def test_local_corpus_ranks_by_overlap_then_citations(corpus_path: Path) -> None:
+    corpus = LocalSemanticScholarCorpus(corpus_path)
+
+    response = corpus.search("efficient sparse attention transformers", 10, "title")
+
+    assert len(corpus.papers) == 3
+    assert response["total"] == 2
+    assert [paper["paperId"] for paper in response["data"]] == ["b", "a"]
+    assert response["data"][0] == {"paperId": "b", "title": "Sparse attention"}
+
+
+def test_local_corpus_honours_the_limit(corpus_path: Path) -> None:
+    corpus = LocalSemanticScholarCorpus(corpus_path)
+
+    response = corpus.search("attention", 1, FIELDS)
+
+    assert response["total"] == 2
+    assert [paper["paperId"] for paper in response["data"]] == ["a"]
+    assert corpus.search("unrelated words", 10, FIELDS)["data"] == []
+
+
+def _gather(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, rounds: list[Any]) -> list[int]:
+    """Run gather_citations against scripted rounds; returns max_queries of each call."""
+    calls: list[int] = []
+
+    def fake_additions(*, max_queries: int, **_kwargs: object) -> tuple[list[str], int] | None:
+        calls.append(max_queries)
+        result = rounds[len(calls) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(perform_writeup, "get_citation_additions", fake_additions)
+    perform_writeup.gather_citations(
+        base_path=tmp_path,
+        logs_dir=tmp_path / "logs",
+        model="model",
+        temperature=0.0,
+        num_cite_rounds=6,
+        run_dir_name="run",
+        queries_per_round=3,
+    )
+    return calls
+
+
+def test_citation_rounds_charge_the_searches_issued(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rounds = [
+        (["@a{x, title = {A}}"], 1),
+        (["@b{y, title = {B}}"], 3),
+        (["@c{z, title = {C}}"], 2),
+    ]
+
+    assert _gather(tmp_path, monkeypatch, rounds) == [3, 3, 2]
+
+
+def test_a_failed_citation_round_charges_one(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rounds: list[Any] = [RuntimeError("boom"), (["@a{x, title = {A}}"], 3), None]
+
+    assert _gather(tmp_path, monkeypatch, rounds) == [3, 3, 2]
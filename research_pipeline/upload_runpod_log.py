@@ -31,6 +31,7 @@ def upload_runlog(*, log_path: Path, artifact_type: str) -> None:
         aws_region=_require_env("AWS_REGION"),
         aws_s3_bucket_name=_require_env("AWS_S3_BUCKET_NAME"),
         database_url=_require_env("DATABASE_PUBLIC_URL"),
+        aws_endpoint_url=os.environ.get("AWS_S3_ENDPOINT_URL"),
     )
     try:
         publisher.publish(
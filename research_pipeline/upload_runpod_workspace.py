@@ -11,7 +11,7 @@ from ai_scientist.artifact_manager import ArtifactPublisher, ArtifactSpec
 PROJECT_DIR = Path(__file__).resolve().parent
 load_dotenv(PROJECT_DIR / ".env")
 DEFAULT_WORKSPACE_PATH = PROJECT_DIR / "workspaces" / "0-run"
-DEFAULT_EXCLUDES = (".venv", ".ai_scientist_venv")
+DEFAULT_EXCLUDES = (".venv", ".ai_scientist_venv", ".worker_context", ".exec_cache")
 
 
 def _require_env(name: str) -> str:
@@ -43,6 +43,7 @@ def upload_workspace(
         aws_region=_require_env("AWS_REGION"),
         aws_s3_bucket_name=_require_env("AWS_S3_BUCKET_NAME"),
         database_url=_require_env("DATABASE_PUBLIC_URL"),
+        aws_endpoint_url=os.environ.get("AWS_S3_ENDPOINT_URL"),
     )
 
     archive = archive_name or f"{workspace_path.name}-workspace.zip"
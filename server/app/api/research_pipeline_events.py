@@ -105,6 +105,20 @@ class BestNodeSelectionPayload(BaseModel):
     event: BestNodeSelectionEvent
 
 
+class NodeTimingEvent(BaseModel):
+    stage: str
+    node_id: str
+    is_buggy: bool
+    total_s: float
+    phases: Dict[str, Dict[str, Any]]
+    profile_path: Optional[str] = None
+
+
+class NodeTimingPayload(BaseModel):
+    run_id: str
+    event: NodeTimingEvent
+
+
 def _verify_bearer_token(authorization: str = Header(...)) -> None:
     expected_token = settings.TELEMETRY_WEBHOOK_TOKEN
     if not expected_token:
@@ -229,6 +243,23 @@ def ingest_best_node_selection(
     )
 
 
+@router.post("/node-timing", status_code=status.HTTP_204_NO_CONTENT)
+def ingest_node_timing(
+    payload: NodeTimingPayload,
+    _: None = Depends(_verify_bearer_token),
+) -> None:
+    event = payload.event
+    logger.info(
+        "RP node timing: run=%s stage=%s node=%s buggy=%s total=%.1fs phases=%s",
+        payload.run_id,
+        event.stage,
+        event.node_id,
+        event.is_buggy,
+        event.total_s,
+        ",".join(sorted(event.phases)),
+    )
+
+
 @router.post("/run-started", status_code=status.HTTP_204_NO_CONTENT)
 def ingest_run_started(
     payload: RunStartedPayload,
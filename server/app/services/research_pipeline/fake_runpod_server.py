@@ -305,6 +305,13 @@ def telemetry_best_node_selection(payload: Dict[str, object] = Body(...)) -> Non
     )
 
 
+@app.post("/telemetry/node-timing", status_code=204)
+def telemetry_node_timing(payload: Dict[str, object] = Body(...)) -> None:
+    _telemetry_events.append(
+        TelemetryRecord(path="/telemetry/node-timing", payload=payload, received_at=time.time())
+    )
+
+
 @app.get("/telemetry")
 def list_telemetry() -> List[Dict[str, object]]:
     return [